@@ -119,8 +119,27 @@ def documentation_command(include_help: bool):
         reporter_manager.print_reporters_help()
 
 
+@click.command("import-osv-mirror", short_help="import osv data dumps into offline osv mirror")
+@click.argument("dump_files", type=click.Path(exists=True, dir_okay=False), nargs=-1, required=True)
+@debug_option
+def import_osv_mirror_command(dump_files: list):
+    """
+    imports osv ecosystem data dumps (zip files of osv json) into offline osv mirror,
+    used instead of api.osv.dev when scan.OSV_OFFLINE_MIRROR enabled
+
+    aka https://osv-vulnerabilities.storage.googleapis.com/Maven/all.zip
+    """
+    from eze.utils.data.osv_mirror import OsvMirror  # pylint: disable=import-outside-toplevel
+
+    osv_mirror = OsvMirror(True)
+    for dump_file in dump_files:
+        imported_count = osv_mirror.import_dump(dump_file)
+        log(f"Imported {imported_count} advisories from '{dump_file}' into osv mirror '{osv_mirror.db_file}'")
+
+
 housekeeping_group.add_command(create_local_config_command)
 housekeeping_group.add_command(create_global_config_command)
 housekeeping_group.add_command(list_locations_command)
 housekeeping_group.add_command(get_repo_command)
 housekeeping_group.add_command(documentation_command)
+housekeeping_group.add_command(import_osv_mirror_command)
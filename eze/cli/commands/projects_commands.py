@@ -4,7 +4,6 @@ import click
 
 from eze.cli.utils.command_helpers import debug_option
 from eze.utils.log import log
-from eze.utils.language.utils import get_projects
 
 
 @click.command("projects", short_help="List code projects found in the directory")
@@ -13,6 +12,8 @@ def projects_command() -> None:
     """
     List code projects found in the directory
     """
+    from eze.utils.language.utils import get_projects  # pylint: disable=import-outside-toplevel
+
     projects = get_projects()
     for project_name in projects:
         project_list = projects[project_name]
@@ -1,16 +1,12 @@
 """CLI test commands"""
 import textwrap
-import urllib.request
-from urllib.error import HTTPError
 import urllib.parse
 import os
 import asyncio
-import git
 import click
 
 from eze.utils.io.print import pretty_print_json
 from eze.cli.utils.command_helpers import base_options, pass_state
-from eze.core.engine import EzeCore
 from eze.core.config import EzeConfig
 from eze.utils.log import log, log_debug, log_error
 
@@ -30,11 +26,34 @@ from eze.utils.log import log, log_debug, log_error
     default=False,
 )
 @click.option("--autoconfig", type=click.Path(exists=True), help="File with custom autoconfig json", required=False)
-def test_command(state, config_file: str, scan_type: str, force_autoscan: bool, autoconfig: click.Path = None) -> None:
+@click.option(
+    "--max-parallel-tools",
+    "-p",
+    type=click.IntRange(min=1),
+    help="maximum number of tools to run at once, overrides scan.MAX_PARALLEL_TOOLS config (defaults to 1)",
+    required=False,
+)
+@click.option(
+    "--changed-since",
+    help="""git ref aka 'origin/main', file based SAST tools only scan files changed since ref,
+merged with cached findings for unchanged files (requires scan.RESULT_CACHE_TTL_SEC)""",
+    required=False,
+)
+def test_command(
+    state,
+    config_file: str,
+    scan_type: str,
+    force_autoscan: bool,
+    autoconfig: click.Path = None,
+    max_parallel_tools: int = None,
+    changed_since: str = None,
+) -> None:
     """Eze run scan"""
+    from eze.core.engine import EzeCore  # pylint: disable=import-outside-toplevel
+
     EzeCore.auto_build_ezerc(force_autoscan, autoconfig)
     eze_core = EzeCore.get_instance()
-    asyncio.run(eze_core.run_scan(scan_type))
+    asyncio.run(eze_core.run_scan(scan_type, max_parallel_tools=max_parallel_tools, changed_since=changed_since))
 
 
 @click.command("test-online")
@@ -48,6 +67,9 @@ def test_command(state, config_file: str, scan_type: str, force_autoscan: bool,
 )
 def test_online_command(state, config_file: str, url: str) -> None:
     """Eze run scan remotely on a server"""
+    import urllib.request  # pylint: disable=import-outside-toplevel
+    from urllib.error import HTTPError  # pylint: disable=import-outside-toplevel
+
     api_key = os.environ.get("EZE_APIKEY", "")
     api_url = os.environ.get("EZE_REMOTE_SCAN_ENDPOINT", "")
     data = {"remote-url": url}
@@ -87,6 +109,10 @@ def test_remote_command(
     state, config_file: str, scan_type, url: str, branch: str, s3_bucket: str, s3_file: str
 ) -> None:
     """Eze run scan against git repo, and report back to management console"""
+    # INFO: GitPython imported here, as slow to import on every cli run
+    import git  # pylint: disable=import-outside-toplevel
+    from eze.core.engine import EzeCore  # pylint: disable=import-outside-toplevel
+
     temp_dir = os.path.join(os.getcwd(), "test-remote")
 
     try:
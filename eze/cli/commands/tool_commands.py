@@ -7,7 +7,6 @@ import click
 
 from eze.cli.utils.command_helpers import base_options, pass_state, debug_option
 from eze.core.config import EzeConfig
-from eze.core.engine import EzeCore
 from eze.core.enums import SourceType
 from eze.core.tool import ToolManager, ToolType
 from eze.utils.config import extract_embedded_run_type
@@ -111,6 +110,8 @@ def run_command(state, config_file: str, tool: str, report: str = "console", sca
         )
         sys.exit(1)
 
+    from eze.core.engine import EzeCore  # pylint: disable=import-outside-toplevel
+
     eze_core = EzeCore.get_instance()
 
     asyncio.run(eze_core.run([tool], [report], scan_type))
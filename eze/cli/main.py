@@ -12,6 +12,7 @@ from eze.cli.commands.test_commands import test_remote_command, test_online_comm
 from eze.cli.commands.projects_commands import projects_command
 from eze.core.reporter import ReporterManager
 from eze.core.tool import ToolManager
+from eze.utils.cli.version_cache import ToolVersionCache
 from eze.utils.package import get_plugins
 
 # see https://click.palletsprojects.com/en/7.x/api/#click.Context
@@ -28,6 +29,8 @@ def cli(ctx) -> None:
     installed_plugins = get_plugins()
     ToolManager.set_instance(installed_plugins)
     ReporterManager.set_instance(installed_plugins)
+    # detected tool versions persisted between runs, keyed on tool executable, opt out via EZE_TOOL_VERSION_CACHE=false
+    ToolVersionCache.set_instance(ToolVersionCache.is_enabled_in_env())
 
 
 cli.add_command(housekeeping_group)
@@ -123,7 +123,9 @@ LICENSE_DENYLIST = []
 
 # speeds up SAST tools by using copied folder with no binary/dependencies assets
 # for mono-repos can speed up scans from 800s to 30s, by avoiding common dependencies such as node_modules
-# stored: TMP/.eze/cached-workspace
+# stored: TMP/.eze/cached-workspace/<project hash>, kept between runs so only changed files are re-synced
+# files are hardlinked where supported, so tools writing into the copy (aka autofix) also change the real files,
+# set EZE_SOURCE_COPY_HARDLINKS=false to always copy files instead
 USE_SOURCE_COPY = true
 
 # Should SCA scan test or development dependencies
@@ -12,6 +12,7 @@ import click
 from pydash import py_
 import shlex
 from abc import ABC
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 
 from eze import __version__
@@ -28,7 +29,17 @@ from eze.utils.error import EzeFileAccessError, EzeFileParsingError, EzeConfigEr
 import semantic_version
 from eze.utils.error import EzeError
 from eze.utils.log import log, log_debug, log_error
-from eze.utils.cli.version import extract_cmd_version, extract_version_from_maven, detect_pip_executable_version
+from eze.utils.cli.version import (
+    extract_cmd_version,
+    extract_version_from_maven,
+    detect_pip_executable_version,
+    get_dotnet_tool_folder,
+    get_maven_plugin_folder,
+)
+from eze.utils.cli.version_cache import ToolVersionCache
+
+# version checks are subprocess bound, so ran on threads when listing plugins
+MAX_PARALLEL_VERSION_CHECKS: int = 8
 
 
 class EzeConfig:
@@ -118,6 +129,8 @@ class EzeConfig:
             config_files = []
         #
         self.config = {}
+        # (plugin_name, scan_type, run_type) -> merged plugin config, config is immutable once loaded
+        self._plugin_configs: dict = {}
         for config_file in config_files:
             try:
                 if config_file is None:
@@ -157,6 +170,14 @@ class EzeConfig:
 
     def get_plugin_config(self, plugin_name: str, scan_type: str = None, run_type: str = None) -> dict:
         """Gives plugin's configuration, and any custom config from a named scan or run type"""
+        plugin_key = (plugin_name, scan_type, run_type)
+        if plugin_key not in self._plugin_configs:
+            self._plugin_configs[plugin_key] = self._merge_plugin_config(plugin_name, scan_type, run_type)
+        # INFO: copy as callers normalise / extend the returned config
+        return deepcopy(self._plugin_configs[plugin_key])
+
+    def _merge_plugin_config(self, plugin_name: str, scan_type: str = None, run_type: str = None) -> dict:
+        """merge plugin's configuration from root, named scan and run type configs"""
         composite_config = {}
         [plugin_name, run_type] = extract_embedded_run_type(plugin_name, run_type)
         # step 1) clone default plugin config
@@ -238,7 +259,13 @@ class PluginMeta(ABC):
         VERSION_CHECK.FROM_MAVEN
         VERSION_CHECK.CONDITION semantic_version.SimpleSpec statement aka >=6.0
         """
-        version: str = cls._get_version()
+        version: str = ToolVersionCache.get_instance().get_version(
+            f"{cls.__module__}.{cls.__qualname__}",
+            cls.VERSION_CHECK,
+            cls._get_version_executable(),
+            cls._get_version,
+            cls._get_version_install_folders(),
+        )
         condition: str = py_.get(cls.VERSION_CHECK, "CONDITION")
         if condition:
             try:
@@ -250,6 +277,33 @@ class PluginMeta(ABC):
                 pass
         return version
 
+    @classmethod
+    def _get_version_executable(cls) -> str:
+        """executable ran by version check, None when no process spawned (aka FROM_EZE)"""
+        exe_to_check: str = py_.get(cls.VERSION_CHECK, "FROM_EXE")
+        maven_package: str = py_.get(cls.VERSION_CHECK, "FROM_MAVEN")
+        pip_package: str = py_.get(cls.VERSION_CHECK, "FROM_PIP")
+        if maven_package and not pip_package:
+            return "mvn"
+        if exe_to_check:
+            return shlex.split(exe_to_check)[0]
+        return None
+
+    @classmethod
+    def _get_version_install_folders(cls) -> list:
+        """folders tool is installed into without changing it's executable, aka maven plugins installed into ~/.m2"""
+        exe_to_check: str = py_.get(cls.VERSION_CHECK, "FROM_EXE")
+        maven_package: str = py_.get(cls.VERSION_CHECK, "FROM_MAVEN")
+        pip_package: str = py_.get(cls.VERSION_CHECK, "FROM_PIP")
+        if maven_package and not pip_package:
+            return [get_maven_plugin_folder(maven_package)]
+        if exe_to_check:
+            command: list = shlex.split(exe_to_check)
+            # INFO: dotnet tools are ran via dotnet, which is unchanged when tool (re)installed
+            if command[0] == "dotnet" and len(command) > 1 and not command[1].startswith("-"):
+                return [get_dotnet_tool_folder(command[1])]
+        return []
+
     @classmethod
     def _get_version(cls) -> str:
         """Method for detecting if tool installed and ready to run scan, returns version installed"""
@@ -269,3 +323,12 @@ class PluginMeta(ABC):
             return extract_cmd_version(shlex.split(exe_to_check), ignored_err_messages)
         if use_eze_version:
             return __version__
+
+
+def check_installed_versions(plugin_classes: dict) -> dict:
+    """installed versions of plugins (name -> class), checked in parallel as each check spawns processes"""
+    if not plugin_classes:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_VERSION_CHECKS, len(plugin_classes))) as executor:
+        futures = {name: executor.submit(plugin_classes[name].check_installed) for name in plugin_classes}
+    return {name: futures[name].result() for name in futures}
@@ -1,4 +1,6 @@
 """Core engine of Eze"""
+import asyncio
+import os
 
 import click
 
@@ -6,10 +8,22 @@ from pydash import py_
 
 from eze.core.config import EzeConfig
 from eze.core.autoconfig import AutoConfigRunner
+from eze.core.pipeline import Pipeline, get_default_stages
 from eze.core.reporter import ReporterManager
-from eze.core.tool import ToolManager
+from eze.core.scheduler import ResourceScheduler, get_cpu_count, get_memory_mb
+from eze.core.tool import ToolManager, ScanResult
+from eze.utils.data.advisory_cache import AdvisoryCache
+from eze.utils.data.osv_mirror import OsvMirror
+from eze.utils.config import extract_embedded_run_type, get_config_key
+from eze.utils.error import EzeError, EzeConfigError
+from eze.utils.git import GitContext
 from eze.utils.log import log, log_debug, log_error
 
+# by default tools are ran one at a time, can be increased via scan.MAX_PARALLEL_TOOLS or --max-parallel-tools
+DEFAULT_MAX_PARALLEL_TOOLS: int = 1
+# advisory lookups (osv / pypi / nvd) are cached for a day by default, 0 disables via scan.ADVISORY_CACHE_TTL_SEC
+DEFAULT_ADVISORY_CACHE_TTL_SEC: int = 24 * 60 * 60
+
 
 class EzeCore:
     """Singleton Class for accessing Core Eze Engine"""
@@ -48,32 +62,118 @@ class EzeCore:
         EzeConfig.refresh_ezerc_config()
         return True
 
-    async def run_scan(self, scan_type: str = None, custom_reporters: list = None) -> list:
+    async def run_scan(
+        self,
+        scan_type: str = None,
+        custom_reporters: list = None,
+        max_parallel_tools: int = None,
+        changed_since: str = None,
+    ) -> list:
         """run a scan with configured tools and reporters"""
         eze_config = EzeConfig.get_instance()
         scan_config = eze_config.get_scan_config(scan_type)
 
         tools = py_.get(scan_config, "tools", [])
         reporters = custom_reporters or py_.get(scan_config, "reporters", None)
-
-        return await self.run(tools, reporters, scan_type)
-
-    async def run(self, tools: list, reporters: list, scan_type: str = None) -> list:
+        if not max_parallel_tools:
+            max_parallel_tools = get_config_key(scan_config, "MAX_PARALLEL_TOOLS", int, DEFAULT_MAX_PARALLEL_TOOLS)
+        self._configure_advisory_cache(scan_config)
+        OsvMirror.set_instance(get_config_key(scan_config, "OSV_OFFLINE_MIRROR", bool, False))
+        # git repo / branch resolved once, shared by all tools and reporters
+        GitContext.set_instance(os.getcwd())
+
+        return await self.run(tools, reporters, scan_type, max_parallel_tools, changed_since)
+
+    async def run(
+        self,
+        tools: list,
+        reporters: list,
+        scan_type: str = None,
+        max_parallel_tools: int = None,
+        changed_since: str = None,
+    ) -> list:
         """run a scan with set tools and reporters"""
         scan_results = []
-        tool_results = await self.run_tools(tools, scan_type)
+        tool_results = await self.run_tools(tools, scan_type, max_parallel_tools, changed_since)
         scan_results.extend(tool_results)
         return await self.run_reports(scan_results, reporters, scan_type)
 
-    async def run_tools(self, tools: list, scan_type: str = None) -> list:
-        """starting scanning for vulnerabilities"""
-        results = []
+    async def run_tools(
+        self, tools: list, scan_type: str = None, max_parallel_tools: int = None, changed_since: str = None
+    ) -> list:
+        """starting scanning for vulnerabilities, running up to max_parallel_tools at once
+
+        shared setup stages (aka npm install) are ran once, before the tools which depend on them
+        tools are packed against the machine's cpu / memory budget using each tool's RESOURCE_PROFILE
+        results are returned in the configured tool order, regardless of completion order
+        a tool failing (aka bad config) gives a fatal error result for that tool, other tools carry on
+        when changed_since git ref given, incremental tools (aka semgrep) only scan changed files"""
         tool_manager = ToolManager.get_instance()
-        for tool_name in tools:
-            scan_result = await tool_manager.run_tool(tool_name, scan_type)
-            results.append(scan_result)
+        if not max_parallel_tools or max_parallel_tools < 1:
+            max_parallel_tools = DEFAULT_MAX_PARALLEL_TOOLS
+        [cpu_budget, mem_mb_budget] = self._get_resource_budget(scan_type)
+        log_debug(
+            f"running {len(tools)} tools, max {max_parallel_tools} in parallel (cpu:{cpu_budget}, mem_mb:{mem_mb_budget})"
+        )
+        scheduler = ResourceScheduler(max_parallel_tools, cpu_budget, mem_mb_budget)
+        pipeline = Pipeline(get_default_stages())
+
+        async def run_tool_stages(tool_name: str) -> ScanResult:
+            pipeline_stages = tool_manager.get_tool_pipeline_stages(tool_name, scan_type, changed_since=changed_since)
+            resource_profile = tool_manager.get_tool_resource_profile(tool_name, scan_type)
+            # INFO: setup stages (mvn / dotnet / npm) are heavy, so ran inside the tool's resource reservation
+            async with scheduler.reserve(resource_profile, tool_name):
+                tool_version = await self._get_tool_version(tool_name) if pipeline_stages else None
+                if pipeline_stages and tool_version:
+                    try:
+                        await pipeline.run_stages(pipeline_stages)
+                    except EzeError as error:
+                        log_error(f"[{tool_name}] setup stages {pipeline_stages} failed: {error}")
+                        return ScanResult({"tool": tool_name, "fatal_errors": [f"{tool_name} setup failed: {error}"]})
+                return await tool_manager.run_tool(
+                    tool_name, scan_type, changed_since=changed_since, tool_version=tool_version
+                )
+
+        async def run_tool(tool_name: str) -> ScanResult:
+            # INFO: any tool error (including config errors) is isolated into it's result, so other tools carry on
+            try:
+                return await run_tool_stages(tool_name)
+            except Exception as error:  # pylint: disable=broad-except
+                log_error(f"[{tool_name}] failed: {error}")
+                return ScanResult({"tool": tool_name, "fatal_errors": [f"{tool_name} failed: {error}"]})
+
+        results = await asyncio.gather(*[run_tool(tool_name) for tool_name in tools])
+        return list(results)
 
-        return results
+    @staticmethod
+    async def _get_tool_version(tool_name: str) -> str:
+        """tool's version check, setup stages skipped for uninstalled tools so the tool reports it's install help"""
+        [tool_name, _] = extract_embedded_run_type(tool_name)
+        tool_class = ToolManager.get_instance().get_tool_class(tool_name)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, tool_class.check_installed)
+
+    @staticmethod
+    def _get_resource_budget(scan_type: str = None) -> list:
+        """cpu / memory budget for tools, defaults to detected machine resources
+
+        can be overridden via scan.MAX_CPU and scan.MAX_MEMORY_MB config, aka for shared ci runners"""
+        try:
+            scan_config = EzeConfig.get_instance().get_scan_config(scan_type)
+        except EzeConfigError:
+            scan_config = {}
+        cpu_budget = get_config_key(scan_config, "MAX_CPU", int, None) or get_cpu_count()
+        mem_mb_budget = get_config_key(scan_config, "MAX_MEMORY_MB", int, None) or get_memory_mb()
+        return [cpu_budget, mem_mb_budget]
+
+    @staticmethod
+    def _configure_advisory_cache(scan_config: dict) -> None:
+        """persistent cache of osv / pypi / nvd lookups, configured via scan.ADVISORY_CACHE_* config"""
+        AdvisoryCache.set_instance(
+            get_config_key(scan_config, "ADVISORY_CACHE_TTL_SEC", int, DEFAULT_ADVISORY_CACHE_TTL_SEC),
+            get_config_key(scan_config, "ADVISORY_CACHE_SOURCE_TTL_SEC", dict, {}),
+            get_config_key(scan_config, "ADVISORY_CACHE_STALE_WHILE_REVALIDATE", bool, False),
+        )
 
     async def run_reports(self, scan_results: list, reports: list = None, scan_type: str = None) -> None:
         """starting reporting scan results"""
@@ -82,5 +182,24 @@ class EzeCore:
             reports = ["console"]
         #
         reporter_manager = ReporterManager.get_instance()
+        concurrent_reports = [x for x in reports if reporter_manager.is_concurrent_reporter(x)]
+        ordered_reports = [x for x in reports if x not in concurrent_reports]
+        errors = {}
+
+        async def run_report(reporter_name: str) -> None:
+            # INFO: every error captured, so a failing reporter doesn't escape gather while other uploads still run
+            try:
+                await reporter_manager.run_report(scan_results, reporter_name, scan_type)
+            except Exception as error:  # pylint: disable=broad-except
+                errors[reporter_name] = error
+
+        # INFO: file / upload reporters ran concurrently, then console / quality reporters in config order
+        # so console output is deterministic and quality gate exits last, errors raised in config order
+        await asyncio.gather(*[run_report(reporter_name) for reporter_name in concurrent_reports])
+        for reporter_name in ordered_reports:
+            await run_report(reporter_name)
+            if reporter_name in errors:
+                break
         for reporter_name in reports:
-            await reporter_manager.run_report(scan_results, reporter_name, scan_type)
+            if reporter_name in errors:
+                raise errors[reporter_name]
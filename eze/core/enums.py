@@ -1,8 +1,11 @@
 # pylint: disable=invalid-name
 
 """Eze's core enums module"""
+import re
+import sys
 from enum import Enum
-from pydash import py_
+from functools import lru_cache
+
 from eze.utils.config import get_config_key
 from eze.utils.io.file import normalise_linux_file_path
 
@@ -105,6 +108,17 @@ All modes will also warn on "unprofessional", "deprecated", and "permissive with
     "help_example": "PROPRIETARY",
 }
 
+USE_SOURCE_COPY_CONFIG = {
+    "type": bool,
+    "default": True,
+    "environment_variable": "USE_SOURCE_COPY",
+    "help_text": """speeds up SAST tools by using copied folder with no binary/dependencies assets
+for mono-repos can speed up scans from 800s to 30s, by avoiding common dependencies such as node_modules
+stored: TMP/.eze/cached-workspace/<project hash>, kept between runs so only changed files are re-synced
+files are hardlinked where supported, so tools writing into the copy (aka autofix) also change the real files,
+set EZE_SOURCE_COPY_HARDLINKS=false to always copy files instead""",
+}
+
 LICENSE_ALLOWLIST_CONFIG = {
     "type": list,
     "default": [],
@@ -121,79 +135,151 @@ LICENSE_DENYLIST_CONFIG = {
 
 
 class Vulnerability:
-    """Wrapper around raw dict to provide easy code typing"""
+    """Wrapper around raw dict to provide easy code typing
+
+    slotted with interned enum-like strings, as secret / sast scans of large repos can produce 100,000s of these"""
+
+    __slots__ = (
+        "vulnerability_type",
+        "name",
+        "overview",
+        "recommendation",
+        "severity",
+        "confidence",
+        "is_ignored",
+        "is_excluded",
+        "identifiers",
+        "file_location",
+        "version",
+        "references",
+        "metadata",
+    )
 
     def __init__(self, vo: dict):
         """constructor"""
+        # INFO: inlined equivalent of get_config_key, as called for every vulnerability
+        vo_get = vo.get
         # aka generic / dependency / secret
-        self.vulnerability_type: str = get_config_key(vo, "vulnerability_type", str, VulnerabilityType.generic.name)
+        self.vulnerability_type: str = sys.intern(
+            _typed(vo_get("vulnerability_type"), str, VulnerabilityType.generic.name)
+        )
         # package name for SCA
         # file name for SAST
-        self.name: str = get_config_key(vo, "name", str, "")
+        self.name: str = _typed(vo_get("name"), str, "")
         # description of issue for SCA/SAST
-        self.overview: str = get_config_key(vo, "overview", str, "")
+        self.overview: str = _typed(vo_get("overview"), str, "")
         # [optional] mitigation recommendations for SCA/SAST
-        self.recommendation: str = get_config_key(vo, "recommendation", str, "")
-        self.severity: str = get_config_key(vo, "severity", str, "").lower()
-        self.confidence: str = get_config_key(vo, "confidence", str, "").lower()
-        self.is_ignored: bool = get_config_key(vo, "is_ignored", bool, False)
-        self.is_excluded: bool = get_config_key(vo, "is_excluded", bool, False)
+        self.recommendation: str = _typed(vo_get("recommendation"), str, "")
+        self.severity: str = sys.intern(_typed(vo_get("severity"), str, "").lower())
+        self.confidence: str = sys.intern(_typed(vo_get("confidence"), str, "").lower())
+        self.is_ignored: bool = _typed(vo_get("is_ignored"), bool, False)
+        self.is_excluded: bool = _typed(vo_get("is_excluded"), bool, False)
         # [optional] containers cve/cwe info
-        self.identifiers: dict = get_config_key(vo, "identifiers", dict, {})
+        self.identifiers: dict = _typed(vo_get("identifiers"), dict, {})
         # [optional] pair of File/Line
-        self.file_location: dict = get_config_key(vo, "file_location", dict, None)
+        self.file_location: dict = _typed(vo_get("file_location"), dict, None)
+        if self.file_location and isinstance(self.file_location.get("path"), str):
+            # many findings share a few files, so share one copy of each path
+            self.file_location["path"] = sys.intern(self.file_location["path"])
         # [optional] version of object under test
-        self.version: str = get_config_key(vo, "version", str, "")
+        self.version: str = _typed(vo_get("version"), str, "")
         # [optional] list of reference urls
-        self.references: list = get_config_key(vo, "references", list, [])
+        references = vo_get("references")
+        self.references: list = [references] if isinstance(references, str) else _typed(references, list, [])
         # misc container
-        self.metadata: dict = get_config_key(vo, "metadata", dict, None)
+        self.metadata: dict = _typed(vo_get("metadata"), dict, None)
+
+    @property
+    def __dict__(self) -> dict:
+        """attributes as dict, so vulnerabilities still serialise via json.dumps(default=vars)"""
+        return {x: getattr(self, x) for x in Vulnerability.__slots__}
 
     def update_ignored(self, tool_config: dict) -> bool:
         """detect if vulnerability is to be ignored"""
-        # TODO: move function to util
-        if self.is_ignored:
-            self.is_ignored = True
-            return True
-        if self.name in tool_config["IGNORED_VULNERABILITIES"]:
-            self.is_ignored = True
-            return True
-        for identifier_key in self.identifiers:
-            identifier_value = self.identifiers[identifier_key]
-            if identifier_value in tool_config["IGNORED_VULNERABILITIES"]:
-                self.is_ignored = True
-                return True
-        file_location = py_.get(self, "file_location.path", False)
-        if file_location:
-            file_location = normalise_linux_file_path(file_location)
-            for ignored_path in tool_config["IGNORED_FILES"]:
-                if file_location.startswith(ignored_path):
-                    self.is_ignored = True
-                    return True
-        severity_level = VulnerabilitySeverityEnum[self.severity].value
-        if severity_level > tool_config["IGNORE_BELOW_SEVERITY_INT"]:
-            self.is_ignored = True
-            return True
-        self.is_ignored = False
-        return False
+        return VulnerabilityMatcher(tool_config).update_ignored(self)
 
     def update_excluded(self, tool_config: dict) -> bool:
         """detect if vulnerability is to be excluded"""
-        # TODO: move function to util
-        if self.is_excluded:
-            self.is_excluded = True
-            return True
-
-        file_location = py_.get(self, "file_location.path", False)
-        if file_location:
-            file_location = normalise_linux_file_path(file_location)
-            for excluded_path in tool_config["EXCLUDE"]:
-                if file_location.startswith(excluded_path):
-                    self.is_excluded = True
-                    return True
+        return VulnerabilityMatcher(tool_config).update_excluded(self)
+
+
+def _typed(value, value_type: type, default):
+    """value if of given type, otherwise default"""
+    return value if isinstance(value, value_type) else default
 
-        self.is_excluded = False
-        return False
+
+class VulnerabilityMatcher:
+    """Tool's ignore / exclude config compiled once, for matching many vulnerabilities
+
+    ignored ids in a frozenset, ignored / excluded path prefixes each as one compiled regex"""
+
+    def __init__(self, tool_config: dict):
+        """constructor"""
+        self.ignored_ids: frozenset = frozenset(tool_config.get("IGNORED_VULNERABILITIES") or [])
+        self.ignored_files_regex = _compile_prefix_regex(tuple(tool_config.get("IGNORED_FILES") or []))
+        self.excluded_files_regex = _compile_prefix_regex(tuple(tool_config.get("EXCLUDE") or []))
+        self.ignore_below_severity_int: int = tool_config.get(
+            "IGNORE_BELOW_SEVERITY_INT", VulnerabilitySeverityEnum.na.value
+        )
+        # findings are often clustered in a few files, so normalised paths are memoised
+        self.normalised_paths: dict = {}
+
+    def filter(self, vulnerabilities: list) -> list:
+        """update ignored / excluded status of vulnerabilities in one pass, returns non excluded vulnerabilities"""
+        filtered_vulnerabilities = []
+        for vulnerability in vulnerabilities:
+            self.update_ignored(vulnerability)
+            if not self.update_excluded(vulnerability):
+                filtered_vulnerabilities.append(vulnerability)
+        return filtered_vulnerabilities
+
+    def update_ignored(self, vulnerability: Vulnerability) -> bool:
+        """detect if vulnerability is to be ignored"""
+        vulnerability.is_ignored = vulnerability.is_ignored or self._is_ignored(vulnerability)
+        return vulnerability.is_ignored
+
+    def update_excluded(self, vulnerability: Vulnerability) -> bool:
+        """detect if vulnerability is to be excluded"""
+        vulnerability.is_excluded = vulnerability.is_excluded or self._is_excluded(vulnerability)
+        return vulnerability.is_excluded
+
+    def _is_ignored(self, vulnerability: Vulnerability) -> bool:
+        """vulnerability matches ignored ids, files or severity"""
+        if self.ignored_ids:
+            if vulnerability.name in self.ignored_ids:
+                return True
+            for identifier in vulnerability.identifiers.values():
+                if isinstance(identifier, str) and identifier in self.ignored_ids:
+                    return True
+        if self.ignored_files_regex:
+            file_location = self._get_normalised_path(vulnerability)
+            if file_location and self.ignored_files_regex.match(file_location):
+                return True
+        return VulnerabilitySeverityEnum[vulnerability.severity].value > self.ignore_below_severity_int
+
+    def _is_excluded(self, vulnerability: Vulnerability) -> bool:
+        """vulnerability matches excluded files"""
+        if not self.excluded_files_regex:
+            return False
+        file_location = self._get_normalised_path(vulnerability)
+        return bool(file_location and self.excluded_files_regex.match(file_location))
+
+    def _get_normalised_path(self, vulnerability: Vulnerability) -> str:
+        """linux style path of vulnerability's file, None if vulnerability has no file"""
+        file_location = vulnerability.file_location.get("path") if vulnerability.file_location else None
+        if not file_location:
+            return None
+        if file_location not in self.normalised_paths:
+            self.normalised_paths[file_location] = normalise_linux_file_path(file_location)
+        return self.normalised_paths[file_location]
+
+
+@lru_cache(maxsize=32)
+def _compile_prefix_regex(prefixes: tuple):
+    """single regex matching any of prefixes, None when no prefixes"""
+    if not prefixes:
+        return None
+    return re.compile("|".join(re.escape(x) for x in prefixes))
 
 
 class Component:
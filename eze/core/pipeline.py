@@ -0,0 +1,107 @@
+"""Pipeline of shared setup stages (aka npm install, source copy), ran once before the tools which depend on them"""
+import asyncio
+import inspect
+from typing import Callable
+
+from eze.utils.error import EzeConfigError
+from eze.utils.io.file_scanner import cache_workspace_into_tmp
+from eze.utils.language.dotnet import restore_dotnet_projects
+from eze.utils.language.java import resolve_maven_projects
+from eze.utils.language.node import install_npm_projects
+from eze.utils.log import log_debug
+
+
+class PipelineStage:
+    """Shared setup step, which can depend on other stages"""
+
+    def __init__(self, name: str, action: Callable, depends_on: list = None):
+        """constructor, action can be a sync or async callable"""
+        self.name: str = name
+        self.action: Callable = action
+        self.depends_on: list = depends_on or []
+
+
+class Pipeline:
+    """DAG of PipelineStages
+
+    each stage is ran at most once per pipeline, after all of its dependencies,
+    independent stages are ran concurrently"""
+
+    def __init__(self, stages: list = None):
+        """constructor"""
+        self.stages: dict = {}
+        self._tasks: dict = {}
+        for stage in stages or []:
+            self.add_stage(stage)
+
+    def add_stage(self, stage: PipelineStage) -> None:
+        """register stage, replacing any stage with the same name"""
+        self.stages[stage.name] = stage
+
+    def get_stage_order(self, stage_names: list) -> list:
+        """
+        topologically sorted list of stages required to run given stages, dependencies first
+
+        :raises EzeConfigError
+        """
+        ordered: list = []
+        visiting: list = []
+
+        def visit(stage_name: str) -> None:
+            if stage_name in ordered:
+                return
+            if stage_name in visiting:
+                cycle = " -> ".join(visiting[visiting.index(stage_name) :] + [stage_name])
+                raise EzeConfigError(f"pipeline stages have a circular dependency: {cycle}")
+            if stage_name not in self.stages:
+                raise EzeConfigError(f"unknown pipeline stage '{stage_name}'")
+            visiting.append(stage_name)
+            for dependency_name in self.stages[stage_name].depends_on:
+                visit(dependency_name)
+            visiting.pop()
+            ordered.append(stage_name)
+
+        for stage_name in stage_names:
+            visit(stage_name)
+        return ordered
+
+    async def run_stages(self, stage_names: list) -> None:
+        """
+        run given stages and their dependencies, stages already ran (or running) are awaited not re-ran
+
+        :raises EzeConfigError
+        :raises EzeError
+        """
+        self.get_stage_order(stage_names)
+        await asyncio.gather(*[self._get_stage_task(stage_name) for stage_name in stage_names])
+
+    def _get_stage_task(self, stage_name: str) -> asyncio.Future:
+        """get shared task for stage, starting it on first request"""
+        if stage_name not in self._tasks:
+            self._tasks[stage_name] = asyncio.ensure_future(self._run_stage(self.stages[stage_name]))
+        return self._tasks[stage_name]
+
+    async def _run_stage(self, stage: PipelineStage) -> None:
+        """run stage once its dependencies have completed"""
+        await asyncio.gather(*[self._get_stage_task(dependency_name) for dependency_name in stage.depends_on])
+        log_debug(f"running pipeline stage '{stage.name}'")
+        result = stage.action()
+        if inspect.isawaitable(result):
+            await result
+        log_debug(f"finished pipeline stage '{stage.name}'")
+
+
+async def copy_workspace() -> None:
+    """copy workspace into tmp folder (USE_SOURCE_COPY), off the event loop as it's io heavy"""
+    loop = asyncio.get_event_loop()
+    await loop.run_in_executor(None, cache_workspace_into_tmp)
+
+
+def get_default_stages() -> list:
+    """shared setup stages available to tools via ToolMeta.PIPELINE_STAGES"""
+    return [
+        PipelineStage("npm-install", install_npm_projects),
+        PipelineStage("workspace-copy", copy_workspace),
+        PipelineStage("maven-resolve", resolve_maven_projects),
+        PipelineStage("dotnet-restore", restore_dotnet_projects),
+    ]
@@ -4,11 +4,12 @@ import time
 from abc import abstractmethod
 from typing import Callable
 
-from eze.core.config import EzeConfig, PluginMeta
+from eze.core.config import EzeConfig, PluginMeta, check_installed_versions
 from eze.utils.config import extract_embedded_run_type, create_config_help
 from eze.utils.io.print import pretty_print_table
 from eze.utils.error import EzeConfigError
 from eze.utils.log import log, log_debug, log_error
+from eze.utils.package import PluginRegistry, is_valid_plugin
 
 
 class ReporterManager:
@@ -39,7 +40,7 @@ class ReporterManager:
         if plugins is None:
             plugins = []
         #
-        self.reporters = {}
+        self.reporters: PluginRegistry = PluginRegistry(base_class=ReporterMeta)
         for plugin_name in plugins:
             plugin = plugins[plugin_name]
             if not hasattr(plugin, "get_reporters") or not isinstance(plugin.get_reporters, Callable):
@@ -64,6 +65,16 @@ class ReporterManager:
         duration_sec = toc - tic
         log_debug(f"\nReport '{reporter_name}' took {duration_sec:0.1f} seconds")
 
+    def is_concurrent_reporter(self, reporter_name: str) -> bool:
+        """reporter can run alongside other reporters, unknown reporters ran in order so config errors stay ordered"""
+        [reporter_name, _] = extract_embedded_run_type(reporter_name)
+        if reporter_name not in self.reporters:
+            return False
+        try:
+            return self.reporters[reporter_name].CONCURRENT_REPORT
+        except EzeConfigError:
+            return False
+
     def get_reporter(self, reporter_name: str, scan_type: str = None, run_type: str = None):
         """
         Gets a instance of a reporter, populated with it's configuration
@@ -82,7 +93,7 @@ class ReporterManager:
         """adds new tools to tools registry"""
         for reporter_name in reporters:
             reporter = reporters[reporter_name]
-            if issubclass(reporter, ReporterMeta):
+            if is_valid_plugin(reporter, ReporterMeta):
                 if not hasattr(self.reporters, reporter_name):
                     log_debug(f"-- installing reporter '{reporter_name}'")
                     self.reporters[reporter_name] = reporter
@@ -116,9 +127,10 @@ class ReporterManager:
 ======================="""
         )
         reporters = []
+        reporter_versions = check_installed_versions(self.reporters)
         for reporter_name in self.reporters:
             reporter_class: ReporterMeta = self.reporters[reporter_name]
-            reporter_version = reporter_class.check_installed() or "Not Installed"
+            reporter_version = reporter_versions[reporter_name] or "Not Installed"
             reporter_license = reporter_class.license()
             reporter_description = reporter_class.short_description()
             reporters.append(
@@ -178,6 +190,8 @@ class ReporterMeta(PluginMeta):
     """Base class for all reporter implementations"""
 
     REPORTER_NAME: str = "AbstractReporter"
+    # reporters writing files / uploading can run alongside each other, console output and quality gates can't
+    CONCURRENT_REPORT: bool = False
 
     REPORTER_CONFIG = {}
 
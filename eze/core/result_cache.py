@@ -0,0 +1,71 @@
+"""Content addressed cache of tool ScanResults
+
+keyed on tool name and version, normalised tool config, and a hash of the input files the tool declares
+"""
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+import click
+
+from eze.utils.io.file import hash_file
+from eze.utils.io.print import pretty_print_json
+from eze.utils.log import log_debug
+
+
+class ToolResultCache:
+    """Stores raw tool scan results (as json) under the eze app dir"""
+
+    def __init__(self, ttl_sec: int, cache_folder: Path = None):
+        """constructor, ttl_sec of 0 or less disables cache"""
+        self.ttl_sec: int = ttl_sec or 0
+        self.cache_folder: Path = cache_folder or ToolResultCache.get_default_cache_folder()
+
+    @staticmethod
+    def get_default_cache_folder() -> Path:
+        """Path of result cache folder, inside eze app dir"""
+        raw_path = click.get_app_dir("eze", roaming=False, force_posix=False)
+        return Path(raw_path) / "cache" / "results"
+
+    def is_enabled(self) -> bool:
+        """cache is enabled when given positive ttl"""
+        return self.ttl_sec > 0
+
+    @staticmethod
+    def create_key(tool_name: str, tool_version: str, tool_config: dict, input_files: list) -> str:
+        """sha256 key of tool, version, normalised config and content of input files"""
+        hasher = hashlib.sha256()
+        hasher.update(json.dumps([tool_name, tool_version], default=str).encode())
+        hasher.update(json.dumps(tool_config, default=str, sort_keys=True).encode())
+        for input_file in sorted(str(input_file) for input_file in input_files):
+            file_hash = hash_file(input_file) if os.path.isfile(input_file) else "missing"
+            hasher.update(f"\n{input_file}:{file_hash}".encode())
+        return hasher.hexdigest()
+
+    def get(self, key: str) -> dict:
+        """get cached raw scan result, None if missing or expired"""
+        cache_file = self.cache_folder / f"{key}.json"
+        try:
+            with open(cache_file, "r", encoding="utf-8") as json_file:
+                cache_entry = json.load(json_file)
+        except (OSError, ValueError):
+            return None
+        if time.time() - cache_entry.get("created", 0) > self.ttl_sec:
+            log_debug(f"result cache entry {key} expired")
+            return None
+        return cache_entry.get("scan_result")
+
+    def set(self, key: str, scan_result) -> None:
+        """store raw scan result, cache write failures are not fatal"""
+        cache_file = self.cache_folder / f"{key}.json"
+        tmp_cache_file = self.cache_folder / f"{key}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.cache_folder, exist_ok=True)
+            with open(tmp_cache_file, "w", encoding="utf-8") as json_file:
+                json_file.write(pretty_print_json({"created": time.time(), "scan_result": scan_result}))
+            # atomic replace, so parallel eze runs never read a partly written entry
+            os.replace(tmp_cache_file, cache_file)
+        except (OSError, TypeError, ValueError) as error:
+            log_debug(f"unable to write result cache entry {key}: {error}")
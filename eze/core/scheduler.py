@@ -0,0 +1,92 @@
+"""Resource aware scheduler, used for running tools in parallel without overloading the machine"""
+import asyncio
+import os
+from contextlib import asynccontextmanager
+
+from eze.utils.log import log_debug
+
+
+def get_cpu_count() -> int:
+    """detect number of cores available to eze, respects cpu affinity where supported (aka linux containers)"""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
+def get_memory_mb() -> int:
+    """detect total physical memory in mb, returns None when unable to detect (aka windows)"""
+    try:
+        return int(os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") / (1024 * 1024))
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+class ResourceScheduler:
+    """Packs running tasks against a cpu / memory budget and maximum number of parallel tasks
+
+    a task will start as soon as its resource profile fits into the remaining budget,
+    hence cheap tasks will fill the gaps left by expensive tasks,
+    tasks larger than the whole budget are ran on their own"""
+
+    def __init__(self, max_parallel: int = 1, cpu_budget: int = None, mem_mb_budget: int = None):
+        """constructor"""
+        self.max_parallel: int = max(max_parallel or 1, 1)
+        self.cpu_budget: int = cpu_budget
+        self.mem_mb_budget: int = mem_mb_budget
+        self.running: int = 0
+        self.cpu_used: int = 0
+        self.mem_mb_used: int = 0
+        self._condition = asyncio.Condition()
+
+    def normalise_profile(self, resource_profile: dict) -> dict:
+        """clamp resource profile to the budget, so oversized tasks can still be ran on their own"""
+        cpu = max(int(resource_profile.get("cpu", 0) or 0), 0)
+        mem_mb = max(int(resource_profile.get("mem_mb", 0) or 0), 0)
+        if self.cpu_budget:
+            cpu = min(cpu, self.cpu_budget)
+        if self.mem_mb_budget:
+            mem_mb = min(mem_mb, self.mem_mb_budget)
+        return {"cpu": cpu, "mem_mb": mem_mb}
+
+    def fits(self, resource_profile: dict) -> bool:
+        """if given normalised resource profile fits into the remaining budget"""
+        if self.running == 0:
+            return True
+        if self.running >= self.max_parallel:
+            return False
+        if self.cpu_budget and self.cpu_used + resource_profile["cpu"] > self.cpu_budget:
+            return False
+        if self.mem_mb_budget and self.mem_mb_used + resource_profile["mem_mb"] > self.mem_mb_budget:
+            return False
+        return True
+
+    async def acquire(self, resource_profile: dict) -> dict:
+        """wait until resource profile fits into budget and reserve it, returns normalised profile"""
+        normalised_profile = self.normalise_profile(resource_profile)
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.fits(normalised_profile))
+            self.running += 1
+            self.cpu_used += normalised_profile["cpu"]
+            self.mem_mb_used += normalised_profile["mem_mb"]
+        return normalised_profile
+
+    async def release(self, normalised_profile: dict) -> None:
+        """release previously acquired resources, and wake any waiting tasks"""
+        async with self._condition:
+            self.running -= 1
+            self.cpu_used -= normalised_profile["cpu"]
+            self.mem_mb_used -= normalised_profile["mem_mb"]
+            self._condition.notify_all()
+
+    @asynccontextmanager
+    async def reserve(self, resource_profile: dict, name: str = ""):
+        """context manager wrapping acquire and release"""
+        normalised_profile = await self.acquire(resource_profile)
+        log_debug(
+            f"scheduler starting '{name}' (cpu:{normalised_profile['cpu']}, mem_mb:{normalised_profile['mem_mb']}), "
+            f"using cpu:{self.cpu_used}/{self.cpu_budget or '-'} mem_mb:{self.mem_mb_used}/{self.mem_mb_budget or '-'}"
+        )
+        try:
+            yield normalised_profile
+        finally:
+            await self.release(normalised_profile)
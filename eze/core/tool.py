@@ -6,17 +6,28 @@ import os
 import time
 import math
 from abc import abstractmethod
+from pathlib import Path
 from typing import Callable
 
 from copy import deepcopy
 
+from pydash import py_
+
 from eze.core.reporter import ReporterManager
-from eze.core.config import EzeConfig, PluginMeta
-from eze.core.enums import VulnerabilitySeverityEnum, ToolType, Vulnerability
-from eze.utils.git import get_active_branch_name, get_active_branch_uri
+from eze.core.config import EzeConfig, PluginMeta, check_installed_versions
+from eze.core.enums import VulnerabilitySeverityEnum, ToolType, Vulnerability, VulnerabilityMatcher, Component
+from eze.core.result_cache import ToolResultCache
+from eze.utils.git import GitContext, get_changed_files, get_head_commit
 from eze.utils.cli.run import EzeExecutableNotFoundError
-from eze.utils.io.file import normalise_file_paths, create_folder
+from eze.utils.io.file import (
+    create_absolute_path,
+    create_folder,
+    load_partial_json,
+    normalise_file_paths,
+    normalise_linux_file_path,
+)
 from eze.utils.io.print import pretty_print_table
+from eze.utils.package import PluginRegistry, is_valid_plugin
 from eze.utils.config import (
     get_config_key,
     get_config_keys,
@@ -25,7 +36,12 @@ from eze.utils.config import (
 )
 from eze.utils.error import EzeError, EzeConfigError
 from eze.utils.log import log, log_debug, log_error, status_message, clear_status_message
-from eze.utils.io.file_scanner import IGNORED_FOLDERS
+from eze.utils.io.file_scanner import (
+    IGNORED_FOLDERS,
+    cache_changed_files_into_tmp,
+    cache_workspace_into_tmp,
+    find_files_by_names,
+)
 
 
 class ScanResult:
@@ -40,6 +56,12 @@ class ScanResult:
         # bom and boms in Cyclonedx format
         # https://cyclonedx.org/
         self.sboms: dict = get_config_key(vo, "sboms", dict, None)
+        # license annotated sbom components by project, computed once when sboms parsed and shared by reporters
+        self.components: dict = get_config_key(vo, "components", dict, None)
+        if self.components:
+            # rehydrate components if not Component Class
+            for project_name, components in self.components.items():
+                self.components[project_name] = [x if isinstance(x, Component) else Component(x) for x in components]
 
         raw_vulnerabilities = get_config_key(vo, "vulnerabilities", list, [])
         # rehydrate vulnerabilities if not Vulnerability Class
@@ -99,7 +121,32 @@ available levels: critical, high, medium, low, none, na""",
             "default": [],
             "help_text": """files or prefix folders to exclude in the scanning process""",
         },
+        "TIMEOUT_SEC": {
+            "type": int,
+            "help_text": """maximum seconds tool can run for, before it's killed and reported as a fatal error
+any partly written report will still be parsed, defaults to no timeout
+aka TIMEOUT_SEC = 600""",
+        },
+        "RESOURCE_PROFILE": {
+            "type": dict,
+            "help_text": """overrides cpu cores and memory (mb) the tool is expected to use,
+used when packing parallel tools against the machine's resources (see scan.MAX_PARALLEL_TOOLS)
+aka RESOURCE_PROFILE = { cpu = 4, mem_mb = 2000 }""",
+        },
     }
+    # expected cpu cores and memory (mb) used by tool, used when scheduling tools in parallel
+    RESOURCE_PROFILE: dict = {"cpu": 1, "mem_mb": 256}
+    # shared setup stages tool depends on, ran once before tool, see eze.core.pipeline
+    PIPELINE_STAGES: list = []
+    # filename regexes of files tool's result depends on (aka lockfiles), used as result cache key
+    # None when tool can't be cached, aka depends on container images, git history or live advisory / registry data
+    CACHE_INPUT_FILES: list = None
+    # file-granular tools (findings only depend on the file they're in) can scan just changed files, see --changed-since
+    INCREMENTAL_SCAN: bool = False
+    # REPORT_FILE is json that parse_report can read when truncated (aka list of findings), see parse_partial_report
+    PARSE_PARTIAL_REPORT: bool = False
+    # files to scan in incremental mode, set by ToolManager, None for full scan
+    changed_files: list = None
 
     DEFAULT_IGNORED_LOCATIONS: list = IGNORED_FOLDERS
 
@@ -133,6 +180,37 @@ available levels: critical, high, medium, low, none, na""",
         :raises EzeError
         """
 
+    def pipeline_stages(self) -> list:
+        """Returns shared setup stages tool depends on, plus source copy when USE_SOURCE_COPY"""
+        pipeline_stages = list(self.PIPELINE_STAGES)
+        if self.config.get("USE_SOURCE_COPY") and "workspace-copy" not in pipeline_stages:
+            pipeline_stages.append("workspace-copy")
+        return pipeline_stages
+
+    def cache_input_files(self) -> list:
+        """Returns files tool's result depends on, None if tool's result can't be cached
+
+        SCA_ENABLED results depend on live advisory data, so aren't cached, as newly published advisories would be hidden
+        """
+        if self.CACHE_INPUT_FILES is None or self.config.get("SCA_ENABLED"):
+            return None
+        return sorted(set(find_files_by_names(self.CACHE_INPUT_FILES))) if self.CACHE_INPUT_FILES else []
+
+    def source_folder(self) -> Path:
+        """Returns folder to scan from, copy of changed files when incremental scanning,
+        otherwise source copy if USE_SOURCE_COPY, or None for cwd"""
+        if self.changed_files is not None:
+            return cache_changed_files_into_tmp(self.changed_files)
+        return cache_workspace_into_tmp() if self.config.get("USE_SOURCE_COPY") else None
+
+    def parse_partial_report(self) -> ScanResult:
+        """Returns ScanResult recovered from partly written REPORT_FILE after a timeout, None if unsupported or unusable"""
+        report_file = self.config.get("REPORT_FILE")
+        if not self.PARSE_PARTIAL_REPORT or not report_file:
+            return None
+        parsed_json = load_partial_json(create_absolute_path(report_file))
+        return self.parse_report(parsed_json) if parsed_json else None
+
     def prepare_folder(self) -> None:
         """Create a reports folder for the plugin report if it does not exist"""
         report_path = self.config.get("REPORT_FILE", None)
@@ -168,7 +246,10 @@ class ToolManager:
         if plugins is None:
             plugins = {}
         #
-        self.tools = {}
+        self.tools: PluginRegistry = PluginRegistry(base_class=ToolMeta)
+        # (scan_type, run_type) -> tool / reporter output files, recomputed when EzeConfig refreshed
+        self._output_files: dict = {}
+        self._output_files_config: EzeConfig = None
         for plugin_name in plugins:
             plugin = plugins[plugin_name]
             if not hasattr(plugin, "get_tools") or not isinstance(plugin.get_tools, Callable):
@@ -177,18 +258,93 @@ class ToolManager:
             plugin_tools = plugin.get_tools()
             self._add_tools(plugin_tools)
 
-    async def run_tool(self, tool_name: str, scan_type: str = None, run_type: str = None) -> ScanResult:
+    async def run_tool(
+        self,
+        tool_name: str,
+        scan_type: str = None,
+        run_type: str = None,
+        changed_since: str = None,
+        tool_version: str = None,
+    ) -> ScanResult:
         """
         Runs a instance of a tool, populated with it's configuration
 
+        when changed_since git ref given, incremental tools only scan changed files (see _run_incremental_scan)
+        tool_version is the tool's installed version when already checked, otherwise checked once when result caching
+
         :raises EzeConfigError
         """
         tic = time.perf_counter()
         [tool_name, run_type] = extract_embedded_run_type(tool_name, run_type)
         tool_instance = self.get_tool(tool_name, scan_type, run_type)
         tool_instance.prepare_folder()
+        result_cache = self._get_result_cache(scan_type)
+        if tool_version is None and result_cache.is_enabled():
+            # INFO: version is part of result cache keys, resolved once per run as checks spawn processes
+            tool_version = self.tools[tool_name].check_installed()
+        is_incremental = self._is_incremental_scan(tool_instance, result_cache, changed_since)
+        if changed_since and tool_instance.INCREMENTAL_SCAN and not is_incremental:
+            log_error(
+                f"[{tool_name}] --changed-since ignored as result cache is disabled (set RESULT_CACHE_TTL_SEC), "
+                "running full scan"
+            )
+        if is_incremental:
+            scan_result = await self._run_incremental_scan(
+                tool_instance, tool_name, run_type, tool_version, result_cache, changed_since, tic
+            )
+        else:
+            scan_result = await self._run_cached_scan(
+                tool_instance, tool_name, run_type, tool_version, result_cache, tic
+            )
+
+        toc = time.perf_counter()
+        # annotation raw scan result
+        if not scan_result:
+            scan_result = ScanResult(
+                {
+                    "tool": tool_instance.TOOL_NAME,
+                    "fatal_errors": ["Not scan result received"],
+                }
+            )
+        if not scan_result.tool:
+            scan_result.tool = tool_instance.TOOL_NAME
+
+        git_context = GitContext.get_instance()
+        scan_result.run_details = {
+            "tool_name": tool_name,
+            "tool_url": tool_instance.TOOL_URL,
+            "tool_type": tool_instance.TOOL_TYPE.value,
+            "scan_type": scan_type,
+            "run_type": run_type,
+            "duration_sec": toc - tic,
+            "date": tic,
+            "git_repo": git_context.branch_uri,
+            "git_branch": git_context.branch_name,
+        }
+        # get tool config for ignore list
+        tool_config = self._get_tool_config(tool_name, scan_type, run_type)
+        # normalise vulnerabilities list
+        scan_result.vulnerabilities = self._normalise_vulnerabilities(scan_result.vulnerabilities, tool_config)
+        # create counts of vulnerabilities
+        scan_result.summary = self._create_summary(scan_result.vulnerabilities, tool_config)
+        return scan_result
+
+    def get_tool_class(self, tool_name: str) -> ToolMeta:
+        """
+        Gets a instance of a tool class
+
+        :raises EzeConfigError
+        """
+        if tool_name not in self.tools:
+            raise EzeConfigError(f"tool id: {tool_name} does not exist")
+        tool_class = self.tools[tool_name]
+        return tool_class
+
+    async def _run_scan(self, tool_instance: ToolMeta, tool_name: str, tic: float) -> ScanResult:
+        """run tool's scan, converting errors and timeouts into fatal errors on ScanResult"""
+        timeout_sec = get_config_key(tool_instance.config, "TIMEOUT_SEC", int, None)
         try:
-            process = {"scan_result": None}
+            process = {"scan_result": None, "timed_out": False}
 
             async def run_counter(what: str, delay: int = 1):
                 status_message(what)
@@ -201,7 +357,9 @@ class ToolManager:
 
             async def run_process():
                 try:
-                    process["scan_result"] = await tool_instance.run_scan()
+                    process["scan_result"] = await asyncio.wait_for(tool_instance.run_scan(), timeout_sec or None)
+                except asyncio.TimeoutError:
+                    process["timed_out"] = True
                 finally:
                     run_counter_task.cancel()
 
@@ -213,6 +371,8 @@ class ToolManager:
             except asyncio.exceptions.CancelledError:
                 pass
             scan_result: ScanResult = process["scan_result"]
+            if process["timed_out"]:
+                scan_result = self._timed_out_scan_result(tool_instance, tool_name, timeout_sec)
         except EzeExecutableNotFoundError as error:
             # Special Case:
             # If executable not installed print "install help"
@@ -243,51 +403,198 @@ Looks like {tool_name} is not installed
                     "fatal_errors": [f"{error}"],
                 }
             )
-
-        toc = time.perf_counter()
-        # annotation raw scan result
-        if not scan_result:
-            scan_result = ScanResult(
+        except Exception as error:  # pylint: disable=broad-except
+            # INFO: tools can be ran in parallel, an unexpected crash shouldn't take down the other tools
+            log_error(f"[{tool_name}] crashed unexpectedly: {error}")
+            scan_result: ScanResult = ScanResult(
                 {
                     "tool": tool_instance.TOOL_NAME,
-                    "fatal_errors": ["Not scan result received"],
+                    "fatal_errors": [f"{tool_name} crashed unexpectedly: {error}"],
                 }
             )
-        if not scan_result.tool:
-            scan_result.tool = tool_instance.TOOL_NAME
 
-        git_dir = os.getcwd()
-        git_repo = get_active_branch_uri(git_dir)
-        git_branch = get_active_branch_name(git_dir)
-        scan_result.run_details = {
-            "tool_name": tool_name,
-            "tool_url": tool_instance.TOOL_URL,
-            "tool_type": tool_instance.TOOL_TYPE.value,
-            "scan_type": scan_type,
-            "run_type": run_type,
-            "duration_sec": toc - tic,
-            "date": tic,
-            "git_repo": git_repo,
-            "git_branch": git_branch,
-        }
-        # get tool config for ignore list
-        tool_config = self._get_tool_config(tool_name, scan_type, run_type)
-        # normalise vulnerabilities list
-        scan_result.vulnerabilities = self._normalise_vulnerabilities(scan_result.vulnerabilities, tool_config)
-        # create counts of vulnerabilities
-        scan_result.summary = self._create_summary(scan_result.vulnerabilities, tool_config)
         return scan_result
 
-    def get_tool_class(self, tool_name: str) -> ToolMeta:
+    async def _run_cached_scan(
+        self,
+        tool_instance: ToolMeta,
+        tool_name: str,
+        run_type: str,
+        tool_version: str,
+        result_cache: ToolResultCache,
+        tic: float,
+    ) -> ScanResult:
+        """run tool's scan, unless result cache has a result for the same tool version, config and input files"""
+        result_cache_key = self._get_result_cache_key(result_cache, tool_instance, tool_name, run_type, tool_version)
+        cached_scan_result = result_cache.get(result_cache_key) if result_cache_key else None
+        if cached_scan_result:
+            log_debug(f"[{tool_name}] using cached result {result_cache_key}")
+            return ScanResult(cached_scan_result)
+        scan_result = await self._run_scan(tool_instance, tool_name, tic)
+        if result_cache_key and scan_result and not scan_result.fatal_errors:
+            result_cache.set(result_cache_key, scan_result)
+        self._set_baseline_result(result_cache, tool_instance, tool_name, run_type, tool_version, scan_result)
+        return scan_result
+
+    async def _run_incremental_scan(
+        self,
+        tool_instance: ToolMeta,
+        tool_name: str,
+        run_type: str,
+        tool_version: str,
+        result_cache: ToolResultCache,
+        changed_since: str,
+        tic: float,
+    ) -> ScanResult:
         """
-        Gets a instance of a tool class
+        scan only files changed since git ref, merging in baseline findings for unchanged files
+
+        baseline is the tool's last cached full or incremental result, files changed since the baseline's
+        commit are also rescanned, falls back to a full scan when there's no usable baseline
+        """
+        baseline_key = self._get_baseline_cache_key(result_cache, tool_instance, tool_name, run_type, tool_version)
+        baseline = result_cache.get(baseline_key) or {}
+        baseline_commit = baseline.get("git_commit")
+        changed_files = None
+        if not baseline_commit:
+            log(f"[{tool_name}] no cached baseline result to merge with, running full scan")
+        else:
+            try:
+                changed_files = set(get_changed_files(changed_since))
+                if baseline_commit != get_head_commit():
+                    changed_files.update(get_changed_files(baseline_commit))
+                changed_files = sorted(changed_files)
+            except EzeError as error:
+                log_error(f"[{tool_name}] {error}, running full scan")
+                changed_files = None
+        if changed_files is None:
+            scan_result = await self._run_scan(tool_instance, tool_name, tic)
+            self._set_baseline_result(result_cache, tool_instance, tool_name, run_type, tool_version, scan_result)
+            return scan_result
+
+        log_debug(f"[{tool_name}] incremental scan of {len(changed_files)} files changed since '{changed_since}'")
+        if changed_files:
+            tool_instance.changed_files = changed_files
+            scan_result = await self._run_scan(tool_instance, tool_name, tic)
+        else:
+            scan_result = ScanResult({"tool": tool_instance.TOOL_NAME})
+        if scan_result and not scan_result.fatal_errors:
+            scan_result = self._merge_incremental_scan_result(
+                ScanResult(baseline["scan_result"]), scan_result, changed_files
+            )
+            self._set_baseline_result(result_cache, tool_instance, tool_name, run_type, tool_version, scan_result)
+        return scan_result
+
+    @staticmethod
+    def _merge_incremental_scan_result(
+        baseline_result: ScanResult, scan_result: ScanResult, changed_files: list
+    ) -> ScanResult:
+        """combine findings of incremental scan with baseline findings in unchanged files"""
+        changed_paths = set(os.path.normpath(changed_file) for changed_file in changed_files)
+        unchanged_vulnerabilities = []
+        for vulnerability in baseline_result.vulnerabilities:
+            file_path = py_.get(vulnerability, "file_location.path", None)
+            if file_path and os.path.normpath(normalise_linux_file_path(file_path)) not in changed_paths:
+                unchanged_vulnerabilities.append(vulnerability)
+        scan_result.vulnerabilities = unchanged_vulnerabilities + scan_result.vulnerabilities
+        return scan_result
+
+    @staticmethod
+    def _get_baseline_cache_key(
+        result_cache: ToolResultCache, tool_instance: ToolMeta, tool_name: str, run_type: str, tool_version: str
+    ) -> str:
+        """result cache key of tool's baseline for incremental scans, only depends on tool version and config"""
+        return result_cache.create_key(f"{tool_name}:{run_type}:baseline", tool_version, tool_instance.config, [])
+
+    def _set_baseline_result(
+        self,
+        result_cache: ToolResultCache,
+        tool_instance: ToolMeta,
+        tool_name: str,
+        run_type: str,
+        tool_version: str,
+        scan_result: ScanResult,
+    ) -> None:
+        """store result of incremental tool as baseline for future --changed-since scans"""
+        if not tool_instance.INCREMENTAL_SCAN or not result_cache.is_enabled():
+            return
+        if not scan_result or scan_result.fatal_errors:
+            return
+        git_commit = get_head_commit()
+        if not git_commit:
+            return
+        baseline_key = self._get_baseline_cache_key(result_cache, tool_instance, tool_name, run_type, tool_version)
+        result_cache.set(baseline_key, {"git_commit": git_commit, "scan_result": scan_result})
+
+    @staticmethod
+    def _is_incremental_scan(tool_instance: ToolMeta, result_cache: ToolResultCache, changed_since: str = None) -> bool:
+        """incremental scans need a cached baseline to merge changed files into, hence require the result cache"""
+        return bool(changed_since and tool_instance.INCREMENTAL_SCAN and result_cache.is_enabled())
+
+    @staticmethod
+    def _get_result_cache(scan_type: str = None) -> ToolResultCache:
+        """result cache, enabled via scan.RESULT_CACHE_TTL_SEC"""
+        try:
+            scan_config = EzeConfig.get_instance().get_scan_config(scan_type)
+        except EzeConfigError:
+            scan_config = {}
+        return ToolResultCache(get_config_key(scan_config, "RESULT_CACHE_TTL_SEC", int, 0))
+
+    @staticmethod
+    def _get_result_cache_key(
+        result_cache: ToolResultCache, tool_instance: ToolMeta, tool_name: str, run_type: str, tool_version: str
+    ) -> str:
+        """result cache key, None when cache disabled or tool doesn't declare its input files"""
+        if not result_cache.is_enabled():
+            return None
+        input_files = tool_instance.cache_input_files()
+        if input_files is None:
+            return None
+        return result_cache.create_key(f"{tool_name}:{run_type}", tool_version, tool_instance.config, input_files)
+
+    @staticmethod
+    def _timed_out_scan_result(tool_instance: ToolMeta, tool_name: str, timeout_sec: int) -> ScanResult:
+        """ScanResult for tool killed by TIMEOUT_SEC, includes findings from any partly written report"""
+        error_message = f"{tool_name} timed out after {timeout_sec} seconds (TIMEOUT_SEC), results may be incomplete"
+        log_error(f"[{tool_name}] {error_message}")
+        scan_result: ScanResult = None
+        try:
+            scan_result = tool_instance.parse_partial_report()
+        except Exception as error:  # pylint: disable=broad-except
+            log_debug(f"[{tool_name}] unable to parse partial report: {error}")
+        if not scan_result:
+            scan_result = ScanResult({"tool": tool_instance.TOOL_NAME})
+        scan_result.fatal_errors.append(error_message)
+        return scan_result
+
+    def get_tool_resource_profile(self, tool_name: str, scan_type: str = None, run_type: str = None) -> dict:
+        """
+        Gets tool's resource profile, tool defaults overridden by any configured RESOURCE_PROFILE
 
         :raises EzeConfigError
         """
-        if tool_name not in self.tools:
-            raise EzeConfigError(f"tool id: {tool_name} does not exist")
-        tool_class = self.tools[tool_name]
-        return tool_class
+        [tool_name, run_type] = extract_embedded_run_type(tool_name, run_type)
+        tool_class = self.get_tool_class(tool_name)
+        tool_config = EzeConfig.get_instance().get_plugin_config(tool_name, scan_type, run_type)
+        resource_profile = {**ToolMeta.RESOURCE_PROFILE, **tool_class.RESOURCE_PROFILE}
+        resource_profile.update(get_config_key(tool_config, "RESOURCE_PROFILE", dict, {}))
+        return resource_profile
+
+    def get_tool_pipeline_stages(
+        self, tool_name: str, scan_type: str = None, run_type: str = None, changed_since: str = None
+    ) -> list:
+        """
+        Gets shared setup stages tool depends on, aka "npm-install"
+
+        incremental scans (changed_since) copy just the changed files, so don't need the full "workspace-copy"
+
+        :raises EzeConfigError
+        """
+        tool_instance = self.get_tool(tool_name, scan_type, run_type)
+        pipeline_stages = tool_instance.pipeline_stages()
+        if self._is_incremental_scan(tool_instance, self._get_result_cache(scan_type), changed_since):
+            pipeline_stages = [x for x in pipeline_stages if x != "workspace-copy"]
+        return pipeline_stages
 
     def get_tool(self, tool_name: str, scan_type: str = None, run_type: str = None) -> ToolMeta:
         """
@@ -316,10 +623,7 @@ Looks like {tool_name} is not installed
 ======================="""
         )
         tools = []
-        tools_counter = 0
-        tools_length = len(self.tools)
         for current_tool_name in self.tools:
-            tools_counter += 1
             current_tool_class = self.get_tool_class(current_tool_name)
             current_tool_type = current_tool_class.tool_type().name
             current_source_support = current_tool_class.source_support()
@@ -339,15 +643,19 @@ Looks like {tool_name} is not installed
             tool_entry["Type"] = current_tool_type
             tool_entry["Name"] = current_tool_name
             if include_version:
-                status_message(f"({tools_counter}/{tools_length}) obtaining '{current_tool_name}' tool version")
-                current_tool_version = current_tool_class.check_installed() or "Not Installed"
-                tool_entry["Version"] = current_tool_version
+                # INFO: placeholder keeps column order, versions checked in parallel below
+                tool_entry["Version"] = None
             tool_entry["License"] = current_tool_license
             if include_source_type:
                 tool_entry["Sources"] = current_source_support_str
             tool_entry["Description"] = current_tool_description
             tools.append(tool_entry)
 
+        if include_version:
+            status_message(f"obtaining {len(tools)} tool versions")
+            tool_versions = check_installed_versions({x["Name"]: self.tools[x["Name"]] for x in tools})
+            for tool_entry in tools:
+                tool_entry["Version"] = tool_versions[tool_entry["Name"]] or "Not Installed"
         clear_status_message()
         pretty_print_table(tools)
 
@@ -412,9 +720,8 @@ Tool '{tool_id}' Help
         # normalise any corrupted values
         for vulnerability in vulnerabilities:
             vulnerability.severity = self._get_severity(vulnerability, tool_config)
-            vulnerability.update_ignored(tool_config)
-            vulnerability.update_excluded(tool_config)
-        vulnerabilities = [x for x in vulnerabilities if not x.is_excluded]
+        # ignore / exclude config compiled once, then matched against all vulnerabilities in one pass
+        vulnerabilities = VulnerabilityMatcher(tool_config).filter(vulnerabilities)
         # sort by severity and ignored status
         vulnerabilities = self._sort_vulnerabilities(vulnerabilities)
         return vulnerabilities
@@ -436,16 +743,9 @@ Tool '{tool_id}' Help
         return summary
 
     def _sort_vulnerabilities(self, vulnerabilities: list) -> list:
-        """sort vulnerabilities by ignored, severity, title"""
-
-        def sort_heuristic(vulnerability: Vulnerability):
-            """sort heuristic function"""
-            sort_key: str = "b_" if vulnerability.is_ignored else "a_"
-            sort_key += str(VulnerabilitySeverityEnum[vulnerability.severity].value) + "_"
-            sort_key += str(vulnerability.name) + "_" + str(vulnerability.overview)
-            return sort_key
-
-        return sorted(vulnerabilities, key=sort_heuristic)
+        """sort vulnerabilities by ignored, severity, title, reporters output in this order without re-sorting"""
+        severity_ranks: dict = {x.name: x.value for x in VulnerabilitySeverityEnum}
+        return sorted(vulnerabilities, key=lambda x: (x.is_ignored, severity_ranks[x.severity], x.name, x.overview))
 
     def _get_severity(self, vulnerability: Vulnerability, tool_config: dict) -> str:
         """detect severity of vulnerability"""
@@ -456,9 +756,10 @@ Tool '{tool_id}' Help
 
     def _add_tools(self, tools: dict):
         """adds new tools to tools registry"""
+        self._output_files = {}
         for tool_name in tools:
             tool = tools[tool_name]
-            if issubclass(tool, ToolMeta):
+            if is_valid_plugin(tool, ToolMeta):
                 if not hasattr(self.tools, tool_name):
                     log_debug(f"-- installing tool '{tool_name}'")
                     self.tools[tool_name] = tool
@@ -501,8 +802,7 @@ Tool '{tool_id}' Help
         tool_config["IGNORED_FILES"] = normalise_file_paths(raw_ignored_files)
 
         raw_excluded_files = get_config_key(tool_config, "EXCLUDE", list, [])
-        raw_excluded_files.extend(self.find_tool_output_files(scan_type, run_type))
-        raw_excluded_files.extend(self.find_reporter_files(scan_type, run_type))
+        raw_excluded_files.extend(self._get_output_files(scan_type, run_type))
         tool_config["EXCLUDE"] = normalise_file_paths(raw_excluded_files)
 
         ignore_below_severity_name = get_config_key(
@@ -514,6 +814,19 @@ Tool '{tool_id}' Help
         tool_config["IGNORE_BELOW_SEVERITY_INT"] = VulnerabilitySeverityEnum[ignore_below_severity_name].value
         return tool_config
 
+    def _get_output_files(self, scan_type: str, run_type: str) -> list:
+        """tool and reporter output files, found once per scan / run type until EzeConfig refreshed"""
+        eze_config = EzeConfig.get_instance()
+        if eze_config is not self._output_files_config:
+            self._output_files = {}
+            self._output_files_config = eze_config
+        output_key = (scan_type, run_type)
+        if output_key not in self._output_files:
+            output_files = self.find_tool_output_files(scan_type, run_type)
+            output_files.extend(self.find_reporter_files(scan_type, run_type))
+            self._output_files[output_key] = output_files
+        return self._output_files[output_key]
+
     def find_tool_output_files(self, scan_type: str, run_type: str):
         """Get Tool Config, handle default config parameters"""
         eze_config = EzeConfig.get_instance()
@@ -1,48 +1,23 @@
-"""Lists out the inbuilt plugins in Eze"""
-from eze.plugins.reporters.bom import BomReporter
-from eze.plugins.reporters.bom_formatted import BomFormattedReporter
-from eze.plugins.reporters.console import ConsoleReporter
-from eze.plugins.reporters.eze import EzeReporter
-from eze.plugins.reporters.json import JsonReporter
-from eze.plugins.reporters.s3 import S3Reporter
-from eze.plugins.reporters.junit import JunitReporter
-from eze.plugins.reporters.quality import QualityReporter
-from eze.plugins.reporters.sarif import SarifReporter
-from eze.plugins.reporters.markdown import MarkdownReporter
-from eze.plugins.reporters.html import HtmlReporter
-from eze.plugins.tools.anchore_grype import GrypeTool
-from eze.plugins.tools.anchore_syft import SyftTool
-from eze.plugins.tools.container_trivy import TrivyTool
-from eze.plugins.tools.gitleaks import GitLeaksTool
-from eze.plugins.tools.java_cyclonedx import JavaCyclonedxTool
-from eze.plugins.tools.java_spotbugs import JavaSpotbugsTool
-from eze.plugins.tools.node_cyclonedx import NodeCyclonedxTool
-from eze.plugins.tools.node_npmaudit import NpmAuditTool
-from eze.plugins.tools.node_npmoutdated import NpmOutdatedTool
-from eze.plugins.tools.python_bandit import BanditTool
-from eze.plugins.tools.python_cyclonedx import PythonCyclonedxTool
-from eze.plugins.tools.python_piprot import PiprotTool
-from eze.plugins.tools.raw import RawTool
-from eze.plugins.tools.semgrep import SemGrepTool
-from eze.plugins.tools.trufflehog import TruffleHogTool
-from eze.plugins.tools.checkmarx_kics import KicsTool
-from eze.plugins.tools.dotnet_cyclonedx import DotnetCyclonedxTool
+"""Lists out the inbuilt plugins in Eze
+
+plugins are given as "module:Class" import paths, so only imported when used (see eze.utils.package.PluginRegistry)
+"""
 
 
 def get_reporters() -> dict:
     """Return the default reporters engines that are installed"""
     return {
-        "console": ConsoleReporter,
-        "json": JsonReporter,
-        "s3": S3Reporter,
-        "junit": JunitReporter,
-        "quality": QualityReporter,
-        "eze": EzeReporter,
-        "bom": BomReporter,
-        "bom-formatted": BomFormattedReporter,
-        "sarif": SarifReporter,
-        "markdown": MarkdownReporter,
-        "html": HtmlReporter,
+        "console": "eze.plugins.reporters.console:ConsoleReporter",
+        "json": "eze.plugins.reporters.json:JsonReporter",
+        "s3": "eze.plugins.reporters.s3:S3Reporter",
+        "junit": "eze.plugins.reporters.junit:JunitReporter",
+        "quality": "eze.plugins.reporters.quality:QualityReporter",
+        "eze": "eze.plugins.reporters.eze:EzeReporter",
+        "bom": "eze.plugins.reporters.bom:BomReporter",
+        "bom-formatted": "eze.plugins.reporters.bom_formatted:BomFormattedReporter",
+        "sarif": "eze.plugins.reporters.sarif:SarifReporter",
+        "markdown": "eze.plugins.reporters.markdown:MarkdownReporter",
+        "html": "eze.plugins.reporters.html:HtmlReporter",
     }
 
 
@@ -50,29 +25,29 @@ def get_tools() -> dict:
     """Return the default tools that are installed"""
     return {
         # Generic Tools
-        "anchore-grype": GrypeTool,
-        "anchore-syft": SyftTool,
-        "container-trivy": TrivyTool,
+        "anchore-grype": "eze.plugins.tools.anchore_grype:GrypeTool",
+        "anchore-syft": "eze.plugins.tools.anchore_syft:SyftTool",
+        "container-trivy": "eze.plugins.tools.container_trivy:TrivyTool",
         # Dotnet / C# Tools
-        "dotnet-cyclonedx": DotnetCyclonedxTool,
+        "dotnet-cyclonedx": "eze.plugins.tools.dotnet_cyclonedx:DotnetCyclonedxTool",
         # Secrets Tools
-        "gitleaks": GitLeaksTool,
+        "gitleaks": "eze.plugins.tools.gitleaks:GitLeaksTool",
         # Container SAST Tool
-        "kics": KicsTool,
+        "kics": "eze.plugins.tools.checkmarx_kics:KicsTool",
         # Java Tools
-        "java-cyclonedx": JavaCyclonedxTool,
-        "java-spotbugs": JavaSpotbugsTool,
+        "java-cyclonedx": "eze.plugins.tools.java_cyclonedx:JavaCyclonedxTool",
+        "java-spotbugs": "eze.plugins.tools.java_spotbugs:JavaSpotbugsTool",
         # Node Tools
-        "node-npmaudit": NpmAuditTool,
-        "node-npmoutdated": NpmOutdatedTool,
-        "node-cyclonedx": NodeCyclonedxTool,
+        "node-npmaudit": "eze.plugins.tools.node_npmaudit:NpmAuditTool",
+        "node-npmoutdated": "eze.plugins.tools.node_npmoutdated:NpmOutdatedTool",
+        "node-cyclonedx": "eze.plugins.tools.node_cyclonedx:NodeCyclonedxTool",
         # Python Tools
-        "python-piprot": PiprotTool,
-        "python-bandit": BanditTool,
-        "python-cyclonedx": PythonCyclonedxTool,
-        "raw": RawTool,
+        "python-piprot": "eze.plugins.tools.python_piprot:PiprotTool",
+        "python-bandit": "eze.plugins.tools.python_bandit:BanditTool",
+        "python-cyclonedx": "eze.plugins.tools.python_cyclonedx:PythonCyclonedxTool",
+        "raw": "eze.plugins.tools.raw:RawTool",
         # SAST Tool
-        "semgrep": SemGrepTool,
+        "semgrep": "eze.plugins.tools.semgrep:SemGrepTool",
         # Secrets Tool
-        "trufflehog": TruffleHogTool,
+        "trufflehog": "eze.plugins.tools.trufflehog:TruffleHogTool",
     }
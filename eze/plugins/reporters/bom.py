@@ -13,6 +13,7 @@ class BomReporter(ReporterMeta):
     """Python report class for echoing json dx output Bill of Materials"""
 
     REPORTER_NAME: str = "bom"
+    CONCURRENT_REPORT: bool = True
     SHORT_DESCRIPTION: str = "json cyclonedx bill of materials reporter"
     INSTALL_HELP: str = """inbuilt"""
     LICENSE: str = """inbuilt"""
@@ -1,4 +1,5 @@
 """Bill of Materials reporter class implementation"""
+import asyncio
 import re
 import shlex
 
@@ -15,6 +16,7 @@ class BomFormattedReporter(ReporterMeta):
     """Python report class for echoing all converting Bill of Materials into various formats"""
 
     REPORTER_NAME: str = "bom-formatted"
+    CONCURRENT_REPORT: bool = True
     SHORT_DESCRIPTION: str = "bill of materials multiformat reporter"
     INSTALL_HELP: str = """In most cases all that is required to install the cyclonedx-cli binary on path
 
@@ -70,7 +72,8 @@ By default set to eze_%PROJECT%_bom.json %PROJECT% will be substituted for proje
 
     async def run_report(self, scan_results: list):
         """Method for taking scans and turning then into report output"""
-        self._output_sboms(scan_results)
+        # INFO: cyclonedx-cli conversion is a blocking subprocess, ran off the event loop
+        await asyncio.get_running_loop().run_in_executor(None, self._output_sboms, scan_results)
 
     def _output_sboms(self, scan_results: list):
         """convert scan sboms into bom files"""
@@ -11,6 +11,7 @@ from eze.utils.scan_result import (
     name_and_time_summary,
     has_sbom_data,
     has_vulnerability_data,
+    get_sbom_components,
 )
 from eze.utils.io.print import pretty_print_table
 from eze.utils.license import annotated_sbom_table
@@ -213,7 +214,11 @@ Bill of Materials
 [{tool_name}{run_type}] {project_name} SBOM
 ================================="""
                 )
-                sboms = annotated_sbom_table(cyclonedx_bom, self.config["PRINT_TRANSITIVE_PACKAGES"])
+                sboms = annotated_sbom_table(
+                    cyclonedx_bom,
+                    self.config["PRINT_TRANSITIVE_PACKAGES"],
+                    get_sbom_components(scan_result, project_name),
+                )
                 pretty_print_table(sboms)
 
     def _print_scan_report_warnings(self, scan_results_with_warnings: list):
@@ -1,19 +1,27 @@
 """Eze reporter class implementation"""
+import asyncio
+import math
 import os
 import urllib.request
+import uuid
 
 from eze.core.reporter import ReporterMeta
-from eze.utils.git import get_active_branch_name, get_active_branch_uri
+from eze.utils.git import GitContext
 from eze.utils.error import EzeConfigError, EzeNetworkingError, EzeError
+from eze.utils.io.file import spool_json
 from eze.utils.io.print import pretty_print_json
-from eze.utils.io.http import request_json
+from eze.utils.io.http import AsyncHttpClient, NOT_PROCESSED_STATUS_CODES, parse_json_response, retry_request
 from eze.utils.log import log, log_error
 
+MB: int = 1024 * 1024
+UPLOAD_MODES: list = ["single", "tool", "chunked"]
+
 
 class EzeReporter(ReporterMeta):
     """Python report class for sending scan reports to eze management console"""
 
     REPORTER_NAME: str = "eze"
+    CONCURRENT_REPORT: bool = True
     SHORT_DESCRIPTION: str = "eze management console reporter"
     INSTALL_HELP: str = """inbuilt"""
     MORE_INFO: str = """inbuilt"""
@@ -53,14 +61,45 @@ if not set, git repo url will be automatically determined via local git info and
             "help_text": """Optional code branch name,
 if not set, will be automatically determined via local git info""",
         },
+        "GZIP": {
+            "type": bool,
+            "default": False,
+            "help_text": """gzip request bodies, sent with content-encoding gzip""",
+        },
+        "UPLOAD_MODE": {
+            "type": str,
+            "default": "single",
+            "help_example": "chunked",
+            "help_text": """how scan results are sent to management console
+single: one request
+tool: one request per tool's scan result
+chunked: json split into CHUNK_SIZE_MB sized chunks
+tool / chunked requests are tied together by x-eze-upload-id / x-eze-upload-part / x-eze-upload-parts headers""",
+        },
+        "CHUNK_SIZE_MB": {
+            "type": int,
+            "default": 5,
+            "help_text": """maximum request body size when UPLOAD_MODE is chunked""",
+        },
+        "MAX_RETRIES": {
+            "type": int,
+            "default": 3,
+            "help_text": """times a request is retried on failing to connect / 408 / 429 / 503 responses
+requests aren't retried once they may have been processed (aka timeouts, other 5xx), to avoid duplicate uploads""",
+        },
+        "RETRY_BACKOFF_SEC": {
+            "type": int,
+            "default": 1,
+            "help_text": """delay before first retry, doubled for each retry after""",
+        },
     }
 
     async def run_report(self, scan_results: list):
         """Method for taking scans and turning then into report output"""
         log("Sending Eze scans to management console:\n")
-        self.send_results(scan_results)
+        await self.send_results(scan_results)
 
-    def send_results(self, scan_results: list) -> None:
+    async def send_results(self, scan_results: list) -> None:
         """
         Sending results to management console
 
@@ -79,7 +118,9 @@ if not set, will be automatically determined via local git info""",
 
         try:
             log(f"scan results to short term storage: {scan_api_url} ({apikey})")
-            short_storage_results = self._get_http_json(scan_api_url, scan_results, apikey)
+            # INFO: parts are sent one at a time, so server receives them in order
+            async with AsyncHttpClient(max_concurrency=1) as http_client:
+                short_storage_results = await self._send_parts(http_client, scan_api_url, scan_results)
             log(pretty_print_json(short_storage_results))
         except EzeNetworkingError as error:
             raise EzeError(
@@ -92,6 +133,81 @@ error: {error}
 """
             )
 
+    async def _send_parts(self, http_client: AsyncHttpClient, api_url: str, scan_results: list) -> dict:
+        """
+        send scan results as configured UPLOAD_MODE, returns last response
+
+        :raises EzeNetworkingError: on networking error
+        """
+        upload_mode = self.config["UPLOAD_MODE"]
+        if upload_mode == "single" or not scan_results:
+            return await self._send_json(http_client, api_url, scan_results, {})
+        upload_id = uuid.uuid4().hex
+        if upload_mode == "tool":
+            for part_number, scan_result in enumerate(scan_results, 1):
+                part_headers = self._get_part_headers(upload_id, part_number, len(scan_results))
+                response = await self._send_json(http_client, api_url, [scan_result], part_headers)
+            return response
+        # INFO: chunked, chunks are parts of one json (gzipped) body, reassembled by server
+        loop = asyncio.get_running_loop()
+        chunk_size = self.config["CHUNK_SIZE_MB"] * MB
+        with await loop.run_in_executor(None, spool_json, scan_results, True, self.config["GZIP"]) as json_file:
+            part_count = max(1, math.ceil(json_file.seek(0, os.SEEK_END) / chunk_size))
+            json_file.seek(0)
+            for part_number in range(1, part_count + 1):
+                part_headers = self._get_part_headers(upload_id, part_number, part_count)
+                part_headers["content-type"] = "application/octet-stream"
+                part_headers["x-eze-upload-content-type"] = "application/json; charset=UTF-8"
+                if self.config["GZIP"]:
+                    part_headers["x-eze-upload-content-encoding"] = "gzip"
+                response = await self._post(http_client, api_url, json_file.read(chunk_size), part_headers)
+        return response
+
+    async def _send_json(self, http_client: AsyncHttpClient, api_url: str, json_vo, headers: dict) -> dict:
+        """
+        send compact json body, streamed from a spooled temp file
+
+        :raises EzeNetworkingError: on networking error
+        """
+        loop = asyncio.get_running_loop()
+        with await loop.run_in_executor(None, spool_json, json_vo, True, self.config["GZIP"]) as json_file:
+            headers = {**headers, "content-type": "application/json; charset=UTF-8"}
+            if self.config["GZIP"]:
+                headers["content-encoding"] = "gzip"
+            return await self._post(http_client, api_url, json_file, headers)
+
+    async def _post(self, http_client: AsyncHttpClient, api_url: str, data, headers: dict) -> dict:
+        """
+        make api call to post endpoint, retried with exponential backoff while request is unprocessed
+
+        :raises EzeNetworkingError: on networking error
+        """
+        headers = {**headers, "accept": "application/json, text/plain, */*", "x-api-key": self.config["APIKEY"]}
+
+        async def send_request() -> str:
+            if hasattr(data, "seek"):
+                # INFO: rewind spooled body, as previous attempt may have read some or all of it
+                data.seek(0)
+            return await http_client.request(api_url, data=data, method="POST", headers=headers)
+
+        contents = await retry_request(
+            send_request,
+            self.config["MAX_RETRIES"],
+            self.config["RETRY_BACKOFF_SEC"],
+            NOT_PROCESSED_STATUS_CODES,
+        )
+        # INFO: parsed outside retries, a bad response body means report was received, so don't resend
+        return parse_json_response(api_url, contents)
+
+    @staticmethod
+    def _get_part_headers(upload_id: str, part_number: int, part_count: int) -> dict:
+        """headers tying parts of an upload together"""
+        return {
+            "x-eze-upload-id": upload_id,
+            "x-eze-upload-part": str(part_number),
+            "x-eze-upload-parts": str(part_count),
+        }
+
     def _parse_config(self, config: dict) -> dict:
         """take raw config dict and normalise values"""
         parsed_config = super()._parse_config(config)
@@ -99,8 +215,7 @@ error: {error}
         # ADDITION PARSING: CODEBRANCH_ID
         # CODEBRANCH_ID can determined via local git info
         if not parsed_config["CODEBASE_ID"]:
-            git_dir = os.getcwd()
-            codebase_id = get_active_branch_uri(git_dir)
+            codebase_id = GitContext.get_instance().branch_uri
             if not codebase_id:
                 raise EzeConfigError(
                     "requires codebase id or url supplied via 'CODEBASE_ID' config field or a checked out git repo in current dir"
@@ -110,30 +225,17 @@ error: {error}
         # ADDITION PARSING: CODEBRANCH_NAME
         # CODEBRANCH_NAME can determined via local git info
         if not parsed_config["CODEBRANCH_NAME"]:
-            git_dir = os.getcwd()
-            branch = get_active_branch_name(git_dir)
+            branch = GitContext.get_instance().branch_name
             if not branch:
                 raise EzeConfigError(
                     "requires branch supplied via 'CODEBRANCH_NAME' config field or a checked out git repo in current dir"
                 )
             parsed_config["CODEBRANCH_NAME"] = branch
 
-        return parsed_config
-
-    @staticmethod
-    def _get_http_json(api_url, body, apikey) -> dict:
-        """
-        make api call to post endpoint
+        # ADDITION PARSING: UPLOAD_MODE
+        if parsed_config["UPLOAD_MODE"] not in UPLOAD_MODES:
+            raise EzeConfigError(
+                f"invalid UPLOAD_MODE '{parsed_config['UPLOAD_MODE']}', expected one of {', '.join(UPLOAD_MODES)}"
+            )
 
-        :raises EzeNetworkingError: on networking error
-        """
-        return request_json(
-            api_url,
-            data=pretty_print_json(body).encode("utf-8"),
-            method="POST",
-            headers={
-                "content-type": "application/json; charset=UTF-8",
-                "accept": "application/json, text/plain, */*",
-                "x-api-key": apikey,
-            },
-        )
+        return parsed_config
@@ -13,6 +13,7 @@ class HtmlReporter(ReporterMeta):
     """Python report class for echoing output into a html report"""
 
     REPORTER_NAME: str = "html"
+    CONCURRENT_REPORT: bool = True
     SHORT_DESCRIPTION: str = "html output file formatter"
     INSTALL_HELP: str = """inbuilt"""
     MORE_INFO: str = """inbuilt"""
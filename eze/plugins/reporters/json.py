@@ -9,6 +9,7 @@ class JsonReporter(ReporterMeta):
     """Python report class for echoing all output into a json file"""
 
     REPORTER_NAME: str = "json"
+    CONCURRENT_REPORT: bool = True
     SHORT_DESCRIPTION: str = "json output file reporter"
     INSTALL_HELP: str = """inbuilt"""
     MORE_INFO: str = """inbuilt"""
@@ -20,10 +21,15 @@ class JsonReporter(ReporterMeta):
             "default": ".eze/eze_report.json",
             "help_text": """report file location
 By default set to eze_report.json""",
-        }
+        },
+        "COMPACT": {
+            "type": bool,
+            "default": False,
+            "help_text": """write json without indentation / whitespace, smaller and faster for machine consumers""",
+        },
     }
 
     async def run_report(self, scan_results: list):
         """Method for taking scans and turning then into report output"""
-        json_location = write_json(self.config["REPORT_FILE"], scan_results)
+        json_location = write_json(self.config["REPORT_FILE"], scan_results, self.config["COMPACT"])
         log(f"Written json report : {json_location}")
@@ -17,6 +17,7 @@ class JunitReporter(ReporterMeta):
     """Python report class for echoing all output into a json file"""
 
     REPORTER_NAME: str = "junit"
+    CONCURRENT_REPORT: bool = True
     SHORT_DESCRIPTION: str = "junit output file reporter"
     INSTALL_HELP: str = """inbuilt"""
     MORE_INFO: str = """inbuilt"""
@@ -13,6 +13,7 @@ class MarkdownReporter(ReporterMeta):
     """Python report class for echoing output into a markdown report"""
 
     REPORTER_NAME: str = "markdown"
+    CONCURRENT_REPORT: bool = True
     SHORT_DESCRIPTION: str = "markdown output file formatter"
     INSTALL_HELP: str = """inbuilt"""
     MORE_INFO: str = """inbuilt"""
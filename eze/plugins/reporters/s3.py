@@ -1,18 +1,36 @@
 """JSON reporter exported to S3 bucket class implementation"""
-
-import os
+import asyncio
+import threading
 from datetime import datetime
+from functools import lru_cache
 
-import boto3
+import boto3.session
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 from pydash import py_
 
 from eze.core.reporter import ReporterMeta
-from eze.utils.io.print import pretty_print_json
-from eze.utils.git import get_active_branch_name, get_active_branch_uri
+from eze.utils.error import EzeConfigError
+from eze.utils.io.file import spool_json
+from eze.utils.git import GitContext
 from eze.utils.log import log, log_error
 from eze.utils.io.http import spine_case_url
 
+MB: int = 1024 * 1024
+# s3 rejects multipart uploads with parts (other than the last) smaller than 5MB
+MIN_PART_SIZE_MB: int = 5
+
+_S3_CLIENT_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def get_s3_client(endpoint_url: str = None):
+    """shared s3 client per endpoint, boto3 clients are thread safe and creating one per report is slow"""
+    # INFO: called from executor threads, boto3's default session isn't thread safe so use an explicit session
+    with _S3_CLIENT_LOCK:
+        return boto3.session.Session().client("s3", endpoint_url=endpoint_url)
+
 
 class S3Reporter(ReporterMeta):
     """Python report class for uploading the report results in json format into an S3 bucket
@@ -21,6 +39,7 @@ class S3Reporter(ReporterMeta):
     https://boto3.amazonaws.com/v1/documentation/api/latest/guide/quickstart.html#configuration"""
 
     REPORTER_NAME: str = "s3"
+    CONCURRENT_REPORT: bool = True
     SHORT_DESCRIPTION: str = "s3 uploader reporter"
     INSTALL_HELP: str = """inbuilt"""
     MORE_INFO: str = """S3 reporters uses the boto3 library
@@ -49,29 +68,62 @@ https://boto3.amazonaws.com/v1/documentation/api/latest/guide/credentials.html
             "required": False,
             "help_text": """object key used to store the report json in s3 bucket""",
         },
+        "COMPACT": {
+            "type": bool,
+            "default": False,
+            "help_text": """upload json without indentation / whitespace, smaller and faster for machine consumers""",
+        },
+        "GZIP": {
+            "type": bool,
+            "default": False,
+            "help_text": """gzip report json, uploaded with Content-Encoding gzip""",
+        },
+        "PART_SIZE_MB": {
+            "type": int,
+            "default": 8,
+            "help_text": """reports larger than this are uploaded as a multipart upload, in parts of this size
+s3 minimum part size is 5MB""",
+        },
+        "MAX_CONCURRENCY": {
+            "type": int,
+            "default": 10,
+            "help_text": """maximum number of parts uploaded in parallel""",
+        },
+        "ENDPOINT_URL": {
+            "type": str,
+            "default": None,
+            "help_example": "http://localhost:9000",
+            "help_text": """optional s3 compatible endpoint, such as minio / localstack, defaults to aws s3""",
+        },
     }
 
     async def run_report(self, scan_results: list):
         """Method for taking scans and turning then into report output"""
-        self.upload_object(scan_results)
+        # INFO: boto3 is blocking, upload off the event loop so other reporters carry on
+        await asyncio.get_running_loop().run_in_executor(None, self.upload_object, scan_results)
 
     def upload_object(self, value: any):
         """Method for uploading json files into s3 bucket"""
-        pretty_json = pretty_print_json(value)
-
-        client = boto3.client("s3")
+        client = get_s3_client(self.config["ENDPOINT_URL"])
         bucket = self.config["BUCKET_NAME"]
         key = self.config["OBJECT_KEY"]
+        extra_args = {"ContentType": "application/json"}
+        if self.config["GZIP"]:
+            extra_args["ContentEncoding"] = "gzip"
+        part_size = self.config["PART_SIZE_MB"] * MB
+        # INFO: transfer manager switches to a multipart upload (parts sent in parallel) above part size
+        transfer_config = TransferConfig(
+            multipart_threshold=part_size,
+            multipart_chunksize=part_size,
+            max_concurrency=self.config["MAX_CONCURRENCY"],
+        )
         try:
-            client.put_object(
-                Body=pretty_json,
-                Bucket=bucket,
-                Key=key,
-            )
+            with spool_json(value, self.config["COMPACT"], self.config["GZIP"]) as json_file:
+                client.upload_fileobj(json_file, bucket, key, ExtraArgs=extra_args, Config=transfer_config)
             log(f"""Json Report file was uploaded successfully""")
-        except ClientError as error:
+        except (ClientError, S3UploadFailedError) as error:
             region = py_.get(client, "meta.region_name")
-            account = boto3.client("sts").get_caller_identity().get("Account")
+            account = boto3.session.Session().client("sts").get_caller_identity().get("Account")
             log_error(f"Error trying to upload '({region}:{account}){bucket}:{key}' into S3: {error}")
 
     def _parse_config(self, eze_config: dict) -> dict:
@@ -81,9 +133,15 @@ https://boto3.amazonaws.com/v1/documentation/api/latest/guide/credentials.html
         # ADDITION PARSING: OBJECT_KEY
         # if not given, set to <GIT_NAME>-<BRANCH_NAME>-eze-report.json
         if not parsed_config["OBJECT_KEY"]:
-            git_dir = os.getcwd()
-            uri = spine_case_url(get_active_branch_uri(git_dir) or "unknown-repo")
-            branch = spine_case_url(get_active_branch_name(git_dir) or "unknown-branch")
+            git_context = GitContext.get_instance()
+            uri = spine_case_url(git_context.branch_uri or "unknown-repo")
+            branch = spine_case_url(git_context.branch_name or "unknown-branch")
             parsed_config["OBJECT_KEY"] = f"{uri}-{branch}-{datetime.now().strftime('%Y-%m-%d')}-eze-report.json"
 
+        # ADDITION PARSING: PART_SIZE_MB
+        if parsed_config["PART_SIZE_MB"] < MIN_PART_SIZE_MB:
+            raise EzeConfigError(
+                f"param 'PART_SIZE_MB' is {parsed_config['PART_SIZE_MB']}, s3 minimum part size is {MIN_PART_SIZE_MB}MB"
+            )
+
         return parsed_config
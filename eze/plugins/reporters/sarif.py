@@ -16,6 +16,7 @@ class SarifReporter(ReporterMeta):
     """Python report class for echoing all output into a sarif file"""
 
     REPORTER_NAME: str = "sarif"
+    CONCURRENT_REPORT: bool = True
     SHORT_DESCRIPTION: str = "sarif output file reporter"
     INSTALL_HELP: str = """inbuilt"""
     MORE_INFO: str = """SBOM plugins will not be exported by this reporter"""
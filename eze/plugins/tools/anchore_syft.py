@@ -4,7 +4,7 @@ import shlex
 from eze.core.enums import ToolType, SourceType, LICENSE_CHECK_CONFIG, LICENSE_ALLOWLIST_CONFIG, LICENSE_DENYLIST_CONFIG
 from eze.core.tool import ToolMeta, ScanResult
 from eze.utils.cli.run import run_cli_command, run_async_cli_command
-from eze.utils.io.file import create_tempfile_path, write_text, load_json
+from eze.utils.io.file import create_tempfile_path, load_json
 from eze.utils.scan_result import convert_sbom_into_scan_result
 
 
@@ -113,9 +113,11 @@ From syft help
         """
 
         # create xml cyclonedx using syft
-        completed_process = await run_async_cli_command(self.TOOL_CLI_CONFIG["CMD_CONFIG"], self.config, self.TOOL_NAME)
-        report_text = completed_process.stdout
-        write_text(self.config["INTERMEDIATE_FILE"], report_text)
+        with await run_async_cli_command(
+            self.TOOL_CLI_CONFIG["CMD_CONFIG"], self.config, self.TOOL_NAME
+        ) as completed_process:
+            # stream (potentially huge) xml sbom to disk, rather than decoding it into memory
+            completed_process.write_stdout(self.config["INTERMEDIATE_FILE"])
 
         # convert xml cyclonedx format into json cyclonedx format
         completed_process = run_cli_command(self.TOOL_CLI_CONFIG["CONVERSION_CMD_CONFIG"], self.config, self.TOOL_NAME)
@@ -4,14 +4,13 @@ import os
 
 from pydash import py_
 
-from eze.core.enums import VulnerabilityType, ToolType, SourceType, Vulnerability
+from eze.core.enums import VulnerabilityType, ToolType, SourceType, Vulnerability, USE_SOURCE_COPY_CONFIG
 from eze.core.tool import (
     ToolMeta,
     ScanResult,
 )
 from eze.utils.cli.run import run_async_cli_command
 from eze.utils.io.file import load_json, create_tempfile_path, create_absolute_path
-from eze.utils.io.file_scanner import cache_workspace_into_tmp
 
 
 class KicsTool(ToolMeta):
@@ -40,6 +39,9 @@ Last step, make sure you are able to run this command:
     # https://github.com/Checkmarx/kics/blob/master/LICENSE
     LICENSE: str = """Apache-2.0"""
     VERSION_CHECK: dict = {"FROM_EXE": "kics version"}
+    RESOURCE_PROFILE: dict = {"cpu": 2, "mem_mb": 1500}
+    CACHE_INPUT_FILES: list = [".*"]
+    PARSE_PARTIAL_REPORT: bool = True
     EZE_CONFIG: dict = {
         "SOURCE": {
             "type": str,
@@ -78,14 +80,7 @@ enables --disable-secrets flag""",
             "help_text": """Optional change if SBOMs are generated by kics
 enables --bom""",
         },
-        "USE_SOURCE_COPY": {
-            "type": bool,
-            "default": True,
-            "environment_variable": "USE_SOURCE_COPY",
-            "help_text": """speeds up SAST tools by using copied folder with no binary/dependencies assets
-for mono-repos can speed up scans from 800s to 30s, by avoiding common dependencies such as node_modules
-stored: TMP/.eze/cached-workspace""",
-        },
+        "USE_SOURCE_COPY": USE_SOURCE_COPY_CONFIG.copy(),
     }
 
     TOOL_LANGUAGE = "container"
@@ -119,15 +114,16 @@ stored: TMP/.eze/cached-workspace""",
         # convert REPORT_FILE to separated REPORT_PATH/REPORT_FILENAME arguments to fit the plugin
         scan_config["REPORT_PATH"] = os.path.dirname(scan_config["REPORT_FILE"]) or "."
         scan_config["REPORT_FILENAME"] = os.path.basename(scan_config["REPORT_FILE"])
-        cwd = cache_workspace_into_tmp() if self.config["USE_SOURCE_COPY"] else None
+        cwd = self.source_folder()
 
-        completed_process = await run_async_cli_command(
+        with await run_async_cli_command(
             self.TOOL_CLI_CONFIG["CMD_CONFIG"], scan_config, self.TOOL_NAME, cwd=cwd
-        )
+        ) as completed_process:
+            tool_error = completed_process.stderr
         report_events = load_json(scan_config["REPORT_FILE"])
         report = self.parse_report(report_events)
-        if completed_process.stderr:
-            report.warnings.append(completed_process.stderr)
+        if tool_error:
+            report.warnings.append(tool_error)
 
         return report
 
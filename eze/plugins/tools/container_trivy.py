@@ -102,12 +102,15 @@ Total: 112 (UNKNOWN: 2, LOW: 74, MEDIUM: 11, HIGH: 21, CRITICAL: 4)"""
         :raises EzeError
         """
 
-        completed_process = await run_async_cli_command(self.TOOL_CLI_CONFIG["CMD_CONFIG"], self.config, self.TOOL_NAME)
+        with await run_async_cli_command(
+            self.TOOL_CLI_CONFIG["CMD_CONFIG"], self.config, self.TOOL_NAME
+        ) as completed_process:
+            tool_error = completed_process.stderr
 
         report_events = load_json(self.config["REPORT_FILE"])
         report = self.parse_report(report_events)
-        if completed_process.stderr:
-            report.warnings.append(completed_process.stderr)
+        if tool_error:
+            report.warnings.append(tool_error)
 
         return report
 
@@ -39,6 +39,7 @@ https://cyclonedx.org/
     LICENSE: str = """Apache-2.0"""
 
     VERSION_CHECK: dict = {"FROM_EXE": "dotnet CycloneDX --version"}
+    PIPELINE_STAGES: list = ["dotnet-restore"]
 
     EZE_CONFIG: dict = {
         "REPORT_FILE": {
@@ -86,12 +87,13 @@ https://cyclonedx.org/
             scan_config = self.config.copy()
             scan_config["INPUT_FILE"] = Path(dotnet_project_file).name
             scan_config["REPORT_FILE"] = str(create_absolute_path(scan_config["REPORT_FILE"]))
-            completed_process = await run_async_cli_command(
+            with await run_async_cli_command(
                 self.TOOL_CLI_CONFIG["CMD_CONFIG"], scan_config, self.TOOL_NAME, False, cwd=project_folder
-            )
+            ) as completed_process:
+                tool_error = completed_process.stderr
             sboms[dotnet_project_file] = load_json(Path(self.config["REPORT_FILE"]) / "bom.json")
-            if completed_process.stderr:
-                warnings.append(f"Errored when parsing {dotnet_project_file}: {completed_process.stderr}")
+            if tool_error:
+                warnings.append(f"Errored when parsing {dotnet_project_file}: {tool_error}")
                 continue
             # annotate transitive packages
             # "properties"."transitive" not "dependency" as too complex to calculate
@@ -101,7 +103,11 @@ https://cyclonedx.org/
             vulns.extend(await get_deprecated_packages(project_folder, dotnet_project_file))
 
             # annotate vulnerabilities packages
-            vulns.extend(await get_vulnerable_packages(project_folder, dotnet_project_file))
+            [vulnerable_packages, vulnerable_package_warnings] = await get_vulnerable_packages(
+                project_folder, dotnet_project_file
+            )
+            vulns.extend(vulnerable_packages)
+            warnings.extend(vulnerable_package_warnings)
 
         report = self.parse_report(sboms)
         # add all warnings
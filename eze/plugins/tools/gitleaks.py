@@ -41,6 +41,7 @@ gitleaks --version
     LICENSE: str = """MIT"""
 
     VERSION_CHECK: dict = {"FROM_EXE": "gitleaks --version"}
+    PARSE_PARTIAL_REPORT: bool = True
     MORE_INFO: str = """https://github.com/zricethezav/gitleaks
 
 Helpful tips:
@@ -94,7 +95,10 @@ Warning: on production might want to set this to False to prevent found Secrets
         """
 
         tic = time.perf_counter()
-        completed_process = await run_async_cli_command(self.TOOL_CLI_CONFIG["CMD_CONFIG"], self.config, self.TOOL_NAME)
+        with await run_async_cli_command(
+            self.TOOL_CLI_CONFIG["CMD_CONFIG"], self.config, self.TOOL_NAME
+        ) as completed_process:
+            tool_error = completed_process.stderr
         toc = time.perf_counter()
         total_time = toc - tic
         if total_time > 10:
@@ -105,8 +109,8 @@ Warning: on production might want to set this to False to prevent found Secrets
             )
         parsed_json = load_json(self.config["REPORT_FILE"])
         report = self.parse_report(parsed_json)
-        if completed_process.stderr:
-            report.warnings.append(completed_process.stderr)
+        if tool_error:
+            report.warnings.append(tool_error)
 
         return report
 
@@ -46,6 +46,9 @@ You can add org.cyclonedx:cyclonedx-maven-plugin to customise your SBOM output
     # https://github.com/CycloneDX/cyclonedx-maven-plugin/blob/master/LICENSE
     LICENSE: str = """Apache-2.0"""
     VERSION_CHECK: dict = {"FROM_MAVEN": "org.cyclonedx:cyclonedx-maven-plugin"}
+    RESOURCE_PROFILE: dict = {"cpu": 4, "mem_mb": 2000}
+    PIPELINE_STAGES: list = ["maven-resolve"]
+    CACHE_INPUT_FILES: list = ["^pom.xml$"]
     EZE_CONFIG: dict = {
         "REPORT_FILE": {
             "type": str,
@@ -61,7 +64,8 @@ You can add org.cyclonedx:cyclonedx-maven-plugin to customise your SBOM output
         "SCA_ENABLED": {
             "type": bool,
             "default": True,
-            "help_text": "use osv data feeds to detect Maven vulnerabilities",
+            "help_text": """use osv data feeds to detect Maven vulnerabilities
+results use live advisory data, so aren't reused from result cache (scan.RESULT_CACHE_TTL_SEC)""",
         },
         "LICENSE_CHECK": LICENSE_CHECK_CONFIG.copy(),
         "LICENSE_ALLOWLIST": LICENSE_ALLOWLIST_CONFIG.copy(),
@@ -91,9 +95,10 @@ You can add org.cyclonedx:cyclonedx-maven-plugin to customise your SBOM output
             maven_project = Path(pom_file).parent
             maven_project_fullpath = Path.joinpath(Path.cwd(), maven_project)
 
-            completed_process = await run_async_cli_command(
+            with await run_async_cli_command(
                 self.TOOL_CLI_CONFIG["CMD_CONFIG"], self.config, self.TOOL_NAME, cwd=maven_project_fullpath
-            )
+            ) as completed_process:
+                tool_error = completed_process.stderr
             # TODO: AB#1047: add option to SCA test dependencies: INCLUDE_TEST -DincludeTestScope=true
             # TODO: AB#1048: EZE CLI: mark java-cyclonedx transitive packages
             # "properties"."transitive" not "dependency" as too complex to calculate
@@ -104,12 +109,17 @@ You can add org.cyclonedx:cyclonedx-maven-plugin to customise your SBOM output
 
             write_json(self.config["REPORT_FILE"], cyclonedx_bom)
             sboms[pom_file] = cyclonedx_bom
-            if completed_process.stderr:
-                tool_warnings = ignore_groovy_errors(completed_process.stderr)
+            if tool_error:
+                tool_warnings = ignore_groovy_errors(tool_error)
                 for tool_warning in tool_warnings:
                     warnings_list.append(tool_warning)
 
         report = self.parse_report(sboms)
+        # When SCA_ENABLED get SCA vulnerabilities/warnings from osv, batched and concurrent so doesn't block
+        if self.config.get("SCA_ENABLED", False):
+            [osv_vulnerabilities, osv_warnings] = await osv_sca_sboms(sboms)
+            report.vulnerabilities.extend(osv_vulnerabilities)
+            report.warnings.extend(osv_warnings)
         # add all warnings
         report.warnings.extend(warnings_list)
 
@@ -117,13 +127,4 @@ You can add org.cyclonedx:cyclonedx-maven-plugin to customise your SBOM output
 
     def parse_report(self, cyclonedx_boms: dict) -> ScanResult:
         """convert report json into ScanResult"""
-        is_sca_enabled = self.config.get("SCA_ENABLED", False)
-        scan_result: ScanResult = convert_multi_sbom_into_scan_result(self, cyclonedx_boms)
-        if not is_sca_enabled:
-            return scan_result
-        # When SCA_ENABLED get SCA vulnerabilities/warnings directly from PYPI
-        [osv_vulnerabilities, osv_warnings] = osv_sca_sboms(cyclonedx_boms)
-        scan_result.vulnerabilities.extend(osv_vulnerabilities)
-        scan_result.warnings.extend(osv_warnings)
-
-        return scan_result
+        return convert_multi_sbom_into_scan_result(self, cyclonedx_boms)
@@ -11,7 +11,7 @@ from eze.core.enums import VulnerabilityType, ToolType, SourceType, Vulnerabilit
 from eze.core.tool import ToolMeta, ScanResult
 from eze.utils.cli.run import run_async_cli_command
 from eze.utils.io.file import create_tempfile_path, write_json
-from eze.utils.io.file_scanner import find_files_by_name
+from eze.utils.io.file_scanner import find_files_by_exact_name
 from eze.utils.language.java import ignore_groovy_errors
 
 
@@ -44,6 +44,9 @@ https://spotbugs.readthedocs.io/en/latest/filter.html
     # https://github.com/spotbugs/spotbugs/blob/master/LICENSE
     LICENSE: str = """LGPL"""
     VERSION_CHECK: dict = {"FROM_MAVEN": "com.github.spotbugs:spotbugs-maven-plugin"}
+    RESOURCE_PROFILE: dict = {"cpu": 4, "mem_mb": 2000}
+    PIPELINE_STAGES: list = ["maven-resolve"]
+    CACHE_INPUT_FILES: list = [".*"]
     EZE_CONFIG: dict = {
         "INCLUDE_FULL_REASON": {
             "type": bool,
@@ -83,19 +86,20 @@ Warning: on production might want to set this to False to prevent found Secrets
         """
         vulnerabilities_list: list = []
         warnings_list: list = []
-        pom_files: list = find_files_by_name("^pom.xml$")
+        pom_files: list = find_files_by_exact_name("pom.xml")
 
         for pom_file in pom_files:
             log_debug(f"run 'java cyclonedx' on {pom_file}")
             maven_project = Path(pom_file).parent
             maven_project_fullpath = Path.joinpath(Path.cwd(), maven_project)
 
-            completed_process = await run_async_cli_command(
+            with await run_async_cli_command(
                 self.TOOL_CLI_CONFIG["CMD_CONFIG"], self.config, self.TOOL_NAME, cwd=maven_project_fullpath
-            )
+            ) as completed_process:
+                tool_error = completed_process.stderr
 
-            if completed_process.stderr:
-                warnings = ignore_groovy_errors(completed_process.stderr)
+            if tool_error:
+                warnings = ignore_groovy_errors(tool_error)
                 for warning in warnings:
                     warnings_list.append(warning)
 
@@ -6,7 +6,11 @@ from pathlib import Path
 from eze.core.enums import ToolType, SourceType, LICENSE_CHECK_CONFIG, LICENSE_ALLOWLIST_CONFIG, LICENSE_DENYLIST_CONFIG
 from eze.core.tool import ToolMeta, ScanResult
 from eze.utils.cli.run import run_async_cli_command
-from eze.utils.language.node import install_npm_in_path, annotate_transitive_licenses, get_npm_projects
+from eze.utils.language.node import (
+    install_npm_in_path,
+    annotate_transitive_licenses,
+    get_npm_projects,
+)
 from eze.utils.log import log_debug
 from eze.utils.error import EzeExecutableError
 from eze.utils.scan_result import convert_multi_sbom_into_scan_result
@@ -46,6 +50,8 @@ This will be ran automatically, if npm install fails this tool can't be run
     # https://github.com/CycloneDX/cyclonedx-node-module/blob/master/LICENSE
     LICENSE: str = """Apache-2.0"""
     VERSION_CHECK: dict = {"FROM_EXE": "cyclonedx-bom --version"}
+    PIPELINE_STAGES: list = ["npm-install"]
+    CACHE_INPUT_FILES: list = ["^package.json$", "^package-lock.json$", "^npm-shrinkwrap.json$", "^yarn.lock$"]
     EZE_CONFIG: dict = {
         "REPORT_FILE": {
             "type": str,
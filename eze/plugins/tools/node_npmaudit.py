@@ -11,9 +11,9 @@ from eze.core.tool import (
     ScanResult,
 )
 from eze.utils.cli.run import build_cli_command, run_async_cmd
-from eze.utils.io.file import create_tempfile_path, write_text, parse_json
+from eze.utils.io.file import create_tempfile_path, load_json
 from eze.utils.language.node import install_npm_in_path
-from eze.utils.io.file_scanner import find_files_by_name
+from eze.utils.io.file_scanner import find_files_by_exact_name
 from pathlib import Path
 
 
@@ -46,6 +46,7 @@ https://docs.npmjs.com/downloading-and-installing-node-js-and-npm
     # https://github.com/npm/cli/blob/latest/LICENSE
     LICENSE: str = """NPM"""
     VERSION_CHECK: dict = {"FROM_EXE": "npm --version", "CONDITION": ">=6"}
+    PIPELINE_STAGES: list = ["npm-install"]
 
     TOOL_LANGUAGE = "node"
     DEFAULT_SEVERITY = VulnerabilitySeverityEnum.high.name
@@ -65,17 +66,17 @@ https://docs.npmjs.com/downloading-and-installing-node-js-and-npm
         :raises EzeError
         """
         vulnerabilities_list = []
-        npm_package_jsons = find_files_by_name("^package.json$")
+        npm_package_jsons = find_files_by_exact_name("package.json")
         for npm_package in npm_package_jsons:
             log_debug(f"run 'npm audit' on {npm_package}")
             npm_project = Path(npm_package).parent
             npm_project_fullpath = Path.joinpath(Path.cwd(), npm_project)
             await install_npm_in_path(npm_project)
             command_str = build_cli_command(self.TOOL_CLI_CONFIG["CMD_CONFIG"], self.config)
-            completed_process = await run_async_cmd(command_str, True, cwd=npm_project_fullpath)
-            report_text = completed_process.stdout
-            write_text(self.config["REPORT_FILE"], report_text)
-            parsed_json = parse_json(report_text)
+            with await run_async_cmd(command_str, True, cwd=npm_project_fullpath) as completed_process:
+                # stream (potentially huge) npm output to disk, rather than holding it in memory twice
+                completed_process.write_stdout(self.config["REPORT_FILE"])
+            parsed_json = load_json(self.config["REPORT_FILE"])
             vulnerabilities = self.parse_report(parsed_json, npm_package)
             vulnerabilities_list.extend(vulnerabilities)
 
@@ -2,9 +2,15 @@
 import json
 import shlex
 
-from eze.utils.io.file_scanner import cache_workspace_into_tmp
 
-from eze.core.enums import VulnerabilityType, VulnerabilitySeverityEnum, ToolType, SourceType, Vulnerability
+from eze.core.enums import (
+    VulnerabilityType,
+    VulnerabilitySeverityEnum,
+    ToolType,
+    SourceType,
+    Vulnerability,
+    USE_SOURCE_COPY_CONFIG,
+)
 from eze.core.tool import (
     ToolMeta,
     ScanResult,
@@ -36,6 +42,9 @@ Tips and Tricks
     # https://github.com/PyCQA/bandit/blob/master/LICENSE
     LICENSE: str = """Apache-2.0"""
     VERSION_CHECK: dict = {"FROM_EXE": "bandit --version"}
+    CACHE_INPUT_FILES: list = [".*"]
+    INCREMENTAL_SCAN: bool = True
+    PARSE_PARTIAL_REPORT: bool = True
 
     EZE_CONFIG: dict = {
         "SOURCE": {
@@ -77,14 +86,7 @@ Warning: on production might want to set this to False to prevent found Secrets
             "default_help_value": "<tempdir>/.eze-temp/tmp-bandit-report.json",
             "help_text": "output report location (will default to tmp file otherwise)",
         },
-        "USE_SOURCE_COPY": {
-            "type": bool,
-            "default": True,
-            "environment_variable": "USE_SOURCE_COPY",
-            "help_text": """speeds up SAST tools by using copied folder with no binary/dependencies assets
-for mono-repos can speed up scans from 800s to 30s, by avoiding common dependencies such as node_modules
-stored: TMP/.eze/cached-workspace""",
-        },
+        "USE_SOURCE_COPY": USE_SOURCE_COPY_CONFIG.copy(),
     }
 
     DEFAULT_SEVERITY = VulnerabilitySeverityEnum.high.name
@@ -113,9 +115,11 @@ stored: TMP/.eze/cached-workspace""",
         scan_config = self.config.copy()
         # make REPORT_FILE absolute in-case cwd changes
         scan_config["REPORT_FILE"] = create_absolute_path(scan_config["REPORT_FILE"])
-        cwd = cache_workspace_into_tmp() if scan_config["USE_SOURCE_COPY"] else None
+        cwd = self.source_folder()
         command_str = build_cli_command(self.TOOL_CLI_CONFIG["CMD_CONFIG"], self.config)
-        await run_async_cmd(command_str, cwd=cwd)
+        completed_process = await run_async_cmd(command_str, cwd=cwd)
+        # output not needed, release spooled output
+        completed_process.close()
 
         parsed_json = load_json(self.config["REPORT_FILE"])
         report = self.parse_report(parsed_json)
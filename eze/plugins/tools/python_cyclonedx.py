@@ -6,7 +6,7 @@ from pydash import py_
 
 from eze.utils.log import log_debug
 
-from eze.utils.io.file_scanner import find_files_by_name
+from eze.utils.io.file_scanner import find_files_by_exact_name
 
 from eze.core.enums import (
     ToolType,
@@ -56,6 +56,7 @@ $ pip freeze > requirements.txt
     # https://github.com/CycloneDX/cyclonedx-python/blob/master/LICENSE
     LICENSE: str = """Apache-2.0"""
     VERSION_CHECK: dict = {"FROM_EXE": "cyclonedx-py", "FROM_PIP": "cyclonedx-bom"}
+    CACHE_INPUT_FILES: list = ["^requirements.txt$", "^requirements-dev.txt$", "^poetry.lock$", "^Pipfile.lock$"]
     EZE_CONFIG: dict = {
         "REQUIREMENTS_FILES": {
             "type": list,
@@ -79,7 +80,8 @@ gotcha: make sure it's a frozen version of the pip requirements""",
         "SCA_ENABLED": {
             "type": bool,
             "default": True,
-            "help_text": "use pypi and nvd data feeds to Pypi detect vulnerabilities",
+            "help_text": """use pypi and nvd data feeds to Pypi detect vulnerabilities
+results use live advisory data, so aren't reused from result cache (scan.RESULT_CACHE_TTL_SEC)""",
         },
         "LICENSE_CHECK": LICENSE_CHECK_CONFIG.copy(),
         "LICENSE_ALLOWLIST": LICENSE_ALLOWLIST_CONFIG.copy(),
@@ -149,7 +151,7 @@ gotcha: make sure it's a frozen version of the pip requirements""",
 
         requirements_files = get_requirements_projects()
         if self.config["INCLUDE_DEV"]:
-            requirements_files.extend(find_files_by_name("^requirements-dev.txt$"))
+            requirements_files.extend(find_files_by_exact_name("requirements-dev.txt"))
         requirements_files.extend(self.config["REQUIREMENTS_FILES"])
         poetry_files = get_poetry_projects()
         piplock_files = get_piplock_projects()
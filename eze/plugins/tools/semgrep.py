@@ -1,10 +1,18 @@
 """SemGrep Python tool class"""
+import os
 import shlex
 import time
 
 from pydash import py_
 
-from eze.core.enums import VulnerabilityType, VulnerabilitySeverityEnum, ToolType, SourceType, Vulnerability
+from eze.core.enums import (
+    VulnerabilityType,
+    VulnerabilitySeverityEnum,
+    ToolType,
+    SourceType,
+    Vulnerability,
+    USE_SOURCE_COPY_CONFIG,
+)
 from eze.core.tool import (
     ToolMeta,
     ScanResult,
@@ -13,7 +21,7 @@ from eze.utils.cli.run import run_async_cli_command
 from eze.utils.io.file import create_tempfile_path, load_json, create_absolute_path
 from eze.utils.error import EzeError
 from eze.utils.log import log
-from eze.utils.io.file_scanner import has_filetype, cache_workspace_into_tmp
+from eze.utils.io.file_scanner import has_filetype
 
 
 class SemGrepTool(ToolMeta):
@@ -50,6 +58,10 @@ Tips and Tricks
         "FROM_EXE": "semgrep --version",
         "IGNORED_ERR_MESSAGES": ["A new version of Semgrep is available"],
     }
+    RESOURCE_PROFILE: dict = {"cpu": 4, "mem_mb": 2000}
+    CACHE_INPUT_FILES: list = [".*"]
+    INCREMENTAL_SCAN: bool = True
+    PARSE_PARTIAL_REPORT: bool = True
 
     EZE_CONFIG: dict = {
         "SOURCE": {
@@ -72,6 +84,9 @@ ending in .yml|.yaml, URL of a configuration file, or semgrep registry entry nam
 See https://semgrep.dev/docs/writing-rules/rule-syntax for
 information on configuration file format.
 
+results are only reused from result cache (scan.RESULT_CACHE_TTL_SEC) when all configs are local files,
+as registry / url rulesets change
+
 maps to --config""",
             "help_example": ["p/ci", "p/python"],
         },
@@ -116,14 +131,7 @@ maps to semgrep flag --exclude""",
             "default_help_value": "<tempdir>/.eze-temp/tmp-semgrep-report.json",
             "help_text": "output report location (will default to tmp file otherwise)",
         },
-        "USE_SOURCE_COPY": {
-            "type": bool,
-            "default": True,
-            "environment_variable": "USE_SOURCE_COPY",
-            "help_text": """speeds up SAST tools by using copied folder with no binary/dependencies assets
-for mono-repos can speed up scans from 800s to 30s, by avoiding common dependencies such as node_modules
-stored: TMP/.eze/cached-workspace""",
-        },
+        "USE_SOURCE_COPY": USE_SOURCE_COPY_CONFIG.copy(),
     }
 
     DEFAULT_SEVERITY = VulnerabilitySeverityEnum.high.name
@@ -160,10 +168,11 @@ stored: TMP/.eze/cached-workspace""",
         scan_config["REPORT_FILE"] = create_absolute_path(scan_config["REPORT_FILE"])
         scan_config["EXCLUDE"] = scan_config["EXCLUDE"].copy()
         scan_config["EXCLUDE"].extend(self.DEFAULT_TEST_PATTERNS)
-        cwd = cache_workspace_into_tmp() if scan_config["USE_SOURCE_COPY"] else None
-        completed_process = await run_async_cli_command(
+        cwd = self.source_folder()
+        with await run_async_cli_command(
             self.TOOL_CLI_CONFIG["CMD_CONFIG"], scan_config, self.TOOL_NAME, cwd=cwd
-        )
+        ) as completed_process:
+            tool_error = completed_process.stderr
         toc = time.perf_counter()
         total_time = toc - tic
         if total_time > 60:
@@ -172,8 +181,8 @@ stored: TMP/.eze/cached-workspace""",
                 f"you can often speed up significantly by ignoring compiled assets and test/dependency folders"
             )
         if (
-            "OSError: [WinError 193] %1 is not a valid Win32 application" in completed_process.stderr
-            or "ModuleNotFoundError: No module named 'resource'" in completed_process.stderr
+            "OSError: [WinError 193] %1 is not a valid Win32 application" in tool_error
+            or "ModuleNotFoundError: No module named 'resource'" in tool_error
         ):
             raise EzeError(
                 f"""[{self.TOOL_NAME}] semgrep crashed while running, this is likely because semgrep doesn't support native windows yet
@@ -283,6 +292,13 @@ https://github.com/returntocorp/semgrep/issues/1330"""
                 parsed_config["CONFIGS"].append("p/nginx")
         return parsed_config
 
+    def cache_input_files(self) -> list:
+        """Returns files semgrep's result depends on, None when using registry / url rulesets (aka p/ci) as they change"""
+        configs: list = self.config["CONFIGS"]
+        if not all(os.path.isfile(config) for config in configs):
+            return None
+        return sorted(set(super().cache_input_files() + configs))
+
     @staticmethod
     def print_out_semgrep_timing_report(time_info: dict, total_time: int) -> dict:
         """prints out debug information for semgrep to identifier poorly performing rules"""
@@ -6,7 +6,14 @@ import os
 
 from pydash import py_
 
-from eze.core.enums import VulnerabilityType, VulnerabilitySeverityEnum, ToolType, SourceType, Vulnerability
+from eze.core.enums import (
+    VulnerabilityType,
+    VulnerabilitySeverityEnum,
+    ToolType,
+    SourceType,
+    Vulnerability,
+    USE_SOURCE_COPY_CONFIG,
+)
 from eze.core.tool import (
     ToolMeta,
     ScanResult,
@@ -21,7 +28,7 @@ from eze.utils.io.file import (
     create_absolute_path,
 )
 from eze.utils.log import log
-from eze.utils.io.file_scanner import IGNORED_FOLDERS, cache_workspace_into_tmp
+from eze.utils.io.file_scanner import IGNORED_FOLDERS
 from eze.utils.git import get_gitignore_paths
 
 
@@ -62,6 +69,9 @@ Tips and Tricks
 
     LICENSE: str = """GPL"""
     VERSION_CHECK: dict = {"FROM_EXE": "trufflehog3", "FROM_PIP": "truffleHog3"}
+    RESOURCE_PROFILE: dict = {"cpu": 2, "mem_mb": 512}
+    INCREMENTAL_SCAN: bool = True
+    PARSE_PARTIAL_REPORT: bool = True
 
     EZE_CONFIG: dict = {
         "SOURCE": {
@@ -119,14 +129,7 @@ Warning: on production might want to set this to False to prevent found Secrets
             "default": True,
             "help_text": """ignore files specified in .gitignore""",
         },
-        "USE_SOURCE_COPY": {
-            "type": bool,
-            "default": True,
-            "environment_variable": "USE_SOURCE_COPY",
-            "help_text": """speeds up SAST tools by using copied folder with no binary/dependencies assets
-for mono-repos can speed up scans from 800s to 30s, by avoiding common dependencies such as node_modules
-stored: TMP/.eze/cached-workspace""",
-        },
+        "USE_SOURCE_COPY": USE_SOURCE_COPY_CONFIG.copy(),
     }
     DEFAULT_SEVERITY = VulnerabilitySeverityEnum.high.name
 
@@ -189,10 +192,11 @@ stored: TMP/.eze/cached-workspace""",
         scan_config = self.config.copy()
         # make REPORT_FILE absolute in-case cwd changes
         scan_config["REPORT_FILE"] = create_absolute_path(scan_config["REPORT_FILE"])
-        cwd = cache_workspace_into_tmp() if self.config["USE_SOURCE_COPY"] else None
-        completed_process = await run_async_cli_command(
+        cwd = self.source_folder()
+        with await run_async_cli_command(
             self.TOOL_CLI_CONFIG["CMD_CONFIG"], scan_config, self.TOOL_NAME, cwd=cwd
-        )
+        ) as completed_process:
+            tool_error = completed_process.stderr
         toc = time.perf_counter()
         total_time = toc - tic
         if total_time > 10:
@@ -202,8 +206,8 @@ stored: TMP/.eze/cached-workspace""",
             )
         parsed_json = load_json(self.config["REPORT_FILE"])
         report = self.parse_report(parsed_json)
-        if completed_process.stderr:
-            report.warnings.append(completed_process.stderr)
+        if tool_error:
+            report.warnings.append(tool_error)
 
         return report
 
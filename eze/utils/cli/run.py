@@ -23,26 +23,145 @@ aka
 ls . -man
 """
 import asyncio
+import io
+import os
 import re
 import shlex
 import shutil
+import signal
+import tempfile
 
 # nosec: Subprocess is inherently required to run cli tools, hence is a necessary security risk
 import subprocess  # nosec
 
-from eze.utils.io.file import is_windows_os
+from eze.utils.io.file import is_windows_os, write_text, write_stream
 from eze.utils.error import EzeExecutableNotFoundError, EzeExecutableStdErrError
-from eze.utils.log import log_debug
+from eze.utils.log import log_debug, LogLevel
 import eze.utils.cli.windowslex as windowslex
 
+# seconds a cancelled (aka timed out) process is given to exit cleanly, before being killed
+KILL_GRACE_SEC: int = 5
+# bytes of process output held in memory per stream, before spilling over into a temp file
+SPOOL_MAX_MEMORY_BYTES: int = 10 * 1024 * 1024
+# bytes read from process output per read
+STREAM_CHUNK_BYTES: int = 64 * 1024
+# bytes of stdout checked for shell "executable not found" messages
+EXE_NOT_FOUND_CHECK_BYTES: int = 4 * 1024
+
 
 class CompletedProcess:
-    """completed process output container"""
+    """completed process output container
+
+    output can be given as str, or as binary files (aka spooled capture of a large process output),
+    files are only decoded into str on first access of stdout / stderr, and closed once decoded
+
+    spooled output holds a file descriptor once it spills to disk, hence close() or use as a context manager"""
 
-    def __init__(self, stdout: str, stderr: str = ""):
+    def __init__(self, stdout: str = "", stderr: str = "", stdout_file=None, stderr_file=None):
         """constructor"""
-        self.stdout = stdout
-        self.stderr = stderr
+        self._stdout: str = None if stdout_file else stdout
+        self._stderr: str = None if stderr_file else stderr
+        self.stdout_file = stdout_file
+        self.stderr_file = stderr_file
+
+    @property
+    def stdout(self) -> str:
+        """stdout as str"""
+        if self._stdout is None:
+            self._stdout = _read_spool_file(self.stdout_file)
+            self.stdout_file.close()
+            self.stdout_file = None
+        return self._stdout
+
+    @stdout.setter
+    def stdout(self, value: str):
+        self._stdout = value
+
+    @property
+    def stderr(self) -> str:
+        """stderr as str"""
+        if self._stderr is None:
+            self._stderr = _read_spool_file(self.stderr_file)
+            self.stderr_file.close()
+            self.stderr_file = None
+        return self._stderr
+
+    @stderr.setter
+    def stderr(self, value: str):
+        self._stderr = value
+
+    def stdout_head(self, size: int) -> str:
+        """first size bytes of stdout, without decoding whole output"""
+        if self._stdout is not None:
+            return self._stdout[:size]
+        self.stdout_file.seek(0)
+        return self.stdout_file.read(size).decode(errors="ignore")
+
+    def open_stdout(self) -> io.TextIOBase:
+        """stdout as text stream, for parsers which can read from a file"""
+        if self._stdout is not None:
+            return io.StringIO(self._stdout)
+        self.stdout_file.seek(0)
+        # WORKAROUND: ignore encoding issues
+        return io.TextIOWrapper(_UnclosableStream(self.stdout_file), encoding="utf-8", errors="ignore")
+
+    def write_stdout(self, file_path: str) -> None:
+        """
+        write stdout to file, without decoding whole output
+
+        :raises EzeFileAccessError
+        """
+        if self._stdout is not None:
+            write_text(file_path, self._stdout)
+            return
+        self.stdout_file.seek(0)
+        write_stream(file_path, self.stdout_file)
+
+    def close(self) -> None:
+        """close any spooled output files, already decoded stdout / stderr stay available, others become empty"""
+        for spool_file in [self.stdout_file, self.stderr_file]:
+            if spool_file:
+                spool_file.close()
+        if self._stdout is None:
+            self._stdout = ""
+        if self._stderr is None:
+            self._stderr = ""
+        self.stdout_file = None
+        self.stderr_file = None
+
+    def __enter__(self) -> "CompletedProcess":
+        """context manager, closing spooled output files on exit"""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """close spooled output files"""
+        self.close()
+
+
+class _UnclosableStream(io.RawIOBase):
+    """read only wrapper, so TextIOWrapper closing doesn't close the underlying spool file"""
+
+    def __init__(self, stream):
+        """constructor"""
+        super().__init__()
+        self.stream = stream
+
+    def readable(self) -> bool:
+        """stream is readable"""
+        return True
+
+    def readinto(self, buffer) -> int:
+        """read into given buffer"""
+        data = self.stream.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+def _read_spool_file(spool_file) -> str:
+    """decode whole spool file"""
+    spool_file.seek(0)
+    # WORKAROUND: ignore encoding issues
+    return spool_file.read().decode(errors="ignore")
 
 
 def run_cli_command(
@@ -220,14 +339,68 @@ async def async_subprocess_run(cmd: list, cwd=None) -> CompletedProcess:
     # WORKAROUND: many programming tools failing without shell=true
     # aka: unable to access JAVA_HOME without shell unfortunately, hence mvn command fails
     # see https://stackoverflow.com/questions/28420087/how-to-get-maven-to-work-with-python-subprocess
+    # run in own process group, so whole tree can be killed on cancellation (aka TIMEOUT_SEC)
     process = await asyncio.create_subprocess_shell(
-        final_cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE, cwd=cwd
+        final_cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE, cwd=cwd, **_process_group_kwargs()
     )
-    await process.wait()
-    stdout, stderr = await process.communicate()
-    # WORKAROUND: ignore encoding issues
-    process_output = CompletedProcess(stdout.decode(errors="ignore"), stderr.decode(errors="ignore"))
-    return process_output
+    # drain both streams while process runs, so chatty tools can't block on a full pipe
+    # output over SPOOL_MAX_MEMORY_BYTES is spilled to disk
+    stdout_file = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY_BYTES)
+    stderr_file = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY_BYTES)
+    try:
+        await asyncio.gather(
+            _drain_stream(process.stdout, stdout_file), _drain_stream(process.stderr, stderr_file), process.wait()
+        )
+    except BaseException as error:
+        if isinstance(error, asyncio.CancelledError):
+            await _terminate_process_tree(process)
+        stdout_file.close()
+        stderr_file.close()
+        raise
+    return CompletedProcess(stdout_file=stdout_file, stderr_file=stderr_file)
+
+
+async def _drain_stream(stream: asyncio.StreamReader, spool_file) -> None:
+    """copy stream into spool file, chunk by chunk"""
+    while True:
+        chunk = await stream.read(STREAM_CHUNK_BYTES)
+        if not chunk:
+            break
+        spool_file.write(chunk)
+
+
+def _process_group_kwargs() -> dict:
+    """subprocess kwargs to start process in a new process group"""
+    if is_windows_os():
+        return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    return {"start_new_session": True}
+
+
+def _signal_process_tree(process, force: bool) -> None:
+    """signal process and all of its children, aka the tool started by the shell"""
+    if process.returncode is not None:
+        return
+    try:
+        if is_windows_os():
+            # nosec: taskkill is a fixed windows command, pid is an int
+            subprocess.run(
+                ["taskkill", "/F", "/T", "/PID", str(process.pid)], check=False, capture_output=True
+            )  # nosec # nosemgrep
+        else:
+            os.killpg(process.pid, signal.SIGKILL if force else signal.SIGTERM)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+async def _terminate_process_tree(process, grace_sec: int = KILL_GRACE_SEC) -> None:
+    """terminate process tree, giving it grace_sec to flush any reports before killing it"""
+    log_debug(f"terminating process {process.pid}")
+    _signal_process_tree(process, False)
+    try:
+        await asyncio.wait_for(process.wait(), grace_sec)
+    except asyncio.TimeoutError:
+        _signal_process_tree(process, True)
+        await process.wait()
 
 
 def subprocess_run(cmd: list, cwd=None) -> CompletedProcess:
@@ -266,8 +439,14 @@ async def run_async_cmd(cmd: list, error_on_missing_executable: bool = True, cwd
         process_output = await async_subprocess_run(cmd, cwd=cwd)
     except FileNotFoundError:
         return _raise_exe_not_found(sanitised_command_str, error_on_missing_executable)
-    log_debug(f" std output: '{process_output.stdout}' error output: '{process_output.stderr}'")
-    _detect_output_errors(sanitised_command_str, process_output, error_on_missing_executable)
+    # only decode (potentially huge) output when debugging
+    if LogLevel.get_level() <= LogLevel.DEBUG:
+        log_debug(f" std output: '{process_output.stdout}' error output: '{process_output.stderr}'")
+    try:
+        _detect_output_errors(sanitised_command_str, process_output, error_on_missing_executable)
+    except Exception:
+        process_output.close()
+        raise
     return process_output
 
 
@@ -329,7 +508,10 @@ def _detect_output_errors(
     """
     if not error_on_missing_executable:
         return
-    is_exe_not_found = has_missing_exe_output(process_output.stderr) or has_missing_exe_output(process_output.stdout)
+    # shell missing executable messages are at start of output, no need to decode whole stdout
+    is_exe_not_found = has_missing_exe_output(process_output.stderr) or has_missing_exe_output(
+        process_output.stdout_head(EXE_NOT_FOUND_CHECK_BYTES)
+    )
     if is_exe_not_found:
         _raise_exe_not_found(sanitised_command_str, True)
 
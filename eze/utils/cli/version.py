@@ -3,6 +3,7 @@
 handles detecting versions of tools
 """
 import re
+from pathlib import Path
 
 from eze.utils.cli.run import run_cmd, cmd_exists, has_missing_exe_output
 from eze.utils.semvar import is_semvar
@@ -43,6 +44,17 @@ def extract_version_from_maven(mvn_package: str) -> str:
     return version
 
 
+def get_maven_plugin_folder(mvn_package: str) -> Path:
+    """local repository folder of maven plugin aka ~/.m2/repository/org/cyclonedx/cyclonedx-maven-plugin"""
+    [group_id, artifact_id] = mvn_package.split(":")[:2]
+    return Path.home().joinpath(".m2", "repository", *group_id.split("."), artifact_id)
+
+
+def get_dotnet_tool_folder(tool_command: str) -> Path:
+    """global tool store folder of dotnet tool aka ~/.dotnet/tools/.store/cyclonedx"""
+    return Path.home().joinpath(".dotnet", "tools", ".store", tool_command.lower())
+
+
 def detect_pip_executable_version(pip_package: str, cli_command: str) -> str:
     """Check pip package metadata and check for pip version"""
     # 1. detect tool on command line
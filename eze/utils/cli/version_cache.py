@@ -0,0 +1,149 @@
+"""
+Persistent manifest of installed tool versions
+
+version checks spawn pip / mvn / tool processes (maven alone takes seconds), so detected versions are stored
+keyed on the tool's executable path, mtime and inode, which change whenever the tool is (re)installed
+plus mtimes of any extra install folders (aka maven plugin folder, as plugins are installed without changing mvn)
+
+not installed results are never stored, so newly installed tools are detected on the next run
+can be disabled via EZE_TOOL_VERSION_CACHE=false, versions are then detected each run
+"""
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Callable
+
+import click
+
+from eze.utils.io.print import pretty_print_json
+from eze.utils.log import log_debug
+
+# env var to disable persisting detected tool versions
+VERSION_CACHE_ENV: str = "EZE_TOOL_VERSION_CACHE"
+
+
+def get_executable_fingerprint(executable: str) -> list:
+    """[path, mtime, inode] of executable on path, None if not installed"""
+    executable_path = shutil.which(executable)
+    if not executable_path:
+        return None
+    try:
+        executable_path = os.path.realpath(executable_path)
+        executable_stat = os.stat(executable_path)
+    except OSError:
+        return None
+    return [executable_path, executable_stat.st_mtime_ns, executable_stat.st_ino]
+
+
+def get_folder_fingerprint(folder: Path) -> list:
+    """[path, mtime] of folder, None if missing"""
+    try:
+        return [str(folder), os.stat(folder).st_mtime_ns]
+    except OSError:
+        return None
+
+
+class ToolVersionCache:
+    """Singleton Class for accessing persistent manifest of detected tool versions"""
+
+    _instance = None
+
+    @staticmethod
+    def get_instance():
+        """Get previously set version cache, disabled cache if not set"""
+        if ToolVersionCache._instance is None:
+            ToolVersionCache._instance = ToolVersionCache()
+        return ToolVersionCache._instance
+
+    @staticmethod
+    def set_instance(enabled: bool, manifest_file: Path = None):
+        """Set the global version cache"""
+        ToolVersionCache._instance = ToolVersionCache(enabled, manifest_file)
+        return ToolVersionCache._instance
+
+    @staticmethod
+    def reset_instance():
+        """Reset the global version cache"""
+        ToolVersionCache._instance = None
+
+    def __init__(self, enabled: bool = False, manifest_file: Path = None):
+        """constructor"""
+        self.enabled: bool = enabled
+        self.manifest_file: Path = manifest_file or ToolVersionCache.get_default_manifest_file()
+        self._versions: dict = None
+        # INFO: versions are probed in parallel when listing tools
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_default_manifest_file() -> Path:
+        """Path of installed tools manifest, inside eze app dir"""
+        raw_path = click.get_app_dir("eze", roaming=False, force_posix=False)
+        return Path(raw_path) / "cache" / "tool-versions.json"
+
+    @staticmethod
+    def is_enabled_in_env() -> bool:
+        """version persistence can be disabled via EZE_TOOL_VERSION_CACHE=false"""
+        return os.environ.get(VERSION_CACHE_ENV, "true").lower() not in ["false", "0", "no"]
+
+    def is_enabled(self) -> bool:
+        """versions are stored between runs"""
+        return self.enabled
+
+    def get_version(
+        self,
+        check_key: str,
+        version_check: dict,
+        executable: str,
+        detect_version: Callable,
+        install_folders: list = None,
+    ) -> str:
+        """version from manifest when executable, install folders and version check unchanged, otherwise detected
+
+        detected versions are stored, unless tool not installed (empty version)"""
+        if not self.enabled or not executable:
+            return detect_version()
+        fingerprint = get_executable_fingerprint(executable)
+        if not fingerprint:
+            # INFO: not installed, detection fails fast and nothing to key on
+            return detect_version()
+        folder_fingerprints = [get_folder_fingerprint(x) for x in install_folders or []]
+        if None in folder_fingerprints:
+            # INFO: tool not in install folder (not installed, or aka dotnet local tool), so nothing to key on
+            return detect_version()
+        fingerprint.extend(folder_fingerprints)
+        fingerprint.append(json.dumps(version_check, default=str, sort_keys=True))
+        with self._lock:
+            entry = self._get_versions().get(check_key)
+        if entry and entry["fingerprint"] == fingerprint:
+            return entry["version"]
+        version = detect_version()
+        if not version:
+            return version
+        with self._lock:
+            self._get_versions()[check_key] = {"fingerprint": fingerprint, "version": version}
+            self._save()
+        return version
+
+    def _get_versions(self) -> dict:
+        """manifest of check key -> fingerprint and version, loaded once"""
+        if self._versions is None:
+            try:
+                with open(self.manifest_file, "r", encoding="utf-8") as json_file:
+                    self._versions = json.load(json_file)
+            except (OSError, ValueError):
+                self._versions = {}
+        return self._versions
+
+    def _save(self) -> None:
+        """write manifest, failures are not fatal"""
+        tmp_manifest_file = self.manifest_file.parent / f"{self.manifest_file.name}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.manifest_file.parent, exist_ok=True)
+            with open(tmp_manifest_file, "w", encoding="utf-8") as json_file:
+                json_file.write(pretty_print_json(self._versions))
+            # atomic replace, so parallel eze runs never read a partly written manifest
+            os.replace(tmp_manifest_file, self.manifest_file)
+        except (OSError, TypeError, ValueError) as error:
+            log_debug(f"unable to write tool versions manifest: {error}")
@@ -0,0 +1,271 @@
+"""
+Persistent cache of vulnerability advisory lookups (osv, pypi, nvd)
+
+stored in sqlite under the eze app dir, entries are revalidated with conditional requests (ETag / Last-Modified)
+"""
+import json
+import sqlite3
+import threading
+import time
+from json import JSONDecodeError
+from pathlib import Path
+
+import click
+
+from eze.utils.error import EzeNetworkingError
+from eze.utils.io.http import AsyncHttpClient, HttpResponse, request_json, request_response
+from eze.utils.log import log_debug
+
+# advisory sources, each can be given it's own ttl
+OSV_SOURCE: str = "osv"
+PYPI_SOURCE: str = "pypi"
+NVD_SOURCE: str = "nvd"
+# with stale while revalidate, expired entries are served (and refreshed in background) for up to a week
+MAX_STALE_SEC: int = 7 * 24 * 60 * 60
+
+
+class AdvisoryCacheEntry:
+    """Cached advisory api response"""
+
+    def __init__(self, body: str, etag: str, last_modified: str, fetched_at: float):
+        """constructor"""
+        self.body: str = body
+        self.etag: str = etag
+        self.last_modified: str = last_modified
+        self.fetched_at: float = fetched_at
+
+    def age_sec(self) -> float:
+        """seconds since entry was downloaded or last revalidated"""
+        return time.time() - self.fetched_at
+
+    def validator_headers(self) -> dict:
+        """headers for conditional request, server responds 304 if entry still valid"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class AdvisoryCache:
+    """Singleton Class for accessing sqlite cache of advisory api responses"""
+
+    _instance = None
+
+    @staticmethod
+    def get_instance():
+        """Get previously set advisory cache, disabled cache if not set"""
+        if AdvisoryCache._instance is None:
+            AdvisoryCache._instance = AdvisoryCache()
+        return AdvisoryCache._instance
+
+    @staticmethod
+    def set_instance(
+        ttl_sec: int, source_ttl_sec: dict = None, stale_while_revalidate: bool = False, db_file: Path = None
+    ):
+        """Set the global advisory cache"""
+        AdvisoryCache._instance = AdvisoryCache(ttl_sec, source_ttl_sec, stale_while_revalidate, db_file)
+        return AdvisoryCache._instance
+
+    @staticmethod
+    def reset_instance():
+        """Reset the global advisory cache"""
+        AdvisoryCache._instance = None
+
+    def __init__(
+        self,
+        ttl_sec: int = 0,
+        source_ttl_sec: dict = None,
+        stale_while_revalidate: bool = False,
+        db_file: Path = None,
+    ):
+        """constructor, ttl_sec of 0 or less disables cache"""
+        self.ttl_sec: int = ttl_sec or 0
+        self.source_ttl_sec: dict = source_ttl_sec or {}
+        self.stale_while_revalidate: bool = stale_while_revalidate
+        self.db_file: Path = db_file or AdvisoryCache.get_default_db_file()
+        self._connection: sqlite3.Connection = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_default_db_file() -> Path:
+        """Path of advisory cache database, inside eze app dir"""
+        raw_path = click.get_app_dir("eze", roaming=False, force_posix=False)
+        return Path(raw_path) / "cache" / "advisories.sqlite"
+
+    def is_enabled(self) -> bool:
+        """cache is enabled when given positive ttl"""
+        return self.ttl_sec > 0
+
+    def get_ttl_sec(self, source: str) -> int:
+        """ttl of source's entries, defaults to ttl_sec"""
+        return self.source_ttl_sec.get(source, self.ttl_sec)
+
+    def is_fresh(self, source: str, entry: AdvisoryCacheEntry) -> bool:
+        """entry can be used without revalidating"""
+        return entry.age_sec() < self.get_ttl_sec(source)
+
+    def can_serve_stale(self, source: str, entry: AdvisoryCacheEntry) -> bool:
+        """expired entry can be used while it's revalidated in background"""
+        return self.stale_while_revalidate and entry.age_sec() < self.get_ttl_sec(source) + MAX_STALE_SEC
+
+    def get(self, source: str, key: str) -> AdvisoryCacheEntry:
+        """get cached entry, None if missing or cache disabled"""
+        if not self.is_enabled():
+            return None
+        row = self._execute(
+            "SELECT body, etag, last_modified, fetched_at FROM advisories WHERE source = ? AND key = ?",
+            (source, key),
+        )
+        return AdvisoryCacheEntry(*row) if row else None
+
+    def set(self, source: str, key: str, body: str, etag: str = None, last_modified: str = None) -> None:
+        """store entry, cache write failures are not fatal"""
+        if not self.is_enabled():
+            return
+        self._execute(
+            "INSERT OR REPLACE INTO advisories (source, key, body, etag, last_modified, fetched_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (source, key, body, etag, last_modified, time.time()),
+        )
+
+    def touch(self, source: str, key: str) -> None:
+        """mark entry as revalidated (aka server responded 304 not modified)"""
+        if not self.is_enabled():
+            return
+        self._execute("UPDATE advisories SET fetched_at = ? WHERE source = ? AND key = ?", (time.time(), source, key))
+
+    def _execute(self, sql: str, parameters: tuple) -> tuple:
+        """run sql returning first row, shared connection used from multiple threads so guarded by lock"""
+        with self._lock:
+            try:
+                if not self._connection:
+                    self._connection = self._connect()
+                cursor = self._connection.execute(sql, parameters)
+                row = cursor.fetchone()
+                self._connection.commit()
+                return row
+            except sqlite3.Error as error:
+                log_debug(f"advisory cache error: {error}")
+                return None
+
+    def _connect(self) -> sqlite3.Connection:
+        """open database, creating table on first use"""
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        # INFO: timeout as parallel eze runs can share the cache
+        connection = sqlite3.connect(str(self.db_file), timeout=10, check_same_thread=False)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS advisories ("
+            "source TEXT NOT NULL, key TEXT NOT NULL, body TEXT, etag TEXT, last_modified TEXT, fetched_at REAL, "
+            "PRIMARY KEY (source, key))"
+        )
+        return connection
+
+
+def cached_request_json(source: str, key: str, url: str, data=None, method=None) -> dict:
+    """
+    requests a url and convert return into json, via advisory cache
+
+    :raises EzeNetworkingError: on networking error or json decoding error"""
+    advisory_cache = AdvisoryCache.get_instance()
+    if not advisory_cache.is_enabled():
+        return request_json(url, data=data, method=method)
+    entry = advisory_cache.get(source, key)
+    cached_json = _get_cached_json(advisory_cache, source, key, url, data, method, entry)
+    if cached_json is not None:
+        return cached_json
+    try:
+        response = request_response(url, data=data, headers=_validator_headers(entry), method=method)
+    except EzeNetworkingError as error:
+        return _stale_if_error(source, key, entry, error)
+    return _store_response(advisory_cache, source, key, url, response, entry)
+
+
+async def async_cached_request_json(
+    http_client: AsyncHttpClient, source: str, key: str, url: str, data=None, method=None
+) -> dict:
+    """
+    requests a url via http_client and convert return into json, via advisory cache
+
+    :raises EzeNetworkingError: on networking error or json decoding error"""
+    advisory_cache = AdvisoryCache.get_instance()
+    if not advisory_cache.is_enabled():
+        return await http_client.request_json(url, data=data, method=method)
+    entry = advisory_cache.get(source, key)
+    cached_json = _get_cached_json(advisory_cache, source, key, url, data, method, entry)
+    if cached_json is not None:
+        return cached_json
+    try:
+        response = await http_client.request_response(url, data=data, headers=_validator_headers(entry), method=method)
+    except EzeNetworkingError as error:
+        return _stale_if_error(source, key, entry, error)
+    return _store_response(advisory_cache, source, key, url, response, entry)
+
+
+def _get_cached_json(
+    advisory_cache: AdvisoryCache, source: str, key: str, url: str, data, method, entry: AdvisoryCacheEntry
+) -> dict:
+    """cached json if entry fresh, or stale and can be served while revalidating in background"""
+    if not entry:
+        return None
+    if advisory_cache.is_fresh(source, entry):
+        return _parse_json(url, entry.body)
+    if advisory_cache.can_serve_stale(source, entry):
+        log_debug(f"serving stale {source} advisory {key}, revalidating in background")
+        # INFO: daemon thread, so revalidation doesn't delay exit, if unfinished it's retried next run
+        threading.Thread(
+            target=_revalidate, args=(advisory_cache, source, key, url, data, method, entry), daemon=True
+        ).start()
+        return _parse_json(url, entry.body)
+    return None
+
+
+def _revalidate(
+    advisory_cache: AdvisoryCache, source: str, key: str, url: str, data, method, entry: AdvisoryCacheEntry
+) -> None:
+    """refresh entry in background"""
+    try:
+        response = request_response(url, data=data, headers=entry.validator_headers(), method=method)
+        _store_response(advisory_cache, source, key, url, response, entry)
+    except EzeNetworkingError as error:
+        log_debug(f"unable to revalidate {source} advisory {key}: {error}")
+
+
+def _validator_headers(entry: AdvisoryCacheEntry) -> dict:
+    """conditional request headers for expired entry"""
+    return entry.validator_headers() if entry else {}
+
+
+def _stale_if_error(source: str, key: str, entry: AdvisoryCacheEntry, error: EzeNetworkingError) -> dict:
+    """
+    on networking error fallback to expired entry
+
+    :raises EzeNetworkingError: when no entry to fallback to"""
+    if not entry:
+        raise error
+    log_debug(f"unable to refresh {source} advisory {key}, using expired entry: {error}")
+    return _parse_json("", entry.body)
+
+
+def _store_response(
+    advisory_cache: AdvisoryCache, source: str, key: str, url: str, response: HttpResponse, entry: AdvisoryCacheEntry
+) -> dict:
+    """store downloaded response, or mark entry as revalidated when not modified"""
+    if response.status == 304 and entry:
+        advisory_cache.touch(source, key)
+        return _parse_json(url, entry.body)
+    parsed_json = _parse_json(url, response.body)
+    advisory_cache.set(source, key, response.body, response.etag, response.last_modified)
+    return parsed_json
+
+
+def _parse_json(url: str, contents: str) -> dict:
+    """
+    parse json response
+
+    :raises EzeNetworkingError: on json decoding error"""
+    try:
+        return json.loads(contents)
+    except JSONDecodeError as error:
+        raise EzeNetworkingError(f"Error in JSON response '{url}', {contents} ({error})")
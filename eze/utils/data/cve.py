@@ -9,7 +9,7 @@ from urllib.parse import quote
 
 from eze.core.enums import VulnerabilitySeverityEnum
 from pydash import py_
-from eze.utils.io.http import request_json
+from eze.utils.data.advisory_cache import NVD_SOURCE, cached_request_json
 from eze.utils.error import EzeNetworkingError
 
 CVE_IN_TEXT_RE = re.compile("cve-[0-9-]+", re.IGNORECASE)
@@ -61,7 +61,7 @@ def get_cve_raw_data(cve_id: str) -> dict:
     :raises EzeNetworkingError: on networking error or json decoding error
     """
     api_url = to_api(cve_id)
-    raw_data = request_json(api_url)
+    raw_data = cached_request_json(NVD_SOURCE, cve_id.upper(), api_url)
     cve_data = py_.get(raw_data, "result.CVE_Items[0]", None)
     if not cve_data:
         raise EzeNetworkingError(f"unable to find CVE '{cve_id}' data")
@@ -4,6 +4,8 @@ Helper functions for osv vulnerability reports
 @see https://osv.dev/list
 @see https://osv.dev/docs/
 """
+import asyncio
+import json
 from enum import Enum
 
 import re
@@ -14,13 +16,21 @@ from eze.utils.purl import PurlBreakdown, purl_to_components, safe_unquote
 from eze.core.enums import Vulnerability, VulnerabilityType, VulnerabilitySeverityEnum
 from eze.utils.io.print import pretty_print_json
 
-from eze.utils.io.http import request_json
+from eze.utils.io.http import AsyncHttpClient
+from eze.utils.data.advisory_cache import AdvisoryCache, OSV_SOURCE, async_cached_request_json, cached_request_json
+from eze.utils.data.osv_mirror import OsvMirror
 from eze.utils.error import EzeError
 from eze.utils.data.cve import severity_rating
 
 LICENSE_CLASSIFIER = re.compile("license :: ", re.IGNORECASE)
 CVE_CLASSIFIER = re.compile("^CVE-[0-9-]+$", re.IGNORECASE)
 
+OSV_QUERY_BATCH_URL: str = "https://api.osv.dev/v1/querybatch"
+OSV_VULN_URL: str = "https://api.osv.dev/v1/vulns/"
+# osv accepts up to 1000 queries per batch, smaller chunks are sent concurrently
+OSV_QUERY_BATCH_SIZE: int = 250
+OSV_MAX_CONCURRENCY: int = 8
+
 
 class OsvEcosystem(Enum):
     """Enum for Ecosystems supported by osv"""
@@ -151,8 +161,15 @@ def get_osv_package_data(ecosystem: str, package_name: str, package_version: str
     body: dict = {"version": package_version, "package": {"name": package_name, "ecosystem": ecosystem}}
     try:
         log_debug(f"osv_data for {package_name}({package_version})[{ecosystem}]")
-        request_data = pretty_print_json(body).encode("utf-8")
-        osv_data = request_json(pypi_url, request_data)
+        osv_mirror = OsvMirror.get_instance()
+        if osv_mirror.is_enabled():
+            vulnerability_ids = osv_mirror.query(ecosystem, package_name, package_version)
+            osv_data = {"vulns": [osv_mirror.get_vulnerability(x) for x in vulnerability_ids]}
+        else:
+            request_data = pretty_print_json(body).encode("utf-8")
+            osv_data = cached_request_json(
+                OSV_SOURCE, f"query:{ecosystem}:{package_name}:{package_version}", pypi_url, request_data
+            )
     except EzeError as error:
         warnings.append(f"unable to get osv data for {ecosystem}:{package_name}:{package_version}, Error: {error}")
 
@@ -187,7 +204,11 @@ def get_osv_id_data(vulnerability_id: str, package_name: str, package_version: s
     osv_data: dict = {}
     try:
         log_debug(f"osv_id {vulnerability_id} for {package_name}({package_version})")
-        osv_data = request_json(pypi_url, method="GET")
+        osv_mirror = OsvMirror.get_instance()
+        if osv_mirror.is_enabled():
+            osv_data = osv_mirror.get_vulnerability(safe_unquote(vulnerability_id)) or {}
+        else:
+            osv_data = cached_request_json(OSV_SOURCE, f"vulns:{vulnerability_id}", pypi_url, method="GET")
     except EzeError as error:
         warnings.append(
             f"unable to get osv data for {vulnerability_id}:{package_name}:{package_version}, Error: {error}"
@@ -247,32 +268,175 @@ def purl_to_osv_ecosystem(purl_type: str):
     return purl_type_to_osv_ecosystem.get(purl_type.lower(), None)
 
 
-def _sca_component(component: dict, project_name: str) -> list:
-    """
-    on component dict using pypi data
-    - detect warnings/vulnerabilities
-    """
+def _get_component_query(component: dict) -> dict:
+    """osv query for sbom component, None if component's ecosystem not supported by osv"""
     purl = py_.get(component, "purl")
     purl_breakdown: PurlBreakdown = purl_to_components(purl)
     if not purl_breakdown:
-        return [[], []]
+        return None
     osv_ecosystem = purl_to_osv_ecosystem(purl_breakdown.type)
+    if not osv_ecosystem:
+        log_debug(f"skipping osv lookup of {purl}, ecosystem not supported")
+        return None
     osv_id = f"{purl_breakdown.namespace}:{purl_breakdown.name}" if purl_breakdown.namespace else purl_breakdown.name
-    osv_data: OsvPackageVO = get_osv_package_data(osv_ecosystem, osv_id, purl_breakdown.version, project_name)
-    return [osv_data.vulnerabilities, osv_data.warnings]
+    query = {"package": {"name": osv_id, "ecosystem": osv_ecosystem}}
+    if purl_breakdown.version:
+        query["version"] = purl_breakdown.version
+    return query
+
+
+async def _query_osv_batch(http_client: AsyncHttpClient, queries: list) -> list:
+    """
+    vulnerability ids affecting each query, queries sent in concurrent chunks to osv's batch endpoint
+
+    queries with fresh results in the advisory cache aren't sent
 
+    @see https://osv.dev/docs/#operation/OSV_QueryAffectedBatch
+    """
+    vulnerability_ids: list = [[] for _ in queries]
+    warnings: list = []
+    failed_indexes: set = set()
+    advisory_cache = AdvisoryCache.get_instance()
+    query_cache_keys = [f"querybatch:{pretty_print_json(x)}" for x in queries]
+    uncached_indexes = []
+    for query_index, query_cache_key in enumerate(query_cache_keys):
+        cache_entry = advisory_cache.get(OSV_SOURCE, query_cache_key)
+        if cache_entry and advisory_cache.is_fresh(OSV_SOURCE, cache_entry):
+            vulnerability_ids[query_index] = json.loads(cache_entry.body)
+        else:
+            uncached_indexes.append(query_index)
+
+    async def query_chunk(query_indexes: list, page_tokens: dict) -> dict:
+        """query chunk of queries, returns page tokens of queries with more results"""
+        chunk_queries = []
+        for query_index in query_indexes:
+            chunk_query = {**queries[query_index]}
+            if query_index in page_tokens:
+                chunk_query["page_token"] = page_tokens[query_index]
+            chunk_queries.append(chunk_query)
+        try:
+            log_debug(f"osv querybatch of {len(chunk_queries)} packages")
+            request_data = pretty_print_json({"queries": chunk_queries}).encode("utf-8")
+            osv_data = await http_client.request_json(OSV_QUERY_BATCH_URL, request_data)
+        except EzeError as error:
+            failed_indexes.update(query_indexes)
+            for query in chunk_queries:
+                package_id = f"{py_.get(query, 'package.ecosystem')}:{py_.get(query, 'package.name')}"
+                warnings.append(f"unable to get osv data for {package_id}:{query.get('version')}, Error: {error}")
+            return {}
+        next_page_tokens = {}
+        for query_index, result in zip(query_indexes, py_.get(osv_data, "results", [])):
+            vulnerability_ids[query_index].extend(py_.get(x, "id") for x in py_.get(result, "vulns", []) or [])
+            if py_.get(result, "next_page_token"):
+                next_page_tokens[query_index] = result["next_page_token"]
+        return next_page_tokens
+
+    pending_indexes = uncached_indexes
+    page_tokens: dict = {}
+    while pending_indexes:
+        chunks = [
+            pending_indexes[i : i + OSV_QUERY_BATCH_SIZE] for i in range(0, len(pending_indexes), OSV_QUERY_BATCH_SIZE)
+        ]
+        chunks_page_tokens = await asyncio.gather(*[query_chunk(x, page_tokens) for x in chunks])
+        page_tokens = {}
+        for chunk_page_tokens in chunks_page_tokens:
+            page_tokens.update(chunk_page_tokens)
+        pending_indexes = sorted(page_tokens)
+    for query_index in uncached_indexes:
+        if query_index not in failed_indexes:
+            advisory_cache.set(OSV_SOURCE, query_cache_keys[query_index], json.dumps(vulnerability_ids[query_index]))
+    return [vulnerability_ids, warnings]
+
+
+async def _get_osv_vulnerabilities(http_client: AsyncHttpClient, vulnerability_ids: list) -> list:
+    """
+    download full vulnerability details of given ids concurrently
 
-def osv_sca_sboms(cyclonedx_boms: dict) -> list:
+    @see https://osv.dev/docs/#operation/OSV_GetVulnById
+    """
+    warnings: list = []
+
+    async def get_vulnerability(vulnerability_id: str) -> dict:
+        try:
+            log_debug(f"osv_id {vulnerability_id}")
+            vulnerability_url = f"{OSV_VULN_URL}{safe_unquote(vulnerability_id)}"
+            return await async_cached_request_json(
+                http_client, OSV_SOURCE, f"vulns:{vulnerability_id}", vulnerability_url, method="GET"
+            )
+        except EzeError as error:
+            warnings.append(f"unable to get osv data for {vulnerability_id}, Error: {error}")
+            return None
+
+    raw_vulnerabilities = await asyncio.gather(*[get_vulnerability(x) for x in vulnerability_ids])
+    vulnerabilities = {x: y for x, y in zip(vulnerability_ids, raw_vulnerabilities) if y}
+    return [vulnerabilities, warnings]
+
+
+def _query_osv_mirror(osv_mirror: OsvMirror, queries: list) -> list:
+    """
+    vulnerability ids affecting each query and their full details, resolved via offline osv mirror
+
+    :raises EzeError: when mirror hasn't been imported
+    """
+    vulnerability_ids = [
+        osv_mirror.query(py_.get(x, "package.ecosystem"), py_.get(x, "package.name"), x.get("version")) for x in queries
+    ]
+    unique_vulnerability_ids = sorted(set(x for ids in vulnerability_ids for x in ids))
+    vulnerabilities = {x: osv_mirror.get_vulnerability(x) for x in unique_vulnerability_ids}
+    return [vulnerability_ids, vulnerabilities]
+
+
+async def osv_sca_sboms(cyclonedx_boms: dict) -> list:
     """
     parses dict of cyclonedx sboms
     returns the osv vulnerabilities and warnings
+
+    components are looked up with osv's batch endpoint (de-duplicated across sboms),
+    then full details are downloaded once per affecting vulnerability id
+    or when offline osv mirror enabled, resolved locally
     """
-    vulnerabilities: list = []
-    warnings: list = []
+    queries: list = []
+    query_keys: dict = {}
+    component_queries: list = []
     for project_name in cyclonedx_boms:
         cyclonedx_bom = cyclonedx_boms[project_name]
         for component in py_.get(cyclonedx_bom, "components", []):
-            [osv_vulnerabilities, osv_warnings] = _sca_component(component, project_name)
-            vulnerabilities.extend(osv_vulnerabilities)
-            warnings.extend(osv_warnings)
+            query = _get_component_query(component)
+            if not query:
+                continue
+            query_key = pretty_print_json(query)
+            if query_key not in query_keys:
+                query_keys[query_key] = len(queries)
+                queries.append(query)
+            component_queries.append([project_name, query_keys[query_key]])
+    if not queries:
+        return [[], []]
+
+    osv_mirror = OsvMirror.get_instance()
+    if osv_mirror.is_enabled():
+        try:
+            [query_vulnerability_ids, raw_vulnerabilities] = _query_osv_mirror(osv_mirror, queries)
+        except EzeError as error:
+            return [[], [f"unable to get osv data, Error: {error}"]]
+        warnings = []
+    else:
+        async with AsyncHttpClient(OSV_MAX_CONCURRENCY) as http_client:
+            [query_vulnerability_ids, warnings] = await _query_osv_batch(http_client, queries)
+            unique_vulnerability_ids = sorted(set(x for ids in query_vulnerability_ids for x in ids))
+            [raw_vulnerabilities, vulnerability_warnings] = await _get_osv_vulnerabilities(
+                http_client, unique_vulnerability_ids
+            )
+        warnings.extend(vulnerability_warnings)
+
+    vulnerabilities: list = []
+    for [project_name, query_index] in component_queries:
+        package_name = py_.get(queries[query_index], "package.name")
+        package_version = queries[query_index].get("version")
+        for vulnerability_id in query_vulnerability_ids[query_index]:
+            if vulnerability_id in raw_vulnerabilities:
+                vulnerabilities.append(
+                    convert_vulnerability(
+                        raw_vulnerabilities[vulnerability_id], package_name, package_version, project_name
+                    )
+                )
     return [vulnerabilities, warnings]
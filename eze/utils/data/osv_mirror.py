@@ -0,0 +1,277 @@
+"""
+Offline mirror of osv advisories, for build agents without access to api.osv.dev
+
+imported from osv ecosystem data dumps (aka https://osv-vulnerabilities.storage.googleapis.com/PyPI/all.zip)
+into sqlite under the eze app dir, affected ranges are loaded into memory once per ecosystem and matched locally
+
+@see https://ossf.github.io/osv-schema/
+"""
+
+import json
+import re
+import sqlite3
+import threading
+import zipfile
+import zlib
+from pathlib import Path
+
+import click
+
+from eze.utils.error import EzeError
+from eze.utils.log import log_debug
+
+# pre-release words sort before the release, aka 1.0-rc1 < 1.0, post-release words after, aka 1.0.post1 > 1.0
+PRE_RELEASE_RANK: int = 0
+RELEASE_RANK: int = 1
+NUMBER_RANK: int = 2
+POST_RELEASE_WORDS: set = {"post", "rev", "r", "sp", "patch", "pl"}
+RELEASE_WORDS: set = {"final", "ga", "release"}
+VERSION_TOKEN_REGEX = re.compile("[0-9]+|[a-z]+")
+PYPI_NAME_SEPARATOR_REGEX = re.compile("[-_.]+")
+# git ranges are resolved via affected "versions", as commits can't be ordered offline
+VERSION_RANGE_TYPES: set = {"ECOSYSTEM", "SEMVER"}
+
+
+def version_key(version: str) -> tuple:
+    """
+    sortable key of version, approximates ordering of maven / pypi / npm / nuget etc versions
+
+    aka 1.0 == 1.0.0 < 1.0.1 and 1.0-rc1 < 1.0 < 1.0.post1
+    """
+    tokens = []
+    for token in VERSION_TOKEN_REGEX.findall(version.lower()):
+        if token.isdigit():
+            tokens.append((NUMBER_RANK, int(token)))
+        elif token in RELEASE_WORDS:
+            continue
+        else:
+            _strip_trailing_zeros(tokens)
+            tokens.append((RELEASE_RANK if token in POST_RELEASE_WORDS else PRE_RELEASE_RANK, token))
+    _strip_trailing_zeros(tokens)
+    tokens.append((RELEASE_RANK, ""))
+    return tuple(tokens)
+
+
+def _strip_trailing_zeros(tokens: list) -> None:
+    """remove trailing zero numbers, so 1.0.0 and 1 give the same key"""
+    while tokens and tokens[-1] == (NUMBER_RANK, 0):
+        tokens.pop()
+
+
+def normalise_package_name(ecosystem: str, package_name: str) -> str:
+    """pypi package names are case insensitive, and treat -_. as the same separator (PEP 503)"""
+    if ecosystem == "PyPI":
+        return PYPI_NAME_SEPARATOR_REGEX.sub("-", package_name).lower()
+    return package_name
+
+
+class AffectedPackage:
+    """affected versions of a package by an advisory, with ranges pre-parsed into version key intervals"""
+
+    def __init__(self, vulnerability_id: str, versions: list, ranges: list):
+        """constructor"""
+        self.vulnerability_id: str = vulnerability_id
+        self.versions: set = set(versions)
+        self.intervals: list = []
+        for version_range in ranges:
+            if version_range.get("type") in VERSION_RANGE_TYPES:
+                self.intervals.extend(_get_range_intervals(version_range.get("events", [])))
+
+    def is_affected(self, version: str, key: tuple) -> bool:
+        """version listed as affected, or within an affected range"""
+        if version in self.versions:
+            return True
+        for [introduced, limit, is_limit_inclusive] in self.intervals:
+            if key < introduced:
+                continue
+            if limit is None or key < limit or (is_limit_inclusive and key == limit):
+                return True
+        return False
+
+
+def _get_range_intervals(events: list) -> list:
+    """
+    convert osv range events into [introduced, fixed / last_affected, is last_affected] intervals
+
+    as per osv spec, events are evaluated in version order (dumps don't always list them in order)
+    """
+    sorted_events = []
+    for event in events:
+        for event_type in ["introduced", "fixed", "last_affected"]:
+            if event_type in event:
+                event_key = () if event[event_type] == "0" else version_key(event[event_type])
+                sorted_events.append([event_key, event_type])
+    sorted_events.sort(key=lambda x: x[0])
+    intervals = []
+    introduced = None
+    for [event_key, event_type] in sorted_events:
+        if event_type == "introduced":
+            if introduced is None:
+                introduced = event_key
+        elif introduced is not None:
+            intervals.append([introduced, event_key, event_type == "last_affected"])
+            introduced = None
+    if introduced is not None:
+        intervals.append([introduced, None, False])
+    return intervals
+
+
+class OsvMirror:
+    """Singleton Class for accessing offline mirror of osv advisories"""
+
+    _instance = None
+
+    @staticmethod
+    def get_instance():
+        """Get previously set osv mirror, disabled mirror if not set"""
+        if OsvMirror._instance is None:
+            OsvMirror._instance = OsvMirror()
+        return OsvMirror._instance
+
+    @staticmethod
+    def set_instance(enabled: bool, db_file: Path = None):
+        """Set the global osv mirror"""
+        OsvMirror._instance = OsvMirror(enabled, db_file)
+        return OsvMirror._instance
+
+    @staticmethod
+    def reset_instance():
+        """Reset the global osv mirror"""
+        OsvMirror._instance = None
+
+    def __init__(self, enabled: bool = False, db_file: Path = None):
+        """constructor"""
+        self.enabled: bool = enabled
+        self.db_file: Path = db_file or OsvMirror.get_default_db_file()
+        self._connection: sqlite3.Connection = None
+        self._lock = threading.Lock()
+        # ecosystem -> package name -> list of AffectedPackage, loaded once per run
+        self._ecosystems: dict = {}
+        self._vulnerabilities: dict = {}
+
+    @staticmethod
+    def get_default_db_file() -> Path:
+        """Path of osv mirror database, inside eze app dir"""
+        raw_path = click.get_app_dir("eze", roaming=False, force_posix=False)
+        return Path(raw_path) / "cache" / "osv-mirror.sqlite"
+
+    def is_enabled(self) -> bool:
+        """lookups are resolved locally, instead of via api.osv.dev"""
+        return self.enabled
+
+    def check_available(self) -> None:
+        """
+        check imported mirror can be read, so callers can warn once rather than per lookup
+
+        :raises EzeError: when mirror hasn't been imported or is unreadable
+        """
+        self._execute("SELECT 1 FROM vulnerabilities LIMIT 1", [])
+
+    def import_dump(self, dump_file: str) -> int:
+        """
+        import osv data dump (zip of osv json files), replacing any previously imported copies of its advisories
+
+        :raises EzeError: on invalid dump
+        """
+        rows = []
+        affected_rows = []
+        try:
+            with zipfile.ZipFile(dump_file) as dump_zip:
+                for dump_entry in dump_zip.namelist():
+                    if not dump_entry.endswith(".json"):
+                        continue
+                    vulnerability = json.loads(dump_zip.read(dump_entry))
+                    vulnerability_id = vulnerability["id"]
+                    rows.append([vulnerability_id, zlib.compress(json.dumps(vulnerability).encode())])
+                    for affected in vulnerability.get("affected", []):
+                        ecosystem = affected.get("package", {}).get("ecosystem")
+                        package_name = affected.get("package", {}).get("name")
+                        if not ecosystem or not package_name:
+                            continue
+                        affected_rows.append(
+                            [
+                                ecosystem,
+                                normalise_package_name(ecosystem, package_name),
+                                vulnerability_id,
+                                json.dumps([affected.get("versions", []), affected.get("ranges", [])]),
+                            ]
+                        )
+        except (OSError, zipfile.BadZipFile, ValueError, KeyError) as error:
+            raise EzeError(f"unable to import osv data dump '{dump_file}', Error: {error}")
+        with self._lock:
+            connection = self._get_connection()
+            with connection:
+                connection.executemany("DELETE FROM affected WHERE vulnerability_id = ?", [[x[0]] for x in rows])
+                connection.executemany("INSERT OR REPLACE INTO vulnerabilities (id, body) VALUES (?, ?)", rows)
+                connection.executemany(
+                    "INSERT INTO affected (ecosystem, package, vulnerability_id, ranges) VALUES (?, ?, ?, ?)",
+                    affected_rows,
+                )
+        self._ecosystems = {}
+        self._vulnerabilities = {}
+        return len(rows)
+
+    def query(self, ecosystem: str, package_name: str, package_version: str) -> list:
+        """
+        ids of advisories affecting package version, all package's advisories when version not given
+
+        :raises EzeError: when mirror hasn't been imported
+        """
+        if ecosystem not in self._ecosystems:
+            self._ecosystems[ecosystem] = self._load_ecosystem(ecosystem)
+        affected_packages = self._ecosystems[ecosystem].get(normalise_package_name(ecosystem, package_name), [])
+        if not package_version:
+            return sorted(set(x.vulnerability_id for x in affected_packages))
+        key = version_key(package_version)
+        return sorted(set(x.vulnerability_id for x in affected_packages if x.is_affected(package_version, key)))
+
+    def get_vulnerability(self, vulnerability_id: str) -> dict:
+        """
+        full osv advisory, None if not in mirror
+
+        :raises EzeError: when mirror hasn't been imported
+        """
+        if vulnerability_id not in self._vulnerabilities:
+            rows = self._execute("SELECT body FROM vulnerabilities WHERE id = ?", [vulnerability_id])
+            self._vulnerabilities[vulnerability_id] = json.loads(zlib.decompress(rows[0][0])) if rows else None
+        return self._vulnerabilities[vulnerability_id]
+
+    def _load_ecosystem(self, ecosystem: str) -> dict:
+        """load all affected ranges of ecosystem, pre-parsing their versions"""
+        log_debug(f"loading osv mirror of {ecosystem}")
+        packages = {}
+        rows = self._execute("SELECT package, vulnerability_id, ranges FROM affected WHERE ecosystem = ?", [ecosystem])
+        for [package_name, vulnerability_id, raw_ranges] in rows:
+            [versions, ranges] = json.loads(raw_ranges)
+            packages.setdefault(package_name, []).append(AffectedPackage(vulnerability_id, versions, ranges))
+        return packages
+
+    def _execute(self, sql: str, parameters: list) -> list:
+        """
+        run sql query against imported mirror
+
+        :raises EzeError: when mirror hasn't been imported
+        """
+        with self._lock:
+            if not self._connection and not self.db_file.is_file():
+                raise EzeError(
+                    f"osv mirror '{self.db_file}' not found, import osv data dumps via 'eze housekeeping import-osv-mirror'"
+                )
+            try:
+                return self._get_connection().execute(sql, parameters).fetchall()
+            except sqlite3.Error as error:
+                raise EzeError(f"unable to read osv mirror '{self.db_file}', Error: {error}")
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """open database, creating tables on first use"""
+        if not self._connection:
+            self.db_file.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(str(self.db_file), timeout=10, check_same_thread=False)
+            connection.execute("CREATE TABLE IF NOT EXISTS vulnerabilities (id TEXT PRIMARY KEY, body BLOB)")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS affected (ecosystem TEXT, package TEXT, vulnerability_id TEXT, ranges TEXT)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS affected_by_ecosystem ON affected (ecosystem, package)")
+            connection.execute("CREATE INDEX IF NOT EXISTS affected_by_vulnerability ON affected (vulnerability_id)")
+            self._connection = connection
+        return self._connection
@@ -13,8 +13,10 @@ from eze.utils.purl import PurlBreakdown, purl_to_components
 from pydash import py_
 
 from eze.core.enums import Vulnerability, VulnerabilitySeverityEnum, VulnerabilityType
-from eze.utils.io.http import request_json
+from eze.utils.data.advisory_cache import PYPI_SOURCE, cached_request_json
 from eze.utils.data.cve import get_cve_data
+from eze.utils.data.osv import OsvEcosystem, OsvPackageVO, get_osv_package_data
+from eze.utils.data.osv_mirror import OsvMirror
 from eze.utils.error import EzeError
 
 LICENSE_CLASSIFIER = re.compile("license :: ", re.IGNORECASE)
@@ -96,7 +98,7 @@ def get_pypi_package_data(
     warnings = []
     package_metadata: dict = {}
     try:
-        package_metadata = request_json(pypi_url)
+        package_metadata = cached_request_json(PYPI_SOURCE, f"{package_name}:{package_version}", pypi_url)
     except EzeError as error:
         warnings.append(f"unable to get pypi data for {package_name}:{package_version}, Error: {error}")
 
@@ -131,6 +133,12 @@ def _sca_component(component: dict, project_name: str) -> list:
     purl_breakdown: PurlBreakdown = purl_to_components(purl)
     if not purl_breakdown or purl_breakdown.type != "pypi":
         return [[], []]
+    if OsvMirror.get_instance().is_enabled():
+        # offline, so vulnerabilities from osv mirror (which includes pypa advisory-db), and licenses only from sbom
+        osv_data: OsvPackageVO = get_osv_package_data(
+            OsvEcosystem.PyPI.value, purl_breakdown.name, purl_breakdown.version, project_name
+        )
+        return [osv_data.vulnerabilities, osv_data.warnings]
     pypi_data: PypiPackageVO = get_pypi_package_data(purl_breakdown.name, purl_breakdown.version, project_name)
     licenses = component.get("licenses", [])
     if len(licenses) == 0:
@@ -146,6 +154,12 @@ def pypi_sca_sboms(cyclonedx_boms: dict) -> list:
     annotates sboms with license information
     returns the pypi vulnerabilities and warnings
     """
+    osv_mirror = OsvMirror.get_instance()
+    if osv_mirror.is_enabled():
+        try:
+            osv_mirror.check_available()
+        except EzeError as error:
+            return [[], [f"unable to get osv data, Error: {error}"]]
     vulnerabilities: list = []
     warnings: list = []
     for project_name in cyclonedx_boms:
@@ -22,6 +22,18 @@ class EzeNetworkingError(EzeError):
     """Networking Error Class for all Eze"""
 
 
+class EzeConnectionError(EzeNetworkingError):
+    """Connection Error Class for all Eze (when connection to server fails, so request never sent)"""
+
+
+class EzeHttpStatusError(EzeNetworkingError):
+    """Http Error Status Class for all Eze (when server responds with 4xx / 5xx)"""
+
+    def __init__(self, message: str, status_code: int):
+        super().__init__(message)
+        self.status_code: int = status_code
+
+
 class EzeConfigError(EzeError):
     """Config Error Class for all Eze"""
 
@@ -2,21 +2,29 @@
 """
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
 from pydash import py_
 
-from eze.utils.error import EzeFileAccessError
+from eze.utils.error import EzeError, EzeFileAccessError
 from eze.utils.io.file import load_text
 from eze.utils.log import log_error
 
 MAX_RECURSION: int = 10
 
-try:
-    import git
-except ImportError:
-    # WORKAROUND: see "ImportError: Bad git executable."
-    # see https://github.com/gitpython-developers/GitPython/issues/816
-    log_error("Git not installed, eze will not be able to detect git branches")
+
+@lru_cache(maxsize=None)
+def _import_git():
+    """GitPython imported on first use, as slow to import, None when git not installed"""
+    try:
+        import git  # pylint: disable=import-outside-toplevel
+
+        return git
+    except ImportError:
+        # WORKAROUND: see "ImportError: Bad git executable."
+        # see https://github.com/gitpython-developers/GitPython/issues/816
+        log_error("Git not installed, eze will not be able to detect git branches")
+        return None
 
 
 def clean_url(url: str) -> str:
@@ -42,12 +50,12 @@ def get_active_branch(git_dir: str) -> object:
 
 def _get_active_branch(git_dir: str) -> object:
     """non-recursive git repo check will return branch object if found"""
+    git = _import_git()
+    if not git:
+        return None
     try:
         repo = git.Repo(git_dir)
         git_branch = repo.active_branch
-    except NameError:
-        # INFO: git will not exist when git not installed
-        git_branch = None
     except git.GitError:
         # in particular git.InvalidGitRepositoryError
         git_branch = None
@@ -61,9 +69,44 @@ def _get_active_branch(git_dir: str) -> object:
     return git_branch
 
 
+class GitContext:
+    """Singleton Class for run-scoped git metadata, resolved once per run instead of per tool / reporter"""
+
+    _instance = None
+
+    @staticmethod
+    def get_instance():
+        """Get previously set git context, resolving current dir's if not set"""
+        if GitContext._instance is None:
+            GitContext._instance = GitContext(os.getcwd())
+        return GitContext._instance
+
+    @staticmethod
+    def set_instance(git_dir: str):
+        """Set the global git context"""
+        GitContext._instance = GitContext(git_dir)
+        return GitContext._instance
+
+    @staticmethod
+    def reset_instance():
+        """Reset the global git context"""
+        GitContext._instance = None
+
+    def __init__(self, git_dir: str):
+        """constructor, repo opened once for both uri and branch name"""
+        branch = get_active_branch(git_dir)
+        self.git_dir: str = git_dir
+        self.branch_uri: str = _get_branch_uri(branch)
+        self.branch_name: str = _get_branch_name(branch)
+
+
 def get_active_branch_uri(git_dir: str) -> str:
     """given dir will check repo latest uri"""
-    branch = get_active_branch(git_dir)
+    return _get_branch_uri(get_active_branch(git_dir))
+
+
+def _get_branch_uri(branch: object) -> str:
+    """uri of branch's repo, falling back to ci environment variables"""
     git_uri = py_.get(branch, "repo.remotes.origin.url", None)
     if git_uri:
         # remove any credentials inside repo url
@@ -102,7 +145,11 @@ def get_active_branch_uri(git_dir: str) -> str:
 
 def get_active_branch_name(git_dir: str) -> str:
     """given dir will check repo latest branch"""
-    branch = get_active_branch(git_dir)
+    return _get_branch_name(get_active_branch(git_dir))
+
+
+def _get_branch_name(branch: object) -> str:
+    """name of branch, falling back to ci environment variables"""
     git_branchname = py_.get(branch, "name", None)
     if git_branchname:
         return git_branchname
@@ -160,3 +207,36 @@ def get_gitignore_paths(git_dir: str = None) -> list:
         return []
     gitignore_lines = [x for x in gitignore_txt.split("\n") if not x.strip().startswith("#") and not x.strip() == ""]
     return list(set(gitignore_lines))
+
+
+def get_head_commit(git_dir: str = None) -> str:
+    """given dir will return sha of checked out commit, None if not a git repo"""
+    git = _import_git()
+    if not git:
+        return None
+    try:
+        repo = git.Repo(git_dir or os.getcwd(), search_parent_directories=True)
+        return repo.head.commit.hexsha
+    except (git.GitError, ValueError, OSError):
+        # INFO: ValueError thrown when repo has no commits yet
+        return None
+
+
+def get_changed_files(git_ref: str, git_dir: str = None) -> list:
+    """
+    list of files changed since git ref (committed, uncommitted and untracked), relative to git_dir
+    includes deleted files, so callers can drop any stale findings for them
+    INFO: uses NUL separated output, as newline output c-quotes non-ascii paths
+
+    :raises EzeError
+    """
+    git = _import_git()
+    if not git:
+        raise EzeError("git not installed, unable to detect changed files")
+    try:
+        git_cmd = git.Git(git_dir or os.getcwd())
+        changed_files = git_cmd.diff("--name-only", "-z", "--relative", git_ref, "--").split("\0")
+        untracked_files = git_cmd.ls_files("--others", "--exclude-standard", "-z").split("\0")
+    except (git.GitError, OSError) as error:
+        raise EzeError(f"unable to detect files changed since '{git_ref}': {error}")
+    return sorted(set(x for x in changed_files + untracked_files if x))
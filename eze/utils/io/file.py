@@ -1,23 +1,25 @@
 """IO helpers
 """
+import gzip
+import hashlib
 import json
 import os
 import re
+import shutil
 import tempfile
 from pathlib import Path
 
-# INFO: saxutils.escape not insecure, it's xml.sax, no xml attribute escape equivilent in defused
-# https://github.com/PyCQA/bandit/issues/452
-from xml.sax.saxutils import escape  # nosec # nosemgrep
-
-import xmltodict
 import click
 import toml
-from eze.utils.io.print import pretty_print_json
+from eze.utils.io.print import iter_json
 
 from eze.utils.error import EzeFileAccessError, EzeFileParsingError
 from eze.utils.log import log, log_debug, log_error
 
+# json spooled for uploads is kept in memory up to this size, then spilled to disk
+SPOOL_MAX_MEMORY_BYTES: int = 10 * 1024 * 1024
+SPOOL_WRITE_BATCH_SIZE: int = 64 * 1024
+
 
 def sane(key):
     """sanitise keys to be Alpha-numerical"""
@@ -141,6 +143,37 @@ def load_json(file_path: str):
         )
 
 
+def load_partial_json(file_path: str):
+    """
+    Load json file which may have been partly written (aka tool killed mid-report), never raises
+
+    returns whole json when valid, the complete leading items of a truncated top-level list,
+    otherwise None
+    """
+    try:
+        json_str = load_text(file_path)
+    except EzeFileAccessError:
+        return None
+    try:
+        return json.loads(json_str)
+    except json.decoder.JSONDecodeError:
+        pass
+    json_str = json_str.lstrip()
+    if not json_str.startswith("["):
+        return None
+    decoder = json.JSONDecoder()
+    items: list = []
+    position = 1
+    while True:
+        while position < len(json_str) and json_str[position] in " \t\r\n,":
+            position += 1
+        try:
+            item, position = decoder.raw_decode(json_str, position)
+        except json.decoder.JSONDecodeError:
+            return items
+        items.append(item)
+
+
 def load_xml(file_path: str, force_list: dict = None):
     """
     Load xml file and convert to dict
@@ -148,6 +181,8 @@ def load_xml(file_path: str, force_list: dict = None):
     :raises EzeFileAccessError
     :raises EzeFileParsingError
     """
+    import xmltodict  # pylint: disable=import-outside-toplevel
+
     xml_str = load_text(file_path)
     try:
         return xmltodict.parse(xml_str, force_list=force_list or {})
@@ -173,6 +208,15 @@ def create_folder(file_path: str, raise_error_on_fail: bool = True):
         log_error(f"Eze cannot create folder '{not_permitted_err.filename}', Permission was denied")
 
 
+def hash_file(file_path: str) -> str:
+    """sha256 hex digest of file content, read in chunks"""
+    hasher = hashlib.sha256()
+    with open(file_path, "rb") as binary_file:
+        for chunk in iter(lambda: binary_file.read(1024 * 1024), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
 def write_text(file_path: str, text: str) -> str:
     """
     Save text file
@@ -190,15 +234,63 @@ def write_text(file_path: str, text: str) -> str:
         raise EzeFileAccessError(f"Eze cannot write '{not_permitted_err.filename}', Permission was denied")
 
 
-def write_json(file_path: str, json_vo) -> str:
+def write_stream(file_path: str, binary_stream) -> str:
+    """
+    Save binary stream to file, chunk by chunk
+
+    :raises EzeFileAccessError
+    """
+    create_folder(file_path)
+    location = get_absolute_filename(file_path)
+    try:
+        with open(location, mode="wb") as binary_file:
+            shutil.copyfileobj(binary_stream, binary_file)
+        return location
+    except PermissionError as not_permitted_err:
+        raise EzeFileAccessError(f"Eze cannot write '{not_permitted_err.filename}', Permission was denied")
+
+
+def write_json(file_path: str, json_vo, compact: bool = False) -> str:
     """
-    Save json file
+    Save json file, streamed chunk by chunk
 
     :raises EzeFileAccessError
     """
-    json_str = pretty_print_json(json_vo)
-    json_location = write_text(file_path, json_str)
-    return json_location
+    create_folder(file_path)
+    location = get_absolute_filename(file_path)
+    try:
+        with open(location, mode="w", encoding="utf-8") as json_file:
+            json_file.writelines(iter_json(json_vo, compact))
+        return location
+    except PermissionError as not_permitted_err:
+        raise EzeFileAccessError(f"Eze cannot write '{not_permitted_err.filename}', Permission was denied")
+
+
+def spool_json(json_vo, compact: bool = False, compress: bool = False):
+    """
+    Encode json into a utf-8 binary temp file (rewound), for uploading without holding json str in memory
+
+    json over SPOOL_MAX_MEMORY_BYTES is spilled to disk, caller must close returned file
+    compress gzips the json as it's written
+    """
+    json_file = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY_BYTES)
+    # INFO: mtime=0 so same json always gives same gzip bytes, closing gzip writer doesn't close json_file
+    writer = gzip.GzipFile(fileobj=json_file, mode="wb", mtime=0) if compress else json_file
+    chunks = []
+    chunks_size = 0
+    for chunk in iter_json(json_vo, compact):
+        chunks.append(chunk)
+        chunks_size += len(chunk)
+        # INFO: chunks are tiny (single tokens), encode / write in batches
+        if chunks_size >= SPOOL_WRITE_BATCH_SIZE:
+            writer.write("".join(chunks).encode("utf-8"))
+            chunks = []
+            chunks_size = 0
+    writer.write("".join(chunks).encode("utf-8"))
+    if compress:
+        writer.close()
+    json_file.seek(0)
+    return json_file
 
 
 def write_sarif(file_path: str, json_vo) -> str:
@@ -214,6 +306,11 @@ def write_sarif(file_path: str, json_vo) -> str:
 
 def xescape(fragment: str) -> str:
     """Helper, escapes xml attribute strings prevents xml expansion attacks"""
+    # INFO: saxutils.escape not insecure, it's xml.sax, no xml attribute escape equivilent in defused
+    # https://github.com/PyCQA/bandit/issues/452
+    # INFO: imported on use, saxutils pulls in urllib.request which slows cli startup
+    from xml.sax.saxutils import escape  # nosec # nosemgrep # pylint: disable=import-outside-toplevel
+
     if not fragment:
         if fragment == 0:
             return "0"
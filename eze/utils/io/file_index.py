@@ -0,0 +1,168 @@
+"""Persistent index of project files
+
+refreshed incrementally using directory mtimes, only folders whose entries changed are re-listed
+"""
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+import click
+
+from eze.utils.log import log_debug
+
+# folders modified this close to a scan may change again within the same mtime tick, so are always re-listed
+RACY_MTIME_NS: int = 2 * 1000 * 1000 * 1000
+# env var to disable persisting file index, aka read-only home folders or ephemeral ci runners
+FILE_INDEX_ENV: str = "EZE_FILE_INDEX"
+
+
+class FileIndex:
+    """Index of folders under root path, each with it's files (name, size, mtime) and sub folders
+
+    file size and mtime are as of when the file's folder was last listed"""
+
+    INDEX_VERSION: int = 1
+
+    def __init__(self, root_path: str, ignored_folders: list, index_file: Path = None):
+        """constructor"""
+        self.root_path: str = os.path.abspath(root_path)
+        self.ignored_folders: list = sorted(ignored_folders)
+        self.index_file: Path = index_file or FileIndex.get_default_index_file(self.root_path)
+        self.folders: dict = {}
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """index persistence can be disabled via EZE_FILE_INDEX=false, project is then fully listed each run"""
+        return os.environ.get(FILE_INDEX_ENV, "true").lower() not in ["false", "0", "no"]
+
+    @staticmethod
+    def get_default_index_file(root_path: str) -> Path:
+        """Path of index file for project, inside eze app dir"""
+        raw_path = click.get_app_dir("eze", roaming=False, force_posix=False)
+        project_key = hashlib.sha256(str(root_path).encode()).hexdigest()[:16]
+        return Path(raw_path) / "cache" / "file-index" / f"{project_key}.json"
+
+    def load(self) -> None:
+        """load previously saved index, ignored when missing, corrupted or built with other settings"""
+        try:
+            with open(self.index_file, "r", encoding="utf-8") as json_file:
+                saved_index = json.load(json_file)
+        except (OSError, ValueError):
+            return
+        if (
+            not isinstance(saved_index, dict)
+            or saved_index.get("version") != self.INDEX_VERSION
+            or saved_index.get("root_path") != self.root_path
+            or saved_index.get("ignored_folders") != self.ignored_folders
+        ):
+            log_debug(f"file index {self.index_file} out of date, rebuilding")
+            return
+        self.folders = saved_index.get("folders", {})
+
+    def save(self) -> None:
+        """save index, index write failures are not fatal"""
+        tmp_index_file = f"{self.index_file}.{os.getpid()}.tmp"
+        saved_index = {
+            "version": self.INDEX_VERSION,
+            "root_path": self.root_path,
+            "ignored_folders": self.ignored_folders,
+            "folders": self.folders,
+        }
+        try:
+            os.makedirs(Path(self.index_file).parent, exist_ok=True)
+            with open(tmp_index_file, "w", encoding="utf-8") as json_file:
+                json.dump(saved_index, json_file)
+            os.replace(tmp_index_file, self.index_file)
+        except OSError as error:
+            log_debug(f"unable to write file index {self.index_file}: {error}")
+
+    def refresh(self) -> dict:
+        """re-list folders whose mtime changed since last refresh, returns counts of listed and reused folders"""
+        scan_time_ns = time.time_ns()
+        previous_folders = self.folders
+        self.folders = {}
+        refresh_stats = {"listed": 0, "reused": 0}
+        pending_folders = [""]
+        while pending_folders:
+            folder = pending_folders.pop()
+            try:
+                folder_mtime_ns = os.stat(os.path.join(self.root_path, folder)).st_mtime_ns
+            except OSError:
+                continue
+            folder_entry = previous_folders.get(folder)
+            if folder_entry and folder_entry["mtime_ns"] == folder_mtime_ns:
+                refresh_stats["reused"] += 1
+            else:
+                folder_entry = self._list_folder(folder, folder_mtime_ns, scan_time_ns)
+                refresh_stats["listed"] += 1
+            self.folders[folder] = folder_entry
+            pending_folders.extend(os.path.join(folder, x) for x in reversed(folder_entry["folders"]))
+        return refresh_stats
+
+    def _list_folder(self, folder: str, folder_mtime_ns: int, scan_time_ns: int) -> dict:
+        """list files and sub folders of folder"""
+        folder_entry = {
+            # INFO: racy mtimes aren't stored, so folder is re-listed next refresh
+            "mtime_ns": folder_mtime_ns if folder_mtime_ns < scan_time_ns - RACY_MTIME_NS else None,
+            "files": {},
+            "folders": [],
+            "linked_folders": [],
+            "ignored_folders": [],
+        }
+        try:
+            dir_entries = sorted(os.scandir(os.path.join(self.root_path, folder)), key=lambda x: x.name)
+        except OSError:
+            return folder_entry
+        for dir_entry in dir_entries:
+            try:
+                is_dir = dir_entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                if dir_entry.name in self.ignored_folders:
+                    folder_entry["ignored_folders"].append(dir_entry.name)
+                elif dir_entry.is_symlink():
+                    # INFO: same as os.walk, linked folders are listed but not followed
+                    folder_entry["linked_folders"].append(dir_entry.name)
+                else:
+                    folder_entry["folders"].append(dir_entry.name)
+                continue
+            try:
+                file_stat = dir_entry.stat()
+                folder_entry["files"][dir_entry.name] = [file_stat.st_size, file_stat.st_mtime_ns]
+            except OSError:
+                folder_entry["files"][dir_entry.name] = [None, None]
+        return folder_entry
+
+    def get_file_lists(self) -> list:
+        """folder, ignored folder, file and filename lists, plus count of files by extension"""
+        discovered_folders = []
+        ignored_folders = []
+        discovered_files = []
+        discovered_filenames = []
+        discovered_types = {}
+        pending_folders = [""]
+        while pending_folders:
+            folder = pending_folders.pop()
+            folder_entry = self.folders.get(folder)
+            if not folder_entry:
+                continue
+            discovered_folders.extend(
+                os.path.join(folder, x) for x in folder_entry["folders"] + folder_entry["linked_folders"]
+            )
+            ignored_folders.extend(os.path.join(folder, x) for x in folder_entry["ignored_folders"])
+            for filename in folder_entry["files"]:
+                discovered_files.append(os.path.join(folder, filename))
+                discovered_filenames.append(filename)
+                extension = get_file_extension(filename)
+                discovered_types[extension] = discovered_types.get(extension, 0) + 1
+            pending_folders.extend(os.path.join(folder, x) for x in reversed(folder_entry["folders"]))
+        return [discovered_folders, ignored_folders, discovered_files, discovered_filenames, discovered_types]
+
+
+def get_file_extension(filename: str) -> str:
+    """extension of filename aka '.py', or filename when it has no extension aka 'Dockerfile'"""
+    filename_without_extension, extension = os.path.splitext(filename)
+    return extension or filename_without_extension
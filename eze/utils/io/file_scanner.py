@@ -1,14 +1,17 @@
 """Basic file finder utility
 """
+import hashlib
+import json
 import os
 import re
 import shutil
-from distutils.file_util import copy_file
+import threading
 from pathlib import Path
 
 from eze.utils.log import log_debug
 
-from eze.utils.io.file import create_tempfile_folder
+from eze.utils.io.file import create_tempfile_folder, delete_file, hash_file
+from eze.utils.io.file_index import FileIndex, get_file_extension
 
 from eze.utils.error import EzeError
 
@@ -23,7 +26,15 @@ __c.ignored_folders = None
 __c.discovered_files = None
 __c.discovered_filenames = None
 __c.discovered_types = None
-__c.cached_workspace = False
+__c.files_by_name = None
+__c.files_by_extension = None
+__c.name_matches = None
+__c.cached_workspace = None
+__c.cached_workspace_lock = threading.Lock()
+__c.changed_workspace_files = None
+
+# env var to disable hardlinking files into USE_SOURCE_COPY mirror, for tools which write into their source folder
+SOURCE_COPY_HARDLINKS_ENV: str = "EZE_SOURCE_COPY_HARDLINKS"
 
 IGNORED_FOLDERS: list = [
     # IDEs and Configs
@@ -68,17 +79,24 @@ def populate_file_cache(
     discovered_filenames: list,
     discovered_types: dict,
 ) -> None:
-    """delete file caching"""
+    """populate file caching, and lookups of files by name and extension"""
     __c.discovered_folders = discovered_folders
     __c.ignored_folders = ignored_folders
     __c.discovered_files = discovered_files
     __c.discovered_filenames = discovered_filenames
     __c.discovered_types = discovered_types
+    # filename / extension -> indexes into discovered_files, so lookups keep the discovered file order
+    __c.files_by_name = {}
+    __c.files_by_extension = {}
+    for file_index, filename in enumerate(discovered_filenames):
+        __c.files_by_name.setdefault(filename, []).append(file_index)
+        __c.files_by_extension.setdefault(get_file_extension(filename), []).append(file_index)
+    __c.name_matches = {}
 
 
 def initialise_cache():
     """sets up cache of files for project"""
-    if not __c.discovered_folders:
+    if __c.discovered_files is None:
         [
             discovered_folders,
             ignored_folders,
@@ -98,47 +116,26 @@ def delete_file_cache() -> None:
     __c.discovered_files = None
     __c.discovered_filenames = None
     __c.discovered_types = None
-    __c.cached_workspace = False
+    __c.files_by_name = None
+    __c.files_by_extension = None
+    __c.name_matches = None
+    __c.cached_workspace = None
+    __c.changed_workspace_files = None
 
 
 def _build_file_list(root_path: str = None) -> list:
-    """build a list of folder and file names"""
+    """build a list of folder and file names, from persistent file index refreshed using folder mtimes"""
     if not root_path:
         root_path = Path.cwd()
-    walk_dir = os.path.abspath(root_path)
-
-    root_prefix = len(str(Path(root_path))) + 1
-
-    ignored_folders = []
-    discovered_files = []
-    discovered_folders = []
-    discovered_filenames = []
-    discovered_filetypes = {}
-
-    for root, subdirs, files in os.walk(walk_dir):
-        # Ignore Some directories
-        for ignored_directory in IGNORED_FOLDERS:
-            if ignored_directory in subdirs:
-                ignored_folder_path = os.path.join(root, ignored_directory)[root_prefix:]
-                ignored_folders.append(ignored_folder_path)
-                subdirs.remove(ignored_directory)
-
-        for subdir in subdirs:
-            folder_path = os.path.join(root, subdir)[root_prefix:]
-            discovered_folders.append(folder_path)
-
-        for filename in files:
-            file_path = os.path.join(root, filename)[root_prefix:]
-            discovered_files.append(file_path)
-            discovered_filenames.append(filename)
-            filename_without_extension, extension = os.path.splitext(filename)
-            if not extension:
-                extension = filename_without_extension
-            if extension not in discovered_filetypes:
-                discovered_filetypes[extension] = 0
-            discovered_filetypes[extension] += 1
-
-    return [discovered_folders, ignored_folders, discovered_files, discovered_filenames, discovered_filetypes]
+    file_index = FileIndex(root_path, IGNORED_FOLDERS)
+    is_index_enabled = FileIndex.is_enabled()
+    if is_index_enabled:
+        file_index.load()
+    refresh_stats = file_index.refresh()
+    log_debug(f"refreshed file index {refresh_stats}")
+    if is_index_enabled and refresh_stats["listed"] > 0:
+        file_index.save()
+    return file_index.get_file_lists()
 
 
 def has_filetype(filetype: str) -> int:
@@ -152,28 +149,55 @@ def has_filetype(filetype: str) -> int:
 def find_files_by_path(regex_str: str) -> list:
     """find list of matching files by full path aka 'backend\\function\\ezemcdbcrud\\src\\package.json'"""
     list_of_files: list = get_file_list()
-    try:
-        regex = re.compile(regex_str)
-    except re.error as error:
-        raise EzeError(f"unable to parse regex '{regex_str}' due to {error.msg}")
+    regex = _compile_regex(regex_str)
     return list(filter(regex.match, list_of_files))
 
 
 def find_files_by_name(regex_str: str) -> list:
     """find list of matching files by name aka 'package.json'"""
-    list_of_files: list = get_file_list()
-    list_of_filenames: list = get_filename_list()
+    return find_files_by_names([regex_str])
+
+
+def find_files_by_names(regex_strs: list) -> list:
+    """find list of files with names matching any of the regexes, regexes are combined and compiled once"""
+    initialise_cache()
+    regex_key = tuple(regex_strs)
+    if regex_key not in __c.name_matches:
+        for regex_str in regex_strs:
+            # INFO: validate individually, so errors reference the given regex
+            _compile_regex(regex_str)
+        regex = _compile_regex("|".join(f"(?:{regex_str})" for regex_str in regex_strs))
+        file_indexes = []
+        # INFO: only match each distinct filename once
+        for filename, filename_indexes in __c.files_by_name.items():
+            if regex.match(filename):
+                file_indexes.extend(filename_indexes)
+        __c.name_matches[regex_key] = [__c.discovered_files[x] for x in sorted(file_indexes)]
+    return list(__c.name_matches[regex_key])
+
+
+def find_files_by_exact_name(filename: str) -> list:
+    """find list of files with exact name aka 'package.json'"""
+    initialise_cache()
+    return [__c.discovered_files[x] for x in __c.files_by_name.get(filename, [])]
+
+
+def find_files_by_extension(extension: str) -> list:
+    """find list of files with extension aka '.py'"""
+    initialise_cache()
+    return [__c.discovered_files[x] for x in __c.files_by_extension.get(extension, [])]
+
+
+def _compile_regex(regex_str: str) -> re.Pattern:
+    """
+    compile regex, raising EzeError if invalid
+
+    :raises EzeError
+    """
     try:
-        regex = re.compile(regex_str)
+        return re.compile(regex_str)
     except re.error as error:
         raise EzeError(f"unable to parse regex '{regex_str}' due to {error.msg}")
-    counter = 0
-    files_by_name = []
-    for filename in list_of_filenames:
-        if regex.match(filename):
-            files_by_name.append(list_of_files[counter])
-        counter += 1
-    return files_by_name
 
 
 def get_filename_list() -> list:
@@ -201,18 +225,139 @@ def get_folder_list() -> list:
 
 
 def cache_workspace_into_tmp() -> Path:
-    """get list of folders aka backend\\function\\ezemcdbcrud\\src\\"""
+    """mirror project files into tmp folder (USE_SOURCE_COPY), returns mirror folder"""
     workspace_folder = create_tempfile_folder("cached-workspace")
-    if __c.cached_workspace:
-        return workspace_folder
-    log_debug(f"running USE_SOURCE_COPY, copying files to {workspace_folder}")
-    log_debug(f"clear '{workspace_folder}'")
-    shutil.rmtree(workspace_folder)
-    files = get_file_list()
+    # lock as copy can be ran from the "workspace-copy" pipeline stage's thread
+    with __c.cached_workspace_lock:
+        if __c.cached_workspace:
+            return __c.cached_workspace
+        # persistent mirror per project, only changed files are re-copied on repeat runs
+        project_key = hashlib.sha256(str(Path.cwd().resolve()).encode()).hexdigest()[:16]
+        use_hardlinks = is_source_copy_hardlinks_enabled()
+        # INFO: separate mirror when hardlinks disabled, as existing mirror's files would still be linked
+        mirror_folder = os.path.join(workspace_folder, project_key if use_hardlinks else f"{project_key}-copy")
+        log_debug(f"running USE_SOURCE_COPY, syncing files to {mirror_folder}")
+        sync_stats = sync_workspace_mirror(get_file_list(), mirror_folder, use_hardlinks)
+        log_debug(f"synced source copy {sync_stats}")
+        __c.cached_workspace = mirror_folder
+    return mirror_folder
+
+
+def is_source_copy_hardlinks_enabled() -> bool:
+    """hardlinks are shared with the real files, so can be disabled via EZE_SOURCE_COPY_HARDLINKS=false"""
+    return os.environ.get(SOURCE_COPY_HARDLINKS_ENV, "true").lower() not in ["false", "0", "no"]
+
+
+def sync_workspace_mirror(files: list, mirror_folder: str, use_hardlinks: bool = True) -> dict:
+    """
+    incrementally mirror files into mirror_folder, returns counts of copied, unchanged and removed files
+
+    files are compared against a manifest of mtime and size from the last sync,
+    touched files with the same size are content hashed before being re-copied,
+    files are hardlinked where the filesystem supports it (unless use_hardlinks false), stale files are removed
+    """
+    manifest_file = f"{mirror_folder}.manifest.json"
+    manifest = _load_mirror_manifest(manifest_file)
+    if manifest is None:
+        # no usable manifest, mirror contents unknown so start afresh
+        shutil.rmtree(mirror_folder, ignore_errors=True)
+        manifest = {}
+    os.makedirs(mirror_folder, exist_ok=True)
+
+    sync_stats = {"copied": 0, "unchanged": 0, "removed": 0}
+    updated_manifest = {}
     for file in files:
-        dest_file = os.path.join(workspace_folder, file)
+        try:
+            file_stat = os.stat(file)
+        except OSError:
+            continue
+        file_signature = [file_stat.st_mtime_ns, file_stat.st_size]
+        dest_file = os.path.join(mirror_folder, file)
+        updated_manifest[file] = file_signature
+        previous_signature = manifest.get(file)
+        if previous_signature and os.path.isfile(dest_file):
+            if previous_signature == file_signature:
+                sync_stats["unchanged"] += 1
+                continue
+            if previous_signature[1] == file_signature[1] and hash_file(file) == hash_file(dest_file):
+                sync_stats["unchanged"] += 1
+                continue
         log_debug(f"copying to '{dest_file}'")
-        os.makedirs(Path(dest_file).parent, exist_ok=True)
-        copy_file(file, dest_file)
-    __c.cached_workspace = True
+        use_hardlinks = _mirror_file(file, dest_file, use_hardlinks)
+        sync_stats["copied"] += 1
+
+    for stale_file in set(manifest) - set(updated_manifest):
+        stale_dest_file = os.path.join(mirror_folder, stale_file)
+        log_debug(f"removing stale '{stale_dest_file}'")
+        delete_file(stale_dest_file)
+        _remove_empty_folders(Path(stale_dest_file).parent, Path(mirror_folder))
+        sync_stats["removed"] += 1
+
+    _save_mirror_manifest(manifest_file, updated_manifest)
+    return sync_stats
+
+
+def _mirror_file(file: str, dest_file: str, use_hardlinks: bool) -> bool:
+    """hardlink or copy file into mirror, returns if hardlinks should be tried for next file"""
+    os.makedirs(Path(dest_file).parent, exist_ok=True)
+    delete_file(dest_file)
+    if use_hardlinks:
+        try:
+            os.link(file, dest_file)
+            return True
+        except OSError:
+            # aka tmp on another device or filesystem without hardlinks, stop trying for remaining files
+            log_debug("unable to hardlink into source copy, falling back to copying files")
+    shutil.copy2(file, dest_file)
+    return False
+
+
+def _remove_empty_folders(folder: Path, root_folder: Path) -> None:
+    """remove folder and any parents left empty, up to root_folder"""
+    while folder != root_folder and root_folder in folder.parents:
+        try:
+            folder.rmdir()
+        except OSError:
+            return
+        folder = folder.parent
+
+
+def _load_mirror_manifest(manifest_file: str) -> dict:
+    """load mirror manifest, None if missing or corrupted"""
+    try:
+        with open(manifest_file, "r", encoding="utf-8") as json_file:
+            manifest = json.load(json_file)
+    except (OSError, ValueError):
+        return None
+    return manifest if isinstance(manifest, dict) else None
+
+
+def _save_mirror_manifest(manifest_file: str, manifest: dict) -> None:
+    """atomically save mirror manifest"""
+    tmp_manifest_file = f"{manifest_file}.{os.getpid()}.tmp"
+    with open(tmp_manifest_file, "w", encoding="utf-8") as json_file:
+        json.dump(manifest, json_file)
+    os.replace(tmp_manifest_file, manifest_file)
+
+
+def cache_changed_files_into_tmp(changed_files: list) -> Path:
+    """copy only given changed files into tmp folder, for incremental scans (see --changed-since)
+
+    deleted files and files inside ignored folders are skipped"""
+    workspace_folder = create_tempfile_folder("changed-workspace")
+    # lock as incremental tools running in parallel share the same copy
+    with __c.cached_workspace_lock:
+        if __c.changed_workspace_files == tuple(changed_files):
+            return workspace_folder
+        log_debug(f"copying {len(changed_files)} changed files to {workspace_folder}")
+        shutil.rmtree(workspace_folder)
+        os.makedirs(workspace_folder, exist_ok=True)
+        project_files = set(Path(file) for file in get_file_list())
+        for file in changed_files:
+            if Path(file) not in project_files or not os.path.isfile(file):
+                continue
+            dest_file = os.path.join(workspace_folder, file)
+            os.makedirs(Path(dest_file).parent, exist_ok=True)
+            shutil.copy2(file, dest_file)
+        __c.changed_workspace_files = tuple(changed_files)
     return workspace_folder
@@ -1,15 +1,25 @@
 """Networking helpers
 """
+import asyncio
 import json
 import urllib.request
 import urllib.error
+from concurrent.futures import ThreadPoolExecutor
 from json import JSONDecodeError
 
 import re
+from typing import Awaitable, Callable
 
-from eze.utils.error import EzeNetworkingError
+from eze.utils.error import EzeConnectionError, EzeHttpStatusError, EzeNetworkingError
 from eze.utils.log import log_debug
 
+DEFAULT_MAX_CONCURRENCY: int = 8
+DEFAULT_TIMEOUT_SEC: int = 60
+# timeouts, throttling and server / proxy errors are worth retrying, other 4xx will fail again
+RETRYABLE_STATUS_CODES: frozenset = frozenset([408, 429, 500, 502, 503, 504])
+# server rejected request without processing it, safe to retry non-idempotent requests aka POST
+NOT_PROCESSED_STATUS_CODES: frozenset = frozenset([408, 429, 503])
+
 
 def request_json(url: str, data=None, headers=None, method=None) -> dict:
     """
@@ -20,6 +30,14 @@ def request_json(url: str, data=None, headers=None, method=None) -> dict:
     if not headers:
         headers = {}
     contents = request(url, data=data, headers=headers, method=method)
+    return parse_json_response(url, contents)
+
+
+def parse_json_response(url: str, contents: str) -> dict:
+    """
+    convert response of url into json
+
+    :raises EzeNetworkingError: on json decoding error"""
     try:
         return json.loads(contents)
     except JSONDecodeError as error:
@@ -45,11 +63,170 @@ def request(url: str, data=None, headers=None, method=None) -> str:
         error_text = error.read().decode()
         error_message = f"{error.code} ({error.reason} [{error_text}]"
 
-        raise EzeNetworkingError(f"Error accessing url '{url}', Error: {error_message}")
+        raise EzeHttpStatusError(f"Error accessing url '{url}', Error: {error_message}", error.code)
+    except urllib.error.URLError as error:
+        raise EzeNetworkingError(f"Error accessing url '{url}', Error: {error}")
+
+
+class HttpResponse:
+    """Status, body and cache validators (ETag / Last-Modified) of a http response"""
+
+    def __init__(self, status: int, body: str = None, etag: str = None, last_modified: str = None):
+        """constructor"""
+        self.status: int = status
+        self.body: str = body
+        self.etag: str = etag
+        self.last_modified: str = last_modified
+
+
+def request_response(url: str, data=None, headers=None, method=None) -> HttpResponse:
+    """
+    requests a url and returns HttpResponse, for conditional requests a 304 (not modified) is returned not raised
+
+    :raises EzeNetworkingError: on networking error
+    """
+    log_debug(f"calling url '{url}'")
+    if not headers:
+        headers = {}
+    try:
+        req = urllib.request.Request(url, data=data, headers=headers, method=method)
+        # nosec: Request is being built directly above as a explicit http request
+        # hence no risk of unexpected scheme
+        with urllib.request.urlopen(req) as stream:  # nosec # nosemgrep
+            return HttpResponse(
+                stream.status, stream.read().decode(), stream.headers.get("ETag"), stream.headers.get("Last-Modified")
+            )
+    except urllib.error.HTTPError as error:
+        if error.code == 304:
+            return HttpResponse(304, None, error.headers.get("ETag"), error.headers.get("Last-Modified"))
+        error_text = error.read().decode()
+        error_message = f"{error.code} ({error.reason} [{error_text}]"
+
+        raise EzeHttpStatusError(f"Error accessing url '{url}', Error: {error_message}", error.code)
     except urllib.error.URLError as error:
         raise EzeNetworkingError(f"Error accessing url '{url}', Error: {error}")
 
 
+class AsyncHttpClient:
+    """Pooled keep-alive http client, for making many concurrent requests from async code
+
+    requests are ran on a bounded pool of worker threads (so don't block the event loop),
+    sharing the session's keep-alive connections"""
+
+    def __init__(self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY, timeout_sec: int = DEFAULT_TIMEOUT_SEC):
+        """constructor"""
+        # INFO: requests imported on first use, as slow to import and not needed on cli startup
+        import requests  # pylint: disable=import-outside-toplevel
+        from requests.adapters import HTTPAdapter  # pylint: disable=import-outside-toplevel
+        from urllib3.exceptions import NewConnectionError  # pylint: disable=import-outside-toplevel
+
+        self.timeout_sec: int = timeout_sec
+        self._request_exception = requests.RequestException
+        self._connect_timeout = requests.ConnectTimeout
+        self._new_connection_error = NewConnectionError
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=max_concurrency)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="eze-http")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        """close pooled connections"""
+        self._executor.shutdown(wait=False)
+        self._session.close()
+
+    async def request_json(self, url: str, data=None, headers=None, method=None) -> dict:
+        """
+        requests a url and convert return into json
+
+        :raises EzeNetworkingError: on networking error or json decoding error"""
+        contents = await self.request(url, data=data, headers=headers, method=method)
+        return parse_json_response(url, contents)
+
+    async def request(self, url: str, data=None, headers=None, method=None) -> str:
+        """
+        requests a url and returns string
+
+        :raises EzeNetworkingError: on networking error
+        """
+        response = await self.request_response(url, data=data, headers=headers, method=method)
+        return response.body
+
+    async def request_response(self, url: str, data=None, headers=None, method=None) -> HttpResponse:
+        """
+        requests a url and returns HttpResponse, for conditional requests a 304 (not modified) is returned not raised
+
+        :raises EzeConnectionError: on failing to connect, request never sent
+        :raises EzeNetworkingError: on networking error
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self._executor, self._request_response, url, data, headers, method)
+
+    def _is_connection_failure(self, error) -> bool:
+        """true when connecting to server failed, hence request never sent"""
+        if isinstance(error, self._connect_timeout):
+            return True
+        # INFO: requests wraps urllib3 errors in a MaxRetryError, its reason is the underlying error
+        reason = getattr(error.args[0], "reason", None) if error.args else None
+        return isinstance(reason, self._new_connection_error)
+
+    def _request_response(self, url: str, data=None, headers=None, method=None) -> HttpResponse:
+        """blocking request, ran on worker thread"""
+        log_debug(f"calling url '{url}'")
+        if not method:
+            method = "POST" if data is not None else "GET"
+        try:
+            response = self._session.request(method, url, data=data, headers=headers, timeout=self.timeout_sec)
+        except self._request_exception as error:
+            if self._is_connection_failure(error):
+                raise EzeConnectionError(f"Error connecting to url '{url}', Error: {error}")
+            raise EzeNetworkingError(f"Error accessing url '{url}', Error: {error}")
+        if response.status_code >= 400:
+            error_message = f"{response.status_code} ({response.reason} [{response.text}]"
+            raise EzeHttpStatusError(f"Error accessing url '{url}', Error: {error_message}", response.status_code)
+        return HttpResponse(
+            response.status_code,
+            None if response.status_code == 304 else response.text,
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+        )
+
+
+async def retry_request(
+    send_request: Callable[[], Awaitable],
+    max_retries: int,
+    backoff_sec: float,
+    retryable_status_codes: frozenset = RETRYABLE_STATUS_CODES,
+):
+    """
+    awaits send_request, retrying failed connections and retryable_status_codes with exponential backoff
+
+    other networking errors (aka timeouts, dropped connections) aren't retried, as request may have been processed
+
+    :raises EzeNetworkingError: on non retryable error, or once retries exhausted
+    """
+    attempt = 0
+    while True:
+        try:
+            return await send_request()
+        except EzeNetworkingError as error:
+            is_retryable = isinstance(error, EzeConnectionError) or (
+                isinstance(error, EzeHttpStatusError) and error.status_code in retryable_status_codes
+            )
+            if not is_retryable or attempt >= max_retries:
+                raise
+            delay_sec = backoff_sec * 2**attempt
+            attempt += 1
+            log_debug(f"retrying request in {delay_sec}s ({attempt}/{max_retries}), {error.message}")
+            await asyncio.sleep(delay_sec)
+
+
 def spine_case_url(url: str) -> str:
     """convert url into spine case, file name safe version"""
     cleaned_url = re.sub("^https?:?[/][/]", "", url)
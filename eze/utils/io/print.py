@@ -1,6 +1,7 @@
 """Print helpers
 """
 import json
+from typing import Iterator
 
 
 def generate_markdown_header(title: str, headerLevel=1) -> str:
@@ -89,6 +90,20 @@ def pretty_print_json(obj) -> str:
     return json.dumps(obj, default=vars, indent=2, sort_keys=True)
 
 
+def iter_json(obj, compact: bool = False) -> Iterator[str]:
+    """
+    Helper, lazily encodes generic python class/object into json str chunks
+
+    same output as pretty_print_json, compact drops indentation / whitespace for machine consumers
+    """
+    if compact:
+        encoder = json.JSONEncoder(default=vars, separators=(",", ":"), sort_keys=True)
+    else:
+        encoder = json.JSONEncoder(default=vars, indent=2, sort_keys=True)
+    # INFO: iterencode walks the object graph as it goes, so the whole json str is never held in memory
+    return encoder.iterencode(obj)
+
+
 def truncate(value: str, limit: int = 80, ellipsis: str = "…") -> str:
     """
     Helper, truncates string to character limit
@@ -2,14 +2,17 @@
 
 import re
 import shlex
+from pathlib import Path
 
 from pydash import py_
 
 from eze.utils.data.osv import get_osv_id_data
+from eze.utils.data.osv_mirror import OsvMirror
 
 from eze.core.enums import Vulnerability, VulnerabilitySeverityEnum, VulnerabilityType
 from eze.utils.cli.run import run_async_cmd
-from eze.utils.io.file_scanner import find_files_by_name
+from eze.utils.error import EzeError
+from eze.utils.io.file_scanner import find_files_by_extension
 
 
 class DeprecatedPackage:
@@ -45,16 +48,24 @@ class DotnetPackage:
 
 def get_dotnet_projects() -> []:
     """give a list of dotnet_projects"""
-    dotnet_projects = find_files_by_name(".*[.]csproj$")
+    dotnet_projects = find_files_by_extension(".csproj")
     return dotnet_projects
 
 
 def get_dotnet_solutions() -> []:
     """give a list of dotnet_solutions"""
-    dotnet_solutions = find_files_by_name(".*[.]sln$")
+    dotnet_solutions = find_files_by_extension(".sln")
     return dotnet_solutions
 
 
+async def restore_dotnet_projects() -> None:
+    """restore nuget packages for all dotnet projects, used by "dotnet-restore" pipeline stage"""
+    for dotnet_project_file in get_dotnet_projects():
+        completed_process = await run_async_cmd(shlex.split("dotnet restore"), cwd=Path(dotnet_project_file).parent)
+        # output not needed, release spooled output
+        completed_process.close()
+
+
 def extract_deprecated_packages(stdout: str) -> list:
     """
     extract deprecated packages from dotnet output
@@ -76,7 +87,8 @@ async def get_deprecated_packages(project_folder: str, dotnet_project_file: str)
     use dotnet to get list of deprecated packages
     @see https://www.nuget.org/packages?q=deprecated
     """
-    completed_process = await run_async_cmd(shlex.split("dotnet list package --deprecated"), cwd=project_folder)
+    with await run_async_cmd(shlex.split("dotnet list package --deprecated"), cwd=project_folder) as completed_process:
+        deprecated_packages = extract_deprecated_packages(completed_process.stdout)
     return list(
         map(
             lambda deprecated_package: Vulnerability(
@@ -92,7 +104,7 @@ async def get_deprecated_packages(project_folder: str, dotnet_project_file: str)
                     "file_location": {"path": dotnet_project_file, "line": 1},
                 }
             ),
-            extract_deprecated_packages(completed_process.stdout),
+            deprecated_packages,
         )
     )
 
@@ -115,15 +127,25 @@ def extract_vulnerable_packages(stdout: str) -> list:
 
 async def get_vulnerable_packages(project_folder: str, dotnet_project_file: str) -> list:
     """
-    use dotnet to get list of vulnerable packages
+    use dotnet to get list of vulnerable packages, returns vulnerabilities and warnings
     @see https://www.nuget.org/packages
     """
-    completed_process = await run_async_cmd(shlex.split("dotnet list package --vulnerable"), cwd=project_folder)
-    vulnerable_packages = extract_vulnerable_packages(completed_process.stdout)
+    with await run_async_cmd(shlex.split("dotnet list package --vulnerable"), cwd=project_folder) as completed_process:
+        vulnerable_packages = extract_vulnerable_packages(completed_process.stdout)
     vp: VulnerablePackage
     vulnerabilities = []
+    warnings = []
+    is_osv_available = True
+    osv_mirror = OsvMirror.get_instance()
+    if vulnerable_packages and osv_mirror.is_enabled():
+        try:
+            osv_mirror.check_available()
+        except EzeError as error:
+            # INFO: fallback to dotnet's advisory details, rather than warning for each package
+            warnings.append(f"unable to get osv data, Error: {error}")
+            is_osv_available = False
     for vp in vulnerable_packages:
-        if vp.advisory_id:
+        if vp.advisory_id and is_osv_available:
             osv_vuln = get_osv_id_data(vp.advisory_id, vp.package, vp.installed_version, dotnet_project_file)
             if osv_vuln.severity == "" or osv_vuln.severity == VulnerabilitySeverityEnum.na.name:
                 osv_vuln.severity = vp.severity.lower()
@@ -142,7 +164,7 @@ async def get_vulnerable_packages(project_folder: str, dotnet_project_file: str)
                     }
                 )
             )
-    return vulnerabilities
+    return [vulnerabilities, warnings]
 
 
 def _extract_transitive_packages(stdout: str, is_transitive: bool) -> dict:
@@ -178,8 +200,10 @@ def extract_transitive_packages(stdout: str) -> dict:
 
 async def annotate_transitive_licenses(sbom: dict, project_folder: str) -> dict:
     """adding annotations to licenses which are not top-level"""
-    completed_process = await run_async_cmd(shlex.split("dotnet list package --include-transitive"), cwd=project_folder)
-    packages = extract_transitive_packages(completed_process.stdout)
+    with await run_async_cmd(
+        shlex.split("dotnet list package --include-transitive"), cwd=project_folder
+    ) as completed_process:
+        packages = extract_transitive_packages(completed_process.stdout)
     for component in py_.get(sbom, "components", []):
         component_name = component["name"]
         is_not_transitive = component_name in packages["top_level"]
@@ -1,15 +1,16 @@
 """helper functions for dealing with iac"""
 
-from eze.utils.io.file_scanner import find_files_by_name
+from eze.utils.io.file_scanner import find_files_by_exact_name, find_files_by_name
 
 
 def get_dockerfile_projects() -> []:
     """give a list of docker projects"""
-    docker_files: list = find_files_by_name("^Dockerfile$")
+    docker_files: list = find_files_by_exact_name("Dockerfile")
     return docker_files
 
 
 def get_terraform_projects() -> []:
     """give a list of terraform projects"""
+    # INFO: prefix match, so json terraform aka main.tf.json is found too
     terraform_files: list = find_files_by_name("^main.tf")
     return terraform_files
@@ -1,16 +1,31 @@
 """helper functions for dealing with mvn and java issues"""
 
 import re
+import shlex
+from pathlib import Path
 
-from eze.utils.io.file_scanner import find_files_by_name
+from eze.utils.cli.run import run_async_cmd
+from eze.utils.io.file_scanner import find_files_by_exact_name
 
 
 def get_maven_projects() -> []:
     """give a list of maven projects"""
-    pom_files: list = find_files_by_name("^pom.xml$")
+    pom_files: list = find_files_by_exact_name("pom.xml")
     return pom_files
 
 
+async def resolve_maven_projects() -> None:
+    """
+    download maven dependencies for all maven projects, used by "maven-resolve" pipeline stage
+    stops parallel maven tools racing to populate the local ~/.m2 repository
+    """
+    maven_projects = [Path.joinpath(Path.cwd(), Path(pom_file).parent) for pom_file in get_maven_projects()]
+    for maven_project in maven_projects:
+        completed_process = await run_async_cmd(shlex.split("mvn -B -q dependency:resolve"), cwd=maven_project)
+        # output not needed, release spooled output
+        completed_process.close()
+
+
 def is_groovy_errors(warning_text: str) -> bool:
     """detect https://issues.apache.org/jira/browse/GROOVY-8339 error messages"""
     return (
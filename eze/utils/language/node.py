@@ -1,5 +1,6 @@
 """Helper functions for node based tools"""
 
+import asyncio
 import os
 import shlex
 from pathlib import Path
@@ -9,7 +10,7 @@ from pydash import py_
 from eze.utils.io.file import parse_json
 
 from eze.utils.cli.run import run_async_cmd
-from eze.utils.io.file_scanner import find_files_by_name
+from eze.utils.io.file_scanner import find_files_by_exact_name
 
 
 class Cache:
@@ -22,7 +23,7 @@ __c.installed_in_folder = {}
 
 def get_npm_projects() -> []:
     """give a list of npm projects"""
-    npm_package_jsons = find_files_by_name("^package.json$")
+    npm_package_jsons = find_files_by_exact_name("package.json")
     return npm_package_jsons
 
 
@@ -32,22 +33,39 @@ def delete_npm_cache() -> None:
 
 
 async def install_npm_in_path(raw_path):
-    """Install node dependencies"""
+    """Install node dependencies, concurrent calls for the same folder share a single npm install"""
     lookup_key: str = str(raw_path)
-    path = Path.joinpath(Path.cwd(), raw_path)
     if not lookup_key in __c.installed_in_folder:
-        has_package_json = os.path.isfile(path / "package.json")
-        if has_package_json:
-            await run_async_cmd(shlex.split("npm install"), cwd=path)
-    __c.installed_in_folder[lookup_key] = True
+        __c.installed_in_folder[lookup_key] = asyncio.ensure_future(_install_npm_in_path(raw_path))
+    try:
+        await __c.installed_in_folder[lookup_key]
+    except Exception:
+        # allow retry on failure
+        __c.installed_in_folder.pop(lookup_key, None)
+        raise
+
+
+async def _install_npm_in_path(raw_path) -> None:
+    """Install node dependencies, when package.json present"""
+    path = Path.joinpath(Path.cwd(), raw_path)
+    has_package_json = os.path.isfile(path / "package.json")
+    if has_package_json:
+        completed_process = await run_async_cmd(shlex.split("npm install"), cwd=path)
+        # output not needed, release spooled output
+        completed_process.close()
+
+
+async def install_npm_projects() -> None:
+    """Install node dependencies for all npm projects, used by "npm-install" pipeline stage"""
+    npm_projects = [Path(npm_package).parent for npm_package in get_npm_projects()]
+    await asyncio.gather(*[install_npm_in_path(npm_project) for npm_project in npm_projects])
 
 
 async def annotate_transitive_licenses(sbom: dict, project_folder: str, include_dev: True) -> dict:
     """adding annotations to licenses which are not top-level"""
     cmd = "npm list --json" if include_dev else "npm list --json --only=prod"
-    completed_process = await run_async_cmd(shlex.split(cmd), cwd=project_folder)
-    report_text = completed_process.stdout
-    parsed_json = parse_json(report_text)
+    with await run_async_cmd(shlex.split(cmd), cwd=project_folder) as completed_process:
+        parsed_json = parse_json(completed_process.stdout)
     top_level_packages = py_.get(parsed_json, "dependencies", {})
     for component in py_.get(sbom, "components", []):
         component_name = component["name"]
@@ -132,6 +132,7 @@ class Cache:
 
 __c = Cache()
 __c.licenses_data = None
+__c.license_resolver = None
 
 
 def get_licenses_data() -> dict:
@@ -173,56 +174,89 @@ def get_bom_license(license_dict: dict) -> str:
     return license_text
 
 
-def get_license(license_text: str) -> dict:
-    """get license data from eze/data/spdx-license-list-data-supplement.json"""
-    licenses_data = get_licenses_data()
-
-    # by spdx short code, aka "MIT"
-    license_id = normalise_license_id(license_text)
-    if license_id in licenses_data["licenses"]:
-        return licenses_data["licenses"][license_id]
-    # by pypi long code, aka "License :: OSI Approved :: MIT License"
-    pypi_license_id = convert_pypi_to_spdx(license_text)
-    if pypi_license_id:
-        if pypi_license_id in licenses_data["licenses"]:
-            return licenses_data["licenses"][pypi_license_id]
-        if pypi_license_id in licenses_data["licensesPatterns"]:
-            license_data = licenses_data["licensesPatterns"][pypi_license_id]
-            created_license_data = license_data.copy()
-            created_license_data["id"] = pypi_license_id
-            created_license_data["isOsiApproved"] = ":: OSI Approved ::" in license_text
+class LicenseResolver:
+    """Resolves license text into license data, using indexes precomputed from spdx-license-list-data-supplement.json
+
+    results are memoised per license text, as large sboms repeat the same few licenses"""
+
+    def __init__(self, licenses_data: dict):
+        """constructor"""
+        self.licenses: dict = licenses_data["licenses"]
+        self.licenses_by_url: dict = licenses_data["licensesUrls"]
+        self.licenses_patterns: dict = licenses_data["licensesPatterns"]
+        self.pypi_lookup_table: dict = py_.get(licenses_data, "pypiToSpdxLookup", {})
+        self.licenses_by_name: dict = {}
+        for license_data in self.licenses.values():
+            # INFO: first license wins, same as previous linear scan
+            self.licenses_by_name.setdefault(license_data["name"], license_data)
+        # all patterns as one alternation, each pattern's named group reports which matched
+        # alternatives are tried in order, so first matching pattern wins
+        self.pattern_names: dict = {f"p{index}": pattern for index, pattern in enumerate(self.licenses_patterns)}
+        self.pattern_regex = re.compile("|".join(f"(?P<{x}>{y})" for x, y in self.pattern_names.items()))
+        self.resolved: dict = {}
+
+    def resolve(self, license_text: str) -> dict:
+        """get license data, memoised per license text"""
+        if license_text not in self.resolved:
+            self.resolved[license_text] = self._resolve(license_text)
+        return self.resolved[license_text]
+
+    def _resolve(self, license_text: str) -> dict:
+        """get license data"""
+        # by spdx short code, aka "MIT"
+        license_id = normalise_license_id(license_text)
+        if license_id in self.licenses:
+            return self.licenses[license_id]
+        # by pypi long code, aka "License :: OSI Approved :: MIT License"
+        pypi_license_id = self.pypi_lookup_table.get(license_text)
+        if pypi_license_id:
+            if pypi_license_id in self.licenses:
+                return self.licenses[pypi_license_id]
+            if pypi_license_id in self.licenses_patterns:
+                created_license_data = self.licenses_patterns[pypi_license_id].copy()
+                created_license_data["id"] = pypi_license_id
+                created_license_data["isOsiApproved"] = ":: OSI Approved ::" in license_text
+                created_license_data["isFsfLibre"] = None
+                created_license_data["isDeprecated"] = None
+                return created_license_data
+        # by name, aka "MIT License"
+        if license_text in self.licenses_by_name:
+            return self.licenses_by_name[license_text]
+        # by url, aka microsoft's "http://go.microsoft.com/fwlink/?LinkId=329770"
+        if license_text in self.licenses_by_url:
+            created_license_data = self.licenses_by_url[license_text].copy()
+            created_license_data["isOsiApproved"] = None
             created_license_data["isFsfLibre"] = None
             created_license_data["isDeprecated"] = None
             return created_license_data
-    # by name, aka "MIT License"
-    for key in licenses_data["licenses"]:
-        license_data = licenses_data["licenses"][key]
-        if license_text == license_data["name"]:
-            return license_data
-    # by url, aka microsoft's "http://go.microsoft.com/fwlink/?LinkId=329770"
-    if license_text in licenses_data["licensesUrls"]:
-        license_data = licenses_data["licensesUrls"][license_text]
-        created_license_data = license_data.copy()
-        created_license_data["isOsiApproved"] = None
-        created_license_data["isFsfLibre"] = None
-        created_license_data["isDeprecated"] = None
-        return created_license_data
-    # by pattern, aka "Apache-X.X lorem ipsum facto"
-    for license_pattern in licenses_data["licensesPatterns"]:
-        license_data = licenses_data["licensesPatterns"][license_pattern]
-        if re.match(license_pattern, license_text):
-            created_license_data = license_data.copy()
+        # by pattern, aka "Apache-X.X lorem ipsum facto"
+        pattern_match = self.pattern_regex.match(license_text)
+        if pattern_match:
+            created_license_data = self.licenses_patterns[self.pattern_names[pattern_match.lastgroup]].copy()
             created_license_data["id"] = license_text
             created_license_data["isOsiApproved"] = None
             created_license_data["isFsfLibre"] = None
             created_license_data["isDeprecated"] = None
             return created_license_data
-    return None
+        return None
+
+
+def get_license_resolver() -> LicenseResolver:
+    """get license resolver, built once from eze/data/spdx-license-list-data-supplement.json"""
+    if not __c.license_resolver:
+        __c.license_resolver = LicenseResolver(get_licenses_data())
+    return __c.license_resolver
+
+
+def get_license(license_text: str) -> dict:
+    """get license data from eze/data/spdx-license-list-data-supplement.json"""
+    return get_license_resolver().resolve(license_text)
 
 
-def annotated_sbom_table(cyclonedx_bom: dict, print_transitive: bool = False) -> list:
-    """annotated and sorted sboms table data"""
-    sbom_components = annotate_licenses(cyclonedx_bom)
+def annotated_sbom_table(cyclonedx_bom: dict, print_transitive: bool = False, sbom_components: list = None) -> list:
+    """annotated and sorted sboms table data, reusing sbom_components when already annotated"""
+    if sbom_components is None:
+        sbom_components = annotate_licenses(cyclonedx_bom)
     sboms = []
     for sbom_component in sbom_components:
         if not print_transitive and sbom_component.is_transitive:
@@ -305,15 +339,21 @@ def get_policy(license_policy: str) -> dict:
 
 
 def check_licenses(
-    sbom: dict, license_policy: str, allowlist: list = None, denylist: list = None, project: str = "sbom"
+    sbom: dict,
+    license_policy: str,
+    allowlist: list = None,
+    denylist: list = None,
+    project: str = "sbom",
+    sbom_components: list = None,
 ) -> list:
-    """check licenses for violations of policies"""
+    """check licenses for violations of policies, reusing sbom_components when already annotated"""
     allowlist = allowlist if allowlist else []
     denylist = denylist if denylist else []
     vulnerabilities = []
     warnings = []
     policy = get_policy(license_policy)
-    sbom_components = annotate_licenses(sbom)
+    if sbom_components is None:
+        sbom_components = annotate_licenses(sbom)
 
     has_data: bool = False
     for sbom_component in sbom_components:
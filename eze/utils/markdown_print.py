@@ -10,6 +10,7 @@ from eze.utils.scan_result import (
     vulnerabilities_short_summary,
     has_vulnerability_data,
     has_sbom_data,
+    get_sbom_components,
 )
 from pydash import py_
 from eze.utils.license import annotated_sbom_table
@@ -74,7 +75,9 @@ def _print_sboms_from_scan_results(scan_results: list, print_transitive: bool =
         run_type = f":{run_details['run_type']}" if "run_type" in run_details and run_details["run_type"] else ""
         for project_name in scan_result.sboms:
             cyclonedx_bom = scan_result.sboms[project_name]
-            sboms = annotated_sbom_table(cyclonedx_bom, print_transitive)
+            sboms = annotated_sbom_table(
+                cyclonedx_bom, print_transitive, get_sbom_components(scan_result, project_name)
+            )
 
             str_buffer.append(generate_markdown_header(f"[{tool_name}{run_type}] {project_name} SBOM", 3))
             str_buffer.append(
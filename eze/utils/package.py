@@ -20,23 +20,131 @@ def get_tools() -> dict[str,ToolMeta]:
     ... this is called on plugin initialisation
 
 3) Enable new notification engines and scan engines
+
+Alternatively register tools / reporters classes directly, these are only imported when used
+
+entry_points={'eze.tools': 'xxx-tool = eze_plugin_xxx.tools:XxxTool'}
+entry_points={'eze.reporters': 'xxx-reporter = eze_plugin_xxx.reporters:XxxReporter'}
 """
 
-import pkg_resources
+import importlib
+from collections.abc import MutableMapping
+
+try:
+    from importlib.metadata import EntryPoint, entry_points
+except ImportError:
+    # python 3.7 backport
+    from importlib_metadata import EntryPoint, entry_points
 
 from eze.plugins import base_plugins
+from eze.utils.error import EzeConfigError
 from eze.utils.log import log
 
 EZE_ENTRY_POINT_PREFIX = "eze.plugins"
+# lazy entry points, aka entry_points={'eze.tools': 'xxx-tool = eze_plugin_xxx.tools:XxxTool'}
+EZE_TOOLS_ENTRY_POINT = "eze.tools"
+EZE_REPORTERS_ENTRY_POINT = "eze.reporters"
+
+
+class PluginRegistry(MutableMapping):
+    """
+    plugin name -> plugin class, lazy plugins are only imported when first used
+
+    entries can be classes, "module:Class" import paths, or entry points
+    """
+
+    def __init__(self, plugins: dict = None, base_class: type = None):
+        """constructor, plugins validated against base_class once loaded"""
+        self.base_class: type = base_class
+        self._plugins: dict = dict(plugins or {})
+        self._loaded: dict = {}
+
+    def __getitem__(self, plugin_name: str) -> type:
+        if plugin_name not in self._loaded:
+            self._loaded[plugin_name] = self._load(plugin_name, self._plugins[plugin_name])
+        return self._loaded[plugin_name]
+
+    def __setitem__(self, plugin_name: str, plugin) -> None:
+        self._plugins[plugin_name] = plugin
+        self._loaded.pop(plugin_name, None)
+
+    def __delitem__(self, plugin_name: str) -> None:
+        del self._plugins[plugin_name]
+        self._loaded.pop(plugin_name, None)
+
+    def __contains__(self, plugin_name: object) -> bool:
+        # INFO: without importing plugin
+        return plugin_name in self._plugins
+
+    def __iter__(self):
+        return iter(self._plugins)
+
+    def __len__(self) -> int:
+        return len(self._plugins)
+
+    def _load(self, plugin_name: str, plugin) -> type:
+        """
+        import plugin class
+
+        :raises EzeConfigError: on invalid plugin
+        """
+        try:
+            if isinstance(plugin, str):
+                [module_name, class_name] = plugin.split(":")
+                plugin = getattr(importlib.import_module(module_name), class_name)
+            elif isinstance(plugin, EntryPoint):
+                plugin = plugin.load()
+        except (ImportError, AttributeError, ValueError) as error:
+            raise EzeConfigError(f"unable to load plugin '{plugin_name}', Error: {error}")
+        if self.base_class and not (isinstance(plugin, type) and issubclass(plugin, self.base_class)):
+            raise EzeConfigError(f"invalid plugin '{plugin_name}', not a {self.base_class.__name__}")
+        return plugin
+
+
+class EntryPointPlugin:
+    """Plugin of lazy tool / reporter entry points"""
+
+    def __init__(self, tools: dict, reporters: dict):
+        """constructor"""
+        self.tools: dict = tools
+        self.reporters: dict = reporters
+
+    def get_tools(self) -> dict:
+        """entry point tools, imported when first used"""
+        return self.tools
+
+    def get_reporters(self) -> dict:
+        """entry point reporters, imported when first used"""
+        return self.reporters
+
+
+def is_valid_plugin(plugin, base_class: type) -> bool:
+    """plugin is a subclass of base_class, lazy plugins are validated once loaded"""
+    if isinstance(plugin, (str, EntryPoint)):
+        return True
+    return isinstance(plugin, type) and issubclass(plugin, base_class)
 
 
 def get_plugins() -> dict:
     """Get all plugins prefixed eze_"""
     discovered_plugins = {"inbuilt": base_plugins}
-    for entry_point in pkg_resources.iter_entry_points(EZE_ENTRY_POINT_PREFIX):
+    for entry_point in _get_entry_points(EZE_ENTRY_POINT_PREFIX):
         if entry_point.name in discovered_plugins:
             log(f"-- skipping plugin {entry_point.name} as already loaded")
             continue
         discovered_plugins[entry_point.name] = entry_point.load()
 
+    tools = {x.name: x for x in _get_entry_points(EZE_TOOLS_ENTRY_POINT)}
+    reporters = {x.name: x for x in _get_entry_points(EZE_REPORTERS_ENTRY_POINT)}
+    if tools or reporters:
+        discovered_plugins[EZE_TOOLS_ENTRY_POINT] = EntryPointPlugin(tools, reporters)
     return discovered_plugins
+
+
+def _get_entry_points(group: str) -> list:
+    """installed entry points of group, via importlib.metadata (no pkg_resources import)"""
+    installed_entry_points = entry_points()
+    if hasattr(installed_entry_points, "select"):
+        return list(installed_entry_points.select(group=group))
+    # INFO: python <3.10 returns dict of group -> entry points
+    return list(installed_entry_points.get(group, []))
@@ -2,17 +2,19 @@
 from pydash import py_
 
 from eze.core.tool import ScanResult, ToolMeta
-from eze.utils.license import get_bom_license, check_licenses
+from eze.utils.license import annotate_licenses, check_licenses
 
 
 def convert_sbom_into_scan_result(tool: ToolMeta, cyclonedx_bom: dict, project: str = "project"):
     """convert sbom into scan_result"""
+    sbom_components = annotate_licenses(cyclonedx_bom)
     [vulnerabilities, warnings] = check_licenses(
         cyclonedx_bom,
         tool.config["LICENSE_CHECK"],
         tool.config["LICENSE_ALLOWLIST"],
         tool.config["LICENSE_DENYLIST"],
         project,
+        sbom_components,
     )
     return ScanResult(
         {
@@ -20,6 +22,7 @@ def convert_sbom_into_scan_result(tool: ToolMeta, cyclonedx_bom: dict, project:
             # bom is deprecated will be removed soon
             "bom": cyclonedx_bom,
             "sboms": {project: cyclonedx_bom},
+            "components": {project: sbom_components},
             "vulnerabilities": vulnerabilities,
             "warnings": warnings,
         }
@@ -31,16 +34,19 @@ def convert_multi_sbom_into_scan_result(tool: ToolMeta, cyclonedx_boms: dict):
     first_bom = None
     vulnerabilities_list: list = []
     warnings_list: list = []
+    components: dict = {}
     for project_name in cyclonedx_boms:
         cyclonedx_bom = cyclonedx_boms[project_name]
         first_bom = cyclonedx_bom
 
+        components[project_name] = annotate_licenses(cyclonedx_bom)
         [vulnerabilities, warnings] = check_licenses(
             cyclonedx_bom,
             tool.config["LICENSE_CHECK"],
             tool.config["LICENSE_ALLOWLIST"],
             tool.config["LICENSE_DENYLIST"],
             project_name,
+            components[project_name],
         )
         vulnerabilities_list.extend(vulnerabilities)
         warnings_list.extend(warnings)
@@ -51,6 +57,7 @@ def convert_multi_sbom_into_scan_result(tool: ToolMeta, cyclonedx_boms: dict):
             # bom is deprecated will be removed soon
             "bom": first_bom,
             "sboms": cyclonedx_boms,
+            "components": components,
             "vulnerabilities": vulnerabilities_list,
             "warnings": warnings_list,
         }
@@ -68,6 +75,15 @@ def name_and_time_summary(scan_result: ScanResult, indent: str = "    ") -> str:
     return f"""{indent}{scan_type}{tool_name}{run_type} (scan duration: {duration_sec:0.1f} seconds)"""
 
 
+def get_sbom_components(scan_result: ScanResult, project_name: str) -> list:
+    """license annotated components of project's sbom, annotated on first use if scan_result wasn't created with them"""
+    if scan_result.components is None:
+        scan_result.components = {}
+    if project_name not in scan_result.components:
+        scan_result.components[project_name] = annotate_licenses(scan_result.sboms[project_name])
+    return scan_result.components[project_name]
+
+
 def bom_short_summary(scan_result: ScanResult, indent: str = "    ", print_transitive: bool = False) -> str:
     """convert bom into one line summary"""
     if not has_sbom_data(scan_result):
@@ -76,16 +92,12 @@ def bom_short_summary(scan_result: ScanResult, indent: str = "    ", print_trans
         return "ERROR when creating SBOM"
     totals_txts = []
     for project_name in scan_result.sboms:
-        cyclonedx_bom = scan_result.sboms[project_name]
         license_counts = {}
 
         # extract non transitive if desired
-        valid_components = []
-        for component in py_.get(cyclonedx_bom, "components", []):
-            is_transitive = py_.get(component, "properties.transitive", False)
-            if not print_transitive and is_transitive:
-                continue
-            valid_components.append(component)
+        valid_components = [
+            x for x in get_sbom_components(scan_result, project_name) if print_transitive or not x.is_transitive
+        ]
 
         component_count = len(valid_components)
         totals_txt = f"""{indent}{project_name} components: {component_count}"""
@@ -93,13 +105,7 @@ def bom_short_summary(scan_result: ScanResult, indent: str = "    ", print_trans
             totals_txt += " ("
             breakdowns = []
             for component in valid_components:
-                licenses = component.get("licenses", [])
-                if len(licenses) == 0:
-                    license_counts["unknown"] = license_counts.get("unknown", 0) + 1
-                for license_dict in licenses:
-                    license_name = get_bom_license(license_dict)
-                    if license_name:
-                        license_counts[license_name] = license_counts.get(license_name, 0) + 1
+                license_counts[component.license] = license_counts.get(component.license, 0) + 1
             for license_name in license_counts:
                 license_count = license_counts[license_name]
                 breakdowns.append(f"{license_name}:{license_count}")
@@ -0,0 +1,45 @@
+"""
+Benchmark import time of eze.cli.main, as paid by every eze invocation (even "eze --version")
+
+usage: python -m scripts.benchmarks.cli_startup [RUN_COUNT]
+"""
+import re
+import statistics
+import subprocess
+import sys
+
+IMPORT_TIME_REGEX = re.compile(r"^import time:\s+\d+ \|\s+(\d+) \|( *)(\S+)$")
+TOP_IMPORT_COUNT: int = 10
+
+
+def measure_import_times() -> dict:
+    """cumulative import time (us) of top level eze.cli.main and each of it's direct imports, in fresh interpreter"""
+    completed_process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import eze.cli.main"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_times = {}
+    for line in completed_process.stderr.splitlines():
+        match = IMPORT_TIME_REGEX.match(line)
+        # INFO: only top level and first level imports, nested imports are included in their cumulative time
+        if match and len(match.group(2)) <= 3:
+            import_times[match.group(3)] = int(match.group(1))
+    return import_times
+
+
+def main(run_count: int) -> None:
+    """print median import time of eze.cli.main, and it's slowest imports"""
+    runs = [measure_import_times() for _ in range(run_count)]
+    total_ms = statistics.median(x["eze.cli.main"] for x in runs) / 1000
+    print(f"eze.cli.main import time (median of {run_count}): {total_ms:.0f}ms")
+    print("slowest imports:")
+    last_run = runs[-1]
+    slowest_imports = sorted(last_run, key=lambda x: last_run[x], reverse=True)[:TOP_IMPORT_COUNT]
+    for module_name in slowest_imports:
+        print(f"    {last_run[module_name] / 1000:6.0f}ms  {module_name}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,44 @@
+"""
+Benchmark peak memory of writing a large json report, as big monorepo scans produce 100s of MBs of results
+
+usage: python -m scripts.benchmarks.json_report_memory [FINDING_COUNT]
+"""
+import os
+import sys
+import tempfile
+import tracemalloc
+
+from eze.core.tool import ScanResult
+from eze.utils.io.file import write_json, write_text
+from eze.utils.io.print import pretty_print_json
+from scripts.benchmarks.vulnerability_memory import create_raw_findings
+
+
+def measure_peak_mb(write_report, scan_results: list) -> float:
+    """peak memory (MB) allocated while writing report, on top of scan results"""
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    write_report(scan_results)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return (peak - before) / 1024 / 1024
+
+
+def main(finding_count: int) -> None:
+    """print peak memory of joined pretty json str vs streamed json, for one tool's findings"""
+    scan_results = [ScanResult({"tool": "dummy", "vulnerabilities": create_raw_findings(finding_count)})]
+    report_file = os.path.join(tempfile.gettempdir(), "eze-json-report-benchmark.json")
+    joined_mb = measure_peak_mb(lambda x: write_text(report_file, pretty_print_json(x)), scan_results)
+    report_mb = os.path.getsize(report_file) / 1024 / 1024
+    streamed_mb = measure_peak_mb(lambda x: write_json(report_file, x), scan_results)
+    compact_mb = measure_peak_mb(lambda x: write_json(report_file, x, compact=True), scan_results)
+    os.remove(report_file)
+    print(f"findings:                       {finding_count} ({report_mb:.0f}MB report)")
+    print(f"pretty_print_json peak memory:  {joined_mb:.1f}MB")
+    print(f"streamed write_json peak:       {streamed_mb:.1f}MB")
+    print(f"streamed compact peak:          {compact_mb:.1f}MB")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,50 @@
+"""
+Benchmark memory used per Vulnerability, as secret / sast scans of large repos can produce 100,000s of findings
+
+usage: python -m scripts.benchmarks.vulnerability_memory [FINDING_COUNT]
+"""
+import sys
+import tracemalloc
+
+from eze.core.enums import Vulnerability
+
+FILE_COUNT: int = 500
+
+
+def create_raw_findings(finding_count: int) -> list:
+    """raw findings as a tool parser would produce them, each with it's own copy of path and enum strings"""
+    return [
+        {
+            "vulnerability_type": "secret",
+            "name": f"Found Hardcoded 'AWS API Key' Pattern in file-{x % FILE_COUNT}.py",
+            "overview": "Found Hardcoded 'AWS API Key' Pattern",
+            "recommendation": f"Investigate 'file-{x % FILE_COUNT}.py' Line {x} for 'AWS API Key' strings",
+            "severity": "".join(["HI", "GH"]),
+            "confidence": "".join(["HI", "GH"]),
+            "identifiers": {},
+            "file_location": {"path": "".join(["src/module/", f"file-{x % FILE_COUNT}.py"]), "line": x},
+        }
+        for x in range(finding_count)
+    ]
+
+
+def main(finding_count: int) -> None:
+    """print bytes allocated per finding, for raw dicts and for Vulnerability objects"""
+    tracemalloc.start()
+    before_raw = tracemalloc.get_traced_memory()[0]
+    raw_findings = create_raw_findings(finding_count)
+    after_raw = tracemalloc.get_traced_memory()[0]
+    vulnerabilities = [Vulnerability(x) for x in raw_findings]
+    after_vulnerabilities = tracemalloc.get_traced_memory()[0]
+    # Vulnerability shares file_location dicts with raw findings, so raw findings kept alive (as during a scan)
+    del raw_findings
+    after_release = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"findings:                         {len(vulnerabilities)}")
+    print(f"raw dict bytes per finding:       {(after_raw - before_raw) / finding_count:.0f}")
+    print(f"Vulnerability bytes per finding:  {(after_vulnerabilities - after_raw) / finding_count:.0f}")
+    print(f"retained bytes per finding:       {(after_release - before_raw) / finding_count:.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -14,6 +14,10 @@ from eze.utils.io.print import pretty_print_json
 from eze.utils.scan_result import name_and_time_summary, vulnerabilities_short_summary, bom_short_summary
 
 from eze.core.config import EzeConfig
+from eze.utils.data.advisory_cache import AdvisoryCache
+from eze.utils.data.osv_mirror import OsvMirror
+from eze.utils.git import GitContext
+from eze.utils.cli.version_cache import ToolVersionCache
 from eze.core.engine import EzeCore
 from eze.core.reporter import ReporterManager, ReporterMeta
 from eze.core.tool import ToolManager, ToolMeta, ScanResult, ToolType
@@ -166,6 +170,10 @@ def setup_mock(eze_config: dict = None, tools: dict = None, reporters: dict = No
     EzeConfig.reset_instance()
     ToolManager.reset_instance()
     ReporterManager.reset_instance()
+    AdvisoryCache.reset_instance()
+    OsvMirror.reset_instance()
+    GitContext.reset_instance()
+    ToolVersionCache.reset_instance()
 
     EzeConfig.set_instance([eze_config])
 
@@ -183,6 +191,10 @@ def teardown_mock():
     EzeConfig.reset_instance()
     ToolManager.reset_instance()
     ReporterManager.reset_instance()
+    AdvisoryCache.reset_instance()
+    OsvMirror.reset_instance()
+    GitContext.reset_instance()
+    ToolVersionCache.reset_instance()
     LogLevel.reset_instance()
 
 
@@ -1,9 +1,11 @@
 # pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring,line-too-long
 
+import json
 import os
 import pathlib
 import shutil
 import tempfile
+import zipfile
 from unittest import mock
 
 from click.testing import CliRunner
@@ -102,3 +104,17 @@ Local configuration file: '{tmp_local_file}'"""
         assert result.exit_code == 0
         snapshot.snapshot_dir = get_snapshot_directory()
         snapshot.assert_match(result.output, "cli_housekeeping_commands/documentation_list.txt")
+
+    @mock.patch("eze.utils.data.osv_mirror.OsvMirror.get_default_db_file")
+    def test_import_osv_mirror_command(self, mock_get_default_db_file, tmp_path):
+        mock_get_default_db_file.return_value = tmp_path / "osv-mirror.sqlite"
+        with zipfile.ZipFile(tmp_path / "all.zip", "w") as dump_zip:
+            dump_zip.writestr("GHSA-1.json", json.dumps({"id": "GHSA-1", "affected": []}))
+
+        expected_success_message = (
+            f"Imported 1 advisories from '{tmp_path / 'all.zip'}' into osv mirror '{tmp_path / 'osv-mirror.sqlite'}'"
+        )
+        runner = CliRunner()
+        result = runner.invoke(housekeeping_group, ["import-osv-mirror", str(tmp_path / "all.zip")])
+        assert result.output.strip() == expected_success_message
+        assert result.exit_code == 0
@@ -61,9 +61,9 @@ class TestTestCommands:
 
     @pytest.mark.asyncio
     @mock.patch("eze.cli.commands.test_commands.os.path.join", mock.MagicMock(return_value=os.getcwd()))
-    @mock.patch("eze.cli.commands.test_commands.git.Repo.clone_from", mock.MagicMock(return_value=None))
-    @mock.patch("eze.cli.commands.test_commands.EzeCore.run_scan", mock.AsyncMock(side_effect=run_fake_scan))
-    @mock.patch("eze.cli.commands.test_commands.EzeCore.auto_build_ezerc", mock.AsyncMock(return_value=None))
+    @mock.patch("git.Repo.clone_from", mock.MagicMock(return_value=None))
+    @mock.patch("eze.core.engine.EzeCore.run_scan", mock.AsyncMock(side_effect=run_fake_scan))
+    @mock.patch("eze.core.engine.EzeCore.auto_build_ezerc", mock.AsyncMock(return_value=None))
     @mock.patch("eze.cli.commands.test_commands.EzeConfig.refresh_ezerc_config", mock.MagicMock(return_value=None))
     def test_tool_run__with_no_rebuild_remote_test(self, snapshot):
         # Given
@@ -90,9 +90,9 @@ class TestTestCommands:
 
     @pytest.mark.asyncio
     @mock.patch("eze.cli.commands.test_commands.os.path.join", mock.MagicMock(return_value=os.getcwd()))
-    @mock.patch("eze.cli.commands.test_commands.git.Repo.clone_from", mock.MagicMock(return_value=None))
-    @mock.patch("eze.cli.commands.test_commands.EzeCore.run_scan", mock.AsyncMock(side_effect=run_fake_scan))
-    @mock.patch("eze.cli.commands.test_commands.EzeCore.auto_build_ezerc", mock.AsyncMock(return_value=None))
+    @mock.patch("git.Repo.clone_from", mock.MagicMock(return_value=None))
+    @mock.patch("eze.core.engine.EzeCore.run_scan", mock.AsyncMock(side_effect=run_fake_scan))
+    @mock.patch("eze.core.engine.EzeCore.auto_build_ezerc", mock.AsyncMock(return_value=None))
     @mock.patch("eze.cli.commands.test_commands.EzeConfig.refresh_ezerc_config", mock.MagicMock(return_value=None))
     def test_tool_run__with_no_rebuild_remote_test_no_bucket(self, snapshot):
         # Given
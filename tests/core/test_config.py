@@ -85,6 +85,20 @@ class TestEzeConfig(TestCase):
         # Then
         assert output == expected_config
 
+    def test_get_plugin_config__memoised_copy(self):
+        # Given
+        inital_dict = {"safety": {"some": "key", "another": ["key"]}}
+        input_tool_name = "safety"
+        expected_config = {"some": "key", "another": ["key"]}
+        testee = EzeConfig()
+        merge_configs(inital_dict, testee.config)
+        # When
+        testee.get_plugin_config(input_tool_name)["another"].append("mutated by caller")
+        output = testee.get_plugin_config(input_tool_name)
+        # Then
+        assert output == expected_config
+        assert list(testee._plugin_configs) == [("safety", None, None)]
+
     def test_get_plugin_config__scan_case(self):
         # Given
         inital_dict = {
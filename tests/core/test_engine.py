@@ -1,8 +1,20 @@
 # pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring,line-too-long
-from unittest import TestCase
+import asyncio
+from unittest import TestCase, mock
+
+import pytest
 
 from eze.core.engine import EzeCore
-from tests.__test_helpers__.mock_helper import teardown_mock
+from eze.core.reporter import ReporterManager
+from eze.core.tool import ToolManager, ScanResult
+from eze.utils.error import EzeError
+from tests.__test_helpers__.mock_helper import (
+    setup_mock,
+    DummyReporter,
+    DummySuccessTool,
+    DEFAULT_MOCK_TOOLS,
+    teardown_mock,
+)
 
 
 class TestEzeCore(TestCase):
@@ -30,3 +42,269 @@ class TestEzeCore(TestCase):
         second_eze_instance = EzeCore.get_instance()
         # Then
         assert eze_instance != second_eze_instance
+
+
+class TestEzeCoreRunTools:
+    def setup_method(self):
+        """Pre-Test Setup func"""
+        fake_tools = ["slow-tool", "fast-tool", "tool-1", "tool-2", "tool-3", "tool-4", "tool-5"]
+        setup_mock(
+            {"scan": {"tools": [], "reporters": [], "MAX_CPU": 16, "MAX_MEMORY_MB": 16000}},
+            {**DEFAULT_MOCK_TOOLS, **{tool_name: DummySuccessTool for tool_name in fake_tools}},
+        )
+
+    def teardown_method(self):
+        """Post-Test Tear Down func"""
+        teardown_mock()
+
+    @pytest.mark.asyncio
+    async def test_run_tools__keeps_configured_order(self):
+        # Given
+        finish_order = []
+
+        async def run_tool(
+            tool_name: str, scan_type: str = None, changed_since: str = None, tool_version: str = None
+        ) -> ScanResult:
+            # first tool is slowest, so will finish last
+            await asyncio.sleep(0.05 if tool_name == "slow-tool" else 0)
+            finish_order.append(tool_name)
+            return ScanResult({"tool": tool_name})
+
+        testee = EzeCore.get_instance()
+        # When
+        with mock.patch.object(ToolManager.get_instance(), "run_tool", side_effect=run_tool):
+            output = await testee.run_tools(["slow-tool", "fast-tool"], max_parallel_tools=2)
+        # Then
+        assert finish_order == ["fast-tool", "slow-tool"]
+        assert [scan_result.tool for scan_result in output] == ["slow-tool", "fast-tool"]
+
+    @pytest.mark.asyncio
+    async def test_run_tools__bounded_concurrency(self):
+        # Given
+        counters = {"running": 0, "max_running": 0}
+
+        async def run_tool(
+            tool_name: str, scan_type: str = None, changed_since: str = None, tool_version: str = None
+        ) -> ScanResult:
+            counters["running"] += 1
+            counters["max_running"] = max(counters["max_running"], counters["running"])
+            await asyncio.sleep(0.01)
+            counters["running"] -= 1
+            return ScanResult({"tool": tool_name})
+
+        testee = EzeCore.get_instance()
+        # When
+        with mock.patch.object(ToolManager.get_instance(), "run_tool", side_effect=run_tool):
+            output = await testee.run_tools(["tool-1", "tool-2", "tool-3", "tool-4", "tool-5"], max_parallel_tools=2)
+        # Then
+        assert len(output) == 5
+        assert counters["max_running"] == 2
+
+    @pytest.mark.asyncio
+    async def test_run_tools__failure_does_not_affect_other_tools(self):
+        # Given
+        testee = EzeCore.get_instance()
+        # When
+        output = await testee.run_tools(["failure-tool", "success-tool"], max_parallel_tools=2)
+        # Then
+        assert output[0].fatal_errors == ["Something bad"]
+        assert output[1].fatal_errors == []
+        assert output[1].tool == "Safety"
+
+    @pytest.mark.asyncio
+    async def test_run_tools__config_error_does_not_affect_other_tools(self):
+        # Given
+        testee = EzeCore.get_instance()
+        # When
+        output = await testee.run_tools(["unknown-tool", "success-tool"], max_parallel_tools=2)
+        # Then
+        assert output[0].tool == "unknown-tool"
+        assert output[0].fatal_errors == [
+            "unknown-tool failed: [unknown-tool] The ./ezerc config references unknown tool plugin 'unknown-tool', run 'eze tools list' to see available tools"
+        ]
+        assert output[1].fatal_errors == []
+
+    @pytest.mark.asyncio
+    async def test_run_tools__unexpected_error_does_not_affect_other_tools(self):
+        # Given
+        testee = EzeCore.get_instance()
+        tool_manager = ToolManager.get_instance()
+        get_tool_pipeline_stages = tool_manager.get_tool_pipeline_stages
+
+        def crash_on_failure_tool(tool_name: str, *args, **kwargs) -> list:
+            if tool_name == "failure-tool":
+                raise KeyError("boom")
+            return get_tool_pipeline_stages(tool_name, *args, **kwargs)
+
+        # When
+        with mock.patch.object(tool_manager, "get_tool_pipeline_stages", side_effect=crash_on_failure_tool):
+            output = await testee.run_tools(["failure-tool", "success-tool"], max_parallel_tools=2)
+        # Then
+        assert output[0].tool == "failure-tool"
+        assert output[0].fatal_errors == ["failure-tool failed: 'boom'"]
+        assert output[1].fatal_errors == []
+
+    @pytest.mark.asyncio
+    async def test_run_tools__heavy_tool_runs_alone_within_budget(self):
+        # Given
+        setup_mock(
+            {
+                "scan": {"tools": [], "reporters": [], "MAX_CPU": 4, "MAX_MEMORY_MB": 4000},
+                "tool-1": {"RESOURCE_PROFILE": {"cpu": 4}},
+            },
+            {**DEFAULT_MOCK_TOOLS, "tool-1": DummySuccessTool, "tool-2": DummySuccessTool, "tool-3": DummySuccessTool},
+        )
+        running = set()
+        overlaps = []
+
+        async def run_tool(
+            tool_name: str, scan_type: str = None, changed_since: str = None, tool_version: str = None
+        ) -> ScanResult:
+            running.add(tool_name)
+            overlaps.append(set(running))
+            await asyncio.sleep(0.01)
+            running.remove(tool_name)
+            return ScanResult({"tool": tool_name})
+
+        testee = EzeCore.get_instance()
+        # When
+        with mock.patch.object(ToolManager.get_instance(), "run_tool", side_effect=run_tool):
+            await testee.run_tools(["tool-1", "tool-2", "tool-3"], max_parallel_tools=3)
+        # Then
+        assert {"tool-1"} in overlaps
+        assert all("tool-1" not in overlap or len(overlap) == 1 for overlap in overlaps)
+        assert {"tool-2", "tool-3"} in overlaps
+
+    @pytest.mark.asyncio
+    async def test_run_tools__setup_stage_failure_is_fatal_error(self):
+        # Given
+        testee = EzeCore.get_instance()
+        # When
+        with mock.patch.object(ToolManager.get_instance(), "get_tool_pipeline_stages", return_value=["npm-install"]):
+            with mock.patch("eze.core.pipeline.install_npm_projects", side_effect=EzeError("npm not found")):
+                output = await testee.run_tools(["success-tool"])
+        # Then
+        assert output[0].tool == "success-tool"
+        assert output[0].fatal_errors == ["success-tool setup failed: npm not found"]
+
+    @pytest.mark.asyncio
+    async def test_run_tools__setup_stages_skipped_when_tool_not_installed(self):
+        # Given
+        testee = EzeCore.get_instance()
+        tool_manager = ToolManager.get_instance()
+        # When
+        with mock.patch.object(tool_manager, "get_tool_pipeline_stages", return_value=["maven-resolve"]):
+            with mock.patch.object(DummySuccessTool, "check_installed", return_value=""):
+                with mock.patch("eze.core.pipeline.resolve_maven_projects") as mock_resolve_maven_projects:
+                    with mock.patch.object(tool_manager, "run_tool", return_value=ScanResult({"tool": "tool-1"})):
+                        output = await testee.run_tools(["tool-1"])
+        # Then
+        assert output[0].tool == "tool-1"
+        mock_resolve_maven_projects.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_run_tools__setup_version_check_passed_to_tool_run(self):
+        # Given
+        testee = EzeCore.get_instance()
+        tool_manager = ToolManager.get_instance()
+        # When
+        with mock.patch.object(tool_manager, "get_tool_pipeline_stages", return_value=["maven-resolve"]):
+            with mock.patch.object(DummySuccessTool, "check_installed", return_value="1.2.3"):
+                with mock.patch("eze.core.pipeline.resolve_maven_projects"):
+                    with mock.patch.object(tool_manager, "run_tool", return_value=ScanResult({})) as mock_run_tool:
+                        await testee.run_tools(["tool-1"])
+        # Then
+        mock_run_tool.assert_called_once_with("tool-1", None, changed_since=None, tool_version="1.2.3")
+
+
+class DummyConcurrentReporter(DummyReporter):
+    CONCURRENT_REPORT: bool = True
+
+
+class TestEzeCoreRunReports:
+    def setup_method(self):
+        """Pre-Test Setup func"""
+        setup_mock(
+            {"scan": {"tools": [], "reporters": []}},
+            None,
+            {
+                "upload-1": DummyConcurrentReporter,
+                "upload-2": DummyConcurrentReporter,
+                "console": DummyReporter,
+                "quality": DummyReporter,
+            },
+        )
+
+    def teardown_method(self):
+        """Post-Test Tear Down func"""
+        teardown_mock()
+
+    @pytest.mark.asyncio
+    async def test_run_reports__concurrent_reporters_then_ordered_reporters(self):
+        # Given
+        running = set()
+        overlaps = []
+        finish_order = []
+
+        async def run_report(scan_results: list, reporter_name: str, scan_type: str = None):
+            running.add(reporter_name)
+            overlaps.append(set(running))
+            await asyncio.sleep(0.05 if reporter_name == "upload-1" else 0.01)
+            running.remove(reporter_name)
+            finish_order.append(reporter_name)
+
+        testee = EzeCore.get_instance()
+        # When
+        with mock.patch.object(ReporterManager.get_instance(), "run_report", side_effect=run_report):
+            await testee.run_reports([], ["quality", "upload-1", "console", "upload-2"])
+        # Then
+        assert {"upload-1", "upload-2"} in overlaps
+        assert finish_order == ["upload-2", "upload-1", "quality", "console"]
+
+    @pytest.mark.asyncio
+    async def test_run_reports__errors_raised_in_configured_order(self):
+        # Given
+        finish_order = []
+
+        async def run_report(scan_results: list, reporter_name: str, scan_type: str = None):
+            finish_order.append(reporter_name)
+            if reporter_name in ["upload-2", "quality"]:
+                raise EzeError(f"{reporter_name} failed")
+
+        testee = EzeCore.get_instance()
+        # When
+        with mock.patch.object(ReporterManager.get_instance(), "run_report", side_effect=run_report):
+            with pytest.raises(EzeError) as raised_error:
+                await testee.run_reports([], ["upload-1", "quality", "upload-2", "console"])
+        # Then
+        assert raised_error.value.message == "quality failed"
+        assert finish_order == ["upload-1", "upload-2", "quality"]
+
+    @pytest.mark.asyncio
+    async def test_run_reports__unexpected_errors_wait_for_concurrent_reporters(self):
+        # Given
+        finish_order = []
+
+        async def run_report(scan_results: list, reporter_name: str, scan_type: str = None):
+            if reporter_name == "upload-1":
+                raise OSError("disk full")
+            await asyncio.sleep(0.01)
+            finish_order.append(reporter_name)
+
+        testee = EzeCore.get_instance()
+        # When
+        with mock.patch.object(ReporterManager.get_instance(), "run_report", side_effect=run_report):
+            with pytest.raises(OSError) as raised_error:
+                await testee.run_reports([], ["upload-1", "upload-2", "console"])
+        # Then
+        assert str(raised_error.value) == "disk full"
+        assert finish_order == ["upload-2", "console"]
+
+    def test_is_concurrent_reporter(self):
+        # Given
+        testee = ReporterManager.get_instance()
+        # When / Then
+        assert testee.is_concurrent_reporter("upload-1")
+        assert testee.is_concurrent_reporter("upload-1:some-run-type")
+        assert not testee.is_concurrent_reporter("console")
+        assert not testee.is_concurrent_reporter("unknown-reporter")
@@ -1,7 +1,7 @@
 # pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring,line-too-long,invalid-name
 import json
 
-from eze.core.enums import VulnerabilityType, VulnerabilitySeverityEnum, Vulnerability
+from eze.core.enums import VulnerabilityType, VulnerabilitySeverityEnum, Vulnerability, VulnerabilityMatcher
 from tests.__fixtures__.fixture_helper import assert_deep_equal
 
 
@@ -112,3 +112,64 @@ class TestVulnerability:
         input_vulnerability.update_ignored(input_config)
         # Then
         assert input_vulnerability.is_ignored == expected_ignored_status
+
+
+class TestVulnerabilityMatcher:
+    INPUT_CONFIG = {
+        "IGNORED_VULNERABILITIES": ["cve-xxxx"],
+        "IGNORED_FILES": ["tests/", "docs/readme.md"],
+        "EXCLUDE": ["node_modules/", ".eze/"],
+        "IGNORE_BELOW_SEVERITY_INT": VulnerabilitySeverityEnum.low.value,
+    }
+
+    @staticmethod
+    def create_vulnerability(name: str, path: str = None, severity: str = "high", identifiers: dict = None):
+        return Vulnerability(
+            {
+                "name": name,
+                "severity": severity,
+                "identifiers": identifiers or {},
+                "file_location": {"path": path, "line": 1} if path else None,
+            }
+        )
+
+    def test_filter(self):
+        # Given
+        input_vulnerabilities = [
+            self.create_vulnerability("kept", "src/main.py"),
+            self.create_vulnerability("excluded", "node_modules/dep/index.js"),
+            self.create_vulnerability("ignored-by-file", "tests\\test_main.py"),
+            self.create_vulnerability("ignored-by-cve", identifiers={"CVE": "cve-xxxx"}),
+            self.create_vulnerability("ignored-by-severity", "src/main.py", "none"),
+        ]
+        testee = VulnerabilityMatcher(self.INPUT_CONFIG)
+        # When
+        output = testee.filter(input_vulnerabilities)
+        # Then
+        assert [(x.name, x.is_ignored) for x in output] == [
+            ("kept", False),
+            ("ignored-by-file", True),
+            ("ignored-by-cve", True),
+            ("ignored-by-severity", True),
+        ]
+        assert input_vulnerabilities[1].is_excluded
+
+    def test_filter__previously_ignored_stays_ignored(self):
+        # Given
+        input_vulnerability = self.create_vulnerability("foo", "src/main.py")
+        input_vulnerability.is_ignored = True
+        testee = VulnerabilityMatcher(self.INPUT_CONFIG)
+        # When
+        output = testee.filter([input_vulnerability])
+        # Then
+        assert output[0].is_ignored
+
+    def test_filter__empty_config(self):
+        # Given
+        input_vulnerability = self.create_vulnerability("foo", "src/main.py", identifiers={"CVE": "cve-xxxx"})
+        testee = VulnerabilityMatcher({})
+        # When
+        output = testee.filter([input_vulnerability])
+        # Then
+        assert not output[0].is_ignored
+        assert not output[0].is_excluded
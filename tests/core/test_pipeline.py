@@ -0,0 +1,99 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring,line-too-long
+import asyncio
+
+import pytest
+
+from eze.core.pipeline import Pipeline, PipelineStage, get_default_stages
+from eze.utils.error import EzeConfigError
+
+
+def create_recording_stage(name: str, calls: list, depends_on: list = None, duration: float = 0) -> PipelineStage:
+    async def action():
+        calls.append(f"start:{name}")
+        await asyncio.sleep(duration)
+        calls.append(f"end:{name}")
+
+    return PipelineStage(name, action, depends_on)
+
+
+def test_get_default_stages():
+    # When
+    output = [stage.name for stage in get_default_stages()]
+    # Then
+    assert output == ["npm-install", "workspace-copy", "maven-resolve", "dotnet-restore"]
+
+
+def test_get_stage_order__dependencies_first():
+    # Given
+    testee = Pipeline(
+        [
+            PipelineStage("install", lambda: None, ["checkout"]),
+            PipelineStage("checkout", lambda: None),
+            PipelineStage("build", lambda: None, ["install", "checkout"]),
+        ]
+    )
+    # When
+    output = testee.get_stage_order(["build"])
+    # Then
+    assert output == ["checkout", "install", "build"]
+
+
+def test_get_stage_order__unknown_stage():
+    # Given
+    testee = Pipeline([PipelineStage("install", lambda: None, ["checkout"])])
+    # When
+    with pytest.raises(EzeConfigError) as raised_error:
+        testee.get_stage_order(["install"])
+    # Then
+    assert raised_error.value.message == "unknown pipeline stage 'checkout'"
+
+
+def test_get_stage_order__circular_dependency():
+    # Given
+    testee = Pipeline([PipelineStage("a", lambda: None, ["b"]), PipelineStage("b", lambda: None, ["a"])])
+    # When
+    with pytest.raises(EzeConfigError) as raised_error:
+        testee.get_stage_order(["a"])
+    # Then
+    assert raised_error.value.message == "pipeline stages have a circular dependency: a -> b -> a"
+
+
+@pytest.mark.asyncio
+async def test_run_stages__shared_stage_ran_once():
+    # Given
+    calls = []
+    testee = Pipeline([create_recording_stage("npm-install", calls, duration=0.01)])
+    # When
+    await asyncio.gather(testee.run_stages(["npm-install"]), testee.run_stages(["npm-install"]))
+    await testee.run_stages(["npm-install"])
+    # Then
+    assert calls == ["start:npm-install", "end:npm-install"]
+
+
+@pytest.mark.asyncio
+async def test_run_stages__dependencies_ran_first_and_independent_stages_concurrently():
+    # Given
+    calls = []
+    testee = Pipeline(
+        [
+            create_recording_stage("copy", calls, duration=0.01),
+            create_recording_stage("restore", calls, duration=0.01),
+            create_recording_stage("build", calls, ["copy", "restore"]),
+        ]
+    )
+    # When
+    await testee.run_stages(["build"])
+    # Then
+    assert calls[:2] == ["start:copy", "start:restore"]
+    assert calls[-2:] == ["start:build", "end:build"]
+
+
+@pytest.mark.asyncio
+async def test_run_stages__sync_action():
+    # Given
+    calls = []
+    testee = Pipeline([PipelineStage("sync", lambda: calls.append("sync"))])
+    # When
+    await testee.run_stages(["sync"])
+    # Then
+    assert calls == ["sync"]
@@ -0,0 +1,67 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring,line-too-long
+import time
+from unittest import mock
+
+from eze.core.result_cache import ToolResultCache
+from eze.core.tool import ScanResult
+
+
+def test_create_key__stable():
+    # Given
+    input_config = {"b": 1, "a": [1, 2]}
+    # When
+    output_1 = ToolResultCache.create_key("semgrep:None", "1.0.0", input_config, [])
+    output_2 = ToolResultCache.create_key("semgrep:None", "1.0.0", {"a": [1, 2], "b": 1}, [])
+    # Then
+    assert output_1 == output_2
+
+
+def test_create_key__changes_with_version_config_and_file_content(tmp_path):
+    # Given
+    input_file = tmp_path / "requirements.txt"
+    input_file.write_text("requests==1.0.0")
+    base_key = ToolResultCache.create_key("python-cyclonedx:None", "1.0.0", {}, [str(input_file)])
+    # When
+    version_key = ToolResultCache.create_key("python-cyclonedx:None", "2.0.0", {}, [str(input_file)])
+    config_key = ToolResultCache.create_key("python-cyclonedx:None", "1.0.0", {"INCLUDE_DEV": True}, [str(input_file)])
+    input_file.write_text("requests==2.0.0")
+    content_key = ToolResultCache.create_key("python-cyclonedx:None", "1.0.0", {}, [str(input_file)])
+    # Then
+    assert len({base_key, version_key, config_key, content_key}) == 4
+
+
+def test_get_set__roundtrip(tmp_path):
+    # Given
+    testee = ToolResultCache(60, tmp_path)
+    input_scan_result = ScanResult({"tool": "semgrep", "warnings": ["some warning"]})
+    # When
+    testee.set("some-key", input_scan_result)
+    output = testee.get("some-key")
+    # Then
+    assert output["tool"] == "semgrep"
+    assert output["warnings"] == ["some warning"]
+
+
+def test_get__missing(tmp_path):
+    # Given
+    testee = ToolResultCache(60, tmp_path)
+    # When
+    output = testee.get("missing-key")
+    # Then
+    assert output is None
+
+
+def test_get__expired(tmp_path):
+    # Given
+    testee = ToolResultCache(60, tmp_path)
+    testee.set("some-key", ScanResult({"tool": "semgrep"}))
+    # When
+    with mock.patch("eze.core.result_cache.time.time", return_value=time.time() + 61):
+        output = testee.get("some-key")
+    # Then
+    assert output is None
+
+
+def test_is_enabled():
+    assert ToolResultCache(0).is_enabled() is False
+    assert ToolResultCache(60).is_enabled() is True
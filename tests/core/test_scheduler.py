@@ -0,0 +1,89 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring,line-too-long
+import asyncio
+
+import pytest
+
+from eze.core.scheduler import ResourceScheduler, get_cpu_count
+
+
+async def run_fake_tasks(testee: ResourceScheduler, tasks: list) -> list:
+    """run tasks of (name, resource_profile, duration), returns snapshots of names running at once"""
+    running = set()
+    snapshots = []
+
+    async def run_task(name: str, resource_profile: dict, duration: float):
+        async with testee.reserve(resource_profile, name):
+            running.add(name)
+            snapshots.append(frozenset(running))
+            await asyncio.sleep(duration)
+            running.remove(name)
+
+    await asyncio.gather(*[run_task(*task) for task in tasks])
+    return snapshots
+
+
+def test_get_cpu_count():
+    assert get_cpu_count() >= 1
+
+
+def test_normalise_profile__clamps_to_budget():
+    # Given
+    testee = ResourceScheduler(4, cpu_budget=2, mem_mb_budget=1000)
+    # When
+    output = testee.normalise_profile({"cpu": 8, "mem_mb": 4000})
+    # Then
+    assert output == {"cpu": 2, "mem_mb": 1000}
+
+
+def test_normalise_profile__missing_keys():
+    # Given
+    testee = ResourceScheduler(4)
+    # When
+    output = testee.normalise_profile({})
+    # Then
+    assert output == {"cpu": 0, "mem_mb": 0}
+
+
+@pytest.mark.asyncio
+async def test_reserve__packs_against_cpu_budget():
+    # Given
+    testee = ResourceScheduler(4, cpu_budget=4)
+    tasks = [("heavy-1", {"cpu": 4}, 0.02), ("heavy-2", {"cpu": 4}, 0.02), ("light", {"cpu": 1}, 0.01)]
+    # When
+    snapshots = await run_fake_tasks(testee, tasks)
+    # Then
+    assert max(len(snapshot) for snapshot in snapshots) == 1
+    assert testee.running == 0 and testee.cpu_used == 0
+
+
+@pytest.mark.asyncio
+async def test_reserve__light_tasks_fill_gaps():
+    # Given
+    testee = ResourceScheduler(4, cpu_budget=4, mem_mb_budget=3000)
+    tasks = [("heavy", {"cpu": 2, "mem_mb": 2000}, 0.05), ("light-1", {"cpu": 1}, 0.01), ("light-2", {"cpu": 1}, 0.01)]
+    # When
+    snapshots = await run_fake_tasks(testee, tasks)
+    # Then
+    assert frozenset(["heavy", "light-1", "light-2"]) in snapshots
+
+
+@pytest.mark.asyncio
+async def test_reserve__oversized_task_runs_alone():
+    # Given
+    testee = ResourceScheduler(4, mem_mb_budget=1000)
+    tasks = [("huge", {"mem_mb": 8000}, 0.02), ("small", {"mem_mb": 100}, 0.01)]
+    # When
+    snapshots = await run_fake_tasks(testee, tasks)
+    # Then
+    assert max(len(snapshot) for snapshot in snapshots) == 1
+
+
+@pytest.mark.asyncio
+async def test_reserve__respects_max_parallel():
+    # Given
+    testee = ResourceScheduler(2)
+    tasks = [(f"task-{i}", {"cpu": 1}, 0.01) for i in range(5)]
+    # When
+    snapshots = await run_fake_tasks(testee, tasks)
+    # Then
+    assert max(len(snapshot) for snapshot in snapshots) == 2
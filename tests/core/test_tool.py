@@ -1,10 +1,12 @@
 # pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring,line-too-long,invalid-name
+import asyncio
 import json
 
 from unittest.mock import patch
 import pytest
 from click import ClickException
 
+from eze.core.config import EzeConfig
 from eze.core.enums import VulnerabilityType, VulnerabilitySeverityEnum, Vulnerability
 from eze.core.tool import ToolManager, ToolMeta, ScanResult
 from tests.__fixtures__.fixture_helper import assert_deep_equal, get_snapshot_directory
@@ -16,6 +18,7 @@ from tests.__test_helpers__.mock_helper import (
     unmock_print,
     mock_print,
     convert_scanresult_to_snapshot,
+    get_dummy_plugin,
 )
 
 
@@ -54,6 +57,47 @@ class DummyPlugin3(ToolMeta):
         return report
 
 
+class DummySlowTool(DummySuccessTool):
+    async def run_scan(self) -> ScanResult:
+        await asyncio.sleep(30)
+
+    def parse_partial_report(self) -> ScanResult:
+        return ScanResult({"tool": "slow-tool", "warnings": ["recovered from partial report"]})
+
+
+class DummyCachedTool(DummySuccessTool):
+    CACHE_INPUT_FILES: list = []
+    scan_count: int = 0
+
+    async def run_scan(self) -> ScanResult:
+        DummyCachedTool.scan_count += 1
+        return ScanResult({"tool": "cached-tool", "warnings": ["some warning"]})
+
+
+class DummyIncrementalTool(DummySuccessTool):
+    INCREMENTAL_SCAN: bool = True
+    scanned_files: list = []
+
+    async def run_scan(self) -> ScanResult:
+        DummyIncrementalTool.scanned_files.append(self.changed_files)
+        changed_files = self.changed_files if self.changed_files is not None else ["a.py", "b.py"]
+        return ScanResult(
+            {
+                "tool": "incremental-tool",
+                "vulnerabilities": [
+                    {"name": f"issue in {file}", "file_location": {"path": file, "line": 1}} for file in changed_files
+                ],
+            }
+        )
+
+
+class DummyPartialReportTool(DummySuccessTool):
+    PARSE_PARTIAL_REPORT: bool = True
+
+    def parse_report(self, parsed_json: list) -> ScanResult:
+        return ScanResult({"tool": "partial-tool", "vulnerabilities": parsed_json})
+
+
 class MockGitBranch:
     def __init__(self):
         self.name = "feature/helloworld"
@@ -157,6 +201,62 @@ class TestToolManager:
         # Then
         assert raised_error.value.message == expected_error_message
 
+    def test_private__get_output_files__memoised_until_config_refreshed(self):
+        # Given
+        eze_config = {"success-tool": {"REPORT_FILE": "tool-report.json"}, "scan": {"tools": [], "reporters": []}}
+        setup_mock(eze_config)
+        tool_manager_instance = ToolManager.get_instance()
+        # When
+        with patch.object(ToolManager, "find_reporter_files", return_value=[]) as mock_find_reporter_files:
+            tool_manager_instance._get_tool_config("success-tool")
+            tool_manager_instance._get_tool_config("failure-tool")
+            first_output = tool_manager_instance._get_output_files(None, None)
+            EzeConfig.set_instance([{"scan": {"tools": [], "reporters": []}}])
+            second_output = tool_manager_instance._get_output_files(None, None)
+        # Then
+        assert first_output == ["tool-report.json"]
+        assert second_output == []
+        assert mock_find_reporter_files.call_count == 2
+
+    def test_get_tool_pipeline_stages__use_source_copy(self):
+        # Given
+        testee = DummySuccessTool({"USE_SOURCE_COPY": True})
+        # When
+        output = testee.pipeline_stages()
+        # Then
+        assert output == ["workspace-copy"]
+        assert DummySuccessTool({}).pipeline_stages() == []
+
+    def test_parse_partial_report__truncated_report_file(self, tmp_path):
+        # Given
+        report_file = tmp_path / "report.json"
+        report_file.write_text('[{"name": "finding-1", "severity": "high"}, {"name": "finding-2", "sev')
+        testee = DummyPartialReportTool({"REPORT_FILE": str(report_file)})
+        # When
+        output = testee.parse_partial_report()
+        # Then
+        assert [x.name for x in output.vulnerabilities] == ["finding-1"]
+        assert DummySuccessTool({"REPORT_FILE": str(report_file)}).parse_partial_report() is None
+
+    def test_get_tool_resource_profile__defaults(self):
+        # Given
+        setup_mock()
+        testee = ToolManager({"test_plugin_1": DummyPlugin1()})
+        # When
+        output = testee.get_tool_resource_profile("success-tool")
+        # Then
+        assert output == {"cpu": 1, "mem_mb": 256}
+
+    def test_get_tool_resource_profile__config_override(self):
+        # Given
+        eze_config = {"success-tool": {"RESOURCE_PROFILE": {"mem_mb": 4000}}, "scan": {"tools": [], "reporters": []}}
+        setup_mock(eze_config)
+        testee = ToolManager({"test_plugin_1": DummyPlugin1()})
+        # When
+        output = testee.get_tool_resource_profile("success-tool")
+        # Then
+        assert output == {"cpu": 1, "mem_mb": 4000}
+
     @patch("git.Repo")
     @pytest.mark.asyncio
     async def test_run_tool__simple(self, mock_repo, snapshot):
@@ -201,6 +301,143 @@ class TestToolManager:
         snapshot.snapshot_dir = get_snapshot_directory()
         snapshot.assert_match(output_snapshot, f"core/tool__run_tool-error-result-output.json")
 
+    @patch("git.Repo")
+    @pytest.mark.asyncio
+    async def test_run_tool__timeout_keeps_partial_report(self, mock_repo):
+        # Given
+        mock_repo.return_value = MockSuccessGitRepo()
+        eze_config = {"slow-tool": {"TIMEOUT_SEC": 1}, "scan": {"tools": [], "reporters": []}}
+        setup_mock(eze_config)
+        tool_manager_instance = ToolManager({"dummy-plugin": get_dummy_plugin({"slow-tool": DummySlowTool})})
+        # When
+        output: ScanResult = await tool_manager_instance.run_tool("slow-tool")
+        # Then
+        assert output.tool == "slow-tool"
+        assert output.warnings == ["recovered from partial report"]
+        assert output.fatal_errors == ["slow-tool timed out after 1 seconds (TIMEOUT_SEC), results may be incomplete"]
+
+    @patch("git.Repo")
+    @pytest.mark.asyncio
+    async def test_run_tool__result_cache_hit_skips_scan(self, mock_repo, tmp_path):
+        # Given
+        mock_repo.return_value = MockSuccessGitRepo()
+        eze_config = {"scan": {"tools": [], "reporters": [], "RESULT_CACHE_TTL_SEC": 60}}
+        setup_mock(eze_config)
+        DummyCachedTool.scan_count = 0
+        tool_manager_instance = ToolManager({"dummy-plugin": get_dummy_plugin({"cached-tool": DummyCachedTool})})
+        # When
+        with patch("eze.core.result_cache.ToolResultCache.get_default_cache_folder", return_value=tmp_path):
+            output_1: ScanResult = await tool_manager_instance.run_tool("cached-tool")
+            output_2: ScanResult = await tool_manager_instance.run_tool("cached-tool")
+        # Then
+        assert DummyCachedTool.scan_count == 1
+        assert output_1.warnings == output_2.warnings == ["some warning"]
+        assert output_2.run_details["tool_name"] == "cached-tool"
+
+    @patch("git.Repo")
+    @pytest.mark.asyncio
+    async def test_run_tool__result_cache_disabled_by_default(self, mock_repo, tmp_path):
+        # Given
+        mock_repo.return_value = MockSuccessGitRepo()
+        setup_mock({"scan": {"tools": [], "reporters": []}})
+        DummyCachedTool.scan_count = 0
+        tool_manager_instance = ToolManager({"dummy-plugin": get_dummy_plugin({"cached-tool": DummyCachedTool})})
+        # When
+        with patch("eze.core.result_cache.ToolResultCache.get_default_cache_folder", return_value=tmp_path):
+            await tool_manager_instance.run_tool("cached-tool")
+            await tool_manager_instance.run_tool("cached-tool")
+        # Then
+        assert DummyCachedTool.scan_count == 2
+
+    def test_cache_input_files__sca_enabled_not_cached(self):
+        # Given
+        sca_disabled_tool = DummyCachedTool({"SCA_ENABLED": False})
+        # When
+        output = DummyCachedTool({"SCA_ENABLED": True}).cache_input_files()
+        # Then
+        assert output is None
+        assert sca_disabled_tool.cache_input_files() == []
+
+    @patch("git.Repo")
+    @patch("eze.core.tool.get_head_commit", return_value="abc123")
+    @patch("eze.core.tool.get_changed_files", return_value=["b.py", "c.py"])
+    @pytest.mark.asyncio
+    async def test_run_tool__changed_since_merges_baseline(self, mock_changed_files, mock_head, mock_repo, tmp_path):
+        # Given
+        mock_repo.return_value = MockSuccessGitRepo()
+        setup_mock({"scan": {"tools": [], "reporters": [], "RESULT_CACHE_TTL_SEC": 60}})
+        DummyIncrementalTool.scanned_files = []
+        tool_manager_instance = ToolManager(
+            {"dummy-plugin": get_dummy_plugin({"incremental-tool": DummyIncrementalTool})}
+        )
+        # When
+        with patch("eze.core.result_cache.ToolResultCache.get_default_cache_folder", return_value=tmp_path):
+            await tool_manager_instance.run_tool("incremental-tool", changed_since="main")
+            output: ScanResult = await tool_manager_instance.run_tool("incremental-tool", changed_since="main")
+        # Then
+        assert DummyIncrementalTool.scanned_files == [None, ["b.py", "c.py"]]
+        mock_changed_files.assert_called_once_with("main")
+        assert sorted(x.name for x in output.vulnerabilities) == ["issue in a.py", "issue in b.py", "issue in c.py"]
+
+    @patch("git.Repo")
+    @patch("eze.core.tool.get_head_commit", return_value="abc123")
+    @patch("eze.core.tool.get_changed_files", return_value=["b.py"])
+    @pytest.mark.asyncio
+    async def test_run_tool__version_checked_once_per_run(self, mock_changed_files, mock_head, mock_repo, tmp_path):
+        # Given
+        mock_repo.return_value = MockSuccessGitRepo()
+        setup_mock({"scan": {"tools": [], "reporters": [], "RESULT_CACHE_TTL_SEC": 60}})
+        DummyIncrementalTool.scanned_files = []
+        tool_manager_instance = ToolManager(
+            {"dummy-plugin": get_dummy_plugin({"incremental-tool": DummyIncrementalTool})}
+        )
+        # When
+        with patch("eze.core.result_cache.ToolResultCache.get_default_cache_folder", return_value=tmp_path):
+            with patch.object(DummyIncrementalTool, "check_installed", return_value="1.0.0") as mock_check_installed:
+                await tool_manager_instance.run_tool("incremental-tool", changed_since="main")
+                await tool_manager_instance.run_tool("incremental-tool", changed_since="main")
+                await tool_manager_instance.run_tool("incremental-tool", changed_since="main", tool_version="1.0.0")
+        # Then
+        assert DummyIncrementalTool.scanned_files == [None, ["b.py"], ["b.py"]]
+        assert mock_check_installed.call_count == 2
+
+    @patch("git.Repo")
+    @patch("eze.core.tool.get_changed_files", return_value=["b.py"])
+    @pytest.mark.asyncio
+    async def test_run_tool__changed_since_requires_result_cache(self, mock_changed_files, mock_repo, tmp_path, capsys):
+        # Given
+        mock_repo.return_value = MockSuccessGitRepo()
+        setup_mock({"scan": {"tools": [], "reporters": []}})
+        DummyIncrementalTool.scanned_files = []
+        tool_manager_instance = ToolManager(
+            {"dummy-plugin": get_dummy_plugin({"incremental-tool": DummyIncrementalTool})}
+        )
+        # When
+        with patch("eze.core.result_cache.ToolResultCache.get_default_cache_folder", return_value=tmp_path):
+            output: ScanResult = await tool_manager_instance.run_tool("incremental-tool", changed_since="main")
+        # Then
+        assert DummyIncrementalTool.scanned_files == [None]
+        mock_changed_files.assert_not_called()
+        assert len(output.vulnerabilities) == 2
+        assert "--changed-since ignored as result cache is disabled" in capsys.readouterr().err
+
+    def test_merge_incremental_scan_result__drops_baseline_findings_in_changed_files(self):
+        # Given
+        baseline_result = ScanResult(
+            {
+                "vulnerabilities": [
+                    {"name": "kept", "file_location": {"path": "./src/a.py", "line": 1}},
+                    {"name": "rescanned", "file_location": {"path": "src\\b.py", "line": 1}},
+                    {"name": "deleted", "file_location": {"path": "src/c.py", "line": 1}},
+                ]
+            }
+        )
+        scan_result = ScanResult({"vulnerabilities": [{"name": "new", "file_location": {"path": "src/b.py"}}]})
+        # When
+        output = ToolManager._merge_incremental_scan_result(baseline_result, scan_result, ["src/b.py", "src/c.py"])
+        # Then
+        assert [x.name for x in output.vulnerabilities] == ["kept", "new"]
+
     @pytest.mark.asyncio
     @patch("eze.core.tool.create_folder")
     async def test_prepare_folder(self, create_folder_mock):
@@ -397,3 +634,17 @@ class TestToolManager:
         # Then
         output = tool_manager_instance._sort_vulnerabilities(test_input)
         assert output == expected_output
+
+    def test_private__sort_vulnerabilities__same_severity_by_name_then_overview(self):
+        # Given
+        b_vulnerability = Vulnerability({"severity": "high", "name": "b", "overview": "a"})
+        a_second_vulnerability = Vulnerability({"severity": "high", "name": "a", "overview": "z"})
+        a_first_vulnerability = Vulnerability({"severity": "high", "name": "a", "overview": "y"})
+
+        expected_output = [a_first_vulnerability, a_second_vulnerability, b_vulnerability]
+        test_input = [b_vulnerability, a_second_vulnerability, a_first_vulnerability]
+        # When
+        tool_manager_instance = ToolManager()
+        # Then
+        output = tool_manager_instance._sort_vulnerabilities(test_input)
+        assert output == expected_output
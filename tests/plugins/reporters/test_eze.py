@@ -1,8 +1,12 @@
 # pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring,line-too-long
 
+import gzip
+import json
 import os
 import shutil
 import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest import mock
 from unittest.mock import patch
 
@@ -10,7 +14,8 @@ import pytest
 from git import InvalidGitRepositoryError
 
 from eze.plugins.reporters.eze import EzeReporter
-from eze.utils.error import EzeConfigError
+from eze.utils.error import EzeConfigError, EzeError
+from eze.utils.git import GitContext
 from tests.plugins.reporters.reporter_helper import ReporterMetaTestBase
 
 
@@ -30,11 +35,56 @@ class MockUnsuccessGitRepo:
             raise InvalidGitRepositoryError("No git repo error")
 
 
+class StubConsoleHandler(BaseHTTPRequestHandler):
+    """management console stub, records requests, first server.failure_count requests get a server.failure_status"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.requests.append({"path": self.path, "headers": dict(self.headers), "body": body})
+        status = self.server.failure_status if len(self.server.requests) <= self.server.failure_count else 200
+        response = self.server.response_body or json.dumps({"received": len(self.server.requests)}).encode()
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_console_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubConsoleHandler)
+    server.requests = []
+    server.failure_count = 0
+    server.failure_status = 503
+    server.response_body = None
+    server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+    server_thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def create_stub_config(stub_server, config: dict = None) -> dict:
+    return {
+        "APIKEY": "MOCK_APIKEY",
+        "CONSOLE_ENDPOINT": f"http://127.0.0.1:{stub_server.server_port}",
+        "CODEBASE_ID": "MOCK_CODEBASE_ID",
+        "CODEBRANCH_NAME": "MOCK_CODEBRANCH_NAME",
+        "RETRY_BACKOFF_SEC": 0,
+        **(config or {}),
+    }
+
+
 class TestEzeReporter(ReporterMetaTestBase):
     ReporterMetaClass = EzeReporter
     SNAPSHOT_PREFIX = "eze"
 
     def setup_method(self):
+        GitContext.reset_instance()
         eze_temp_folder = os.path.join(tempfile.gettempdir(), ".eze-temp")
         shutil.rmtree(eze_temp_folder, ignore_errors=True)
 
@@ -111,6 +161,11 @@ get EZE_CONSOLE_ENDPOINT from eze management console profile page"""
             "CONSOLE_ENDPOINT": "MOCK_CONSOLE_ENDPOINT",
             "CODEBASE_ID": "MOCK_CODEBASE_ID",
             "CODEBRANCH_NAME": "MOCK_CODEBRANCH_NAME",
+            "GZIP": False,
+            "UPLOAD_MODE": "single",
+            "CHUNK_SIZE_MB": 5,
+            "MAX_RETRIES": 3,
+            "RETRY_BACKOFF_SEC": 1,
         }
         # When
         testee = EzeReporter(input_config)
@@ -121,3 +176,108 @@ get EZE_CONSOLE_ENDPOINT from eze management console profile page"""
     @pytest.mark.skip(reason="Mocking of http endpoint not implemented")
     async def test_run_report_snapshot(self, monkeypatch, snapshot):
         """Test that given fixture scan output matches expectations"""
+
+    def test_creation__invalid_upload_mode(self):
+        # Given
+        input_config = {
+            "APIKEY": "MOCK_APIKEY",
+            "CONSOLE_ENDPOINT": "MOCK_CONSOLE_ENDPOINT",
+            "CODEBASE_ID": "MOCK_CODEBASE_ID",
+            "CODEBRANCH_NAME": "MOCK_CODEBRANCH_NAME",
+            "UPLOAD_MODE": "carrier-pigeon",
+        }
+        # When
+        with pytest.raises(EzeConfigError) as raised_error:
+            EzeReporter(input_config)
+        # Then
+        assert (
+            raised_error.value.message == "invalid UPLOAD_MODE 'carrier-pigeon', expected one of single, tool, chunked"
+        )
+
+    @pytest.mark.asyncio
+    async def test_send_results__single_gzip(self, stub_console_server):
+        # Given
+        testee = EzeReporter(create_stub_config(stub_console_server, {"GZIP": True}))
+        # When
+        await testee.send_results([{"tool": "tool-1"}, {"tool": "tool-2"}])
+        # Then
+        [output] = stub_console_server.requests
+        assert output["path"] == "/v1/api/scan/MOCK_CODEBASE_ID/MOCK_CODEBRANCH_NAME"
+        assert output["headers"]["x-api-key"] == "MOCK_APIKEY"
+        assert output["headers"]["content-encoding"] == "gzip"
+        assert gzip.decompress(output["body"]) == b'[{"tool":"tool-1"},{"tool":"tool-2"}]'
+
+    @pytest.mark.asyncio
+    async def test_send_results__per_tool(self, stub_console_server):
+        # Given
+        testee = EzeReporter(create_stub_config(stub_console_server, {"UPLOAD_MODE": "tool"}))
+        # When
+        await testee.send_results([{"tool": "tool-1"}, {"tool": "tool-2"}])
+        # Then
+        output = stub_console_server.requests
+        assert [x["body"] for x in output] == [b'[{"tool":"tool-1"}]', b'[{"tool":"tool-2"}]']
+        assert [x["headers"]["x-eze-upload-part"] for x in output] == ["1", "2"]
+        assert [x["headers"]["x-eze-upload-parts"] for x in output] == ["2", "2"]
+        assert output[0]["headers"]["x-eze-upload-id"] == output[1]["headers"]["x-eze-upload-id"]
+
+    @pytest.mark.asyncio
+    async def test_send_results__chunked(self, stub_console_server):
+        # Given
+        testee = EzeReporter(create_stub_config(stub_console_server, {"UPLOAD_MODE": "chunked", "CHUNK_SIZE_MB": 1}))
+        input_scan_results = [{"tool": "tool-1", "blob": "x" * (2 * 1024 * 1024)}]
+        # When
+        await testee.send_results(input_scan_results)
+        # Then
+        output = stub_console_server.requests
+        assert [len(x["body"]) for x in output][:2] == [1024 * 1024, 1024 * 1024]
+        assert [x["headers"]["x-eze-upload-part"] for x in output] == ["1", "2", "3"]
+        assert output[0]["headers"]["content-type"] == "application/octet-stream"
+        assert json.loads(b"".join(x["body"] for x in output)) == input_scan_results
+
+    @pytest.mark.asyncio
+    async def test_send_results__retries_server_errors(self, stub_console_server):
+        # Given
+        stub_console_server.failure_count = 2
+        testee = EzeReporter(create_stub_config(stub_console_server))
+        # When
+        await testee.send_results([{"tool": "tool-1"}])
+        # Then
+        output = stub_console_server.requests
+        assert len(output) == 3
+        assert all(x["body"] == b'[{"tool":"tool-1"}]' for x in output)
+
+    @pytest.mark.asyncio
+    async def test_send_results__processed_server_errors_not_retried(self, stub_console_server):
+        # Given
+        stub_console_server.failure_count = 1
+        stub_console_server.failure_status = 502
+        testee = EzeReporter(create_stub_config(stub_console_server))
+        # When
+        with pytest.raises(EzeError):
+            await testee.send_results([{"tool": "tool-1"}])
+        # Then
+        assert len(stub_console_server.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_send_results__invalid_json_response_not_retried(self, stub_console_server):
+        # Given
+        stub_console_server.response_body = b"<html>ok</html>"
+        testee = EzeReporter(create_stub_config(stub_console_server))
+        # When
+        with pytest.raises(EzeError) as raised_error:
+            await testee.send_results([{"tool": "tool-1"}])
+        # Then
+        assert len(stub_console_server.requests) == 1
+        assert "Error in JSON response" in raised_error.value.message
+
+    @pytest.mark.asyncio
+    async def test_send_results__retries_exhausted(self, stub_console_server):
+        # Given
+        stub_console_server.failure_count = 10
+        testee = EzeReporter(create_stub_config(stub_console_server, {"MAX_RETRIES": 1}))
+        # When
+        with pytest.raises(EzeError) as raised_error:
+            await testee.send_results([{"tool": "tool-1"}])
+        # Then
+        assert len(stub_console_server.requests) == 2
+        assert "Eze Reporter failure to send report to management console" in raised_error.value.message
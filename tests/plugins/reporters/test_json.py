@@ -31,7 +31,7 @@ class TestJsonReporter(ReporterMetaTestBase):
 
     def test_creation__no_config(self):
         # Given
-        expected_config = {"REPORT_FILE": ".eze/eze_report.json"}
+        expected_config = {"REPORT_FILE": ".eze/eze_report.json", "COMPACT": False}
         # When
         testee = JsonReporter()
         # Then
@@ -40,7 +40,7 @@ class TestJsonReporter(ReporterMetaTestBase):
     def test_creation__simple_config_parsing(self):
         # Given
         input_config = {"REPORT_FILE": "helloworld.json"}
-        expected_config = {"REPORT_FILE": "helloworld.json"}
+        expected_config = {"REPORT_FILE": "helloworld.json", "COMPACT": False}
         # When
         testee = JsonReporter(input_config)
         # Then
@@ -56,7 +56,7 @@ class TestJsonReporter(ReporterMetaTestBase):
         input_scan_result = ScanResult(scan_result_fixture[0])
         expected_scan_result_fixture = load_json_fixture("__fixtures__/plugins_reporters/eze_sample_report_json.json")
         expected_json = [expected_scan_result_fixture[0]]
-        expected_config = {"REPORT_FILE": str(input_report_location)}
+        expected_config = {"REPORT_FILE": str(input_report_location), "COMPACT": False}
         # When
         testee = JsonReporter(input_config)
         await testee.run_report([input_scan_result])
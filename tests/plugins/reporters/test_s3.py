@@ -1,15 +1,22 @@
 # pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring,line-too-long
 
+import gzip
+import hashlib
 import os
 import shutil
 import tempfile
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import pytest
 from unittest import mock
 from botocore.exceptions import ClientError
 from eze.utils.error import EzeConfigError
+from eze.utils.git import GitContext
 
 from eze.core.tool import ScanResult
-from eze.plugins.reporters.s3 import S3Reporter
+from eze.plugins.reporters.s3 import S3Reporter, get_s3_client
 from eze.utils.log import LogLevel
 from tests.__test_helpers__.mock_helper import unmock_print, mock_print, mock_print_stderr
 from tests.__fixtures__.fixture_helper import load_json_fixture
@@ -27,19 +34,84 @@ class FakeBoto3Client:
         meta = {"region_name": "eu-mock"}
         self.error = error
 
-    def put_object(self, Body, Bucket, Key):
+        self.body = None
+
+    def upload_fileobj(self, Fileobj, Bucket, Key, ExtraArgs=None, Config=None):
         if self.error:
             raise self.error
+        self.body = Fileobj.read()
 
     def get_caller_identity(self):
         return {"Account": "fake-aws-account"}
 
 
+class StubS3Handler(BaseHTTPRequestHandler):
+    """minimal path style s3 api: put object and multipart uploads"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_PUT(self):
+        url = urllib.parse.urlparse(self.path)
+        query = urllib.parse.parse_qs(url.query, keep_blank_values=True)
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        if "uploadId" in query:
+            self.server.parts[int(query["partNumber"][0])] = body
+        else:
+            self.server.objects[url.path] = {"body": body, "headers": dict(self.headers), "part_count": 0}
+        self.send_xml(b"", {"ETag": f'"{hashlib.md5(body).hexdigest()}"'})  # nosec
+
+    def do_POST(self):
+        url = urllib.parse.urlparse(self.path)
+        query = urllib.parse.parse_qs(url.query, keep_blank_values=True)
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if "uploads" in query:
+            self.server.upload_headers = dict(self.headers)
+            self.send_xml(
+                b"<InitiateMultipartUploadResult><Bucket>b</Bucket><Key>k</Key><UploadId>upload-1</UploadId></InitiateMultipartUploadResult>"
+            )
+            return
+        parts = self.server.parts
+        self.server.objects[url.path] = {
+            "body": b"".join(parts[x] for x in sorted(parts)),
+            "headers": self.server.upload_headers,
+            "part_count": len(parts),
+        }
+        self.send_xml(b'<CompleteMultipartUploadResult><ETag>"etag"</ETag></CompleteMultipartUploadResult>')
+
+    def send_xml(self, body: bytes, headers: dict = None):
+        self.send_response(200)
+        for header_name, header_value in (headers or {}).items():
+            self.send_header(header_name, header_value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_s3_server(monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "stub-key")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "stub-secret")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "eu-west-2")
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubS3Handler)
+    server.objects = {}
+    server.parts = {}
+    server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+    server_thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
 class TestJsonS3Reporter(ReporterMetaTestBase):
     ReporterMetaClass = S3Reporter
     SNAPSHOT_PREFIX = "jsons3"
 
     def setup_method(self):
+        GitContext.reset_instance()
+        get_s3_client.cache_clear()
         eze_temp_folder = os.path.join(tempfile.gettempdir(), ".eze-temp")
         shutil.rmtree(eze_temp_folder, ignore_errors=True)
 
@@ -72,14 +144,29 @@ class TestJsonS3Reporter(ReporterMetaTestBase):
         expected_config = {
             "OBJECT_KEY": "dummy_object",
             "BUCKET_NAME": "dummy_bucket",
+            "COMPACT": False,
+            "GZIP": False,
+            "PART_SIZE_MB": 8,
+            "MAX_CONCURRENCY": 10,
+            "ENDPOINT_URL": None,
         }
         # When
         testee = S3Reporter(input_config)
         # Then
         assert testee.config == expected_config
 
+    def test_creation__part_size_below_s3_minimum(self):
+        # Given
+        input_config = {"OBJECT_KEY": "dummy_object", "BUCKET_NAME": "dummy_bucket", "PART_SIZE_MB": 4}
+        expected_error = "param 'PART_SIZE_MB' is 4, s3 minimum part size is 5MB"
+        # When
+        with pytest.raises(EzeConfigError) as raised_error:
+            S3Reporter(input_config)
+        # Then
+        assert expected_error in str(raised_error.value)
+
     @pytest.mark.asyncio
-    @mock.patch("boto3.client", mock.MagicMock(return_value=FakeBoto3Client(error=FakeClientError())))
+    @mock.patch("boto3.session.Session.client", mock.MagicMock(return_value=FakeBoto3Client(error=FakeClientError())))
     async def test_run_report__snapshot_client_error(self):
         # Given
         input_config = {
@@ -102,7 +189,7 @@ class TestJsonS3Reporter(ReporterMetaTestBase):
         assert mocked_print_output_stderr.getvalue() == expected_output_stderr
 
     @pytest.mark.asyncio
-    @mock.patch("boto3.client", mock.MagicMock(return_value=FakeBoto3Client()))
+    @mock.patch("boto3.session.Session.client", mock.MagicMock(return_value=FakeBoto3Client()))
     async def test_run_report__ok(self):
         # Given
         input_config = {
@@ -114,6 +201,11 @@ class TestJsonS3Reporter(ReporterMetaTestBase):
         expected_config = {
             "OBJECT_KEY": "dummy_object",
             "BUCKET_NAME": "dummy_bucket",
+            "COMPACT": False,
+            "GZIP": False,
+            "PART_SIZE_MB": 8,
+            "MAX_CONCURRENCY": 10,
+            "ENDPOINT_URL": None,
         }
         mocked_print_output = mock_print()
         mocked_print_output_stderr = mock_print_stderr()
@@ -126,3 +218,57 @@ class TestJsonS3Reporter(ReporterMetaTestBase):
         assert testee.config == expected_config
         assert mocked_print_output.getvalue() == expected_output
         assert mocked_print_output_stderr.getvalue() == expected_output_stderr
+
+    @pytest.mark.asyncio
+    async def test_run_report__streams_compact_json(self):
+        # Given
+        input_config = {"OBJECT_KEY": "dummy_object", "BUCKET_NAME": "dummy_bucket", "COMPACT": True}
+        fake_client = FakeBoto3Client()
+        mock_print()
+        # When
+        testee = S3Reporter(input_config)
+        with mock.patch("boto3.session.Session.client", mock.MagicMock(return_value=fake_client)):
+            await testee.run_report([{"tool": "dummy", "vulnerabilities": []}])
+        # Then
+        assert fake_client.body == b'[{"tool":"dummy","vulnerabilities":[]}]'
+
+    @pytest.mark.asyncio
+    async def test_run_report__stub_server_gzip(self, stub_s3_server):
+        # Given
+        input_config = {
+            "OBJECT_KEY": "report.json",
+            "BUCKET_NAME": "dummy-bucket",
+            "COMPACT": True,
+            "GZIP": True,
+            "ENDPOINT_URL": f"http://127.0.0.1:{stub_s3_server.server_port}",
+        }
+        mock_print()
+        # When
+        testee = S3Reporter(input_config)
+        await testee.run_report([{"tool": "dummy"}])
+        # Then
+        uploaded_object = stub_s3_server.objects["/dummy-bucket/report.json"]
+        assert uploaded_object["part_count"] == 0
+        assert uploaded_object["headers"]["Content-Encoding"] == "gzip"
+        assert uploaded_object["headers"]["Content-Type"] == "application/json"
+        assert gzip.decompress(uploaded_object["body"]) == b'[{"tool":"dummy"}]'
+
+    @pytest.mark.asyncio
+    async def test_run_report__stub_server_multipart(self, stub_s3_server):
+        # Given
+        input_config = {
+            "OBJECT_KEY": "report.json",
+            "BUCKET_NAME": "dummy-bucket",
+            "COMPACT": True,
+            "PART_SIZE_MB": 5,
+            "ENDPOINT_URL": f"http://127.0.0.1:{stub_s3_server.server_port}",
+        }
+        input_scan_results = [{"tool": "dummy", "blob": "x" * (11 * 1024 * 1024)}]
+        mock_print()
+        # When
+        testee = S3Reporter(input_config)
+        await testee.run_report(input_scan_results)
+        # Then
+        uploaded_object = stub_s3_server.objects["/dummy-bucket/report.json"]
+        assert uploaded_object["part_count"] == 3
+        assert uploaded_object["body"] == b'[{"blob":"' + b"x" * (11 * 1024 * 1024) + b'","tool":"dummy"}]'
@@ -26,6 +26,8 @@ class TestGrypeTool(ToolMetaTestBase):
             "EXCLUDE": [],
             "IGNORED_VULNERABILITIES": None,
             "IGNORE_BELOW_SEVERITY": None,
+            "RESOURCE_PROFILE": None,
+            "TIMEOUT_SEC": None,
             "DEFAULT_SEVERITY": None,
         }
         # When
@@ -51,6 +53,8 @@ class TestGrypeTool(ToolMetaTestBase):
             "EXCLUDE": [],
             "IGNORED_VULNERABILITIES": None,
             "IGNORE_BELOW_SEVERITY": None,
+            "RESOURCE_PROFILE": None,
+            "TIMEOUT_SEC": None,
             "DEFAULT_SEVERITY": None,
         }
         # When
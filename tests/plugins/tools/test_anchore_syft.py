@@ -29,6 +29,8 @@ class TestSyftTool(ToolMetaTestBase):
             "EXCLUDE": [],
             "IGNORED_VULNERABILITIES": None,
             "IGNORE_BELOW_SEVERITY": None,
+            "RESOURCE_PROFILE": None,
+            "TIMEOUT_SEC": None,
             "DEFAULT_SEVERITY": None,
         }
         # When
@@ -59,6 +61,8 @@ class TestSyftTool(ToolMetaTestBase):
             "EXCLUDE": [],
             "IGNORED_VULNERABILITIES": None,
             "IGNORE_BELOW_SEVERITY": None,
+            "RESOURCE_PROFILE": None,
+            "TIMEOUT_SEC": None,
             "DEFAULT_SEVERITY": None,
         }
         # When
@@ -28,6 +28,8 @@ class TestKicsTool(ToolMetaTestBase):
             "IGNORED_FILES": None,
             "IGNORED_VULNERABILITIES": None,
             "IGNORE_BELOW_SEVERITY": None,
+            "RESOURCE_PROFILE": None,
+            "TIMEOUT_SEC": None,
             "DEFAULT_SEVERITY": None,
         }
         # When
@@ -58,6 +60,8 @@ class TestKicsTool(ToolMetaTestBase):
             "IGNORED_FILES": None,
             "IGNORED_VULNERABILITIES": None,
             "IGNORE_BELOW_SEVERITY": None,
+            "RESOURCE_PROFILE": None,
+            "TIMEOUT_SEC": None,
             "DEFAULT_SEVERITY": None,
         }
         # When
@@ -78,7 +82,7 @@ class TestKicsTool(ToolMetaTestBase):
         self.assert_parse_report_snapshot_test(snapshot)
 
     @mock.patch("eze.utils.cli.run.async_subprocess_run")
-    @mock.patch("eze.plugins.tools.checkmarx_kics.cache_workspace_into_tmp", mock.MagicMock(return_value=None))
+    @mock.patch("eze.core.tool.cache_workspace_into_tmp", mock.MagicMock(return_value=None))
     @mock.patch(
         "eze.plugins.tools.checkmarx_kics.create_absolute_path",
         mock.MagicMock(return_value="OS_NON_SPECIFIC_ABSOLUTE/tmp-kics-report.json"),
@@ -39,6 +39,8 @@ class TestTrivyTool(ToolMetaTestBase):
             "EXCLUDE": [],
             "IGNORED_VULNERABILITIES": None,
             "IGNORE_BELOW_SEVERITY": None,
+            "RESOURCE_PROFILE": None,
+            "TIMEOUT_SEC": None,
             "DEFAULT_SEVERITY": None,
         }
         # When
@@ -66,6 +68,8 @@ class TestTrivyTool(ToolMetaTestBase):
             "EXCLUDE": [],
             "IGNORED_VULNERABILITIES": None,
             "IGNORE_BELOW_SEVERITY": None,
+            "RESOURCE_PROFILE": None,
+            "TIMEOUT_SEC": None,
             "DEFAULT_SEVERITY": None,
         }
         # When
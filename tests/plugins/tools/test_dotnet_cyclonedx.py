@@ -25,6 +25,8 @@ class TestDotnetCyclonedxTool(ToolMetaTestBase):
             "IGNORED_FILES": None,
             "IGNORED_VULNERABILITIES": None,
             "IGNORE_BELOW_SEVERITY": None,
+            "RESOURCE_PROFILE": None,
+            "TIMEOUT_SEC": None,
             "LICENSE_ALLOWLIST": [],
             "LICENSE_CHECK": "PROPRIETARY",
             "LICENSE_DENYLIST": [],
@@ -50,6 +52,8 @@ class TestDotnetCyclonedxTool(ToolMetaTestBase):
             "IGNORED_FILES": None,
             "IGNORED_VULNERABILITIES": None,
             "IGNORE_BELOW_SEVERITY": None,
+            "RESOURCE_PROFILE": None,
+            "TIMEOUT_SEC": None,
             "LICENSE_ALLOWLIST": [],
             "LICENSE_CHECK": "PROPRIETARY",
             "LICENSE_DENYLIST": [],
@@ -80,7 +84,7 @@ class TestDotnetCyclonedxTool(ToolMetaTestBase):
 
     @mock.patch("eze.utils.cli.run.async_subprocess_run")
     @mock.patch("eze.utils.cli.run.is_windows_os", mock.MagicMock(return_value=True))
-    @mock.patch("eze.utils.language.dotnet.find_files_by_name", mock.MagicMock(return_value=["Ezeproject.csproj"]))
+    @mock.patch("eze.utils.language.dotnet.find_files_by_extension", mock.MagicMock(return_value=["Ezeproject.csproj"]))
     @mock.patch(
         "eze.plugins.tools.dotnet_cyclonedx.create_absolute_path",
         mock.MagicMock(return_value="OS_NON_SPECIFIC_ABSOLUTE/foo_report.json"),
@@ -97,7 +101,7 @@ class TestDotnetCyclonedxTool(ToolMetaTestBase):
 
     @mock.patch("eze.utils.cli.run.async_subprocess_run")
     @mock.patch("eze.utils.cli.run.is_windows_os", mock.MagicMock(return_value=True))
-    @mock.patch("eze.utils.language.dotnet.find_files_by_name", mock.MagicMock(return_value=["Ezeproject.csproj"]))
+    @mock.patch("eze.utils.language.dotnet.find_files_by_extension", mock.MagicMock(return_value=["Ezeproject.csproj"]))
     @mock.patch(
         "eze.plugins.tools.dotnet_cyclonedx.create_absolute_path",
         mock.MagicMock(return_value="OS_NON_SPECIFIC_ABSOLUTE/foo_report.json"),
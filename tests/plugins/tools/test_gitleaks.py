@@ -27,6 +27,8 @@ class TestGitLeaksTool(ToolMetaTestBase):
             "EXCLUDE": [],
             "IGNORED_VULNERABILITIES": None,
             "IGNORE_BELOW_SEVERITY": None,
+            "RESOURCE_PROFILE": None,
+            "TIMEOUT_SEC": None,
             "DEFAULT_SEVERITY": None,
         }
         # When
@@ -56,6 +58,8 @@ class TestGitLeaksTool(ToolMetaTestBase):
             "EXCLUDE": [],
             "IGNORED_VULNERABILITIES": None,
             "IGNORE_BELOW_SEVERITY": None,
+            "RESOURCE_PROFILE": None,
+            "TIMEOUT_SEC": None,
             "DEFAULT_SEVERITY": None,
         }
         # When
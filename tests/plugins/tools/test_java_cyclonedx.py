@@ -30,6 +30,8 @@ class TestJavaCyclonedxTool(ToolMetaTestBase):
             "EXCLUDE": [],
             "IGNORED_VULNERABILITIES": None,
             "IGNORE_BELOW_SEVERITY": None,
+            "RESOURCE_PROFILE": None,
+            "TIMEOUT_SEC": None,
             "DEFAULT_SEVERITY": None,
         }
         # When
@@ -53,6 +55,8 @@ class TestJavaCyclonedxTool(ToolMetaTestBase):
             "EXCLUDE": [],
             "IGNORED_VULNERABILITIES": None,
             "IGNORE_BELOW_SEVERITY": None,
+            "RESOURCE_PROFILE": None,
+            "TIMEOUT_SEC": None,
             "DEFAULT_SEVERITY": None,
         }
         # When
@@ -82,7 +86,7 @@ class TestJavaCyclonedxTool(ToolMetaTestBase):
 
     @mock.patch("eze.utils.cli.run.async_subprocess_run")
     @mock.patch("eze.utils.cli.run.is_windows_os", mock.MagicMock(return_value=True))
-    @mock.patch("eze.utils.language.java.find_files_by_name", mock.MagicMock(return_value=["pom.xml"]))
+    @mock.patch("eze.utils.language.java.find_files_by_exact_name", mock.MagicMock(return_value=["pom.xml"]))
     @pytest.mark.asyncio
     async def test_run_scan__cli_command__std(self, mock_async_subprocess_run):
         # Given
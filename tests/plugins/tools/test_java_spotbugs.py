@@ -26,6 +26,8 @@ class TestJavaSpotbugsTool(ToolMetaTestBase):
             "EXCLUDE": [],
             "IGNORED_VULNERABILITIES": None,
             "IGNORE_BELOW_SEVERITY": None,
+            "RESOURCE_PROFILE": None,
+            "TIMEOUT_SEC": None,
             "INCLUDE_FULL_REASON": True,
             "DEFAULT_SEVERITY": None,
         }
@@ -46,6 +48,8 @@ class TestJavaSpotbugsTool(ToolMetaTestBase):
             "EXCLUDE": [],
             "IGNORED_VULNERABILITIES": None,
             "IGNORE_BELOW_SEVERITY": None,
+            "RESOURCE_PROFILE": None,
+            "TIMEOUT_SEC": None,
             "INCLUDE_FULL_REASON": True,
             "DEFAULT_SEVERITY": None,
         }
@@ -85,7 +89,7 @@ class TestJavaSpotbugsTool(ToolMetaTestBase):
 
     @mock.patch("eze.utils.cli.run.async_subprocess_run")
     @mock.patch("eze.utils.cli.run.is_windows_os", mock.MagicMock(return_value=True))
-    @mock.patch("eze.plugins.tools.java_spotbugs.find_files_by_name", mock.MagicMock(return_value=["pom.xml"]))
+    @mock.patch("eze.plugins.tools.java_spotbugs.find_files_by_exact_name", mock.MagicMock(return_value=["pom.xml"]))
     @pytest.mark.asyncio
     async def test_run_scan__cli_command__std(self, mock_async_subprocess_run):
         # Given
@@ -31,6 +31,8 @@ class TestNodeCyclonedxTool(ToolMetaTestBase):
             "EXCLUDE": [],
             "IGNORED_VULNERABILITIES": None,
             "IGNORE_BELOW_SEVERITY": None,
+            "RESOURCE_PROFILE": None,
+            "TIMEOUT_SEC": None,
             "DEFAULT_SEVERITY": None,
         }
         # When
@@ -53,6 +55,8 @@ class TestNodeCyclonedxTool(ToolMetaTestBase):
             "EXCLUDE": [],
             "IGNORED_VULNERABILITIES": None,
             "IGNORE_BELOW_SEVERITY": None,
+            "RESOURCE_PROFILE": None,
+            "TIMEOUT_SEC": None,
             "DEFAULT_SEVERITY": None,
         }
         # When
@@ -82,7 +86,7 @@ class TestNodeCyclonedxTool(ToolMetaTestBase):
 
     @mock.patch("eze.utils.cli.run.async_subprocess_run")
     @mock.patch("eze.utils.cli.run.is_windows_os", mock.MagicMock(return_value=True))
-    @mock.patch("eze.utils.language.node.find_files_by_name", mock.MagicMock(return_value=["package.json"]))
+    @mock.patch("eze.utils.language.node.find_files_by_exact_name", mock.MagicMock(return_value=["package.json"]))
     @mock.patch(
         "eze.plugins.tools.node_cyclonedx.create_absolute_path",
         mock.MagicMock(return_value="OS_NON_SPECIFIC_ABSOLUTE/foo_report.json"),
@@ -100,7 +104,7 @@ class TestNodeCyclonedxTool(ToolMetaTestBase):
 
     @mock.patch("eze.utils.cli.run.run_async_cmd")
     @mock.patch("eze.utils.cli.run.is_windows_os", mock.MagicMock(return_value=True))
-    @mock.patch("eze.utils.language.node.find_files_by_name", mock.MagicMock(return_value=["package.json"]))
+    @mock.patch("eze.utils.language.node.find_files_by_exact_name", mock.MagicMock(return_value=["package.json"]))
     @mock.patch("eze.utils.language.node.install_npm_in_path", mock.MagicMock(return_value=True))
     @pytest.mark.asyncio
     async def test_run_scan__throw_eze_error_on_broken_package(self, mocked_run_cmd):
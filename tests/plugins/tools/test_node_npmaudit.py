@@ -27,6 +27,8 @@ class TestNpmAuditTool(ToolMetaTestBase):
             "EXCLUDE": [],
             "IGNORED_VULNERABILITIES": None,
             "IGNORE_BELOW_SEVERITY": None,
+            "RESOURCE_PROFILE": None,
+            "TIMEOUT_SEC": None,
             "DEFAULT_SEVERITY": None,
         }
         # When
@@ -47,6 +49,8 @@ class TestNpmAuditTool(ToolMetaTestBase):
             "EXCLUDE": [],
             "IGNORED_VULNERABILITIES": None,
             "IGNORE_BELOW_SEVERITY": None,
+            "RESOURCE_PROFILE": None,
+            "TIMEOUT_SEC": None,
             "DEFAULT_SEVERITY": None,
         }
         # When
@@ -291,7 +295,9 @@ Will install mocha@8.4.0"""
 
     @mock.patch("eze.utils.cli.run.async_subprocess_run")
     @mock.patch("eze.utils.cli.run.is_windows_os", mock.MagicMock(return_value=True))
-    @mock.patch("eze.plugins.tools.node_npmaudit.find_files_by_name", mock.MagicMock(return_value=["package.json"]))
+    @mock.patch(
+        "eze.plugins.tools.node_npmaudit.find_files_by_exact_name", mock.MagicMock(return_value=["package.json"])
+    )
     @mock.patch("eze.utils.language.node.install_npm_in_path", mock.MagicMock(return_value=True))
     @pytest.mark.asyncio
     async def test_run_scan__cli_command__std(self, mock_async_subprocess_run):
@@ -305,7 +311,9 @@ Will install mocha@8.4.0"""
 
     @mock.patch("eze.utils.cli.run.async_subprocess_run")
     @mock.patch("eze.utils.cli.run.is_windows_os", mock.MagicMock(return_value=True))
-    @mock.patch("eze.plugins.tools.node_npmaudit.find_files_by_name", mock.MagicMock(return_value=["package.json"]))
+    @mock.patch(
+        "eze.plugins.tools.node_npmaudit.find_files_by_exact_name", mock.MagicMock(return_value=["package.json"])
+    )
     @mock.patch("eze.utils.language.node.install_npm_in_path", mock.MagicMock(return_value=True))
     @pytest.mark.asyncio
     async def test_run_scan__cli_command__non_prod(self, mock_async_subprocess_run):
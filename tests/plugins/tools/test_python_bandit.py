@@ -36,6 +36,8 @@ class TestBanditTool(ToolMetaTestBase):
             "IGNORED_FILES": None,
             "IGNORED_VULNERABILITIES": None,
             "IGNORE_BELOW_SEVERITY": None,
+            "RESOURCE_PROFILE": None,
+            "TIMEOUT_SEC": None,
             "DEFAULT_SEVERITY": None,
         }
         # When
@@ -78,7 +80,7 @@ class TestBanditTool(ToolMetaTestBase):
 
     @mock.patch("eze.utils.cli.run.async_subprocess_run")
     @mock.patch("eze.utils.cli.run.is_windows_os", mock.MagicMock(return_value=True))
-    @mock.patch("eze.plugins.tools.python_bandit.cache_workspace_into_tmp", mock.MagicMock(return_value=None))
+    @mock.patch("eze.core.tool.cache_workspace_into_tmp", mock.MagicMock(return_value=None))
     @pytest.mark.asyncio
     async def test_run_scan__cli_command__std(self, mock_async_subprocess_run):
         # Given
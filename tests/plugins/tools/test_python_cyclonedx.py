@@ -31,6 +31,8 @@ class TestPythonCyclonedxTool(ToolMetaTestBase):
             "INCLUDE_DEV": False,
             "IGNORED_VULNERABILITIES": None,
             "IGNORE_BELOW_SEVERITY": None,
+            "RESOURCE_PROFILE": None,
+            "TIMEOUT_SEC": None,
             "DEFAULT_SEVERITY": None,
             "SCA_ENABLED": True,
         }
@@ -56,6 +58,8 @@ class TestPythonCyclonedxTool(ToolMetaTestBase):
             "EXCLUDE": [],
             "IGNORED_VULNERABILITIES": None,
             "IGNORE_BELOW_SEVERITY": None,
+            "RESOURCE_PROFILE": None,
+            "TIMEOUT_SEC": None,
             "DEFAULT_SEVERITY": None,
             "LICENSE_ALLOWLIST": [],
             "LICENSE_CHECK": "PROPRIETARY",
@@ -83,16 +87,12 @@ class TestPythonCyclonedxTool(ToolMetaTestBase):
         # Then
         assert output == expected_output
 
-    @mock.patch("eze.utils.data.pypi.request_json")
-    @mock.patch("eze.utils.data.cve.request_json")
-    def test_parse_report__sca_enabled_snapshot(self, mock_cve_request_json, mock_pypi_request_json, snapshot):
+    @mock.patch("eze.utils.data.advisory_cache.request_json")
+    def test_parse_report__sca_enabled_snapshot(self, mock_request_json, snapshot):
         # Given, mocked the pypi and cve results
-        mock_pypi_request_json.return_value = load_json_fixture(
-            "__fixtures__/pypi/pypi_org_pypi_aws-encryption-sdk_1_2_0.json"
-        )
-        mock_cve_request_json.return_value = load_json_fixture(
-            "__fixtures__/cve/services_nvd_nist_gov_rest_json_cve_1_0_CVE_2013_5123.json"
-        )
+        pypi_data = load_json_fixture("__fixtures__/pypi/pypi_org_pypi_aws-encryption-sdk_1_2_0.json")
+        cve_data = load_json_fixture("__fixtures__/cve/services_nvd_nist_gov_rest_json_cve_1_0_CVE_2013_5123.json")
+        mock_request_json.side_effect = lambda url, **kwargs: cve_data if "nvd.nist.gov" in url else pypi_data
         input_fixture_location = f"__fixtures__/plugins_tools/raw-{self.SNAPSHOT_PREFIX}-report--as-sboms.json"
         # Test container fixture and snapshot
         self.assert_parse_report_snapshot_test(
@@ -115,7 +115,7 @@ class TestPythonCyclonedxTool(ToolMetaTestBase):
 
     @mock.patch("eze.utils.cli.run.async_subprocess_run")
     @mock.patch("eze.utils.cli.run.is_windows_os", mock.MagicMock(return_value=True))
-    @mock.patch("eze.utils.language.python.find_files_by_name", mock.MagicMock(return_value=[]))
+    @mock.patch("eze.utils.language.python.find_files_by_exact_name", mock.MagicMock(return_value=[]))
     @mock.patch(
         "eze.plugins.tools.python_cyclonedx.create_absolute_path",
         mock.MagicMock(return_value="OS_NON_SPECIFIC_ABSOLUTE/foo-python-cyclonedx-bom.json"),
@@ -135,6 +135,13 @@ class TestPythonCyclonedxTool(ToolMetaTestBase):
 
         await self.assert_run_scan_command(input_config, expected_cmd, mock_async_subprocess_run)
 
+    @mock.patch(
+        "eze.plugins.tools.python_cyclonedx.get_requirements_projects",
+        mock.MagicMock(return_value=["requirements.txt"]),
+    )
+    @mock.patch("eze.plugins.tools.python_cyclonedx.get_poetry_projects", mock.MagicMock(return_value=[]))
+    @mock.patch("eze.plugins.tools.python_cyclonedx.get_piplock_projects", mock.MagicMock(return_value=[]))
+    @mock.patch("eze.plugins.tools.python_cyclonedx.find_files_by_exact_name", mock.MagicMock(return_value=[]))
     @mock.patch("eze.plugins.tools.python_cyclonedx.load_json")
     @mock.patch("eze.plugins.tools.python_cyclonedx.run_async_cli_command")
     @pytest.mark.asyncio
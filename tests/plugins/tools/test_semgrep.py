@@ -54,6 +54,8 @@ class TestSemGrepTool(ToolMetaTestBase):
             "IGNORED_FILES": None,
             "IGNORED_VULNERABILITIES": None,
             "IGNORE_BELOW_SEVERITY": None,
+            "RESOURCE_PROFILE": None,
+            "TIMEOUT_SEC": None,
             "DEFAULT_SEVERITY": None,
         }
         # When
@@ -61,6 +63,24 @@ class TestSemGrepTool(ToolMetaTestBase):
         # Then
         assert testee.config == expected_config
 
+    def test_cache_input_files__registry_rulesets_not_cached(self):
+        # Given
+        testee = SemGrepTool({"CONFIGS": ["p/ci", "https://example.com/rules.yml"]})
+        # When
+        output = testee.cache_input_files()
+        # Then
+        assert output is None
+
+    def test_cache_input_files__local_rulesets_cached(self, tmp_path):
+        # Given
+        rules_file = str(tmp_path / "rules.yml")
+        (tmp_path / "rules.yml").write_text("rules: []")
+        testee = SemGrepTool({"CONFIGS": [rules_file]})
+        # When
+        output = testee.cache_input_files()
+        # Then
+        assert output == sorted(["Dockerfile", "src/thing.js", rules_file])
+
     def test_creation__with_config(self):
         # Given
         input_config = {
@@ -80,6 +100,8 @@ class TestSemGrepTool(ToolMetaTestBase):
             "IGNORED_FILES": None,
             "IGNORED_VULNERABILITIES": None,
             "IGNORE_BELOW_SEVERITY": None,
+            "RESOURCE_PROFILE": None,
+            "TIMEOUT_SEC": None,
             "DEFAULT_SEVERITY": None,
         }
         # When
@@ -121,7 +143,7 @@ class TestSemGrepTool(ToolMetaTestBase):
 
     @mock.patch("eze.utils.cli.run.async_subprocess_run")
     @mock.patch("eze.utils.cli.run.is_windows_os", mock.MagicMock(return_value=True))
-    @mock.patch("eze.plugins.tools.semgrep.cache_workspace_into_tmp", mock.MagicMock(return_value=None))
+    @mock.patch("eze.core.tool.cache_workspace_into_tmp", mock.MagicMock(return_value=None))
     @pytest.mark.asyncio
     async def test_run_scan__cli_command__std(self, mock_async_subprocess_run):
         # Given
@@ -139,7 +161,7 @@ class TestSemGrepTool(ToolMetaTestBase):
 
     @mock.patch("eze.utils.cli.run.run_async_cmd")
     @mock.patch("eze.utils.cli.run.is_windows_os", mock.MagicMock(return_value=True))
-    @mock.patch("eze.plugins.tools.semgrep.cache_workspace_into_tmp", mock.MagicMock(return_value=None))
+    @mock.patch("eze.core.tool.cache_workspace_into_tmp", mock.MagicMock(return_value=None))
     @pytest.mark.asyncio
     async def test_run_scan_without_semgrep_locally_installed_raise_eze_error(self, mocked_run_async_cmd):
         # Given
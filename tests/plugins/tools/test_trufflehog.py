@@ -87,6 +87,8 @@ class TestTruffleHogTool(ToolMetaTestBase):
             "IGNORED_FILES": None,
             "IGNORED_VULNERABILITIES": None,
             "IGNORE_BELOW_SEVERITY": None,
+            "RESOURCE_PROFILE": None,
+            "TIMEOUT_SEC": None,
             "DEFAULT_SEVERITY": None,
             "USE_SOURCE_COPY": True,
         }
@@ -126,6 +128,8 @@ class TestTruffleHogTool(ToolMetaTestBase):
             "IGNORED_FILES": None,
             "IGNORED_VULNERABILITIES": None,
             "IGNORE_BELOW_SEVERITY": None,
+            "RESOURCE_PROFILE": None,
+            "TIMEOUT_SEC": None,
             "DEFAULT_SEVERITY": None,
             "USE_SOURCE_COPY": True,
         }
@@ -174,6 +178,8 @@ class TestTruffleHogTool(ToolMetaTestBase):
             "IGNORED_FILES": None,
             "IGNORED_VULNERABILITIES": None,
             "IGNORE_BELOW_SEVERITY": None,
+            "RESOURCE_PROFILE": None,
+            "TIMEOUT_SEC": None,
             "DEFAULT_SEVERITY": None,
             "USE_SOURCE_COPY": True,
         }
@@ -218,6 +224,8 @@ class TestTruffleHogTool(ToolMetaTestBase):
             "IGNORED_FILES": None,
             "IGNORED_VULNERABILITIES": None,
             "IGNORE_BELOW_SEVERITY": None,
+            "RESOURCE_PROFILE": None,
+            "TIMEOUT_SEC": None,
             "DEFAULT_SEVERITY": None,
             "USE_SOURCE_COPY": True,
         }
@@ -270,7 +278,7 @@ class TestTruffleHogTool(ToolMetaTestBase):
     @mock.patch(
         "eze.plugins.tools.trufflehog.get_gitignore_paths", mock.MagicMock(return_value=["some-gitignore-statement"])
     )
-    @mock.patch("eze.plugins.tools.trufflehog.cache_workspace_into_tmp", mock.MagicMock(return_value=None))
+    @mock.patch("eze.core.tool.cache_workspace_into_tmp", mock.MagicMock(return_value=None))
     @pytest.mark.asyncio
     async def test_run_scan__cli_command(self, mock_async_subprocess_run):
         # Given
@@ -299,7 +307,7 @@ class TestTruffleHogTool(ToolMetaTestBase):
     @mock.patch(
         "eze.plugins.tools.trufflehog.get_gitignore_paths", mock.MagicMock(return_value=["some-gitignore-statement"])
     )
-    @mock.patch("eze.plugins.tools.trufflehog.cache_workspace_into_tmp", mock.MagicMock(return_value=None))
+    @mock.patch("eze.core.tool.cache_workspace_into_tmp", mock.MagicMock(return_value=None))
     @mock.patch(
         "eze.plugins.tools.trufflehog.create_absolute_path",
         mock.MagicMock(return_value="OS_NON_SPECIFIC_ABSOLUTE/tmp-truffleHog-report.json"),
@@ -336,7 +344,7 @@ class TestTruffleHogTool(ToolMetaTestBase):
     @mock.patch(
         "eze.plugins.tools.trufflehog.get_gitignore_paths", mock.MagicMock(return_value=["some-gitignore-statement"])
     )
-    @mock.patch("eze.plugins.tools.trufflehog.cache_workspace_into_tmp", mock.MagicMock(return_value=None))
+    @mock.patch("eze.core.tool.cache_workspace_into_tmp", mock.MagicMock(return_value=None))
     @mock.patch(
         "eze.plugins.tools.trufflehog.create_absolute_path",
         mock.MagicMock(return_value="OS_NON_SPECIFIC_ABSOLUTE/tmp-truffleHog-report.json"),
@@ -371,7 +379,7 @@ class TestTruffleHogTool(ToolMetaTestBase):
     @mock.patch(
         "eze.plugins.tools.trufflehog.get_gitignore_paths", mock.MagicMock(return_value=["some-gitignore-statement"])
     )
-    @mock.patch("eze.plugins.tools.trufflehog.cache_workspace_into_tmp", mock.MagicMock(return_value=None))
+    @mock.patch("eze.core.tool.cache_workspace_into_tmp", mock.MagicMock(return_value=None))
     @mock.patch(
         "eze.plugins.tools.trufflehog.create_absolute_path",
         mock.MagicMock(return_value="OS_NON_SPECIFIC_ABSOLUTE/tmp-truffleHog-report.json"),
@@ -1,5 +1,9 @@
 # pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring,line-too-long,invalid-name
+import asyncio
 import shlex
+import sys
+import tempfile
+import time
 from unittest import mock
 
 import pytest
@@ -15,7 +19,9 @@ from eze.utils.cli.run import (
     cmd_exists,
     run_cli_command,
     CompletedProcess,
+    async_subprocess_run,
 )
+from eze.utils.io.file import is_windows_os
 
 
 def test_is_missing_exe_output__linux_bash_file_missing():
@@ -218,3 +224,89 @@ def test_run_cli_command__sanity():
     completed_process = run_cli_command(test_input)
     output = trim(completed_process.stdout)
     assert output == expected_output
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(is_windows_os(), reason="uses posix sleep")
+async def test_async_subprocess_run__cancellation_kills_process():
+    # Given
+    tic = time.perf_counter()
+    # When
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(async_subprocess_run(shlex.split("sleep 30")), 0.2)
+    # Then
+    assert time.perf_counter() - tic < 10
+
+
+@pytest.mark.asyncio
+@mock.patch("eze.utils.cli.run.SPOOL_MAX_MEMORY_BYTES", 1024)
+async def test_async_subprocess_run__drains_large_stdout_and_stderr_to_disk():
+    # Given
+    # output larger than os pipe buffers on both streams, would deadlock if streams read after process exit
+    script = "import sys; sys.stdout.write('o' * 500000); sys.stderr.write('e' * 500000)"
+    # When
+    completed_process = await asyncio.wait_for(async_subprocess_run([sys.executable, "-c", script]), 30)
+    # Then
+    assert completed_process.stdout_file._rolled is True
+    assert completed_process.stdout_head(3) == "ooo"
+    assert len(completed_process.stdout) == 500000
+    assert len(completed_process.stderr) == 500000
+
+
+def test_completed_process__from_file(tmp_path):
+    # Given
+    stdout_file = tempfile.SpooledTemporaryFile()
+    stdout_file.write('{"hello": "world"}'.encode())
+    testee = CompletedProcess(stdout_file=stdout_file, stderr_file=tempfile.SpooledTemporaryFile())
+    output_file = tmp_path / "some-folder" / "output.json"
+    # When
+    testee.write_stdout(str(output_file))
+    # Then
+    assert output_file.read_text() == '{"hello": "world"}'
+    assert testee.open_stdout().read() == '{"hello": "world"}'
+    assert testee.stdout_head(7) == '{"hello'
+    assert testee.stdout == '{"hello": "world"}'
+    assert testee.stderr == ""
+
+
+def test_completed_process__from_str(tmp_path):
+    # Given
+    testee = CompletedProcess('{"hello": "world"}', "some warning")
+    output_file = tmp_path / "output.json"
+    # When
+    testee.write_stdout(str(output_file))
+    # Then
+    assert output_file.read_text() == '{"hello": "world"}'
+    assert testee.open_stdout().read() == '{"hello": "world"}'
+    assert testee.stdout_head(7) == '{"hello'
+    assert testee.stderr == "some warning"
+
+
+def test_completed_process__closes_file_once_decoded():
+    # Given
+    stdout_file = tempfile.SpooledTemporaryFile()
+    stdout_file.write(b"some output")
+    stderr_file = tempfile.SpooledTemporaryFile()
+    testee = CompletedProcess(stdout_file=stdout_file, stderr_file=stderr_file)
+    # When
+    output = testee.stdout
+    # Then
+    assert output == "some output"
+    assert stdout_file.closed is True
+    assert stderr_file.closed is False
+
+
+def test_completed_process__context_manager_closes_files():
+    # Given
+    stdout_file = tempfile.SpooledTemporaryFile()
+    stderr_file = tempfile.SpooledTemporaryFile()
+    stderr_file.write(b"some warning")
+    # When
+    with CompletedProcess(stdout_file=stdout_file, stderr_file=stderr_file) as testee:
+        warning = testee.stderr
+    # Then
+    assert warning == "some warning"
+    assert stdout_file.closed is True
+    assert stderr_file.closed is True
+    assert testee.stdout == ""
+    assert testee.stderr == "some warning"
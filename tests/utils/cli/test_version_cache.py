@@ -0,0 +1,168 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring,line-too-long
+import os
+from unittest import mock
+
+from eze.core.config import PluginMeta, check_installed_versions
+from eze.utils.cli.version_cache import ToolVersionCache, get_executable_fingerprint
+
+
+def teardown_function():
+    ToolVersionCache.reset_instance()
+
+
+def create_executable(tmp_path) -> str:
+    executable = tmp_path / "some-tool"
+    executable.write_text("#!/bin/sh\necho 1.2.3\n")
+    executable.chmod(0o755)
+    return str(executable)
+
+
+def test_get_executable_fingerprint__not_installed():
+    assert get_executable_fingerprint("some-tool-that-is-not-installed") is None
+
+
+def test_get_version__disabled_by_default(tmp_path):
+    # Given
+    executable = create_executable(tmp_path)
+    mock_detect_version = mock.MagicMock(return_value="1.2.3")
+    testee = ToolVersionCache.get_instance()
+    # When
+    testee.get_version("some-tool", {}, executable, mock_detect_version)
+    output = testee.get_version("some-tool", {}, executable, mock_detect_version)
+    # Then
+    assert output == "1.2.3"
+    assert mock_detect_version.call_count == 2
+
+
+def test_get_version__persisted_until_executable_changes(tmp_path):
+    # Given
+    executable = create_executable(tmp_path)
+    manifest_file = tmp_path / "tool-versions.json"
+    mock_detect_version = mock.MagicMock(return_value="1.2.3")
+    ToolVersionCache(True, manifest_file).get_version("some-tool", {}, executable, mock_detect_version)
+    # When
+    output = ToolVersionCache(True, manifest_file).get_version("some-tool", {}, executable, mock_detect_version)
+    # Then
+    assert output == "1.2.3"
+    assert mock_detect_version.call_count == 1
+    # and reinstalling tool (new mtime) detects version again
+    os.utime(executable, ns=(0, 0))
+    ToolVersionCache(True, manifest_file).get_version("some-tool", {}, executable, mock_detect_version)
+    assert mock_detect_version.call_count == 2
+
+
+def test_get_version__version_check_change_detects_again(tmp_path):
+    # Given
+    executable = create_executable(tmp_path)
+    mock_detect_version = mock.MagicMock(return_value="1.2.3")
+    testee = ToolVersionCache(True, tmp_path / "tool-versions.json")
+    testee.get_version("some-tool", {"FROM_EXE": "some-tool --version"}, executable, mock_detect_version)
+    # When
+    testee.get_version("some-tool", {"FROM_EXE": "some-tool version"}, executable, mock_detect_version)
+    # Then
+    assert mock_detect_version.call_count == 2
+
+
+def test_check_installed_versions():
+    # Given
+    mock_plugin_1 = mock.MagicMock()
+    mock_plugin_1.check_installed.return_value = "1.0.0"
+    mock_plugin_2 = mock.MagicMock()
+    mock_plugin_2.check_installed.return_value = ""
+    # When
+    output = check_installed_versions({"plugin-1": mock_plugin_1, "plugin-2": mock_plugin_2})
+    # Then
+    assert output == {"plugin-1": "1.0.0", "plugin-2": ""}
+
+
+def test_get_version__not_installed_result_not_persisted(tmp_path):
+    # Given
+    executable = create_executable(tmp_path)
+    manifest_file = tmp_path / "tool-versions.json"
+    mock_detect_version = mock.MagicMock(return_value="")
+    not_installed_output = ToolVersionCache(True, manifest_file).get_version(
+        "some-tool", {}, executable, mock_detect_version
+    )
+    # When
+    mock_detect_version.return_value = "1.2.3"
+    output = ToolVersionCache(True, manifest_file).get_version("some-tool", {}, executable, mock_detect_version)
+    # Then
+    assert not_installed_output == ""
+    assert output == "1.2.3"
+    assert mock_detect_version.call_count == 2
+
+
+def test_get_version__install_folder_change_detects_again(tmp_path):
+    # Given
+    executable = create_executable(tmp_path)
+    plugin_folder = tmp_path / "m2" / "some-plugin"
+    manifest_file = tmp_path / "tool-versions.json"
+    mock_detect_version = mock.MagicMock(return_value="1.0.0")
+    ToolVersionCache(True, manifest_file).get_version("some-tool", {}, executable, mock_detect_version, [plugin_folder])
+    # When
+    plugin_folder.mkdir(parents=True)
+    mock_detect_version.return_value = "2.0.0"
+    output = ToolVersionCache(True, manifest_file).get_version(
+        "some-tool", {}, executable, mock_detect_version, [plugin_folder]
+    )
+    # Then
+    assert output == "2.0.0"
+    assert mock_detect_version.call_count == 2
+
+
+@mock.patch("eze.utils.cli.version_cache.get_executable_fingerprint")
+@mock.patch("eze.core.config.extract_version_from_maven")
+def test_check_installed__maven_plugin_installed_after_not_installed(
+    mock_extract_version_from_maven, mock_get_executable_fingerprint, tmp_path
+):
+    # Given
+    class DummyMavenTool(PluginMeta):
+        VERSION_CHECK: dict = {"FROM_MAVEN": "org.eze:dummy-maven-plugin"}
+
+    mock_get_executable_fingerprint.side_effect = lambda x: ["/usr/bin/mvn", 1, 1]
+    ToolVersionCache.set_instance(True, tmp_path / "tool-versions.json")
+    mock_extract_version_from_maven.return_value = ""
+    with mock.patch("pathlib.Path.home", return_value=tmp_path):
+        not_installed_output = DummyMavenTool.check_installed()
+        # When
+        (tmp_path / ".m2" / "repository" / "org" / "eze" / "dummy-maven-plugin" / "1.2.3").mkdir(parents=True)
+        mock_extract_version_from_maven.return_value = "1.2.3"
+        output = DummyMavenTool.check_installed()
+    # Then
+    assert not_installed_output == ""
+    assert output == "1.2.3"
+
+
+@mock.patch("eze.utils.cli.version_cache.get_executable_fingerprint")
+@mock.patch("eze.core.config.extract_cmd_version")
+def test_check_installed__dotnet_tool_keyed_on_tool_store_folder(
+    mock_extract_cmd_version, mock_get_executable_fingerprint, tmp_path
+):
+    # Given
+    class DummyDotnetTool(PluginMeta):
+        VERSION_CHECK: dict = {"FROM_EXE": "dotnet DummyTool --version"}
+
+    mock_get_executable_fingerprint.side_effect = lambda x: ["/usr/bin/dotnet", 1, 1]
+    ToolVersionCache.set_instance(True, tmp_path / "tool-versions.json")
+    tool_store_folder = tmp_path / ".dotnet" / "tools" / ".store" / "dummytool"
+    tool_store_folder.mkdir(parents=True)
+    mock_extract_cmd_version.return_value = "1.0.0"
+    with mock.patch("pathlib.Path.home", return_value=tmp_path):
+        installed_output = DummyDotnetTool.check_installed()
+        # When
+        tool_store_folder.rmdir()
+        mock_extract_cmd_version.return_value = ""
+        output = DummyDotnetTool.check_installed()
+    # Then
+    assert installed_output == "1.0.0"
+    assert output == ""
+    assert mock_extract_cmd_version.call_count == 2
+
+
+def test_is_enabled_in_env(monkeypatch):
+    # Given
+    monkeypatch.setenv("EZE_TOOL_VERSION_CACHE", "false")
+    # When / Then
+    assert not ToolVersionCache.is_enabled_in_env()
+    monkeypatch.delenv("EZE_TOOL_VERSION_CACHE")
+    assert ToolVersionCache.is_enabled_in_env()
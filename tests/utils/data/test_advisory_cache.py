@@ -0,0 +1,134 @@
+import time
+from unittest import mock
+
+import pytest
+
+from eze.utils.data.advisory_cache import (
+    AdvisoryCache,
+    async_cached_request_json,
+    cached_request_json,
+    MAX_STALE_SEC,
+)
+from eze.utils.error import EzeNetworkingError
+from eze.utils.io.http import HttpResponse
+
+
+def teardown_function():
+    AdvisoryCache.reset_instance()
+
+
+def expire_entry(advisory_cache: AdvisoryCache, source: str, key: str, age_sec: int):
+    advisory_cache._execute(
+        "UPDATE advisories SET fetched_at = ? WHERE source = ? AND key = ?", (time.time() - age_sec, source, key)
+    )
+
+
+@mock.patch("eze.utils.data.advisory_cache.request_json")
+def test_cached_request_json__disabled_by_default(mock_request_json):
+    # Given
+    mock_request_json.return_value = {"vulns": []}
+    # When
+    cached_request_json("osv", "some-key", "https://example.com")
+    output = cached_request_json("osv", "some-key", "https://example.com")
+    # Then
+    assert output == {"vulns": []}
+    assert mock_request_json.call_count == 2
+
+
+@mock.patch("eze.utils.data.advisory_cache.request_response")
+def test_cached_request_json__fresh_entry_served_from_cache(mock_request_response, tmp_path):
+    # Given
+    AdvisoryCache.set_instance(60, db_file=tmp_path / "advisories.sqlite")
+    mock_request_response.return_value = HttpResponse(200, '{"vulns": []}', '"etag-1"')
+    # When
+    cached_request_json("osv", "some-key", "https://example.com")
+    output = cached_request_json("osv", "some-key", "https://example.com")
+    # Then
+    assert output == {"vulns": []}
+    assert mock_request_response.call_count == 1
+
+
+@mock.patch("eze.utils.data.advisory_cache.request_response")
+def test_cached_request_json__expired_entry_revalidated_with_etag(mock_request_response, tmp_path):
+    # Given
+    advisory_cache = AdvisoryCache.set_instance(60, db_file=tmp_path / "advisories.sqlite")
+    advisory_cache.set("osv", "some-key", '{"vulns": []}', '"etag-1"', "Wed, 21 Oct 2015 07:28:00 GMT")
+    expire_entry(advisory_cache, "osv", "some-key", 120)
+    mock_request_response.return_value = HttpResponse(304)
+    # When
+    output = cached_request_json("osv", "some-key", "https://example.com")
+    # Then
+    assert output == {"vulns": []}
+    assert mock_request_response.call_args.kwargs["headers"] == {
+        "If-None-Match": '"etag-1"',
+        "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT",
+    }
+    assert advisory_cache.is_fresh("osv", advisory_cache.get("osv", "some-key"))
+
+
+@mock.patch("eze.utils.data.advisory_cache.request_response")
+def test_cached_request_json__source_ttl_overrides_ttl(mock_request_response, tmp_path):
+    # Given
+    advisory_cache = AdvisoryCache.set_instance(60, {"nvd": 3600}, db_file=tmp_path / "advisories.sqlite")
+    advisory_cache.set("nvd", "CVE-2013-5123", '{"result": {}}')
+    expire_entry(advisory_cache, "nvd", "CVE-2013-5123", 120)
+    # When
+    output = cached_request_json("nvd", "CVE-2013-5123", "https://example.com")
+    # Then
+    assert output == {"result": {}}
+    assert mock_request_response.call_count == 0
+
+
+@mock.patch("eze.utils.data.advisory_cache.request_response")
+def test_cached_request_json__networking_error_serves_expired_entry(mock_request_response, tmp_path):
+    # Given
+    advisory_cache = AdvisoryCache.set_instance(60, db_file=tmp_path / "advisories.sqlite")
+    advisory_cache.set("pypi", "eze-cli:0.1.0", '{"info": {}}')
+    expire_entry(advisory_cache, "pypi", "eze-cli:0.1.0", 120)
+    mock_request_response.side_effect = EzeNetworkingError("some error")
+    # When
+    output = cached_request_json("pypi", "eze-cli:0.1.0", "https://example.com")
+    # Then
+    assert output == {"info": {}}
+
+
+@mock.patch("eze.utils.data.advisory_cache.request_response")
+def test_cached_request_json__networking_error_raised_when_not_cached(mock_request_response, tmp_path):
+    # Given
+    AdvisoryCache.set_instance(60, db_file=tmp_path / "advisories.sqlite")
+    mock_request_response.side_effect = EzeNetworkingError("some error")
+    # When
+    with pytest.raises(EzeNetworkingError) as raised_error:
+        cached_request_json("pypi", "eze-cli:0.1.0", "https://example.com")
+    # Then
+    assert raised_error.value.message == "some error"
+
+
+@mock.patch("eze.utils.data.advisory_cache.threading.Thread")
+def test_cached_request_json__stale_while_revalidate(mock_thread, tmp_path):
+    # Given
+    advisory_cache = AdvisoryCache.set_instance(60, stale_while_revalidate=True, db_file=tmp_path / "advisories.sqlite")
+    advisory_cache.set("osv", "some-key", '{"vulns": []}')
+    expire_entry(advisory_cache, "osv", "some-key", 120)
+    # When
+    output = cached_request_json("osv", "some-key", "https://example.com")
+    # Then
+    assert output == {"vulns": []}
+    assert mock_thread.return_value.start.call_count == 1
+    # and entries older than MAX_STALE_SEC are refetched
+    expire_entry(advisory_cache, "osv", "some-key", 60 + MAX_STALE_SEC + 1)
+    assert not advisory_cache.can_serve_stale("osv", advisory_cache.get("osv", "some-key"))
+
+
+@pytest.mark.asyncio
+async def test_async_cached_request_json__downloads_then_served_from_cache(tmp_path):
+    # Given
+    AdvisoryCache.set_instance(60, db_file=tmp_path / "advisories.sqlite")
+    http_client = mock.MagicMock()
+    http_client.request_response = mock.AsyncMock(return_value=HttpResponse(200, '{"id": "GHSA-1"}'))
+    # When
+    await async_cached_request_json(http_client, "osv", "vulns:GHSA-1", "https://example.com")
+    output = await async_cached_request_json(http_client, "osv", "vulns:GHSA-1", "https://example.com")
+    # Then
+    assert output == {"id": "GHSA-1"}
+    assert http_client.request_response.call_count == 1
@@ -1,10 +1,23 @@
 # pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring,line-too-long
+import json
+import zipfile
 from unittest import mock
 
+import pytest
+
+from eze.utils.data.advisory_cache import AdvisoryCache
+from eze.utils.data.osv_mirror import OsvMirror
+from eze.utils.error import EzeNetworkingError
+from eze.utils.io.http import HttpResponse
 from eze.utils.io.print import pretty_print_json
 
 from tests.__fixtures__.fixture_helper import load_json_fixture, convert_to_std_object, get_snapshot_directory
-from eze.utils.data.osv import from_maven_package_to_osv_id, get_osv_package_data, get_recommendation
+from eze.utils.data.osv import (
+    from_maven_package_to_osv_id,
+    get_osv_package_data,
+    get_recommendation,
+    osv_sca_sboms,
+)
 
 
 def test_from_maven_package_to_osv_id__happy_case():
@@ -19,7 +32,7 @@ def test_from_maven_package_to_osv_id__happy_nothing_case():
     assert from_maven_package_to_osv_id(input) == expected
 
 
-@mock.patch("eze.utils.data.osv.request_json")
+@mock.patch("eze.utils.data.advisory_cache.request_json")
 def test_get_osv_package_data__happy_case(mock_osv_request_json, snapshot):
     # Given
     mock_osv_request_json.return_value = load_json_fixture(
@@ -94,3 +107,141 @@ def test_get_recommendation__happy_case():
     output = get_recommendation(example_vuln_input, "org.opencastproject:opencast-kernel")
     # Then
     assert output == expected_output
+
+
+@pytest.mark.asyncio
+@mock.patch("eze.utils.io.http.AsyncHttpClient.request_json")
+async def test_osv_sca_sboms__batches_queries_and_fetches_each_vulnerability_once(mock_request_json):
+    # Given
+    osv_fixture = load_json_fixture("__fixtures__/osv/osv-org-opencastproject-opencast-kernel.json")
+    raw_vulnerabilities = {x["id"]: x for x in osv_fixture["vulns"][0:2]}
+    kernel_component = {"purl": "pkg:maven/org.opencastproject/opencast-kernel@8.0"}
+    input_boms = {
+        "pom.xml": {"components": [kernel_component, {"purl": "pkg:maven/org.safe/safe-package@1.0"}]},
+        "other/pom.xml": {"components": [kernel_component, {"purl": "pkg:bitbucket/unsupported/package@1.0"}]},
+    }
+    batch_requests = []
+
+    async def request_json(url: str, data=None, headers=None, method=None) -> dict:
+        if url == "https://api.osv.dev/v1/querybatch":
+            batch_requests.append(json.loads(data))
+            return {"results": [{"vulns": [{"id": x} for x in raw_vulnerabilities]}, {}]}
+        return raw_vulnerabilities[url.replace("https://api.osv.dev/v1/vulns/", "")]
+
+    mock_request_json.side_effect = request_json
+    # When
+    [output_vulnerabilities, output_warnings] = await osv_sca_sboms(input_boms)
+    # Then
+    assert batch_requests == [
+        {
+            "queries": [
+                {"package": {"name": "org.opencastproject:opencast-kernel", "ecosystem": "Maven"}, "version": "8.0"},
+                {"package": {"name": "org.safe:safe-package", "ecosystem": "Maven"}, "version": "1.0"},
+            ]
+        }
+    ]
+    assert mock_request_json.call_count == 3
+    assert [(x.file_location["path"], x.identifiers["GHSA"]) for x in output_vulnerabilities] == [
+        ("pom.xml", "GHSA-44cw-p2hm-gpf6"),
+        ("pom.xml", "GHSA-94qw-r73x-j7hg"),
+        ("other/pom.xml", "GHSA-44cw-p2hm-gpf6"),
+        ("other/pom.xml", "GHSA-94qw-r73x-j7hg"),
+    ]
+    assert output_warnings == []
+
+
+@pytest.mark.asyncio
+@mock.patch("eze.utils.io.http.AsyncHttpClient.request_json")
+async def test_osv_sca_sboms__follows_page_tokens(mock_request_json):
+    # Given
+    input_boms = {"pom.xml": {"components": [{"purl": "pkg:maven/org.opencastproject/opencast-kernel@8.0"}]}}
+    batch_requests = []
+
+    async def request_json(url: str, data=None, headers=None, method=None) -> dict:
+        if url == "https://api.osv.dev/v1/querybatch":
+            query = json.loads(data)["queries"][0]
+            batch_requests.append(query.get("page_token"))
+            if "page_token" in query:
+                return {"results": [{"vulns": [{"id": "GHSA-2"}]}]}
+            return {"results": [{"vulns": [{"id": "GHSA-1"}], "next_page_token": "page-2"}]}
+        return {"id": url.replace("https://api.osv.dev/v1/vulns/", "")}
+
+    mock_request_json.side_effect = request_json
+    # When
+    [output_vulnerabilities, output_warnings] = await osv_sca_sboms(input_boms)
+    # Then
+    assert batch_requests == [None, "page-2"]
+    assert [x.identifiers["GHSA"] for x in output_vulnerabilities] == ["GHSA-1", "GHSA-2"]
+
+
+@pytest.mark.asyncio
+@mock.patch("eze.utils.io.http.AsyncHttpClient.request_json")
+async def test_osv_sca_sboms__batch_error_is_warning(mock_request_json):
+    # Given
+    input_boms = {"pom.xml": {"components": [{"purl": "pkg:maven/org.opencastproject/opencast-kernel@8.0"}]}}
+    mock_request_json.side_effect = EzeNetworkingError("some error")
+    # When
+    [output_vulnerabilities, output_warnings] = await osv_sca_sboms(input_boms)
+    # Then
+    assert output_vulnerabilities == []
+    assert output_warnings == [
+        "unable to get osv data for Maven:org.opencastproject:opencast-kernel:8.0, Error: some error"
+    ]
+
+
+@pytest.mark.asyncio
+@mock.patch("eze.utils.io.http.AsyncHttpClient.request_response")
+@mock.patch("eze.utils.io.http.AsyncHttpClient.request_json")
+async def test_osv_sca_sboms__advisory_cache_skips_cached_queries(mock_request_json, mock_request_response, tmp_path):
+    # Given
+    AdvisoryCache.set_instance(60, db_file=tmp_path / "advisories.sqlite")
+    input_boms = {"pom.xml": {"components": [{"purl": "pkg:maven/org.opencastproject/opencast-kernel@8.0"}]}}
+    mock_request_json.return_value = {"results": [{"vulns": [{"id": "GHSA-1"}]}]}
+    mock_request_response.return_value = HttpResponse(200, '{"id": "GHSA-1"}')
+    # When
+    await osv_sca_sboms(input_boms)
+    [output_vulnerabilities, output_warnings] = await osv_sca_sboms(input_boms)
+    AdvisoryCache.reset_instance()
+    # Then
+    assert [x.identifiers["GHSA"] for x in output_vulnerabilities] == ["GHSA-1"]
+    assert mock_request_json.call_count == 1
+    assert mock_request_response.call_count == 1
+
+
+@pytest.mark.asyncio
+@mock.patch("eze.utils.io.http.AsyncHttpClient.request_json")
+async def test_osv_sca_sboms__offline_mirror(mock_request_json, tmp_path):
+    # Given
+    osv_fixture = load_json_fixture("__fixtures__/osv/osv-org-opencastproject-opencast-kernel.json")
+    with zipfile.ZipFile(tmp_path / "all.zip", "w") as dump_zip:
+        for vulnerability in osv_fixture["vulns"]:
+            dump_zip.writestr(f"{vulnerability['id']}.json", json.dumps(vulnerability))
+    OsvMirror.set_instance(True, tmp_path / "osv-mirror.sqlite").import_dump(str(tmp_path / "all.zip"))
+    input_boms = {"pom.xml": {"components": [{"purl": "pkg:maven/org.opencastproject/opencast-kernel@8.0"}]}}
+    # When
+    [output_vulnerabilities, output_warnings] = await osv_sca_sboms(input_boms)
+    OsvMirror.reset_instance()
+    # Then
+    assert "GHSA-44cw-p2hm-gpf6" in [x.identifiers["GHSA"] for x in output_vulnerabilities]
+    assert output_warnings == []
+    assert mock_request_json.call_count == 0
+
+
+@pytest.mark.asyncio
+async def test_osv_sca_sboms__offline_mirror_not_imported_is_single_warning(tmp_path):
+    # Given
+    OsvMirror.set_instance(True, tmp_path / "osv-mirror.sqlite")
+    input_boms = {
+        "pom.xml": {
+            "components": [
+                {"purl": "pkg:maven/org.opencastproject/opencast-kernel@8.0"},
+                {"purl": "pkg:maven/org.safe/safe-package@1.0"},
+            ]
+        }
+    }
+    # When
+    [output_vulnerabilities, output_warnings] = await osv_sca_sboms(input_boms)
+    OsvMirror.reset_instance()
+    # Then
+    assert output_vulnerabilities == []
+    assert len(output_warnings) == 1
@@ -0,0 +1,116 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring,line-too-long
+import json
+import zipfile
+
+import pytest
+
+from eze.utils.data.osv_mirror import OsvMirror, version_key
+from eze.utils.error import EzeError
+from tests.__fixtures__.fixture_helper import load_json_fixture
+
+
+def create_osv_dump(dump_file, vulnerabilities: list):
+    with zipfile.ZipFile(dump_file, "w") as dump_zip:
+        for vulnerability in vulnerabilities:
+            dump_zip.writestr(f"{vulnerability['id']}.json", json.dumps(vulnerability))
+
+
+def create_osv_mirror(tmp_path) -> OsvMirror:
+    osv_fixture = load_json_fixture("__fixtures__/osv/osv-org-opencastproject-opencast-kernel.json")
+    create_osv_dump(tmp_path / "all.zip", osv_fixture["vulns"])
+    osv_mirror = OsvMirror(True, tmp_path / "osv-mirror.sqlite")
+    osv_mirror.import_dump(str(tmp_path / "all.zip"))
+    return osv_mirror
+
+
+def test_version_key():
+    assert version_key("1.0") == version_key("1.0.0") == version_key("1.0.0.RELEASE")
+    assert version_key("1.0-rc1") < version_key("1.0") < version_key("1.0.post1") < version_key("1.0.1")
+    assert version_key("2.0.0-SNAPSHOT") < version_key("2.0.0") < version_key("2.0.10")
+    assert version_key("1.9") < version_key("1.10")
+
+
+def test_import_dump(tmp_path):
+    # Given
+    osv_fixture = load_json_fixture("__fixtures__/osv/osv-org-opencastproject-opencast-kernel.json")
+    create_osv_dump(tmp_path / "all.zip", osv_fixture["vulns"])
+    testee = OsvMirror(True, tmp_path / "osv-mirror.sqlite")
+    # When
+    output = testee.import_dump(str(tmp_path / "all.zip"))
+    # Then
+    assert output == 5
+    assert testee.get_vulnerability("GHSA-44cw-p2hm-gpf6")["id"] == "GHSA-44cw-p2hm-gpf6"
+    assert testee.get_vulnerability("GHSA-missing") is None
+
+
+def test_import_dump__reimport_replaces_advisories(tmp_path):
+    # Given
+    testee = create_osv_mirror(tmp_path)
+    create_osv_dump(tmp_path / "all.zip", [{"id": "GHSA-44cw-p2hm-gpf6", "affected": []}])
+    # When
+    testee.import_dump(str(tmp_path / "all.zip"))
+    # Then
+    assert "GHSA-44cw-p2hm-gpf6" not in testee.query("Maven", "org.opencastproject:opencast-kernel", "8.0")
+
+
+def test_import_dump__invalid_dump(tmp_path):
+    # Given
+    (tmp_path / "all.zip").write_text("not a zip")
+    testee = OsvMirror(True, tmp_path / "osv-mirror.sqlite")
+    # When
+    with pytest.raises(EzeError) as raised_error:
+        testee.import_dump(str(tmp_path / "all.zip"))
+    # Then
+    assert raised_error.value.message.startswith(f"unable to import osv data dump '{tmp_path / 'all.zip'}'")
+
+
+def test_query__resolves_unordered_range_events(tmp_path):
+    # Given
+    # GHSA-44cw-p2hm-gpf6 events are listed as introduced 0, introduced 8.0, fixed 8.9, fixed 7.9
+    testee = create_osv_mirror(tmp_path)
+    # When
+    affected_output = testee.query("Maven", "org.opencastproject:opencast-kernel", "7.0")
+    fixed_output = testee.query("Maven", "org.opencastproject:opencast-kernel", "8.9")
+    # Then
+    assert "GHSA-44cw-p2hm-gpf6" in affected_output
+    assert "GHSA-44cw-p2hm-gpf6" not in fixed_output
+
+
+def test_query__unknown_package(tmp_path):
+    # Given
+    testee = create_osv_mirror(tmp_path)
+    # When
+    output = testee.query("Maven", "org.safe:safe-package", "1.0")
+    # Then
+    assert output == []
+
+
+def test_query__pypi_names_normalised(tmp_path):
+    # Given
+    vulnerability = {
+        "id": "PYSEC-1",
+        "affected": [
+            {
+                "package": {"name": "Aws_Encryption.SDK", "ecosystem": "PyPI"},
+                "ranges": [{"type": "ECOSYSTEM", "events": [{"introduced": "0"}, {"last_affected": "1.2.0"}]}],
+            }
+        ],
+    }
+    create_osv_dump(tmp_path / "all.zip", [vulnerability])
+    testee = OsvMirror(True, tmp_path / "osv-mirror.sqlite")
+    testee.import_dump(str(tmp_path / "all.zip"))
+    # When
+    output = testee.query("PyPI", "aws-encryption-sdk", "1.2.0")
+    # Then
+    assert output == ["PYSEC-1"]
+    assert testee.query("PyPI", "aws-encryption-sdk", "1.2.1") == []
+
+
+def test_query__not_imported(tmp_path):
+    # Given
+    testee = OsvMirror(True, tmp_path / "osv-mirror.sqlite")
+    # When
+    with pytest.raises(EzeError) as raised_error:
+        testee.query("Maven", "org.safe:safe-package", "1.0")
+    # Then
+    assert "import osv data dumps via 'eze housekeeping import-osv-mirror'" in raised_error.value.message
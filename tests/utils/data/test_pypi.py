@@ -2,7 +2,8 @@
 from unittest import mock
 
 from tests.__fixtures__.fixture_helper import convert_to_std_object, load_json_fixture
-from eze.utils.data.pypi import filter_license_classifiers, get_pypi_package_data
+from eze.utils.data.osv_mirror import OsvMirror
+from eze.utils.data.pypi import filter_license_classifiers, get_pypi_package_data, pypi_sca_sboms
 
 
 def test_filter_license_classifiers():
@@ -27,16 +28,12 @@ def test_filter_license_classifiers():
     assert output == expected_license
 
 
-@mock.patch("eze.utils.data.pypi.request_json")
-@mock.patch("eze.utils.data.cve.request_json")
-def test_get_pypi_package_data__happy_case(mock_cve_request_json, mock_pypi_request_json):
+@mock.patch("eze.utils.data.advisory_cache.request_json")
+def test_get_pypi_package_data__happy_case(mock_request_json):
     # Given
-    mock_pypi_request_json.return_value = load_json_fixture(
-        "__fixtures__/pypi/pypi_org_pypi_aws-encryption-sdk_1_2_0.json"
-    )
-    mock_cve_request_json.return_value = load_json_fixture(
-        "__fixtures__/cve/services_nvd_nist_gov_rest_json_cve_1_0_CVE_2013_5123.json"
-    )
+    pypi_data = load_json_fixture("__fixtures__/pypi/pypi_org_pypi_aws-encryption-sdk_1_2_0.json")
+    cve_data = load_json_fixture("__fixtures__/cve/services_nvd_nist_gov_rest_json_cve_1_0_CVE_2013_5123.json")
+    mock_request_json.side_effect = lambda url, **kwargs: cve_data if "nvd.nist.gov" in url else pypi_data
     expected_output = {
         "licenses": ["License :: OSI Approved :: Apache Software License"],
         "package_name": "aws-encryption-sdk",
@@ -67,3 +64,25 @@ def test_get_pypi_package_data__happy_case(mock_cve_request_json, mock_pypi_requ
     output = get_pypi_package_data("aws-encryption-sdk", "1.2.0", "requirements.txt")
     # Then
     assert convert_to_std_object(output) == expected_output
+
+
+@mock.patch("eze.utils.data.pypi.get_osv_package_data")
+def test_pypi_sca_sboms__offline_mirror_missing_is_single_warning(mock_get_osv_package_data, tmp_path):
+    # Given
+    OsvMirror.set_instance(True, tmp_path / "osv-mirror.sqlite")
+    input_boms = {
+        "requirements.txt": {
+            "components": [
+                {"purl": "pkg:pypi/django@1.11.1"},
+                {"purl": "pkg:pypi/flask@0.12"},
+                {"purl": "pkg:pypi/requests@2.19.1"},
+            ]
+        }
+    }
+    # When
+    [output_vulnerabilities, output_warnings] = pypi_sca_sboms(input_boms)
+    OsvMirror.reset_instance()
+    # Then
+    assert output_vulnerabilities == []
+    assert len(output_warnings) == 1
+    assert mock_get_osv_package_data.call_count == 0
@@ -1,4 +1,5 @@
 # pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring,line-too-long,unused-argument
+import gzip
 import os
 import pathlib
 import shutil
@@ -12,9 +13,11 @@ from eze.utils.io.print import pretty_print_json
 from eze.utils.io.file import (
     get_absolute_filename,
     load_json,
+    load_partial_json,
     xescape,
     load_toml,
     write_json,
+    spool_json,
     normalise_linux_file_path,
     normalise_file_paths,
     is_windows_os,
@@ -224,6 +227,43 @@ def test_load_json__sad_path__ab_898_json_error():
     assert expected_error in str(raised_error.value)
 
 
+def test_load_partial_json__complete_json(tmp_path):
+    # Given
+    json_file = tmp_path / "report.json"
+    json_file.write_text('{"results": [1, 2]}')
+    # When
+    output = load_partial_json(str(json_file))
+    # Then
+    assert output == {"results": [1, 2]}
+
+
+def test_load_partial_json__truncated_list_keeps_complete_items(tmp_path):
+    # Given
+    json_file = tmp_path / "report.json"
+    json_file.write_text('[\n  {"id": 1},\n  {"id": 2, "nested": [1, 2]},\n  {"id": 3, "na')
+    # When
+    output = load_partial_json(str(json_file))
+    # Then
+    assert output == [{"id": 1}, {"id": 2, "nested": [1, 2]}]
+
+
+def test_load_partial_json__truncated_object(tmp_path):
+    # Given
+    json_file = tmp_path / "report.json"
+    json_file.write_text('{"results": [{"id": 1}, {"id"')
+    # When
+    output = load_partial_json(str(json_file))
+    # Then
+    assert output is None
+
+
+def test_load_partial_json__missing_file(tmp_path):
+    # When
+    output = load_partial_json(str(tmp_path / "does-not-exist.json"))
+    # Then
+    assert output is None
+
+
 @mock.patch("eze.utils.io.file.open", side_effect=FakePermissionError())
 def test_load_json__sad_path__ab_688_permission_error(mock_write_text):
     # Given
@@ -262,6 +302,40 @@ def test_write_json():
     assert written_location == input_report_location
 
 
+def test_write_json__compact():
+    # Given
+    input_report_location = pathlib.Path(tempfile.gettempdir()) / ".eze-temp" / "tmp-local-test_io_write_json.json"
+    input_vo = {"b": [1, 2], "a": "x"}
+    # When
+    write_json(input_report_location, input_vo, compact=True)
+    # Then
+    assert input_report_location.read_text() == '{"a":"x","b":[1,2]}'
+
+
+def test_spool_json():
+    # Given
+    input_vo = {"hello": "wörld", "list": list(range(20000))}
+    # When
+    with mock.patch("eze.utils.io.file.SPOOL_WRITE_BATCH_SIZE", 100):
+        with spool_json(input_vo) as json_file:
+            output = json_file.read()
+    # Then
+    assert output == pretty_print_json(input_vo).encode("utf-8")
+
+
+def test_spool_json__compress():
+    # Given
+    input_vo = {"hello": "world", "list": list(range(20000))}
+    # When
+    with spool_json(input_vo, compact=True, compress=True) as json_file:
+        output = json_file.read()
+    # Then
+    assert (
+        gzip.decompress(output)
+        == b'{"hello":"world","list":[' + ",".join(str(x) for x in range(20000)).encode() + b"]}"
+    )
+
+
 @mock.patch("eze.utils.io.file.os.makedirs", side_effect=FakePermissionError())
 def test_write_json__ab_688_makedirs_exception(mock_make_dirs):
     """Test irregular case, can't create folder"""
@@ -0,0 +1,65 @@
+import os
+
+from eze.utils.io.file_index import FileIndex
+
+OLD_MTIME_NS: int = 1_000_000_000_000_000_000
+
+
+def create_project(project_folder):
+    (project_folder / "src" / "nested").mkdir(parents=True)
+    (project_folder / "node_modules" / "dep").mkdir(parents=True)
+    (project_folder / "Dockerfile").write_text("FROM scratch")
+    (project_folder / "src" / "thing.js").write_text("const a = 1")
+    (project_folder / "src" / "nested" / "other.py").write_text("a = 1")
+    (project_folder / "node_modules" / "dep" / "index.js").write_text("const b = 1")
+    # INFO: folders modified in the last few seconds are treated as racy and always re-listed
+    for folder in [project_folder, project_folder / "src", project_folder / "src" / "nested"]:
+        os.utime(folder, ns=(OLD_MTIME_NS, OLD_MTIME_NS))
+
+
+def test_get_file_lists(tmp_path):
+    # Given
+    create_project(tmp_path / "project")
+    testee = FileIndex(str(tmp_path / "project"), ["node_modules"], tmp_path / "index.json")
+    expected_output = [
+        ["src", os.path.join("src", "nested")],
+        ["node_modules"],
+        ["Dockerfile", os.path.join("src", "thing.js"), os.path.join("src", "nested", "other.py")],
+        ["Dockerfile", "thing.js", "other.py"],
+        {"Dockerfile": 1, ".js": 1, ".py": 1},
+    ]
+    # When
+    testee.refresh()
+    output = testee.get_file_lists()
+    # Then
+    assert output == expected_output
+
+
+def test_refresh__only_relists_changed_folders(tmp_path):
+    # Given
+    create_project(tmp_path / "project")
+    first_index = FileIndex(str(tmp_path / "project"), ["node_modules"], tmp_path / "index.json")
+    first_index.refresh()
+    first_index.save()
+    (tmp_path / "project" / "src" / "new.js").write_text("const c = 1")
+    # When
+    testee = FileIndex(str(tmp_path / "project"), ["node_modules"], tmp_path / "index.json")
+    testee.load()
+    output = testee.refresh()
+    # Then
+    assert output == {"listed": 1, "reused": 2}
+    assert os.path.join("src", "new.js") in testee.get_file_lists()[2]
+
+
+def test_load__ignores_index_built_with_other_ignored_folders(tmp_path):
+    # Given
+    create_project(tmp_path / "project")
+    first_index = FileIndex(str(tmp_path / "project"), ["node_modules"], tmp_path / "index.json")
+    first_index.refresh()
+    first_index.save()
+    # When
+    testee = FileIndex(str(tmp_path / "project"), [], tmp_path / "index.json")
+    testee.load()
+    output = testee.refresh()
+    # Then
+    assert output == {"listed": 5, "reused": 0}
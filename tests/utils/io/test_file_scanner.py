@@ -1,7 +1,19 @@
+import os
+from unittest import mock
+
 import pytest
 
 from tests.__test_helpers__.mock_helper import unmock_file_scanner, mock_file_scanner
-from eze.utils.io.file_scanner import find_files_by_name, find_files_by_path
+from eze.utils.io.file_scanner import (
+    _build_file_list,
+    find_files_by_exact_name,
+    find_files_by_extension,
+    find_files_by_name,
+    find_files_by_names,
+    find_files_by_path,
+    is_source_copy_hardlinks_enabled,
+    sync_workspace_mirror,
+)
 
 
 def teardown_function(function):
@@ -54,3 +66,124 @@ def test_find_files_by_name__sad_invalid_regex():
     with pytest.raises(Exception) as raised_error:
         test_output = find_files_by_name("*.py")
     assert raised_error.value.args[0] == "unable to parse regex '*.py' due to nothing to repeat"
+
+
+def test_find_files_by_names__happy():
+    # Given
+    mock_file_scanner()
+    expected_output = ["Dockerfile", "src/thing.js"]
+    # When
+    test_output = find_files_by_names(["^thing.js$", "^Dockerfile$"])
+    # Then
+    assert test_output == expected_output
+
+
+def test_find_files_by_names__returns_copy_of_memoised_matches():
+    # Given
+    mock_file_scanner()
+    first_output = find_files_by_names([".*"])
+    # When
+    first_output.append("something-else")
+    test_output = find_files_by_names([".*"])
+    # Then
+    assert test_output == ["Dockerfile", "src/thing.js"]
+
+
+def test_find_files_by_exact_name__happy():
+    # Given
+    mock_file_scanner()
+    # When
+    test_output = find_files_by_exact_name("thing.js")
+    # Then
+    assert test_output == ["src/thing.js"]
+
+
+def test_find_files_by_extension__happy():
+    # Given
+    mock_file_scanner()
+    # When
+    test_output = find_files_by_extension(".js")
+    # Then
+    assert test_output == ["src/thing.js"]
+
+
+def test_sync_workspace_mirror__only_syncs_changes(tmp_path, monkeypatch):
+    # Given
+    project_folder = tmp_path / "project"
+    (project_folder / "src").mkdir(parents=True)
+    (project_folder / "src" / "unchanged.py").write_text("a = 1")
+    (project_folder / "src" / "touched.py").write_text("b = 1")
+    (project_folder / "src" / "edited.py").write_text("c = 1")
+    (project_folder / "stale" / "deleted.py").parent.mkdir()
+    (project_folder / "stale" / "deleted.py").write_text("d = 1")
+    monkeypatch.chdir(project_folder)
+    mirror_folder = str(tmp_path / "mirror")
+    first_files = [os.path.join("src", "unchanged.py"), os.path.join("src", "touched.py")]
+    first_files += [os.path.join("src", "edited.py"), os.path.join("stale", "deleted.py")]
+    first_output = sync_workspace_mirror(first_files, mirror_folder)
+    # When
+    os.utime(project_folder / "src" / "touched.py", ns=(1, 1))
+    (project_folder / "src" / "edited.py").write_text("c = 22")
+    (project_folder / "stale" / "deleted.py").unlink()
+    second_output = sync_workspace_mirror(first_files[:3], mirror_folder)
+    # Then
+    assert first_output == {"copied": 4, "unchanged": 0, "removed": 0}
+    assert second_output == {"copied": 1, "unchanged": 2, "removed": 1}
+    assert (tmp_path / "mirror" / "src" / "edited.py").read_text() == "c = 22"
+    assert not (tmp_path / "mirror" / "stale").exists()
+
+
+def test_sync_workspace_mirror__corrupted_manifest_rebuilds_mirror(tmp_path, monkeypatch):
+    # Given
+    (tmp_path / "project").mkdir()
+    (tmp_path / "project" / "file.py").write_text("a = 1")
+    monkeypatch.chdir(tmp_path / "project")
+    mirror_folder = str(tmp_path / "mirror")
+    (tmp_path / "mirror").mkdir()
+    (tmp_path / "mirror" / "unknown.py").write_text("x = 1")
+    (tmp_path / "mirror.manifest.json").write_text("{corrupted")
+    # When
+    output = sync_workspace_mirror(["file.py"], mirror_folder)
+    # Then
+    assert output == {"copied": 1, "unchanged": 0, "removed": 0}
+    assert sorted(os.listdir(mirror_folder)) == ["file.py"]
+
+
+def test_sync_workspace_mirror__hardlinks_disabled_copies_files(tmp_path, monkeypatch):
+    # Given
+    (tmp_path / "project").mkdir()
+    (tmp_path / "project" / "file.py").write_text("a = 1")
+    monkeypatch.chdir(tmp_path / "project")
+    mirror_folder = str(tmp_path / "mirror")
+    # When
+    sync_workspace_mirror(["file.py"], mirror_folder, use_hardlinks=False)
+    (tmp_path / "mirror" / "file.py").write_text("a = 2")
+    # Then
+    assert (tmp_path / "project" / "file.py").read_text() == "a = 1"
+
+
+def test_is_source_copy_hardlinks_enabled(monkeypatch):
+    # Given
+    monkeypatch.delenv("EZE_SOURCE_COPY_HARDLINKS", raising=False)
+    # When
+    default_output = is_source_copy_hardlinks_enabled()
+    monkeypatch.setenv("EZE_SOURCE_COPY_HARDLINKS", "false")
+    disabled_output = is_source_copy_hardlinks_enabled()
+    # Then
+    assert default_output is True
+    assert disabled_output is False
+
+
+@pytest.mark.parametrize("env_value,expected_index_saved", [("true", True), ("false", False)])
+def test_build_file_list__file_index_opt_out(tmp_path, monkeypatch, env_value, expected_index_saved):
+    # Given
+    (tmp_path / "project").mkdir()
+    (tmp_path / "project" / "file.py").write_text("a = 1")
+    monkeypatch.setenv("EZE_FILE_INDEX", env_value)
+    index_file = tmp_path / "index.json"
+    # When
+    with mock.patch("eze.utils.io.file_index.FileIndex.get_default_index_file", return_value=index_file):
+        output = _build_file_list(str(tmp_path / "project"))
+    # Then
+    assert output[2] == ["file.py"]
+    assert index_file.exists() is expected_index_saved
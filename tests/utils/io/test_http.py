@@ -1,12 +1,23 @@
 # pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring,line-too-long,unused-argument
 
+import asyncio
+import json
+import threading
 import urllib.error
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest import mock
 from io import StringIO
 import pytest
 
-from eze.utils.io.http import request, request_json, spine_case_url
-from eze.utils.error import EzeNetworkingError
+from eze.utils.io.http import (
+    AsyncHttpClient,
+    request,
+    request_json,
+    request_response,
+    retry_request,
+    spine_case_url,
+)
+from eze.utils.error import EzeConnectionError, EzeHttpStatusError, EzeNetworkingError
 from eze.utils.io.print import pretty_print_json
 
 
@@ -108,3 +119,136 @@ def test_spine_case_url__std_case_https():
     output = spine_case_url(input)
     # Then
     assert output == expected_output
+
+
+class StubJsonHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        status = 500 if self.path == "/error" else 200
+        response = b'{"echo": ' + body + b', "port": ' + str(self.client_address[1]).encode() + b"}"
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubJsonHandler)
+    server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+    server_thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.asyncio
+async def test_async_http_client__concurrent_requests_reuse_connections(stub_server_url):
+    # Given
+    async with AsyncHttpClient(max_concurrency=2) as testee:
+        # When
+        output = await asyncio.gather(*[testee.request_json(stub_server_url, b'"req"') for _ in range(10)])
+    # Then
+    assert [x["echo"] for x in output] == ["req"] * 10
+    # INFO: client ports identify connections, keep-alive means at most max_concurrency were opened
+    assert len(set(x["port"] for x in output)) <= 2
+
+
+@pytest.mark.asyncio
+async def test_async_http_client__sad_path_error_status(stub_server_url):
+    # Given
+    async with AsyncHttpClient() as testee:
+        # When
+        with pytest.raises(EzeNetworkingError) as raised_error:
+            await testee.request_json(f"{stub_server_url}/error", b'"req"')
+    # Then
+    assert raised_error.value.message.startswith(f"Error accessing url '{stub_server_url}/error', Error: 500")
+
+
+@pytest.mark.asyncio
+async def test_request_response__body_is_str_for_both_clients(stub_server_url):
+    # Given
+    async with AsyncHttpClient() as http_client:
+        # When
+        async_output = await http_client.request_response(stub_server_url, b'"req"')
+    sync_output = request_response(stub_server_url, b'"req"')
+    # Then
+    assert isinstance(async_output.body, str)
+    assert isinstance(sync_output.body, str)
+    assert json.loads(sync_output.body)["echo"] == json.loads(async_output.body)["echo"] == "req"
+
+
+@mock.patch("urllib.request.urlopen")
+def test_request_response__not_modified_is_returned(mock_urlopen):
+    # Given
+    mock_urlopen.side_effect = urllib.error.HTTPError(
+        "http://example.com", 304, "Not Modified", {"ETag": '"etag-1"'}, None
+    )
+    # When
+    output = request_response("https://someurl.com", headers={"If-None-Match": '"etag-1"'})
+    # Then
+    assert output.status == 304
+    assert output.body is None
+    assert output.etag == '"etag-1"'
+
+
+@pytest.mark.asyncio
+async def test_retry_request__retries_with_backoff():
+    # Given
+    errors = [EzeConnectionError("connection refused"), EzeHttpStatusError("503", 503)]
+    send_request = mock.AsyncMock(side_effect=[*errors, {"ok": True}])
+    # When
+    with mock.patch("eze.utils.io.http.asyncio.sleep", new_callable=mock.AsyncMock) as mock_sleep:
+        output = await retry_request(send_request, max_retries=3, backoff_sec=1)
+    # Then
+    assert output == {"ok": True}
+    assert [x.args[0] for x in mock_sleep.call_args_list] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_retry_request__client_error_not_retried():
+    # Given
+    send_request = mock.AsyncMock(side_effect=EzeHttpStatusError("401", 401))
+    # When
+    with pytest.raises(EzeHttpStatusError):
+        await retry_request(send_request, max_retries=3, backoff_sec=0)
+    # Then
+    assert send_request.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_request__sent_request_errors_not_retried():
+    # Given
+    send_request = mock.AsyncMock(side_effect=EzeNetworkingError("read timed out"))
+    # When
+    with pytest.raises(EzeNetworkingError):
+        await retry_request(send_request, max_retries=3, backoff_sec=0)
+    # Then
+    assert send_request.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_request__status_not_in_retryable_status_codes_not_retried():
+    # Given
+    send_request = mock.AsyncMock(side_effect=EzeHttpStatusError("502", 502))
+    # When
+    with pytest.raises(EzeHttpStatusError):
+        await retry_request(send_request, max_retries=3, backoff_sec=0, retryable_status_codes=frozenset([503]))
+    # Then
+    assert send_request.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_async_http_client__connection_refused_is_connection_error():
+    # Given
+    async with AsyncHttpClient() as testee:
+        # When
+        with pytest.raises(EzeConnectionError) as raised_error:
+            await testee.request("http://127.0.0.1:1", b'"req"')
+    # Then
+    assert raised_error.value.message.startswith("Error connecting to url 'http://127.0.0.1:1'")
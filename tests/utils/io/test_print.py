@@ -4,6 +4,7 @@ import pytest
 from eze.utils.io.print import (
     pretty_print_table,
     pretty_print_json,
+    iter_json,
     truncate,
     generate_markdown_list,
     generate_markdown_header,
@@ -164,6 +165,29 @@ def test_pretty_print_json():
     assert output == expected_output
 
 
+def test_iter_json__same_as_pretty_print_json():
+    # Given
+    class DummyClass:
+        def __init__(self):
+            self.field1 = "should appear"
+
+    test_input = [{"hello": 1, "foo": "bar", "class_is": DummyClass(), "float": 1.5}, None]
+    # When
+    output = iter_json(test_input)
+    # Then
+    assert not isinstance(output, str)
+    assert "".join(output) == pretty_print_json(test_input)
+
+
+def test_iter_json__compact():
+    # Given
+    test_input = {"hello": 1, "foo": ["bar", True]}
+    # When
+    output = "".join(iter_json(test_input, compact=True))
+    # Then
+    assert output == '{"foo":["bar",true],"hello":1}'
+
+
 truncate_test_data = [
     ("short string test", "short text", "short text"),
     ("empty string test", "", ""),
@@ -4,6 +4,7 @@ import pytest
 from eze.core.enums import Vulnerability
 
 from eze.utils.cli.run import CompletedProcess
+from eze.utils.data.osv_mirror import OsvMirror
 
 from tests.__fixtures__.fixture_helper import convert_to_std_object
 from eze.utils.language.dotnet import (
@@ -175,9 +176,30 @@ async def test_get_vulnerable_packages(mocked_get_osv_id_data, mocked_run_cmd):
         }
     ]
     # When
-    output = await get_vulnerable_packages(input_package, input_project)
+    [output, output_warnings] = await get_vulnerable_packages(input_package, input_project)
     # Then
     assert convert_to_std_object(output) == expected_output
+    assert output_warnings == []
+
+
+@pytest.mark.asyncio
+@mock.patch("eze.utils.language.dotnet.run_async_cmd")
+@mock.patch("eze.utils.language.dotnet.get_osv_id_data")
+async def test_get_vulnerable_packages__offline_mirror_missing_is_single_warning(
+    mocked_get_osv_id_data, mocked_run_cmd, tmp_path
+):
+    # Given
+    mocked_run_cmd.return_value = CompletedProcess(VULNERABLE_PACKAGE_STDOUT, "")
+    OsvMirror.set_instance(True, tmp_path / "osv-mirror.sqlite")
+    # When
+    [output, output_warnings] = await get_vulnerable_packages("eze-test-package", "EzeGoatApp.csproj")
+    OsvMirror.reset_instance()
+    # Then
+    assert mocked_get_osv_id_data.call_count == 0
+    assert len(output) == 1
+    assert output[0].severity == "critical"
+    assert len(output_warnings) == 1
+    assert "osv mirror" in output_warnings[0]
 
 
 def test_extract_transitive_packages():
@@ -0,0 +1,33 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring,line-too-long
+from eze.utils.language.iac import get_dockerfile_projects, get_terraform_projects
+from tests.__test_helpers__.mock_helper import mock_file_scanner, unmock_file_scanner
+
+
+def teardown_function(function):
+    unmock_file_scanner()
+
+
+def test_get_terraform_projects__includes_json_terraform():
+    # Given
+    mock_file_scanner(
+        mock_discovered_files=["infra/main.tf", "json-infra/main.tf.json", "infra/variables.tf"],
+        mock_discovered_filenames=["main.tf", "main.tf.json", "variables.tf"],
+    )
+    expected_output = ["infra/main.tf", "json-infra/main.tf.json"]
+    # When
+    output = get_terraform_projects()
+    # Then
+    assert output == expected_output
+
+
+def test_get_dockerfile_projects__exact_name():
+    # Given
+    mock_file_scanner(
+        mock_discovered_files=["Dockerfile", "docs/Dockerfile.md"],
+        mock_discovered_filenames=["Dockerfile", "Dockerfile.md"],
+    )
+    expected_output = ["Dockerfile"]
+    # When
+    output = get_dockerfile_projects()
+    # Then
+    assert output == expected_output
@@ -1,3 +1,4 @@
+import asyncio
 from unittest import mock
 
 import pytest
@@ -7,6 +8,8 @@ from eze.utils.cli.run import CompletedProcess
 from tests.__fixtures__.fixture_helper import convert_to_std_object
 from eze.utils.language.node import (
     annotate_transitive_licenses,
+    delete_npm_cache,
+    install_npm_in_path,
 )
 
 TRANSITIVE_PACKAGE_STDOUT = """{
@@ -63,3 +66,23 @@ async def test_annotate_transitive_licenses(mocked_run_cmd):
     await annotate_transitive_licenses(input_sbom, "some_cwd/", False)
     # Then
     assert convert_to_std_object(input_sbom) == expected_output
+
+
+@pytest.mark.asyncio
+@mock.patch("eze.utils.language.node.os.path.isfile", mock.MagicMock(return_value=True))
+@mock.patch("eze.utils.language.node.run_async_cmd")
+async def test_install_npm_in_path__concurrent_calls_install_once(mocked_run_cmd):
+    # Given
+    delete_npm_cache()
+
+    async def slow_install(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return CompletedProcess("", "")
+
+    mocked_run_cmd.side_effect = slow_install
+    # When
+    await asyncio.gather(install_npm_in_path("some-project"), install_npm_in_path("some-project"))
+    await install_npm_in_path("some-project")
+    # Then
+    assert mocked_run_cmd.call_count == 1
+    delete_npm_cache()
@@ -7,6 +7,7 @@ import pytest
 from git import InvalidGitRepositoryError
 
 from eze.utils import git
+from eze.utils.error import EzeError
 from eze.utils.git import clean_url
 
 
@@ -33,12 +34,6 @@ class MockUnsuccessDetachedGitRepo:
             raise TypeError("HEAD is a detached symbolic reference as it points to xxxx")
 
 
-class MockSimulateGitNotInstalledGitRepo:
-    def __getattribute__(self, key):
-        if key == "active_branch":
-            raise NameError("When git not installed setup_mock, then will make git undefined")
-
-
 @mock.patch.dict(
     os.environ,
     {"BUILD_SOURCEBRANCH": "", "SYSTEM_PULLREQUEST_SOURCEBRANCH": "", "BUILD_SOURCEBRANCHNAME": "", "AWS_BRANCH": ""},
@@ -89,7 +84,7 @@ def test_get_active_branch_name__success_with_ado_ci_detached_example(mock_repo)
     assert output == expected_output
 
 
-@patch("git.Repo")
+@patch("eze.utils.git._import_git", mock.MagicMock(return_value=None))
 @mock.patch.dict(
     os.environ,
     {
@@ -99,8 +94,7 @@ def test_get_active_branch_name__success_with_ado_ci_detached_example(mock_repo)
         "AWS_BRANCH": "main_aws_thing",
     },
 )
-def test_get_active_branch_name__success_with_no_git_installed(mock_repo):
-    mock_repo.return_value = MockSimulateGitNotInstalledGitRepo()
+def test_get_active_branch_name__success_with_no_git_installed():
     expected_output = "main_aws_thing"
     output = git.get_active_branch_name("dir/foobar/")
     assert output == expected_output
@@ -273,3 +267,60 @@ url_test_data = [
 def test_clean_url(title, test_input, expected_output):
     output = clean_url(test_input)
     assert output == expected_output
+
+
+def test_get_changed_files(tmp_path):
+    # Given
+    repo = git._import_git().Repo.init(tmp_path)
+    repo.config_writer().set_value("user", "name", "eze").set_value("user", "email", "eze@example.com").release()
+    (tmp_path / "unchanged.py").write_text("a = 1")
+    (tmp_path / "changed.py").write_text("b = 1")
+    (tmp_path / "deleted.py").write_text("c = 1")
+    (tmp_path / "chänged.py").write_text("e = 1")
+    repo.index.add(["unchanged.py", "changed.py", "deleted.py", "chänged.py"])
+    repo.index.commit("initial")
+    (tmp_path / "changed.py").write_text("b = 2")
+    (tmp_path / "chänged.py").write_text("e = 2")
+    (tmp_path / "deleted.py").unlink()
+    (tmp_path / "untracked.py").write_text("d = 1")
+    (tmp_path / "üntracked.py").write_text("f = 1")
+    # When
+    output = git.get_changed_files("HEAD", str(tmp_path))
+    # Then
+    assert output == ["changed.py", "chänged.py", "deleted.py", "untracked.py", "üntracked.py"]
+    assert git.get_head_commit(str(tmp_path)) == repo.head.commit.hexsha
+
+
+@patch("eze.utils.git._import_git", mock.MagicMock(return_value=None))
+def test_get_changed_files__git_not_installed(tmp_path):
+    # When
+    with pytest.raises(EzeError) as raised_error:
+        git.get_changed_files("HEAD", str(tmp_path))
+    # Then
+    assert raised_error.value.message == "git not installed, unable to detect changed files"
+    assert git.get_head_commit(str(tmp_path)) is None
+
+
+def test_get_changed_files__unknown_ref(tmp_path):
+    # Given
+    git._import_git().Repo.init(tmp_path)
+    # When
+    with pytest.raises(EzeError) as raised_error:
+        git.get_changed_files("not-a-ref", str(tmp_path))
+    # Then
+    assert "unable to detect files changed since 'not-a-ref'" in raised_error.value.message
+
+
+@patch("git.Repo")
+def test_git_context__resolved_once(mock_repo):
+    # Given
+    mock_repo.return_value = MockSuccessGitRepo()
+    git.GitContext.reset_instance()
+    # When
+    output = git.GitContext.set_instance("dir/foobar/")
+    # Then
+    assert output.branch_uri == "https://some-repo.some-domain.com"
+    assert output.branch_name == "feature/helloworld"
+    assert git.GitContext.get_instance() is output
+    assert mock_repo.call_count == 1
+    git.GitContext.reset_instance()
@@ -9,6 +9,7 @@ from eze.utils.license import (
     get_licenses_data,
     normalise_license_id,
     get_license,
+    get_license_resolver,
     convert_pypi_to_spdx,
 )
 
@@ -509,3 +510,35 @@ def test_get_license__sad_case():
     output = get_license(non_license)
     # Then
     assert output == expected_license
+
+
+def test_get_license__name_happy_case():
+    # Given
+    license_name = "BSD Zero Clause License"
+    expected_license_id = "0BSD"
+    # When
+    output = get_license(license_name)
+    # Then
+    assert output["id"] == expected_license_id
+
+
+def test_get_license_resolver__pattern_reports_first_matching_pattern():
+    # Given
+    testee = get_license_resolver()
+    # When
+    bsd_output = testee.resolve("BSD-Lorem")
+    oldap_output = testee.resolve("OLDAP-2.X")
+    # Then
+    assert bsd_output["name"] == "Berkeley Software Distribution"
+    assert oldap_output["id"] == "OLDAP-2.X"
+    assert oldap_output["name"] == get_licenses_data()["licensesPatterns"]["OLDAP-[2-9].*"]["name"]
+
+
+def test_get_license_resolver__memoised_per_license_text():
+    # Given
+    testee = get_license_resolver()
+    # When
+    first_output = testee.resolve("Apache-X.X.X.X-Lorem")
+    second_output = testee.resolve("Apache-X.X.X.X-Lorem")
+    # Then
+    assert first_output is second_output
@@ -1,9 +1,14 @@
 # pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring,line-too-long
+import sys
+from importlib.metadata import EntryPoint
 
-import pkg_resources
+import pytest
 
+from eze.core.tool import ToolMeta
 from eze.plugins import base_plugins
-from eze.utils.package import get_plugins
+from eze.utils import package
+from eze.utils.error import EzeConfigError
+from eze.utils.package import EZE_TOOLS_ENTRY_POINT, PluginRegistry, get_plugins
 
 
 class MockPlugin:
@@ -14,26 +19,66 @@ class MockPlugin:
         return {}
 
 
-class MockEntryPoint(pkg_resources.EntryPoint):
-    def load(self, *args, **kwargs):
+class MockEntryPoint(EntryPoint):
+    def load(self):
         return MockPlugin
 
 
-def test_get_plugins__empty(monkeypatch):
-    def mock_iter_entry_points(group, name=None):
-        return iter([])
+def mock_get_entry_points(entry_points_by_group: dict):
+    def get_entry_points(group: str) -> list:
+        return entry_points_by_group.get(group, [])
+
+    return get_entry_points
+
 
-    monkeypatch.setattr(pkg_resources, "iter_entry_points", mock_iter_entry_points)
+def test_get_plugins__empty(monkeypatch):
+    monkeypatch.setattr(package, "_get_entry_points", mock_get_entry_points({}))
     expected_output = {"inbuilt": base_plugins}
     output = get_plugins()
     assert output == expected_output
 
 
 def test_get_plugins__with_entry(monkeypatch):
-    def mock_iter_entry_points(group, name=None):
-        return iter([MockEntryPoint("dummy", "src.dummy")])
-
-    monkeypatch.setattr(pkg_resources, "iter_entry_points", mock_iter_entry_points)
+    monkeypatch.setattr(
+        package, "_get_entry_points", mock_get_entry_points({"eze.plugins": [MockEntryPoint("dummy", "src.dummy", "")]})
+    )
     expected_output = {"inbuilt": base_plugins, "dummy": MockPlugin}
     output = get_plugins()
     assert output == expected_output
+
+
+def test_get_plugins__with_lazy_tool_entry(monkeypatch):
+    tool_entry_point = EntryPoint("raw-copy", "eze.plugins.tools.raw:RawTool", "eze.tools")
+    monkeypatch.setattr(package, "_get_entry_points", mock_get_entry_points({"eze.tools": [tool_entry_point]}))
+    output = get_plugins()
+    assert output[EZE_TOOLS_ENTRY_POINT].get_tools() == {"raw-copy": tool_entry_point}
+    assert output[EZE_TOOLS_ENTRY_POINT].get_reporters() == {}
+
+
+def test_plugin_registry__imported_when_used(monkeypatch):
+    # Given
+    monkeypatch.delitem(sys.modules, "eze.plugins.tools.raw", raising=False)
+    testee = PluginRegistry({"raw": "eze.plugins.tools.raw:RawTool"}, ToolMeta)
+    # When
+    is_registered = "raw" in testee
+    is_imported_before_use = "eze.plugins.tools.raw" in sys.modules
+    output = testee["raw"]
+    # Then
+    assert is_registered
+    assert not is_imported_before_use
+    assert output.__name__ == "RawTool"
+
+
+def test_plugin_registry__invalid_plugin():
+    # Given
+    testee = PluginRegistry(
+        {"not-a-tool": "eze.plugins.base_plugins:get_tools", "missing": "eze.missing:Tool"}, ToolMeta
+    )
+    # When
+    with pytest.raises(EzeConfigError) as invalid_error:
+        testee["not-a-tool"]
+    with pytest.raises(EzeConfigError) as missing_error:
+        testee["missing"]
+    # Then
+    assert invalid_error.value.message == "invalid plugin 'not-a-tool', not a ToolMeta"
+    assert missing_error.value.message.startswith("unable to load plugin 'missing'")
@@ -1,8 +1,10 @@
 # pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring,line-too-long
+from unittest import mock
+
 import pytest
 from eze.core.tool import ScanResult
 
-from eze.core.enums import LicenseScanType
+from eze.core.enums import Component, LicenseScanType
 from eze.utils.license import (
     check_licenses,
     annotate_licenses,
@@ -14,7 +16,7 @@ from eze.utils.license import (
 )
 
 from tests.__fixtures__.fixture_helper import load_json_fixture, convert_to_std_object
-from eze.utils.scan_result import has_sbom_data, has_vulnerability_data
+from eze.utils.scan_result import bom_short_summary, get_sbom_components, has_sbom_data, has_vulnerability_data
 
 
 def test_has_sbom_data__happypath_no_sbom():
@@ -85,3 +87,41 @@ def test_has_vulnerability_data__happypath_false_no_vulns_no_sbom_one_sbom():
     output = has_vulnerability_data(scan_result)
     # Then
     assert output == expected_output
+
+
+def test_get_sbom_components__annotated_once_and_reused():
+    # Given
+    cyclonedx_bom = {"components": [{"type": "library", "name": "pydash", "version": "1.0", "licenses": []}]}
+    scan_result: ScanResult = ScanResult({"sboms": {"requirements.txt": cyclonedx_bom}})
+    # When
+    with mock.patch("eze.utils.scan_result.annotate_licenses", wraps=annotate_licenses) as mock_annotate_licenses:
+        first_output = get_sbom_components(scan_result, "requirements.txt")
+        second_output = get_sbom_components(scan_result, "requirements.txt")
+    # Then
+    assert first_output is second_output
+    assert first_output[0].license == "unknown"
+    assert mock_annotate_licenses.call_count == 1
+
+
+def test_bom_short_summary__uses_annotated_components():
+    # Given
+    component = Component({"type": "library", "name": "pydash", "version": "1.0", "license": "MIT"})
+    scan_result: ScanResult = ScanResult(
+        {"sboms": {"requirements.txt": {"components": []}}, "components": {"requirements.txt": [component]}}
+    )
+    expected_output = """    requirements.txt components: 1 (MIT:1)
+"""
+    # When
+    output = bom_short_summary(scan_result)
+    # Then
+    assert output == expected_output
+
+
+def test_scan_result__rehydrates_components():
+    # Given
+    raw_component = {"type": "library", "name": "pydash", "version": "1.0", "license": "MIT"}
+    # When
+    scan_result: ScanResult = ScanResult({"components": {"requirements.txt": [raw_component]}})
+    # Then
+    assert isinstance(scan_result.components["requirements.txt"][0], Component)
+    assert scan_result.components["requirements.txt"][0].license == "MIT"